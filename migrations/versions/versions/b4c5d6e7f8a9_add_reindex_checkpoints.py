@@ -0,0 +1,43 @@
+"""add reindex_checkpoints and (created_at, id) keyset indexes
+
+Revision ID: b4c5d6e7f8a9
+Revises: a3b4c5d6e7f8
+Create Date: 2026-10-17 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "b4c5d6e7f8a9"
+down_revision: Union[str, None] = "a3b4c5d6e7f8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "reindex_checkpoints",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("collection", sa.String(200), nullable=False),
+        sa.Column("model", sa.String(200), nullable=False),
+        sa.Column("last_created_at", sa.DateTime(), nullable=True),
+        sa.Column("last_id", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("processed", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("status", sa.String(20), nullable=False, server_default="running"),
+        sa.Column("error_message", sa.Text(), nullable=True),
+        sa.Column("started_at", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.UniqueConstraint("collection", "model", name="uq_reindex_collection_model"),
+    )
+    op.create_index("idx_papers_created_at_id", "papers", ["created_at", "id"])
+    op.create_index("idx_repos_created_at_id", "repositories", ["created_at", "id"])
+
+
+def downgrade() -> None:
+    op.drop_index("idx_repos_created_at_id", table_name="repositories")
+    op.drop_index("idx_papers_created_at_id", table_name="papers")
+    op.drop_table("reindex_checkpoints")
@@ -0,0 +1,43 @@
+"""replace list sort indexes with (sort column, id) keyset indexes
+
+Revision ID: c5d6e7f8a9b0
+Revises: b4c5d6e7f8a9
+Create Date: 2026-10-17 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c5d6e7f8a9b0"
+down_revision: Union[str, None] = "b4c5d6e7f8a9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, old index, new index, sort column)
+SORT_INDEXES = [
+    ("papers", "idx_papers_published_date", "idx_papers_published_date_id", "published_date"),
+    ("repositories", "idx_repos_stars", "idx_repos_stars_id", "stars_count"),
+    ("trending_scores", "idx_trending_score", "idx_trending_score_id", "total_score"),
+    ("community_posts", "idx_community_score", "idx_community_score_id", "score"),
+    (
+        "openreview_notes",
+        "idx_openreview_avg_rating",
+        "idx_openreview_avg_rating_id",
+        "average_rating",
+    ),
+    ("github_discussions", "idx_gh_discussion_upvotes", "idx_gh_discussion_upvotes_id", "upvotes"),
+]
+
+
+def upgrade() -> None:
+    for table, old, new, column in SORT_INDEXES:
+        op.create_index(new, table, [column, "id"])
+        op.drop_index(old, table_name=table)
+
+
+def downgrade() -> None:
+    for table, old, new, column in SORT_INDEXES:
+        op.create_index(old, table, [column])
+        op.drop_index(new, table_name=table)
@@ -0,0 +1,153 @@
+"""add precomputed paper analytics tables
+
+Revision ID: d6e7f8a9b0c1
+Revises: c5d6e7f8a9b0
+Create Date: 2026-10-17 18:00:00.000000
+
+The tables start empty; the first ``rri refresh-analytics`` (or the first
+paper collection task to finish) fills them from ``papers``.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "d6e7f8a9b0c1"
+down_revision: Union[str, None] = "c5d6e7f8a9b0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _paper_fk() -> sa.Column:
+    return sa.Column(
+        "paper_id",
+        postgresql.UUID(as_uuid=True),
+        sa.ForeignKey("papers.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+
+
+def upgrade() -> None:
+    op.create_index("idx_papers_updated_at", "papers", ["updated_at"])
+
+    op.create_table(
+        "paper_authors",
+        _paper_fk(),
+        sa.Column("position", sa.Integer(), nullable=False),
+        sa.Column("name", sa.Text(), nullable=False),
+        sa.Column("affiliation", sa.Text(), nullable=True),
+        sa.Column("year", sa.Integer(), nullable=True),
+        sa.Column("citation_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("categories", postgresql.ARRAY(sa.String(50)), nullable=True),
+        sa.PrimaryKeyConstraint("paper_id", "position"),
+    )
+    op.create_index("idx_paper_authors_name", "paper_authors", ["name"])
+    op.create_index("idx_paper_authors_affiliation", "paper_authors", ["affiliation"])
+
+    op.create_table(
+        "author_stats",
+        sa.Column("scope", sa.String(50), nullable=False),
+        sa.Column("name", sa.Text(), nullable=False),
+        sa.Column("affiliation", sa.Text(), nullable=True),
+        sa.Column("paper_count", sa.Integer(), nullable=False),
+        sa.Column("total_citations", sa.BigInteger(), nullable=False),
+        sa.Column("first_year", sa.Integer(), nullable=True),
+        sa.Column("last_year", sa.Integer(), nullable=True),
+        sa.PrimaryKeyConstraint("scope", "name"),
+    )
+    op.create_index("idx_author_stats_name", "author_stats", ["name"])
+    op.create_index("idx_author_stats_papers", "author_stats", ["scope", "paper_count"])
+    op.create_index("idx_author_stats_citations", "author_stats", ["scope", "total_citations"])
+
+    op.create_table(
+        "coauthor_edges",
+        sa.Column("scope", sa.String(50), nullable=False),
+        sa.Column("source", sa.Text(), nullable=False),
+        sa.Column("target", sa.Text(), nullable=False),
+        sa.Column("weight", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("scope", "source", "target"),
+    )
+    op.create_index("idx_coauthor_edges_weight", "coauthor_edges", ["scope", "weight"])
+    op.create_index("idx_coauthor_edges_source", "coauthor_edges", ["source"])
+    op.create_index("idx_coauthor_edges_target", "coauthor_edges", ["target"])
+
+    op.create_table(
+        "institution_stats",
+        sa.Column("scope", sa.String(50), nullable=False),
+        sa.Column("affiliation", sa.Text(), nullable=False),
+        sa.Column("paper_count", sa.Integer(), nullable=False),
+        sa.Column("author_count", sa.Integer(), nullable=False),
+        sa.Column("mention_count", sa.Integer(), nullable=False),
+        sa.Column("citation_sum", sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint("scope", "affiliation"),
+    )
+    op.create_index("idx_institution_stats_affiliation", "institution_stats", ["affiliation"])
+    op.create_index(
+        "idx_institution_stats_papers", "institution_stats", ["scope", "paper_count"]
+    )
+    op.create_index(
+        "idx_institution_stats_mentions", "institution_stats", ["scope", "mention_count"]
+    )
+
+    op.create_table(
+        "keyword_year_counts",
+        sa.Column("scope", sa.String(50), nullable=False),
+        sa.Column("kind", sa.String(10), nullable=False),
+        sa.Column("keyword", sa.String(100), nullable=False),
+        sa.Column("year", sa.Integer(), nullable=False),
+        sa.Column("paper_count", sa.Integer(), nullable=False),
+        sa.Column("citation_sum", sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint("scope", "kind", "keyword", "year"),
+    )
+
+    op.create_table(
+        "category_year_counts",
+        sa.Column("scope", sa.String(50), nullable=False),
+        sa.Column("category", sa.String(50), nullable=False),
+        sa.Column("year", sa.Integer(), nullable=False),
+        sa.Column("paper_count", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("scope", "category", "year"),
+    )
+
+    op.create_table(
+        "topic_pair_counts",
+        sa.Column("scope", sa.String(50), nullable=False),
+        sa.Column("topic_a", sa.String(100), nullable=False),
+        sa.Column("topic_b", sa.String(100), nullable=False),
+        sa.Column("paper_count", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("scope", "topic_a", "topic_b"),
+    )
+    op.create_index(
+        "idx_topic_pair_counts_papers", "topic_pair_counts", ["scope", "paper_count"]
+    )
+
+    op.create_table(
+        "paper_analytics_sync",
+        _paper_fk(),
+        sa.Column("source_updated_at", sa.DateTime(), nullable=False),
+        sa.Column("year", sa.Integer(), nullable=True),
+        sa.Column("citation_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("categories", postgresql.ARRAY(sa.String(50)), nullable=True),
+        sa.Column("keywords", postgresql.ARRAY(sa.String(100)), nullable=True),
+        sa.Column("topics", postgresql.ARRAY(sa.String(100)), nullable=True),
+        sa.PrimaryKeyConstraint("paper_id"),
+    )
+    op.create_index(
+        "ix_paper_analytics_sync_source_updated_at",
+        "paper_analytics_sync",
+        ["source_updated_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("paper_analytics_sync")
+    op.drop_table("topic_pair_counts")
+    op.drop_table("category_year_counts")
+    op.drop_table("keyword_year_counts")
+    op.drop_table("institution_stats")
+    op.drop_table("coauthor_edges")
+    op.drop_table("author_stats")
+    op.drop_table("paper_authors")
+    op.drop_index("idx_papers_updated_at", table_name="papers")
@@ -0,0 +1,70 @@
+"""add full-text search vectors and trigram indexes to papers and repositories
+
+Revision ID: e1f2a3b4c5d6
+Revises: d9e0f1a2b3c4
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e1f2a3b4c5d6"
+down_revision: Union[str, None] = "d9e0f1a2b3c4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    op.execute(
+        """
+        ALTER TABLE papers ADD COLUMN search_vector tsvector
+        GENERATED ALWAYS AS (
+            setweight(to_tsvector('simple', coalesce(arxiv_id, '')), 'A') ||
+            setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+            setweight(to_tsvector('english', coalesce(abstract, '')), 'B')
+        ) STORED
+        """
+    )
+    op.execute(
+        """
+        ALTER TABLE repositories ADD COLUMN search_vector tsvector
+        GENERATED ALWAYS AS (
+            setweight(to_tsvector('simple', coalesce(full_name, '')), 'A') ||
+            setweight(to_tsvector('english', coalesce(description, '')), 'B')
+        ) STORED
+        """
+    )
+
+    op.create_index(
+        "idx_papers_search_vector", "papers", ["search_vector"], postgresql_using="gin"
+    )
+    op.create_index(
+        "idx_papers_title_trgm",
+        "papers",
+        ["title"],
+        postgresql_using="gin",
+        postgresql_ops={"title": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "idx_repos_search_vector", "repositories", ["search_vector"], postgresql_using="gin"
+    )
+    op.create_index(
+        "idx_repos_full_name_trgm",
+        "repositories",
+        ["full_name"],
+        postgresql_using="gin",
+        postgresql_ops={"full_name": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_repos_full_name_trgm", table_name="repositories")
+    op.drop_index("idx_repos_search_vector", table_name="repositories")
+    op.drop_index("idx_papers_title_trgm", table_name="papers")
+    op.drop_index("idx_papers_search_vector", table_name="papers")
+    op.drop_column("repositories", "search_vector")
+    op.drop_column("papers", "search_vector")
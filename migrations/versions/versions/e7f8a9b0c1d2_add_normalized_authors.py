@@ -0,0 +1,256 @@
+"""add normalized authors table and link paper_authors to it
+
+Revision ID: e7f8a9b0c1d2
+Revises: d6e7f8a9b0c1
+Create Date: 2026-10-17 20:00:00.000000
+
+Backfills ``authors`` / ``paper_authors`` from ``papers.authors``. The
+author aggregates are re-keyed by author id and every analytics table is
+emptied, so the next refresh rebuilds them from scratch.
+"""
+import re
+import unicodedata
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "e7f8a9b0c1d2"
+down_revision: Union[str, None] = "d6e7f8a9b0c1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 1000
+
+ANALYTICS_TABLES = (
+    "institution_stats",
+    "keyword_year_counts",
+    "category_year_counts",
+    "topic_pair_counts",
+    "paper_analytics_sync",
+)
+
+papers = sa.table(
+    "papers",
+    sa.column("id", postgresql.UUID(as_uuid=True)),
+    sa.column("authors", postgresql.JSONB),
+)
+authors = sa.table(
+    "authors",
+    sa.column("id", postgresql.UUID(as_uuid=True)),
+    sa.column("name_key", sa.Text),
+    sa.column("name", sa.Text),
+)
+paper_authors = sa.table(
+    "paper_authors",
+    sa.column("paper_id", postgresql.UUID(as_uuid=True)),
+    sa.column("position", sa.Integer),
+    sa.column("author_id", postgresql.UUID(as_uuid=True)),
+    sa.column("name", sa.Text),
+    sa.column("affiliation", sa.Text),
+)
+
+
+def _name_key(name: str) -> str:
+    # Frozen copy of author_repo.author_name_key as of this revision
+    decomposed = unicodedata.normalize("NFKD", name)
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return re.sub(r"[\W_]+", " ", stripped.casefold()).strip()
+
+
+def _backfill() -> None:
+    import uuid
+
+    conn = op.get_bind()
+    last_id = None
+    while True:
+        query = sa.select(papers.c.id, papers.c.authors).order_by(papers.c.id).limit(BATCH_SIZE)
+        if last_id is not None:
+            query = query.where(papers.c.id > last_id)
+        rows = conn.execute(query).all()
+        if not rows:
+            break
+        last_id = rows[-1].id
+
+        entries = []
+        names: dict[str, str] = {}
+        for row in rows:
+            listed = row.authors if isinstance(row.authors, list) else []
+            for position, author in enumerate(listed, 1):
+                if not isinstance(author, dict) or not isinstance(author.get("name"), str):
+                    continue
+                name = author["name"].strip()
+                key = _name_key(name)
+                if not key:
+                    continue
+                affiliation = author.get("affiliation")
+                if not isinstance(affiliation, str) or not affiliation.strip():
+                    affiliation = None
+                names.setdefault(key, name)
+                entries.append((row.id, position, key, name, affiliation and affiliation.strip()))
+        if not entries:
+            continue
+
+        conn.execute(
+            postgresql.insert(authors)
+            .values([{"id": uuid.uuid4(), "name_key": k, "name": names[k]} for k in sorted(names)])
+            .on_conflict_do_nothing(index_elements=["name_key"])
+        )
+        ids = dict(
+            conn.execute(
+                sa.select(authors.c.name_key, authors.c.id).where(
+                    authors.c.name_key.in_(list(names))
+                )
+            ).all()
+        )
+        conn.execute(
+            paper_authors.insert(),
+            [
+                {
+                    "paper_id": paper_id,
+                    "position": position,
+                    "author_id": ids[key],
+                    "name": name,
+                    "affiliation": affiliation,
+                }
+                for paper_id, position, key, name, affiliation in entries
+            ],
+        )
+
+    op.execute(
+        """
+        UPDATE paper_authors pa
+        SET year = EXTRACT(YEAR FROM p.published_date)::int,
+            citation_count = COALESCE(p.citation_count, 0),
+            categories = p.categories
+        FROM papers p
+        WHERE pa.paper_id = p.id
+        """
+    )
+
+
+def _create_author_aggregates() -> None:
+    op.create_table(
+        "author_stats",
+        sa.Column("scope", sa.String(50), nullable=False),
+        sa.Column(
+            "author_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("authors.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("name", sa.Text(), nullable=False),
+        sa.Column("affiliation", sa.Text(), nullable=True),
+        sa.Column("paper_count", sa.Integer(), nullable=False),
+        sa.Column("total_citations", sa.BigInteger(), nullable=False),
+        sa.Column("first_year", sa.Integer(), nullable=True),
+        sa.Column("last_year", sa.Integer(), nullable=True),
+        sa.PrimaryKeyConstraint("scope", "author_id"),
+    )
+    op.create_index("idx_author_stats_author", "author_stats", ["author_id"])
+    op.create_index("idx_author_stats_papers", "author_stats", ["scope", "paper_count"])
+    op.create_index("idx_author_stats_citations", "author_stats", ["scope", "total_citations"])
+
+    op.create_table(
+        "coauthor_edges",
+        sa.Column("scope", sa.String(50), nullable=False),
+        sa.Column(
+            "source_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("authors.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column(
+            "target_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("authors.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("weight", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("scope", "source_id", "target_id"),
+    )
+    op.create_index("idx_coauthor_edges_weight", "coauthor_edges", ["scope", "weight"])
+    op.create_index("idx_coauthor_edges_source", "coauthor_edges", ["source_id"])
+    op.create_index("idx_coauthor_edges_target", "coauthor_edges", ["target_id"])
+
+
+def upgrade() -> None:
+    op.create_table(
+        "authors",
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("name_key", sa.Text(), nullable=False),
+        sa.Column("name", sa.Text(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.text("now()"), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("name_key", name="authors_name_key_key"),
+    )
+
+    # Aggregates keyed by name are replaced by ones keyed by author id
+    op.drop_table("coauthor_edges")
+    op.drop_table("author_stats")
+    _create_author_aggregates()
+    op.execute(f"TRUNCATE {', '.join(ANALYTICS_TABLES)}")
+    op.add_column(
+        "paper_analytics_sync",
+        sa.Column("author_ids", postgresql.ARRAY(postgresql.UUID(as_uuid=True)), nullable=True),
+    )
+    op.add_column(
+        "paper_analytics_sync",
+        sa.Column("affiliations", postgresql.ARRAY(sa.Text()), nullable=True),
+    )
+
+    op.execute("TRUNCATE paper_authors")
+    op.drop_index("idx_paper_authors_name", table_name="paper_authors")
+    op.add_column(
+        "paper_authors",
+        sa.Column(
+            "author_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("authors.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+    )
+    _backfill()
+    op.create_index("idx_paper_authors_author", "paper_authors", ["author_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("idx_paper_authors_author", table_name="paper_authors")
+    op.drop_column("paper_authors", "author_id")
+    op.create_index("idx_paper_authors_name", "paper_authors", ["name"])
+
+    op.drop_column("paper_analytics_sync", "affiliations")
+    op.drop_column("paper_analytics_sync", "author_ids")
+    op.execute(f"TRUNCATE paper_authors, {', '.join(ANALYTICS_TABLES)}")
+
+    op.drop_table("coauthor_edges")
+    op.drop_table("author_stats")
+    op.create_table(
+        "author_stats",
+        sa.Column("scope", sa.String(50), nullable=False),
+        sa.Column("name", sa.Text(), nullable=False),
+        sa.Column("affiliation", sa.Text(), nullable=True),
+        sa.Column("paper_count", sa.Integer(), nullable=False),
+        sa.Column("total_citations", sa.BigInteger(), nullable=False),
+        sa.Column("first_year", sa.Integer(), nullable=True),
+        sa.Column("last_year", sa.Integer(), nullable=True),
+        sa.PrimaryKeyConstraint("scope", "name"),
+    )
+    op.create_index("idx_author_stats_name", "author_stats", ["name"])
+    op.create_index("idx_author_stats_papers", "author_stats", ["scope", "paper_count"])
+    op.create_index("idx_author_stats_citations", "author_stats", ["scope", "total_citations"])
+    op.create_table(
+        "coauthor_edges",
+        sa.Column("scope", sa.String(50), nullable=False),
+        sa.Column("source", sa.Text(), nullable=False),
+        sa.Column("target", sa.Text(), nullable=False),
+        sa.Column("weight", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("scope", "source", "target"),
+    )
+    op.create_index("idx_coauthor_edges_weight", "coauthor_edges", ["scope", "weight"])
+    op.create_index("idx_coauthor_edges_source", "coauthor_edges", ["source"])
+    op.create_index("idx_coauthor_edges_target", "coauthor_edges", ["target"])
+
+    op.drop_table("authors")
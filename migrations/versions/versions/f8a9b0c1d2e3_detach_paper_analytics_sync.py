@@ -0,0 +1,39 @@
+"""drop the papers foreign key from paper_analytics_sync
+
+Revision ID: f8a9b0c1d2e3
+Revises: e7f8a9b0c1d2
+Create Date: 2026-10-17 22:00:00.000000
+
+A deleted paper's sync row has to outlive it: the analytics refresh
+subtracts the snapshot from the counters and then removes the row.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f8a9b0c1d2e3"
+down_revision: Union[str, None] = "e7f8a9b0c1d2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_constraint(
+        "paper_analytics_sync_paper_id_fkey", "paper_analytics_sync", type_="foreignkey"
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        "DELETE FROM paper_analytics_sync s "
+        "WHERE NOT EXISTS (SELECT 1 FROM papers p WHERE p.id = s.paper_id)"
+    )
+    op.create_foreign_key(
+        "paper_analytics_sync_paper_id_fkey",
+        "paper_analytics_sync",
+        "papers",
+        ["paper_id"],
+        ["id"],
+        ondelete="CASCADE",
+    )
@@ -0,0 +1,90 @@
+"""Parity and throughput of the embedding backends against the fp32 reference.
+
+For every backend, embeds the same corpus as ``torch`` (fp32) and reports
+the mean/min cosine similarity to the reference vectors plus texts/sec.
+Exits non-zero if any backend's minimum cosine falls below --min-cosine,
+so it can gate a switch of ``EMBEDDING_BACKEND``.
+
+Run inside Docker:  docker compose exec worker python -m scripts.bench_embeddings
+Only some backends: python -m scripts.bench_embeddings --backends torch onnx-int8
+"""
+
+import argparse
+import sys
+import time
+
+import numpy as np
+
+from src.processors.embedding import EMBEDDING_BACKENDS, EmbeddingGenerator
+
+SAMPLE_TEXTS = [
+    "Attention Is All You Need\n\nThe dominant sequence transduction models are based on "
+    "complex recurrent or convolutional neural networks that include an encoder and a decoder.",
+    "LoRA: Low-Rank Adaptation of Large Language Models",
+    "huggingface/transformers\n\nState-of-the-art Machine Learning for PyTorch, TensorFlow, "
+    "and JAX.",
+    "retrieval augmented generation with hybrid dense and sparse search",
+    "Denoising diffusion probabilistic models for high fidelity image synthesis",
+    "graph neural networks for molecular property prediction",
+    "A fast, memory-efficient exact attention kernel with IO-awareness",
+    "ggerganov/llama.cpp\n\nLLM inference in C/C++",
+    "speech recognition for low-resource languages with self-supervised pretraining",
+    "Reinforcement learning from human feedback aligns language models with user intent.",
+]
+
+
+def _corpus(size: int) -> list[str]:
+    # Vary each text so the embedding cache and tokenizer caching cannot help
+    return [f"{SAMPLE_TEXTS[i % len(SAMPLE_TEXTS)]} ({i})" for i in range(size)]
+
+
+def _run(backend: str, texts: list[str], batch_size: int) -> tuple[np.ndarray, float]:
+    generator = EmbeddingGenerator(use_cache=False, backend=backend)
+    generator.embed_batch(texts[:batch_size], batch_size=batch_size)  # load + warm up
+
+    start = time.perf_counter()
+    vectors = generator.embed_batch(texts, batch_size=batch_size)
+    elapsed = time.perf_counter() - start
+    return np.asarray(vectors, dtype=np.float32), len(texts) / elapsed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--backends", nargs="+", default=list(EMBEDDING_BACKENDS))
+    parser.add_argument("--texts", type=int, default=512, help="corpus size")
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--min-cosine", type=float, default=0.99)
+    args = parser.parse_args()
+
+    texts = _corpus(args.texts)
+    reference, reference_rate = _run("torch", texts, args.batch_size)
+
+    print(f"{'backend':<12} {'texts/s':>9} {'speedup':>8} {'cos mean':>9} {'cos min':>9}")
+    print(f"{'torch':<12} {reference_rate:>9.1f} {1.0:>7.2f}x {1.0:>9.4f} {1.0:>9.4f}")
+
+    failed = []
+    for backend in args.backends:
+        if backend == "torch":
+            continue
+        try:
+            vectors, rate = _run(backend, texts, args.batch_size)
+        except Exception as e:
+            print(f"{backend:<12} unavailable: {e}")
+            continue
+        # Both sides are L2-normalized, so the row-wise dot product is the cosine
+        cosines = (vectors * reference).sum(axis=1)
+        print(
+            f"{backend:<12} {rate:>9.1f} {rate / reference_rate:>7.2f}x "
+            f"{cosines.mean():>9.4f} {cosines.min():>9.4f}"
+        )
+        if cosines.min() < args.min_cosine:
+            failed.append(backend)
+
+    if failed:
+        print(f"Parity below {args.min_cosine}: {', '.join(failed)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,169 @@
+"""Benchmark retrieval latency, before vs after, over the same query set.
+
+``--mode dense`` (default): "before" reproduces the old HybridRetriever
+loop (blocking QdrantClient, one collection after another, called from the
+event loop); "after" uses AsyncVectorStore.search_many.
+
+``--mode sparse``: "before" is the old keyword fallback, PostgreSQL
+``ILIKE '%query%'`` over paper titles, abstracts and arXiv IDs; "after" is
+a BM25 search of the ``papers`` sparse companion collection.
+
+Requests arrive on a fixed schedule (RATE per
+second, at most CONCURRENCY in flight) and each latency is counted from the
+request's scheduled arrival, so time spent waiting for a blocked event loop
+or a free slot is included, as a client of the API would see it.
+
+Run inside Docker:  docker compose exec app python -m scripts.bench_retrieval
+Run on host:        QDRANT_URL=http://localhost:6333 python -m scripts.bench_retrieval
+Lexical:            docker compose exec app python -m scripts.bench_retrieval --mode sparse
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from sqlalchemy import or_, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.processors.embedding import EmbeddingGenerator
+from src.processors.sparse import BM25SparseEncoder
+from src.storage.database import async_session_factory
+from src.storage.models.paper import Paper
+from src.storage.vector.qdrant_client import AsyncVectorStore, VectorStore
+
+COLLECTIONS = ["papers", "repositories", "chunks"]
+
+QUERIES = [
+    "retrieval augmented generation",
+    "vision transformer image classification",
+    "reinforcement learning from human feedback",
+    "graph neural network molecules",
+    "diffusion models text to image",
+    "efficient attention long context",
+    "speech recognition low resource languages",
+    "code generation large language models",
+    # Exact identifiers, the case the keyword path exists for
+    "2401.04088",
+    "LoRA",
+    "FlashAttention",
+    "bge-base-en-v1.5",
+]
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    idx = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[idx]
+
+
+async def _sequential(store: VectorStore, vector: list[float], top_k: int) -> None:
+    for collection in COLLECTIONS:
+        store.search(collection=collection, query_vector=vector, limit=top_k)
+
+
+async def _fan_out(store: AsyncVectorStore, vector: list[float], top_k: int) -> None:
+    await store.search_many(collections=COLLECTIONS, query_vector=vector, limit=top_k)
+
+
+async def _ilike(
+    session_factory: async_sessionmaker[AsyncSession], query: str, top_k: int
+) -> None:
+    # The `%term%` clause PaperRepository._build_filters used to apply
+    term = f"%{query}%"
+    async with session_factory() as session:
+        await session.execute(
+            select(Paper.id)
+            .where(
+                or_(Paper.title.ilike(term), Paper.abstract.ilike(term), Paper.arxiv_id.ilike(term))
+            )
+            .limit(top_k)
+        )
+
+
+_encoder = BM25SparseEncoder()
+
+
+async def _bm25(store: AsyncVectorStore, query: str, top_k: int) -> None:
+    indices, values = _encoder.encode_query(query)
+    await store.search_sparse(collection="papers", indices=indices, values=values, limit=top_k)
+
+
+async def _measure(
+    fn, store, inputs, requests: int, concurrency: int, rate: float, top_k: int
+) -> list[float]:
+    latencies: list[float] = []
+    semaphore = asyncio.Semaphore(concurrency)
+    t0 = time.perf_counter()
+
+    async def one(i: int) -> None:
+        # Scheduled arrival, not when this task got to run: a sync search
+        # blocks the loop, and the requests queued behind it must pay for it
+        start = t0 + i / rate
+        await asyncio.sleep(max(0.0, start - time.perf_counter()))
+        async with semaphore:
+            await fn(store, inputs[i % len(inputs)], top_k)
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    await asyncio.gather(*(one(i) for i in range(requests)))
+    return latencies
+
+
+def _report(name: str, latencies: list[float]) -> None:
+    print(
+        f"{name:<12} n={len(latencies):<5} "
+        f"p50={statistics.median(latencies):8.1f} ms  "
+        f"p99={_percentile(latencies, 99):8.1f} ms  "
+        f"max={max(latencies):8.1f} ms"
+    )
+
+
+async def _dense(requests: int, concurrency: int, rate: float, top_k: int) -> None:
+    vectors = EmbeddingGenerator().embed_batch(QUERIES)
+    sync_store = VectorStore()
+    async_store = AsyncVectorStore()
+
+    # Warm up connections on both clients
+    await _sequential(sync_store, vectors[0], top_k)
+    await _fan_out(async_store, vectors[0], top_k)
+
+    before = await _measure(_sequential, sync_store, vectors, requests, concurrency, rate, top_k)
+    after = await _measure(_fan_out, async_store, vectors, requests, concurrency, rate, top_k)
+
+    print(f"collections={COLLECTIONS} top_k={top_k} concurrency={concurrency} rate={rate}/s")
+    _report("before", before)
+    _report("after", after)
+    await async_store.close()
+
+
+async def _sparse(requests: int, concurrency: int, rate: float, top_k: int) -> None:
+    async_store = AsyncVectorStore()
+
+    await _ilike(async_session_factory, QUERIES[0], top_k)
+    await _bm25(async_store, QUERIES[0], top_k)
+
+    before = await _measure(
+        _ilike, async_session_factory, QUERIES, requests, concurrency, rate, top_k
+    )
+    after = await _measure(_bm25, async_store, QUERIES, requests, concurrency, rate, top_k)
+
+    print(f"queries={len(QUERIES)} top_k={top_k} concurrency={concurrency} rate={rate}/s")
+    _report("ilike", before)
+    _report("bm25", after)
+    await async_store.close()
+
+
+async def main(mode: str, requests: int, concurrency: int, rate: float, top_k: int) -> None:
+    bench = _sparse if mode == "sparse" else _dense
+    await bench(requests, concurrency, rate, top_k)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--mode", choices=["dense", "sparse"], default="dense")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--rate", type=float, default=50.0, help="Requests per second")
+    parser.add_argument("--top-k", type=int, default=10)
+    args = parser.parse_args()
+    asyncio.run(main(args.mode, args.requests, args.concurrency, args.rate, args.top_k))
@@ -0,0 +1,54 @@
+"""Backfill the BM25 sparse collections from points already in Qdrant.
+
+New points get their sparse vector whenever their dense vector is written
+(``upsert_batch``); this covers everything embedded before the lexical
+index existed. Text is rebuilt from payloads,
+so no database access or re-embedding is needed.
+
+Run inside Docker:  docker compose exec worker python -m scripts.build_sparse_index
+"""
+
+from src.core.logging import get_logger, setup_logging
+from src.processors.sparse import BM25SparseEncoder, payload_lexical_text
+from src.storage.vector.qdrant_client import SPARSE_COLLECTIONS, VectorStore
+
+logger = get_logger(__name__)
+SCROLL_SIZE = 512
+
+
+def backfill(vector_store: VectorStore, encoder: BM25SparseEncoder, collection: str) -> int:
+    total = 0
+    offset = None
+    while True:
+        records, offset = vector_store.client.scroll(
+            collection_name=collection,
+            limit=SCROLL_SIZE,
+            offset=offset,
+            with_payload=True,
+            with_vectors=False,
+        )
+        points = [
+            encoder.to_point(
+                {"id": r.id, "payload": r.payload or {}}, payload_lexical_text(r.payload or {})
+            )
+            for r in records
+        ]
+        vector_store.upsert_sparse_batch(collection=collection, points=points)
+        total += len(points)
+        logger.info("Backfilled sparse batch", collection=collection, total=total)
+        if offset is None:
+            return total
+
+
+def main():
+    setup_logging()
+    vector_store = VectorStore()
+    vector_store.init_collections()
+    encoder = BM25SparseEncoder()
+    for collection in SPARSE_COLLECTIONS:
+        count = backfill(vector_store, encoder, collection)
+        print(f"{collection}: indexed {count} points")
+
+
+if __name__ == "__main__":
+    main()
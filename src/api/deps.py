@@ -2,7 +2,7 @@
 
 from typing import Annotated, Generic, TypeVar
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Query, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from pydantic import BaseModel
 from sqlalchemy import select
@@ -11,6 +11,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.core.config import Settings, get_settings
 from src.core.security import decode_token
 from src.storage.database import get_session
+from src.storage.repositories.pagination import CountMode, Page
 
 T = TypeVar("T")
 
@@ -22,6 +23,20 @@ class PaginatedResponse(BaseModel, Generic[T]):
     total: int
     skip: int
     limit: int
+    # Pass back as ``cursor`` for the next page; None on the last page
+    next_cursor: str | None = None
+    total_is_estimate: bool = False
+
+    @classmethod
+    def from_page(cls, page: Page, items: list, skip: int, limit: int) -> "PaginatedResponse":
+        return cls(
+            items=items,
+            total=page.total,
+            skip=skip,
+            limit=limit,
+            next_cursor=page.next_cursor,
+            total_is_estimate=page.total_is_estimate,
+        )
 
 
 async def get_db() -> AsyncSession:
@@ -75,6 +90,14 @@ async def get_optional_user(
     return user
 
 
+CursorParam = Annotated[
+    str | None, Query(description="Opaque cursor from the previous page's next_cursor")
+]
+CountParam = Annotated[
+    CountMode,
+    Query(description="exact: COUNT(*) per request; estimate: table statistics or a cached count"),
+]
+
 SettingsDep = Annotated[Settings, Depends(get_config)]
 DbSession = Annotated[AsyncSession, Depends(get_db)]
 get_current_user_dep = Annotated[object, Depends(get_current_user)]
@@ -1,6 +1,10 @@
+import json
 import uuid
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
@@ -18,29 +22,34 @@ from src.api.schemas.document_chat import ConversationDocumentsUpdate
 from src.api.schemas.search import ChatRequest, ChatResponse
 from src.core.config import get_settings
 from src.llm.router import LLMRouter
-from src.processors.embedding import EmbeddingGenerator
+from src.processors.embedding_service import get_embedding_service
+from src.rag.answer_cache import get_answer_cache
 from src.rag.generator import AnswerGenerator
-from src.rag.pipeline import RAGPipeline
-from src.rag.reranker import CrossEncoderReranker
+from src.rag.pipeline import RAGPipeline, StreamEvent
+from src.rag.reranker import get_reranker
 from src.rag.retriever import HybridRetriever
+from src.storage.database import async_session_factory
 from src.storage.models.conversation import ChatMessage, Conversation
 from src.storage.models.conversation_document import ConversationDocument
 from src.storage.models.document import Document
 from src.storage.models.document_embedding import DocumentEmbedding
 from src.storage.models.user import User
-from src.storage.vector.qdrant_client import VectorStore
+from src.storage.vector.qdrant_client import get_async_vector_store
 
 router = APIRouter(prefix="/chat", tags=["RAG Chat"])
 
+LLM_UNAVAILABLE_ANSWER = "The language model is currently unavailable. Please try again later."
+
 
 def _get_rag_pipeline() -> RAGPipeline:
-    vector_store = VectorStore()
-    embedding_gen = EmbeddingGenerator()
-    retriever = HybridRetriever(vector_store, embedding_gen)
-    reranker = CrossEncoderReranker()
+    retriever = HybridRetriever(get_async_vector_store(), get_embedding_service())
+    reranker = get_reranker()
     llm = LLMRouter()
     generator = AnswerGenerator(llm)
-    return RAGPipeline(retriever, reranker, generator, llm_client=llm)
+    answer_cache = get_answer_cache() if get_settings().RAG_CACHE_ENABLED else None
+    return RAGPipeline(
+        retriever, reranker, generator, llm_client=llm, answer_cache=answer_cache
+    )
 
 
 @router.post("/", response_model=ChatResponse)
@@ -59,6 +68,14 @@ async def chat(request: ChatRequest):
     )
 
 
+@router.get("/cache/stats")
+async def answer_cache_stats():
+    """Hit rate and latency saved by the semantic answer cache in this process."""
+    if not get_settings().RAG_CACHE_ENABLED:
+        return {"enabled": False}
+    return {"enabled": True, **get_answer_cache().stats()}
+
+
 # ── Conversation CRUD (requires auth) ──
 
 
@@ -237,7 +254,7 @@ async def send_conversation_message(
         from src.rag.pipeline import RAGResponse
 
         rag_response = RAGResponse(
-            answer="The language model is currently unavailable. Please try again later.",
+            answer=LLM_UNAVAILABLE_ANSWER,
             sources=[],
             confidence=0.0,
         )
@@ -276,6 +293,119 @@ async def send_conversation_message(
     ]
 
 
+@router.post("/conversations/{conversation_id}/messages/stream")
+async def stream_conversation_message(
+    conversation_id: uuid.UUID,
+    body: ConversationMessageRequest,
+    user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """Server-sent events variant of ``send_conversation_message``.
+
+    Emits ``sources`` as soon as retrieval finishes, then ``token`` (and
+    ``citation``) events as the answer is generated, and a final ``done``
+    event carrying the persisted assistant message.
+    """
+    result = await db.execute(
+        select(Conversation).where(
+            Conversation.id == conversation_id, Conversation.user_id == user.id
+        )
+    )
+    conv = result.scalar_one_or_none()
+    if not conv:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Conversation not found")
+
+    if not conv.title:
+        conv.title = body.question[:100]
+
+    db.add(
+        ChatMessage(
+            conversation_id=conv.id,
+            role="user",
+            content=body.question,
+        )
+    )
+
+    rag = _get_rag_pipeline()
+    if conv.chat_mode == "documents" and conv.context_mode == "full_context":
+        # Loaded inside the stream, so a failure still ends in an SSE error event
+        events = _full_context_events(rag, body.question, str(user.id), conv.id)
+    elif conv.chat_mode == "documents":
+        events = rag.query_stream(
+            question=body.question,
+            filters={"user_id": str(user.id)},
+            collections=["user_docs"],
+        )
+    else:
+        events = rag.query_stream(question=body.question, filters=body.filters)
+
+    # The request session may be closed before the stream finishes
+    await db.commit()
+
+    return StreamingResponse(
+        _sse_stream(conv.id, events),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def _sse(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+async def _sse_stream(
+    conversation_id: uuid.UUID, events: AsyncIterator[StreamEvent]
+) -> AsyncIterator[str]:
+    """Relay pipeline events as SSE and persist the assistant message at the end."""
+    from src.core.logging import get_logger
+
+    logger = get_logger(__name__)
+
+    answer_parts: list[str] = []
+    sources: list[dict] = []
+    citations: list[dict] = []
+    confidence = 0.0
+    try:
+        async for event in events:
+            if event.event == "done":
+                citations = event.data.get("citations", [])
+                continue
+            if event.event == "sources":
+                sources = event.data["sources"]
+                confidence = event.data["confidence"]
+            elif event.event == "token":
+                answer_parts.append(event.data["text"])
+            yield _sse(event.event, event.data)
+    except Exception as e:
+        logger.error("Streaming answer generation failed", error=str(e))
+        if not answer_parts:
+            answer_parts.append(LLM_UNAVAILABLE_ANSWER)
+            yield _sse("token", {"text": LLM_UNAVAILABLE_ANSWER})
+        yield _sse("error", {"detail": "Answer generation was interrupted"})
+
+    async with async_session_factory() as session:
+        assistant_msg = ChatMessage(
+            conversation_id=conversation_id,
+            role="assistant",
+            content="".join(answer_parts),
+            citations=sources,
+            confidence=confidence,
+        )
+        session.add(assistant_msg)
+        await session.commit()
+        await session.refresh(assistant_msg)
+
+    message = ChatMessageResponse(
+        id=str(assistant_msg.id),
+        role=assistant_msg.role,
+        content=assistant_msg.content,
+        citations=assistant_msg.citations,
+        confidence=assistant_msg.confidence,
+        created_at=assistant_msg.created_at,
+    )
+    yield _sse("done", {"message": message.model_dump(mode="json"), "citations": citations})
+
+
 async def _query_document_mode(rag: RAGPipeline, question: str, user_id: str):
     """Query RAG pipeline in document mode — only search user_docs collection."""
     from src.core.logging import get_logger
@@ -360,18 +490,29 @@ Answer:"""
 FULL_CONTEXT_CHAR_LIMIT = 100_000
 
 
-async def _query_full_context_mode(
-    rag: RAGPipeline,
+@dataclass
+class _FullContext:
+    prompt: str | None = None
+    sources: list[dict] = field(default_factory=list)
+    truncated: bool = False
+    error_answer: str | None = None
+
+
+FULL_CONTEXT_TRUNCATED_NOTE = (
+    "\n\n*Note: Document content was truncated due to size limits. "
+    "Consider using RAG mode for large documents.*"
+)
+
+
+async def _load_full_context(
     question: str,
     user_id: str,
     conversation_id: uuid.UUID,
     db: AsyncSession,
-):
-    """Query LLM with full document content instead of RAG retrieval."""
+) -> _FullContext:
+    """Read the conversation's documents and build the full-context prompt."""
     from src.core.logging import get_logger
-    from src.rag.pipeline import RAGResponse
-    from src.services.file_storage import FileStorageService
-    from src.services.text_extractor import TextExtractor
+    from src.services.document_text import DocumentTextService
 
     logger = get_logger(__name__)
 
@@ -406,15 +547,12 @@ async def _query_full_context_mode(
         doc_ids = fallback_result.scalars().all()
 
         if not doc_ids:
-            return RAGResponse(
-                answer="No documents are attached to this conversation. Please add documents via 'Manage Sources' first.",
-                sources=[],
-                confidence=0.0,
+            return _FullContext(
+                error_answer="No documents are attached to this conversation. Please add documents via 'Manage Sources' first.",
             )
 
-    # 2. Load documents and read file content
-    file_storage = FileStorageService()
-    extractor = TextExtractor()
+    # 2. Load documents and their extracted text (parsed once, then cached)
+    document_texts = DocumentTextService()
     context_parts = []
     sources = []
 
@@ -429,20 +567,7 @@ async def _query_full_context_mode(
             continue
 
         try:
-            abs_path = file_storage.get_absolute_path(doc.storage_path)
-            logger.info(
-                "Reading document for full context",
-                document_id=str(doc_id),
-                path=abs_path,
-                content_type=doc.content_type,
-            )
-
-            import os
-            if not os.path.exists(abs_path):
-                errors.append(f"{doc.original_filename}: file not found at {abs_path}")
-                continue
-
-            content = extractor.extract(abs_path, doc.content_type)
+            content = await document_texts.get_text(db, doc)
             if not content or not content.strip():
                 errors.append(f"{doc.original_filename}: extracted text is empty")
                 continue
@@ -455,6 +580,8 @@ async def _query_full_context_mode(
                 "url": None,
                 "relevance_score": 1.0,
             })
+        except FileNotFoundError:
+            errors.append(f"{doc.original_filename}: file not found")
         except Exception as e:
             logger.error(
                 "Failed to read document for full context",
@@ -467,10 +594,8 @@ async def _query_full_context_mode(
 
     if not context_parts:
         error_detail = "\n".join(f"- {e}" for e in errors) if errors else "Unknown error"
-        return RAGResponse(
-            answer=f"Could not read any of the attached documents.\n\nErrors:\n{error_detail}",
-            sources=[],
-            confidence=0.0,
+        return _FullContext(
+            error_answer=f"Could not read any of the attached documents.\n\nErrors:\n{error_detail}",
         )
 
     # 3. Join and truncate
@@ -480,19 +605,63 @@ async def _query_full_context_mode(
         full_context = full_context[:FULL_CONTEXT_CHAR_LIMIT]
         truncated = True
 
-    # 4. Build prompt and call LLM
     prompt = FULL_CONTEXT_PROMPT.format(context=full_context, question=question)
+    return _FullContext(prompt=prompt, sources=sources, truncated=truncated)
+
+
+async def _query_full_context_mode(
+    rag: RAGPipeline,
+    question: str,
+    user_id: str,
+    conversation_id: uuid.UUID,
+    db: AsyncSession,
+):
+    """Query LLM with full document content instead of RAG retrieval."""
+    from src.core.logging import get_logger
+    from src.rag.pipeline import RAGResponse
+
+    logger = get_logger(__name__)
+
+    full_context = await _load_full_context(question, user_id, conversation_id, db)
+    if full_context.error_answer:
+        return RAGResponse(answer=full_context.error_answer, sources=[], confidence=0.0)
 
     try:
-        answer = await rag.generator.llm.generate(prompt, max_tokens=2000, temperature=0.3)
+        answer = await rag.generator.llm.generate(
+            full_context.prompt, max_tokens=2000, temperature=0.3
+        )
     except Exception as e:
         logger.error("LLM generation failed in full context mode", error=str(e))
-        answer = "The language model is currently unavailable. Please try again later."
-
-    if truncated:
-        answer += "\n\n*Note: Document content was truncated due to size limits. Consider using RAG mode for large documents.*"
-
-    return RAGResponse(answer=answer, sources=sources, confidence=1.0)
+        answer = LLM_UNAVAILABLE_ANSWER
+
+    if full_context.truncated:
+        answer += FULL_CONTEXT_TRUNCATED_NOTE
+
+    return RAGResponse(answer=answer, sources=full_context.sources, confidence=1.0)
+
+
+async def _full_context_events(
+    rag: RAGPipeline, question: str, user_id: str, conversation_id: uuid.UUID
+) -> AsyncIterator[StreamEvent]:
+    """Streaming counterpart of ``_query_full_context_mode``.
+
+    Runs after the request's session is closed, so it loads the documents
+    with a session of its own.
+    """
+    async with async_session_factory() as session:
+        full_context = await _load_full_context(question, user_id, conversation_id, session)
+    if full_context.error_answer:
+        yield StreamEvent("sources", {"sources": [], "confidence": 0.0})
+        yield StreamEvent("token", {"text": full_context.error_answer})
+        return
+
+    yield StreamEvent("sources", {"sources": full_context.sources, "confidence": 1.0})
+    async for chunk in rag.generator.llm.generate_stream(
+        full_context.prompt, max_tokens=2000, temperature=0.3
+    ):
+        yield StreamEvent("token", {"text": chunk})
+    if full_context.truncated:
+        yield StreamEvent("token", {"text": FULL_CONTEXT_TRUNCATED_NOTE})
 
 
 @router.patch(
@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Query
 
-from src.api.deps import DbSession, PaginatedResponse
+from src.api.deps import CountParam, CursorParam, DbSession, PaginatedResponse
 from src.api.schemas.community import (
     CommunityFiltersResponse,
     CommunityPostResponse,
@@ -33,11 +33,14 @@ async def get_community_posts(
     sort_order: str = Query("desc"),
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
+    cursor: CursorParam = None,
+    count: CountParam = "exact",
 ):
     repo = CommunityPostRepository(db)
-    posts, total = await repo.list_posts(
+    page = await repo.list_posts(
         skip=skip, limit=limit, platform=platform,
         search=search, tag=tag, sort_by=sort, sort_order=sort_order,
+        cursor=cursor, count=count,
     )
     items = [
         CommunityPostResponse(
@@ -56,9 +59,9 @@ async def get_community_posts(
             language=p.language,
             published_at=str(p.published_at) if p.published_at else None,
         )
-        for p in posts
+        for p in page.items
     ]
-    return PaginatedResponse(items=items, total=total, skip=skip, limit=limit)
+    return PaginatedResponse.from_page(page, items, skip, limit)
 
 
 @router.get("/posts/filters", response_model=CommunityFiltersResponse)
@@ -110,11 +113,14 @@ async def get_discussions(
     sort_order: str = Query("desc"),
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
+    cursor: CursorParam = None,
+    count: CountParam = "exact",
 ):
     repo = GitHubDiscussionRepository(db)
-    discussions, total = await repo.list_discussions(
+    page = await repo.list_discussions(
         skip=skip, limit=limit, repo=repo_name,
         category=category, search=search, sort_by=sort, sort_order=sort_order,
+        cursor=cursor, count=count,
     )
     items = [
         GitHubDiscussionResponse(
@@ -132,9 +138,9 @@ async def get_discussions(
             answer_chosen=d.answer_chosen,
             published_at=str(d.published_at) if d.published_at else None,
         )
-        for d in discussions
+        for d in page.items
     ]
-    return PaginatedResponse(items=items, total=total, skip=skip, limit=limit)
+    return PaginatedResponse.from_page(page, items, skip, limit)
 
 
 @router.get("/discussions/filters", response_model=DiscussionFiltersResponse)
@@ -173,11 +179,14 @@ async def get_openreview_notes(
     sort_order: str = Query("desc"),
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
+    cursor: CursorParam = None,
+    count: CountParam = "exact",
 ):
     repo = OpenReviewRepository(db)
-    notes, total = await repo.list_notes(
+    page = await repo.list_notes(
         skip=skip, limit=limit, venue=venue, primary_area=primary_area,
         search=search, min_rating=min_rating, sort_by=sort, sort_order=sort_order,
+        cursor=cursor, count=count,
     )
     items = [
         OpenReviewResponse(
@@ -198,9 +207,9 @@ async def get_openreview_notes(
             paper_id=str(n.paper_id) if n.paper_id else None,
             published_at=str(n.published_at) if n.published_at else None,
         )
-        for n in notes
+        for n in page.items
     ]
-    return PaginatedResponse(items=items, total=total, skip=skip, limit=limit)
+    return PaginatedResponse.from_page(page, items, skip, limit)
 
 
 @router.get("/openreview/filters", response_model=OpenReviewFiltersResponse)
@@ -19,9 +19,7 @@ from src.api.schemas.document_chat import (
     RepoEmbedRequest,
 )
 from src.core.logging import get_logger
-from src.processors.embedding import EmbeddingGenerator
-from src.services.file_storage import FileStorageService
-from src.services.text_extractor import SUPPORTED_TYPES, TextExtractor
+from src.services.text_extractor import SUPPORTED_TYPES
 from src.storage.models.bookmark import Bookmark
 from src.storage.models.document import Document
 from src.storage.models.document_embedding import DocumentEmbedding
@@ -29,76 +27,86 @@ from src.storage.models.folder import Folder
 from src.storage.models.paper import Paper
 from src.storage.models.repository import Repository
 from src.storage.models.user import User
-from src.storage.vector.qdrant_client import VectorStore
 
 logger = get_logger(__name__)
 
 router = APIRouter(prefix="/chat/documents", tags=["Document Chat"])
 
-file_storage = FileStorageService()
-text_extractor = TextExtractor()
 
+def _safe_filename(name: str, max_len: int | None = None) -> str:
+    return "".join(c if c.isalnum() or c in " -_" else "_" for c in name[:max_len])
 
-async def _download_paper_pdf(
-    paper: Paper,
-    user: User,
-    folder_id: uuid.UUID,
-    db: AsyncSession,
-) -> Document | None:
-    """Download a paper's PDF from pdf_url and save as a Document."""
-    import httpx
 
-    if not paper.pdf_url:
-        return None
+async def _bookmark_folder(
+    user: User, item_type: str, item_id: uuid.UUID, db: AsyncSession
+) -> uuid.UUID | None:
+    """Folder holding the user's bookmark of an item, else their first folder."""
+    bm_result = await db.execute(
+        select(Bookmark.folder_id).where(
+            Bookmark.user_id == user.id,
+            Bookmark.item_type == item_type,
+            Bookmark.item_id == item_id,
+        ).limit(1)
+    )
+    folder_id = bm_result.scalar_one_or_none()
+    if folder_id:
+        return folder_id
+    first_folder_result = await db.execute(
+        select(Folder.id).where(Folder.user_id == user.id).limit(1)
+    )
+    return first_folder_result.scalar_one_or_none()
 
-    try:
-        async with httpx.AsyncClient(follow_redirects=True, timeout=60.0) as client:
-            response = await client.get(paper.pdf_url)
-            response.raise_for_status()
-            content = response.content
 
-        if len(content) < 100:  # too small to be a real PDF
-            logger.warning("Downloaded PDF too small", paper_id=str(paper.id), size=len(content))
-            return None
+async def _owned_document(doc_id: uuid.UUID, user: User, db: AsyncSession) -> Document | None:
+    result = await db.execute(
+        select(Document).where(Document.id == doc_id, Document.user_id == user.id)
+    )
+    return result.scalar_one_or_none()
 
-        doc_id = uuid.uuid4()
-        # Sanitize filename from paper title
-        safe_title = "".join(c if c.isalnum() or c in " -_" else "_" for c in paper.title[:80])
-        filename = f"{safe_title}.pdf"
 
-        storage_path = file_storage.save_file(
-            user_id=user.id,
-            document_id=doc_id,
-            filename=filename,
-            content=content,
-        )
+async def _queue_embedding(
+    doc: Document, user: User, db: AsyncSession, queue: list[str]
+) -> DocumentEmbedStatus:
+    """Mark ``doc`` pending and add it to ``queue`` unless embedded or already queued.
 
-        document = Document(
-            id=doc_id,
-            user_id=user.id,
-            folder_id=folder_id,
-            filename=filename,
-            original_filename=filename,
-            content_type="application/pdf",
-            file_size=len(content),
-            storage_path=storage_path,
-            note=f"paper:{paper.id}",  # link back to paper
+    ``chunk_count`` is left as is so an interrupted job resumes where it stopped.
+    A document that is pending or processing already has a job; requesting
+    it again reports that job's progress instead of starting a second one.
+    """
+    emb_result = await db.execute(
+        select(DocumentEmbedding).where(DocumentEmbedding.document_id == doc.id)
+    )
+    emb = emb_result.scalar_one_or_none()
+    if emb and emb.status in ("completed", "pending", "processing"):
+        return DocumentEmbedStatus(
+            document_id=str(doc.id),
+            status=emb.status,
+            chunk_count=emb.chunk_count,
+            total_chunks=emb.total_chunks,
         )
-        db.add(document)
-        await db.flush()
-        await db.refresh(document)
 
-        logger.info(
-            "Downloaded paper PDF",
-            paper_id=str(paper.id),
-            document_id=str(doc_id),
-            size=len(content),
-        )
-        return document
+    if not emb:
+        emb = DocumentEmbedding(document_id=doc.id, user_id=user.id, chunk_count=0)
+        db.add(emb)
+    emb.status = "pending"
+    emb.error_message = None
+    await db.flush()
+    queue.append(str(doc.id))
+    return DocumentEmbedStatus(
+        document_id=str(doc.id),
+        status="pending",
+        chunk_count=emb.chunk_count,
+        total_chunks=emb.total_chunks,
+    )
 
-    except Exception as e:
-        logger.error("Failed to download paper PDF", paper_id=str(paper.id), error=str(e))
-        return None
+
+async def _enqueue(queue: list[str], db: AsyncSession) -> None:
+    """Commit the pending records, then hand the documents to the processing queue."""
+    from src.workers.tasks.processing import embed_document
+
+    await db.commit()
+    for document_id in queue:
+        embed_document.delay(document_id)
 
 
 @router.post("/embed", response_model=DocumentEmbedResponse)
@@ -107,12 +115,14 @@ async def embed_documents(
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    """Trigger embedding for selected documents and papers. Skips already-completed ones (cache)."""
-    embedding_gen = EmbeddingGenerator()
-    vector_store = VectorStore()
+    """Queue embedding for selected documents and papers. Skips already-completed ones (cache).
+
+    Work runs on the ``processing`` Celery queue; poll ``/embed-status``.
+    """
     results: list[DocumentEmbedStatus] = []
+    queue: list[str] = []
 
-    # ── Handle paper_ids: auto-download PDF and convert to document_ids ──
+    # ── Handle paper_ids: create a document the worker downloads the PDF into ──
     resolved_doc_ids: list[str] = list(body.document_ids)
 
     for paper_id_str in body.paper_ids:
@@ -131,7 +141,7 @@ async def embed_documents(
             )
             continue
 
-        # Check if already downloaded as Document
+        # Check if already downloaded (or queued for download) as Document
         existing_doc_result = await db.execute(
             select(Document).where(
                 Document.user_id == user.id,
@@ -141,11 +151,9 @@ async def embed_documents(
         existing_doc = existing_doc_result.scalar_one_or_none()
 
         if existing_doc:
-            # Already have local PDF — just add to document list
             resolved_doc_ids.append(str(existing_doc.id))
             continue
 
-        # Need to download PDF
         if not paper.pdf_url:
             results.append(
                 DocumentEmbedStatus(
@@ -156,53 +164,40 @@ async def embed_documents(
             )
             continue
 
-        # Find the folder where this paper is bookmarked
-        bm_result = await db.execute(
-            select(Bookmark.folder_id).where(
-                Bookmark.user_id == user.id,
-                Bookmark.item_type == "paper",
-                Bookmark.item_id == paper_id,
-            ).limit(1)
-        )
-        folder_id = bm_result.scalar_one_or_none()
+        folder_id = await _bookmark_folder(user, "paper", paper_id, db)
         if not folder_id:
-            # Fallback: use user's first folder
-            first_folder_result = await db.execute(
-                select(Folder.id).where(Folder.user_id == user.id).limit(1)
-            )
-            folder_id = first_folder_result.scalar_one_or_none()
-            if not folder_id:
-                results.append(
-                    DocumentEmbedStatus(
-                        document_id=paper_id_str,
-                        status="failed",
-                        error_message="No folder available to save PDF",
-                    )
-                )
-                continue
-
-        # Download PDF
-        downloaded_doc = await _download_paper_pdf(paper, user, folder_id, db)
-        if downloaded_doc:
-            resolved_doc_ids.append(str(downloaded_doc.id))
-        else:
             results.append(
                 DocumentEmbedStatus(
                     document_id=paper_id_str,
                     status="failed",
-                    error_message="Failed to download PDF",
+                    error_message="No folder available to save PDF",
                 )
             )
+            continue
+
+        # The file is written by the worker; storage_path stays empty until then
+        filename = f"{_safe_filename(paper.title, 80)}.pdf"
+        document = Document(
+            id=uuid.uuid4(),
+            user_id=user.id,
+            folder_id=folder_id,
+            filename=filename,
+            original_filename=filename,
+            content_type="application/pdf",
+            file_size=0,
+            storage_path="",
+            note=f"paper:{paper.id}",  # link back to paper
+        )
+        db.add(document)
+        await db.flush()
+        resolved_doc_ids.append(str(document.id))
 
-    # ── Now embed all resolved documents ──
+    # ── Now queue all resolved documents ──
     for doc_id_str in resolved_doc_ids:
         doc_id = uuid.UUID(doc_id_str)
 
         # Verify document belongs to user
-        doc_result = await db.execute(
-            select(Document).where(Document.id == doc_id, Document.user_id == user.id)
-        )
-        doc = doc_result.scalar_one_or_none()
+        doc = await _owned_document(doc_id, user, db)
         if not doc:
             results.append(
                 DocumentEmbedStatus(
@@ -224,117 +219,9 @@ async def embed_documents(
             )
             continue
 
-        # Check cache — if already completed, skip
-        emb_result = await db.execute(
-            select(DocumentEmbedding).where(DocumentEmbedding.document_id == doc_id)
-        )
-        existing_emb = emb_result.scalar_one_or_none()
-
-        if existing_emb and existing_emb.status == "completed":
-            results.append(
-                DocumentEmbedStatus(
-                    document_id=doc_id_str,
-                    status="completed",
-                    chunk_count=existing_emb.chunk_count,
-                )
-            )
-            continue
-
-        # Create or update embedding record
-        if not existing_emb:
-            existing_emb = DocumentEmbedding(
-                document_id=doc_id,
-                user_id=user.id,
-                status="processing",
-            )
-            db.add(existing_emb)
-            await db.flush()
-        else:
-            existing_emb.status = "processing"
-            existing_emb.error_message = None
-            await db.flush()
-
-        try:
-            # Extract text
-            abs_path = file_storage.get_absolute_path(doc.storage_path)
-            text = text_extractor.extract(abs_path, doc.content_type)
-
-            if not text.strip():
-                existing_emb.status = "failed"
-                existing_emb.error_message = "No text could be extracted"
-                results.append(
-                    DocumentEmbedStatus(
-                        document_id=doc_id_str,
-                        status="failed",
-                        error_message="No text could be extracted",
-                    )
-                )
-                continue
-
-            # Chunk text
-            chunks = text_extractor.chunk_text(text)
-
-            if not chunks:
-                existing_emb.status = "failed"
-                existing_emb.error_message = "Text chunking produced no chunks"
-                results.append(
-                    DocumentEmbedStatus(
-                        document_id=doc_id_str,
-                        status="failed",
-                        error_message="Text chunking produced no chunks",
-                    )
-                )
-                continue
-
-            # Embed batch
-            embeddings = embedding_gen.embed_batch(chunks)
-
-            # Prepare points for Qdrant
-            points = []
-            for i, (chunk, embedding) in enumerate(zip(chunks, embeddings)):
-                point_id = str(uuid.uuid5(uuid.NAMESPACE_URL, f"{doc_id}:{i}"))
-                points.append(
-                    {
-                        "id": point_id,
-                        "vector": embedding,
-                        "payload": {
-                            "user_id": str(user.id),
-                            "document_id": str(doc_id),
-                            "chunk_index": i,
-                            "title": doc.original_filename,
-                            "content": chunk,
-                            "source_type": "user_document",
-                        },
-                    }
-                )
-
-            # Upsert to Qdrant
-            vector_store.upsert_batch(collection="user_docs", points=points)
-
-            # Update embedding record
-            existing_emb.status = "completed"
-            existing_emb.chunk_count = len(chunks)
-
-            results.append(
-                DocumentEmbedStatus(
-                    document_id=doc_id_str,
-                    status="completed",
-                    chunk_count=len(chunks),
-                )
-            )
-
-        except Exception as e:
-            logger.error("Failed to embed document", document_id=doc_id_str, error=str(e))
-            existing_emb.status = "failed"
-            existing_emb.error_message = str(e)[:500]
-            results.append(
-                DocumentEmbedStatus(
-                    document_id=doc_id_str,
-                    status="failed",
-                    error_message=str(e)[:200],
-                )
-            )
+        results.append(await _queue_embedding(doc, user, db, queue))
 
+    await _enqueue(queue, db)
     return DocumentEmbedResponse(results=results)
 
 
@@ -344,7 +231,7 @@ async def get_embed_status(
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    """Get embedding status for given document IDs."""
+    """Get embedding status and progress (chunks done out of total) for given document IDs."""
     ids = [s.strip() for s in document_ids.split(",") if s.strip()]
     results: list[DocumentEmbedStatus] = []
 
@@ -363,16 +250,26 @@ async def get_embed_status(
                     document_id=doc_id_str,
                     status=emb.status,
                     chunk_count=emb.chunk_count,
+                    total_chunks=emb.total_chunks,
                     error_message=emb.error_message,
                 )
             )
-        else:
+        elif await _owned_document(doc_id, user, db) is not None:
             results.append(
                 DocumentEmbedStatus(
                     document_id=doc_id_str,
                     status="pending",
                 )
             )
+        else:
+            # Never existed, or a paper/repo whose download or ingestion failed
+            results.append(
+                DocumentEmbedStatus(
+                    document_id=doc_id_str,
+                    status="failed",
+                    error_message="Document not found",
+                )
+            )
 
     return DocumentEmbedResponse(results=results)
 
@@ -383,12 +280,12 @@ async def embed_repos(
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    """Ingest GitHub repos via gitingest, chunk, and embed into Qdrant."""
-    from src.services.repo_ingestion import chunk_repo_content, ingest_repo
+    """Queue GitHub repos for ingestion via gitingest, chunking and embedding into Qdrant.
 
-    embedding_gen = EmbeddingGenerator()
-    vector_store = VectorStore()
+    Work runs on the ``processing`` Celery queue; poll ``/embed-status``.
+    """
     results: list[DocumentEmbedStatus] = []
+    queue: list[str] = []
 
     for repo_id_str in body.repo_ids:
         repo_id = uuid.UUID(repo_id_str)
@@ -413,38 +310,10 @@ async def embed_repos(
                 Document.note == f"repo:{repo_id}",
             )
         )
-        existing_doc = existing_doc_result.scalar_one_or_none()
+        doc = existing_doc_result.scalar_one_or_none()
 
-        if existing_doc:
-            # Check embedding cache
-            emb_result = await db.execute(
-                select(DocumentEmbedding).where(DocumentEmbedding.document_id == existing_doc.id)
-            )
-            existing_emb = emb_result.scalar_one_or_none()
-            if existing_emb and existing_emb.status == "completed":
-                results.append(
-                    DocumentEmbedStatus(
-                        document_id=str(existing_doc.id),
-                        status="completed",
-                        chunk_count=existing_emb.chunk_count,
-                    )
-                )
-                continue
-
-        # Find folder from bookmark
-        bm_result = await db.execute(
-            select(Bookmark.folder_id).where(
-                Bookmark.user_id == user.id,
-                Bookmark.item_type == "repo",
-                Bookmark.item_id == repo_id,
-            ).limit(1)
-        )
-        folder_id = bm_result.scalar_one_or_none()
-        if not folder_id:
-            first_folder_result = await db.execute(
-                select(Folder.id).where(Folder.user_id == user.id).limit(1)
-            )
-            folder_id = first_folder_result.scalar_one_or_none()
+        if not doc:
+            folder_id = await _bookmark_folder(user, "repo", repo_id, db)
             if not folder_id:
                 results.append(
                     DocumentEmbedStatus(
@@ -455,146 +324,24 @@ async def embed_repos(
                 )
                 continue
 
-        try:
-            # Ingest repo via gitingest
-            repo_content = await ingest_repo(repo.html_url)
-
-            # Create or reuse Document record
-            if not existing_doc:
-                doc_id = uuid.uuid4()
-                safe_name = "".join(
-                    c if c.isalnum() or c in " -_" else "_" for c in repo.full_name
-                )
-                filename = f"{safe_name}.txt"
-
-                # Save raw content to file storage
-                raw_text = (
-                    f"# {repo.full_name}\n\n"
-                    f"{repo_content.summary}\n\n"
-                    f"## File Structure\n{repo_content.tree}\n\n"
-                    f"## Content\n{repo_content.content}"
-                )
-                storage_path = file_storage.save_file(
-                    user_id=user.id,
-                    document_id=doc_id,
-                    filename=filename,
-                    content=raw_text.encode("utf-8"),
-                )
-
-                existing_doc = Document(
-                    id=doc_id,
-                    user_id=user.id,
-                    folder_id=folder_id,
-                    filename=filename,
-                    original_filename=repo.full_name,
-                    content_type="text/x-github-repo",
-                    file_size=len(raw_text.encode("utf-8")),
-                    storage_path=storage_path,
-                    note=f"repo:{repo_id}",
-                )
-                db.add(existing_doc)
-                await db.flush()
-                await db.refresh(existing_doc)
-
-            # Create or update embedding record
-            emb_result = await db.execute(
-                select(DocumentEmbedding).where(
-                    DocumentEmbedding.document_id == existing_doc.id
-                )
-            )
-            emb_record = emb_result.scalar_one_or_none()
-            if not emb_record:
-                emb_record = DocumentEmbedding(
-                    document_id=existing_doc.id,
-                    user_id=user.id,
-                    status="processing",
-                )
-                db.add(emb_record)
-                await db.flush()
-            else:
-                emb_record.status = "processing"
-                emb_record.error_message = None
-                await db.flush()
-
-            # Chunk repo content
-            chunks_data = chunk_repo_content(repo_content)
-            if not chunks_data:
-                emb_record.status = "failed"
-                emb_record.error_message = "No content chunks produced"
-                results.append(
-                    DocumentEmbedStatus(
-                        document_id=str(existing_doc.id),
-                        status="failed",
-                        error_message="No content chunks produced",
-                    )
-                )
-                continue
-
-            # Embed batch
-            chunk_texts = [c["content"] for c in chunks_data]
-            embeddings = embedding_gen.embed_batch(chunk_texts)
-
-            # Prepare Qdrant points
-            points = []
-            for i, (chunk_data, embedding) in enumerate(zip(chunks_data, embeddings)):
-                point_id = str(uuid.uuid5(uuid.NAMESPACE_URL, f"{existing_doc.id}:{i}"))
-                points.append({
-                    "id": point_id,
-                    "vector": embedding,
-                    "payload": {
-                        "user_id": str(user.id),
-                        "document_id": str(existing_doc.id),
-                        "chunk_index": i,
-                        "title": repo.full_name,
-                        "content": chunk_data["content"],
-                        "file_path": chunk_data["file_path"],
-                        "source_type": "github_repo",
-                        "url": repo.html_url,
-                    },
-                })
-
-            # Upsert to Qdrant
-            vector_store.upsert_batch(collection="user_docs", points=points)
-
-            emb_record.status = "completed"
-            emb_record.chunk_count = len(chunks_data)
-
-            results.append(
-                DocumentEmbedStatus(
-                    document_id=str(existing_doc.id),
-                    status="completed",
-                    chunk_count=len(chunks_data),
-                )
-            )
-
-            logger.info(
-                "Repo ingested successfully",
-                repo=repo.full_name,
-                chunks=len(chunks_data),
+            # The worker saves the ingested content; storage_path stays empty until then
+            doc = Document(
+                id=uuid.uuid4(),
+                user_id=user.id,
+                folder_id=folder_id,
+                filename=f"{_safe_filename(repo.full_name)}.txt",
+                original_filename=repo.full_name,
+                content_type="text/x-github-repo",
+                file_size=0,
+                storage_path="",
+                note=f"repo:{repo_id}",
             )
+            db.add(doc)
+            await db.flush()
 
-        except Exception as e:
-            logger.error("Failed to ingest repo", repo_id=repo_id_str, error=str(e))
-            if existing_doc:
-                emb_result = await db.execute(
-                    select(DocumentEmbedding).where(
-                        DocumentEmbedding.document_id == existing_doc.id
-                    )
-                )
-                emb_record = emb_result.scalar_one_or_none()
-                if emb_record:
-                    emb_record.status = "failed"
-                    emb_record.error_message = str(e)[:500]
-
-            results.append(
-                DocumentEmbedStatus(
-                    document_id=repo_id_str,
-                    status="failed",
-                    error_message=str(e)[:200],
-                )
-            )
+        results.append(await _queue_embedding(doc, user, db, queue))
 
-    await db.commit()
+    await _enqueue(queue, db)
     return DocumentEmbedResponse(results=results)
 
 
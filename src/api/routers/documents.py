@@ -17,7 +17,7 @@ from src.storage.models.document import Document
 from src.storage.models.document_embedding import DocumentEmbedding
 from src.storage.models.folder import Folder
 from src.storage.models.paper import Paper
-from src.storage.vector.qdrant_client import VectorStore
+from src.storage.vector.qdrant_client import get_async_vector_store
 
 logger = get_logger(__name__)
 
@@ -26,6 +26,20 @@ router = APIRouter(prefix="/documents", tags=["documents"])
 file_storage = FileStorageService()
 
 
+def _stored_file(document: Document) -> str:
+    """Absolute path of ``document``'s file.
+
+    Paper and repo documents are created before a worker has saved their
+    file; until then ``storage_path`` is empty and there is nothing to serve.
+    """
+    if not document.storage_path:
+        raise HTTPException(status_code=404, detail="File not available yet")
+    abs_path = file_storage.get_absolute_path(document.storage_path)
+    if not os.path.exists(abs_path):
+        raise HTTPException(status_code=404, detail="File not found on disk")
+    return abs_path
+
+
 @router.post("/upload/{folder_id}", response_model=DocumentResponse, status_code=status.HTTP_201_CREATED)
 async def upload_document(
     folder_id: uuid.UUID,
@@ -169,9 +183,7 @@ async def download_document(
     if not document:
         raise HTTPException(status_code=404, detail="Document not found")
 
-    abs_path = file_storage.get_absolute_path(document.storage_path)
-    if not os.path.exists(abs_path):
-        raise HTTPException(status_code=404, detail="File not found on disk")
+    abs_path = _stored_file(document)
     return FileResponse(
         path=abs_path,
         filename=document.original_filename,
@@ -217,9 +229,7 @@ async def get_document_content(
 
     content_type = document.content_type if document.content_type in TEXT_TYPES else "text/plain"
 
-    abs_path = file_storage.get_absolute_path(document.storage_path)
-    if not os.path.exists(abs_path):
-        raise HTTPException(status_code=404, detail="File not found on disk")
+    abs_path = _stored_file(document)
     max_size = 1 * 1024 * 1024  # 1MB
     if os.path.getsize(abs_path) > max_size:
         raise HTTPException(status_code=413, detail="File too large for text preview (max 1MB)")
@@ -285,21 +295,14 @@ async def delete_document(
     if not document:
         raise HTTPException(status_code=404, detail="Document not found")
 
-    # Cleanup embeddings from Qdrant if they exist
-    emb_result = await db.execute(
-        select(DocumentEmbedding).where(DocumentEmbedding.document_id == document_id)
-    )
-    emb = emb_result.scalar_one_or_none()
-    if emb and emb.chunk_count > 0:
-        try:
-            vector_store = VectorStore()
-            point_ids = [
-                str(uuid.uuid5(uuid.NAMESPACE_URL, f"{document_id}:{i}"))
-                for i in range(emb.chunk_count)
-            ]
-            vector_store.delete(collection="user_docs", point_ids=point_ids)
-        except Exception as e:
-            logger.warning("Failed to cleanup vectors", document_id=str(document_id), error=str(e))
+    # Cleanup embeddings from Qdrant, including chunks of a partially embedded document
+    try:
+        await get_async_vector_store().delete_by_filter(
+            "user_docs",
+            {"user_id": str(current_user.id), "document_id": str(document_id)},
+        )
+    except Exception as e:
+        logger.warning("Failed to cleanup vectors", document_id=str(document_id), error=str(e))
 
     # Delete embedding record
     await db.execute(delete(DocumentEmbedding).where(DocumentEmbedding.document_id == document_id))
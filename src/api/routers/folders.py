@@ -13,10 +13,14 @@ from src.api.schemas.folder import (
     FolderResponse,
     FolderUpdate,
 )
+from src.core.logging import get_logger
 from src.services.file_storage import FileStorageService
 from src.storage.models.bookmark import Bookmark
 from src.storage.models.document import Document
 from src.storage.models.folder import Folder
+from src.storage.vector.qdrant_client import get_async_vector_store
+
+logger = get_logger(__name__)
 
 router = APIRouter(prefix="/folders", tags=["folders"])
 
@@ -281,6 +285,13 @@ async def delete_folder(
     doc_ids = [row[0] for row in doc_result.all()]
     if doc_ids:
         file_storage.delete_user_folder_files(current_user.id, doc_ids)
+        try:
+            await get_async_vector_store().delete_by_filter(
+                "user_docs",
+                {"user_id": str(current_user.id), "document_id": [str(d) for d in doc_ids]},
+            )
+        except Exception as e:
+            logger.warning("Failed to cleanup vectors", folder_id=str(folder_id), error=str(e))
 
     # Cascade delete will handle DB records for bookmarks, documents, subfolders
     await db.execute(delete(Folder).where(Folder.id == folder_id))
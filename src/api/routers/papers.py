@@ -9,7 +9,7 @@ from fastapi import APIRouter, HTTPException, Query, UploadFile
 
 from fastapi import Body
 
-from src.api.deps import DbSession, PaginatedResponse
+from src.api.deps import CountParam, CursorParam, DbSession, PaginatedResponse
 from src.api.schemas.paper import (
     AuthorAnalyticsResponse,
     AuthorComparisonResponse,
@@ -47,11 +47,13 @@ async def list_papers(
     date_to: date | None = None,
     has_code: bool | None = None,
     is_vietnamese: bool | None = None,
-    sort_by: str = Query("published_date"),
+    sort_by: str | None = Query(None, description="Column to sort by, or 'relevance' (default when searching)"),
     sort_order: str = Query("desc"),
+    cursor: CursorParam = None,
+    count: CountParam = "exact",
 ):
     repo = PaperRepository(db)
-    papers, total = await repo.list_papers(
+    page = await repo.list_papers(
         skip=skip,
         limit=limit,
         category=category,
@@ -64,13 +66,12 @@ async def list_papers(
         is_vietnamese=is_vietnamese,
         sort_by=sort_by,
         sort_order=sort_order,
+        cursor=cursor,
+        count=count,
     )
 
-    return PaginatedResponse(
-        items=[PaperResponse.model_validate(p) for p in papers],
-        total=total,
-        skip=skip,
-        limit=limit,
+    return PaginatedResponse.from_page(
+        page, [PaperResponse.model_validate(p) for p in page.items], skip, limit
     )
 
 
@@ -399,9 +400,7 @@ async def import_papers(file: UploadFile, db: DbSession):
                 skipped += 1
                 continue
 
-            paper = Paper(**entry)
-            db.add(paper)
-            await db.flush()
+            await repo.create(Paper(**entry))
             imported += 1
         except Exception as e:
             errors.append(f"'{entry.get('title', '?')[:50]}': {str(e)}")
@@ -2,7 +2,7 @@ from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 
-from src.api.deps import DbSession, PaginatedResponse
+from src.api.deps import CountParam, CursorParam, DbSession, PaginatedResponse
 from src.api.schemas.repository import (
     RepositoryDetailResponse,
     RepositoryResponse,
@@ -23,11 +23,13 @@ async def list_repositories(
     topic: str | None = None,
     min_stars: int | None = None,
     search: str | None = None,
-    sort_by: str = Query("stars_count"),
+    sort_by: str | None = Query(None, description="Column to sort by, or 'relevance' (default when searching)"),
     sort_order: str = Query("desc"),
+    cursor: CursorParam = None,
+    count: CountParam = "exact",
 ):
     repo = GitHubRepository(db)
-    repos, total = await repo.list_repos(
+    page = await repo.list_repos(
         skip=skip,
         limit=limit,
         language=language,
@@ -36,13 +38,12 @@ async def list_repositories(
         search=search,
         sort_by=sort_by,
         sort_order=sort_order,
+        cursor=cursor,
+        count=count,
     )
 
-    return PaginatedResponse(
-        items=[RepositoryResponse.model_validate(r) for r in repos],
-        total=total,
-        skip=skip,
-        limit=limit,
+    return PaginatedResponse.from_page(
+        page, [RepositoryResponse.model_validate(r) for r in page.items], skip, limit
     )
 
 
@@ -1,28 +1,26 @@
-import asyncio
-from functools import partial
+from datetime import date
 
 from fastapi import APIRouter, Query
 
 from src.api.schemas.search import SearchResponse, SearchResult
-from src.processors.embedding import EmbeddingGenerator
-from src.storage.vector.qdrant_client import VectorStore
+from src.processors.embedding_service import embed_for_collections
+from src.storage.vector.qdrant_client import get_async_vector_store, version_models
 
 router = APIRouter(prefix="/search", tags=["Search"])
 
-_embedding_gen = EmbeddingGenerator()
-
 
 @router.get("/", response_model=SearchResponse)
 async def search(
     q: str = Query(..., min_length=2),
     type: str | None = Query(None),
     limit: int = Query(20, ge=1, le=100),
+    category: list[str] | None = Query(None, description="Paper categories (any of)"),
+    published_after: date | None = Query(None),
+    published_before: date | None = Query(None),
+    language: list[str] | None = Query(None, description="Repository languages (any of)"),
+    min_stars: int | None = Query(None, ge=0),
 ):
-    vector_store = VectorStore()
-
-    # Run CPU-heavy embedding in thread pool to avoid blocking the event loop
-    loop = asyncio.get_event_loop()
-    query_embedding = await loop.run_in_executor(None, partial(_embedding_gen.embed, q))
+    vector_store = get_async_vector_store()
 
     type_to_collection = {"paper": "papers", "repository": "repositories"}
     if type and type != "all":
@@ -30,28 +28,69 @@ async def search(
     else:
         collections = ["papers", "repositories"]
 
+    # Filters run inside Qdrant (indexed payload fields), so the top `limit`
+    # hits already satisfy them.
+    collection_filters = _collection_filters(
+        category, published_after, published_before, language, min_stars
+    )
+    if collection_filters and len(collections) > 1:
+        # A field filter can only match the collection that has the field
+        collections = [c for c in collections if c in collection_filters]
+
+    # Micro-batched with concurrent requests; encoding runs off the event loop.
+    # One embedding per model the searched collections are on; the search
+    # targets the versions those models were read from.
+    versions = await vector_store.active_versions(collections)
+    query_vectors = await embed_for_collections(q, version_models(versions))
+
+    hits = await vector_store.search_many(
+        collections=collections,
+        query_vector=query_vectors,
+        limit=limit,
+        collection_filters=collection_filters,
+        versions=versions,
+    )
+
     results = []
-    for collection in collections:
-        hits = vector_store.search(
-            collection=collection,
-            query_vector=query_embedding,
-            limit=limit,
-        )
-        for hit in hits:
-            payload = hit.get("payload", {})
-            results.append(
-                SearchResult(
-                    id=str(hit["id"]),
-                    type=collection.rstrip("s"),
-                    title=payload.get("title", ""),
-                    description=payload.get("description", payload.get("abstract", "")),
-                    url=payload.get("url"),
-                    score=hit["score"],
-                    metadata=payload,
-                )
+    for hit in hits[:limit]:
+        payload = hit.get("payload", {})
+        results.append(
+            SearchResult(
+                id=str(hit["id"]),
+                type=hit["collection"].rstrip("s"),
+                title=payload.get("title", ""),
+                description=payload.get("description", payload.get("abstract", "")),
+                url=payload.get("url"),
+                score=hit["score"],
+                metadata=payload,
             )
-
-    results.sort(key=lambda x: x.score, reverse=True)
-    results = results[:limit]
+        )
 
     return SearchResponse(query=q, results=results, total=len(results))
+
+
+def _collection_filters(
+    category: list[str] | None,
+    published_after: date | None,
+    published_before: date | None,
+    language: list[str] | None,
+    min_stars: int | None,
+) -> dict[str, dict]:
+    paper_filters: dict = {}
+    if category:
+        paper_filters["categories"] = category
+    if published_after or published_before:
+        paper_filters["published_date"] = {"gte": published_after, "lte": published_before}
+
+    repo_filters: dict = {}
+    if language:
+        repo_filters["primary_language"] = language
+    if min_stars is not None:
+        repo_filters["stars_count"] = {"gte": min_stars}
+
+    filters = {}
+    if paper_filters:
+        filters["papers"] = paper_filters
+    if repo_filters:
+        filters["repositories"] = repo_filters
+    return filters
@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Query
 from sqlalchemy import select
 
-from src.api.deps import DbSession, PaginatedResponse
+from src.api.deps import CountParam, CursorParam, DbSession, PaginatedResponse
 from src.api.schemas.search import (
     HFFiltersResponse,
     HFKeywordTrend,
@@ -39,16 +39,15 @@ async def get_trending_papers(
     search: str | None = None,
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
+    cursor: CursorParam = None,
+    count: CountParam = "exact",
 ):
     metrics = MetricsRepository(db)
 
     if search:
-        rows, total = await metrics.get_trending_papers_with_search(
-            category=category, search=search, skip=skip, limit=limit
+        page = await metrics.get_trending_papers_with_search(
+            category=category, search=search, skip=skip, limit=limit, cursor=cursor, count=count
         )
-        if not rows:
-            return PaginatedResponse(items=[], total=total, skip=skip, limit=limit)
-
         items = [
             TrendingPaperResponse(
                 id=str(t.entity_id),
@@ -59,25 +58,25 @@ async def get_trending_papers(
                 category=t.category,
                 primary_category=paper.categories[0] if paper.categories else None,
             )
-            for t, paper in rows
+            for t, paper in page.items
         ]
-        return PaginatedResponse(items=items, total=total, skip=skip, limit=limit)
+        return PaginatedResponse.from_page(page, items, skip, limit)
 
-    trending, total = await metrics.get_trending(
-        entity_type="paper", category=category, skip=skip, limit=limit
+    page = await metrics.get_trending(
+        entity_type="paper", category=category, skip=skip, limit=limit, cursor=cursor, count=count
     )
 
-    if not trending:
-        return PaginatedResponse(items=[], total=total, skip=skip, limit=limit)
+    if not page.items:
+        return PaginatedResponse.from_page(page, [], skip, limit)
 
-    entity_ids = [t.entity_id for t in trending]
+    entity_ids = [t.entity_id for t in page.items]
     result = await db.execute(
         select(Paper).where(Paper.id.in_(entity_ids))
     )
     papers_map = {p.id: p for p in result.scalars().all()}
 
     items = []
-    for t in trending:
+    for t in page.items:
         paper = papers_map.get(t.entity_id)
         if not paper:
             continue
@@ -93,7 +92,7 @@ async def get_trending_papers(
                 primary_category=primary_category,
             )
         )
-    return PaginatedResponse(items=items, total=total, skip=skip, limit=limit)
+    return PaginatedResponse.from_page(page, items, skip, limit)
 
 
 @router.get("/repos", response_model=PaginatedResponse[TrendingRepoResponse])
@@ -105,17 +104,22 @@ async def get_trending_repos(
     search: str | None = None,
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
+    cursor: CursorParam = None,
+    count: CountParam = "exact",
 ):
     metrics = MetricsRepository(db)
     topics_list = [t.strip() for t in topic.split(",") if t.strip()] if topic else None
 
     if language or topics_list or search:
-        rows, total = await metrics.get_trending_with_language(
-            language=language, topics=topics_list, search=search, skip=skip, limit=limit
+        page = await metrics.get_trending_with_language(
+            language=language,
+            topics=topics_list,
+            search=search,
+            skip=skip,
+            limit=limit,
+            cursor=cursor,
+            count=count,
         )
-        if not rows:
-            return PaginatedResponse(items=[], total=total, skip=skip, limit=limit)
-
         items = [
             TrendingRepoResponse(
                 id=str(t.entity_id),
@@ -126,25 +130,25 @@ async def get_trending_repos(
                 trending_score=t.total_score,
                 primary_language=repo.primary_language,
             )
-            for t, repo in rows
+            for t, repo in page.items
         ]
-        return PaginatedResponse(items=items, total=total, skip=skip, limit=limit)
+        return PaginatedResponse.from_page(page, items, skip, limit)
 
-    trending, total = await metrics.get_trending(
-        entity_type="repository", skip=skip, limit=limit
+    page = await metrics.get_trending(
+        entity_type="repository", skip=skip, limit=limit, cursor=cursor, count=count
     )
 
-    if not trending:
-        return PaginatedResponse(items=[], total=total, skip=skip, limit=limit)
+    if not page.items:
+        return PaginatedResponse.from_page(page, [], skip, limit)
 
-    entity_ids = [t.entity_id for t in trending]
+    entity_ids = [t.entity_id for t in page.items]
     result = await db.execute(
         select(Repository).where(Repository.id.in_(entity_ids))
     )
     repos_map = {r.id: r for r in result.scalars().all()}
 
     items = []
-    for t in trending:
+    for t in page.items:
         repo = repos_map.get(t.entity_id)
         if not repo:
             continue
@@ -159,7 +163,7 @@ async def get_trending_repos(
                 primary_language=repo.primary_language,
             )
         )
-    return PaginatedResponse(items=items, total=total, skip=skip, limit=limit)
+    return PaginatedResponse.from_page(page, items, skip, limit)
 
 
 @router.get("/tech-radar", response_model=TechRadarResponse)
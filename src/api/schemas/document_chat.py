@@ -15,7 +15,8 @@ class RepoEmbedRequest(BaseModel):
 class DocumentEmbedStatus(BaseModel):
     document_id: str
     status: str  # pending | processing | completed | failed
-    chunk_count: int = 0
+    chunk_count: int = 0  # chunks embedded so far
+    total_chunks: int | None = None  # expected chunks (estimated while extracting)
     error_message: str | None = None
 
 
@@ -119,6 +119,18 @@ def get_vector_store():
         return None
 
 
+def get_async_vector_store():
+    """Get async vector store. Returns None if unavailable."""
+    try:
+        from src.storage.vector.qdrant_client import AsyncVectorStore
+
+        settings = get_cli_settings()
+        return AsyncVectorStore(url=_localize_url(settings.QDRANT_URL))
+    except Exception as e:
+        console.print(f"[yellow]Warning: Vector store unavailable ({e})[/yellow]")
+        return None
+
+
 def get_embedding_generator():
     """Get embedding generator. Returns None if unavailable."""
     try:
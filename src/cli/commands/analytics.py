@@ -0,0 +1,39 @@
+"""rri refresh-analytics - Update the precomputed paper analytics tables."""
+
+from typing import Annotated
+
+import typer
+from rich.console import Console
+
+from src.cli._async import run
+
+console = Console()
+
+
+def refresh_analytics_command(
+    full: Annotated[bool, typer.Option("--full", help="Rebuild every table instead of folding in changed papers")] = False,
+) -> None:
+    """Fold papers changed since the last refresh into the analytics tables."""
+    run(_refresh(full))
+
+
+async def _refresh(full: bool) -> None:
+    from src.cli._context import get_session_factory
+    from src.storage.repositories.analytics_repo import PaperAnalyticsRepository
+
+    factory = get_session_factory()
+    if not factory:
+        console.print("[red]Database required for analytics refresh[/red]")
+        raise typer.Exit(1)
+
+    async with factory() as session:
+        stats = await PaperAnalyticsRepository(session).refresh(full=full)
+        await session.commit()
+
+    if stats is None:
+        console.print("[yellow]Another refresh is running; nothing done[/yellow]")
+        return
+    console.print(
+        f"[green]Analytics refreshed: {stats['papers']} papers, "
+        f"{stats['authors']} authors recomputed[/green]"
+    )
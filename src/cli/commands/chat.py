@@ -30,10 +30,11 @@ def chat_command(
 
 
 async def _chat_loop(cloud: bool, no_rerank: bool, collections: list[str]) -> None:
-    from src.cli._context import get_embedding_generator, get_llm_client, get_vector_store
+    from src.cli._context import get_async_vector_store, get_embedding_generator, get_llm_client
+    from src.processors.embedding_service import LocalEmbeddingService
     from src.rag.generator import AnswerGenerator
     from src.rag.pipeline import RAGPipeline
-    from src.rag.reranker import CrossEncoderReranker
+    from src.rag.reranker import get_reranker
     from src.rag.retriever import HybridRetriever
 
     # Initialize components
@@ -42,7 +43,7 @@ async def _chat_loop(cloud: bool, no_rerank: bool, collections: list[str]) -> No
         console.print("[red]LLM client required for chat[/red]")
         raise typer.Exit(1)
 
-    vector_store = get_vector_store()
+    vector_store = get_async_vector_store()
     embedding_gen = get_embedding_generator()
 
     rag_available = vector_store is not None and embedding_gen is not None
@@ -52,9 +53,9 @@ async def _chat_loop(cloud: bool, no_rerank: bool, collections: list[str]) -> No
     if rag_available:
         retriever = HybridRetriever(
             vector_store=vector_store,
-            embedding_model=embedding_gen,
+            embedding_model=LocalEmbeddingService(embedding_gen),
         )
-        reranker = None if no_rerank else CrossEncoderReranker()
+        reranker = None if no_rerank else get_reranker()
         generator = AnswerGenerator(llm_client=llm)
         pipeline = RAGPipeline(
             retriever=retriever,
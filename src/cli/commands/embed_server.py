@@ -0,0 +1,32 @@
+"""rri embed-server - Shared micro-batching embedding server."""
+
+from typing import Annotated, Optional
+
+import typer
+from rich.console import Console
+
+from src.cli._async import run
+
+console = Console()
+
+
+def embed_server_command(
+    socket: Annotated[Optional[str], typer.Option(help="Unix socket path (defaults to EMBEDDING_SERVER_SOCKET)")] = None,
+    max_batch_size: Annotated[Optional[int], typer.Option(help="Flush a micro-batch at this many texts")] = None,
+    max_wait_ms: Annotated[Optional[float], typer.Option(help="Max time a request waits for others to join its batch")] = None,
+) -> None:
+    """Serve the embedding model on a local socket for API and worker processes."""
+    from src.core.config import get_settings
+    from src.processors.embedding_service import EmbeddingServer, LocalEmbeddingService
+
+    socket_path = socket or get_settings().EMBEDDING_SERVER_SOCKET
+    if not socket_path:
+        console.print("[red]Socket path required: pass --socket or set EMBEDDING_SERVER_SOCKET[/red]")
+        raise typer.Exit(1)
+
+    service = LocalEmbeddingService(max_batch_size=max_batch_size, max_wait_ms=max_wait_ms)
+    console.print(f"Serving [cyan]{service.model_name}[/cyan] on [bold]{socket_path}[/bold]")
+    try:
+        run(EmbeddingServer(socket_path, service).serve_forever())
+    except KeyboardInterrupt:
+        console.print("\nStopped.")
@@ -0,0 +1,57 @@
+"""rri reindex - Pipelined, resumable (re)indexing into Qdrant."""
+
+from datetime import datetime
+from typing import Annotated, Optional
+
+import typer
+from rich.console import Console
+
+from src.cli._async import run
+
+console = Console()
+
+
+def reindex_command(
+    collection: Annotated[Optional[list[str]], typer.Option(help="papers or repositories (repeatable; default: both)")] = None,
+    since: Annotated[Optional[datetime], typer.Option(help="Only rows created at or after this date")] = None,
+    model: Annotated[Optional[str], typer.Option(help="Embedding model (defaults to EMBEDDING_MODEL); vector size must match the collection")] = None,
+    restart: Annotated[bool, typer.Option("--restart", help="Ignore the checkpoint and start from the beginning")] = False,
+) -> None:
+    """Embed papers/repositories into Qdrant, resuming from the last checkpoint."""
+    run(_reindex(collection, since, model, restart))
+
+
+async def _reindex(
+    collections: list[str] | None,
+    since: datetime | None,
+    model: str | None,
+    restart: bool,
+) -> None:
+    from src.cli._context import get_async_vector_store, get_session_factory, get_vector_store
+    from src.services.reindexer import INDEX_SOURCES, Reindexer
+
+    names = collections or list(INDEX_SOURCES)
+    unknown = [name for name in names if name not in INDEX_SOURCES]
+    if unknown:
+        console.print(f"[red]Unknown collection(s): {', '.join(unknown)}[/red]")
+        raise typer.Exit(1)
+
+    factory = get_session_factory()
+    sync_store = get_vector_store()
+    store = get_async_vector_store()
+    if not factory or not sync_store or not store:
+        console.print("[red]Database and Qdrant required for reindexing[/red]")
+        raise typer.Exit(1)
+    sync_store.init_collections()
+
+    try:
+        for name in names:
+            console.print(f"Indexing [cyan]{name}[/cyan]...")
+            reindexer = Reindexer(factory, store, name, model=model, since=since)
+            written = await reindexer.run(
+                restart=restart,
+                on_progress=lambda n, name=name: console.print(f"  {name}: {n} points written"),
+            )
+            console.print(f"[green]{name}: {written} points indexed[/green]")
+    finally:
+        await store.close()
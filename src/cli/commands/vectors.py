@@ -0,0 +1,180 @@
+"""rri vectors - Qdrant collection maintenance."""
+
+from typing import Annotated, Optional
+
+import typer
+
+from src.cli._async import run
+from src.cli._output import console
+
+app = typer.Typer(no_args_is_help=True)
+
+
+@app.command()
+def recreate(
+    collection: Annotated[Optional[list[str]], typer.Option(help="Collection to update (repeatable; default: all)")] = None,
+    batch_size: Annotated[int, typer.Option(help="Points copied per scroll/upsert request (rebuilds only)")] = 256,
+) -> None:
+    """Apply the current quantization/HNSW/on-disk config to collections.
+
+    Settings are changed in place while the collection stays online. A
+    distance change rebuilds a new version next to the live one and swaps
+    the alias; stored vectors are copied as-is, nothing is re-embedded.
+    """
+    from src.cli._context import get_vector_store
+    from src.storage.vector.qdrant_client import COLLECTIONS_CONFIG
+
+    names = collection or list(COLLECTIONS_CONFIG)
+    unknown = [name for name in names if name not in COLLECTIONS_CONFIG]
+    if unknown:
+        console.print(f"[red]Unknown collection(s): {', '.join(unknown)}[/red]")
+        raise typer.Exit(1)
+
+    store = get_vector_store()
+    if not store:
+        console.print("[red]Qdrant required to recreate collections[/red]")
+        raise typer.Exit(1)
+
+    for name in names:
+        console.print(f"Updating [cyan]{name}[/cyan]...")
+        try:
+            points = store.recreate_collection(name, batch_size=batch_size)
+        except ValueError as e:
+            console.print(f"[yellow]Skipping {name}: {e}[/yellow]")
+            continue
+        console.print(f"[green]{name}: up to date ({points} points)[/green]")
+
+
+@app.command("purge-user")
+def purge_user(
+    user_id: Annotated[str, typer.Argument(help="ID of the user whose document vectors to delete")],
+) -> None:
+    """Delete all of a user's document chunks from user_docs (dense and BM25)."""
+    from src.cli._context import get_vector_store
+
+    store = get_vector_store()
+    if not store:
+        console.print("[red]Qdrant required to purge vectors[/red]")
+        raise typer.Exit(1)
+
+    store.delete_by_filter("user_docs", {"user_id": user_id})
+    console.print(f"[green]Deleted user_docs vectors of user {user_id}[/green]")
+
+
+def _stores():
+    from src.cli._context import get_async_vector_store, get_session_factory, get_vector_store
+
+    factory = get_session_factory()
+    store = get_vector_store()
+    async_store = get_async_vector_store()
+    if not factory or not store or not async_store:
+        console.print("[red]Database and Qdrant required for model migrations[/red]")
+        raise typer.Exit(1)
+    return store, async_store, factory
+
+
+@app.command()
+def versions() -> None:
+    """Show each collection's active version and the other versions present."""
+    from rich.table import Table
+
+    from src.cli._context import get_vector_store
+    from src.storage.cache.collection_versions import get_migration_target
+    from src.storage.vector.qdrant_client import COLLECTIONS_CONFIG, VERSION_SEPARATOR
+
+    store = get_vector_store()
+    if not store:
+        console.print("[red]Qdrant required[/red]")
+        raise typer.Exit(1)
+
+    aliases = store.aliases()
+    existing = [c.name for c in store.client.get_collections().collections]
+    table = Table(title="Vector collections")
+    table.add_column("Collection", style="cyan")
+    table.add_column("Active version")
+    table.add_column("Migrating to", style="yellow")
+    table.add_column("Other versions", style="dim")
+    for name in COLLECTIONS_CONFIG:
+        active = aliases.get(name, name if name in existing else "-")
+        others = [
+            c for c in existing if c.startswith(f"{name}{VERSION_SEPARATOR}") and c != active
+        ]
+        table.add_row(name, active, get_migration_target(name) or "", ", ".join(others))
+    console.print(table)
+
+
+@app.command()
+def migrate(
+    model: Annotated[str, typer.Option(help="New embedding model, e.g. BAAI/bge-large-en-v1.5")],
+    collection: Annotated[Optional[list[str]], typer.Option(help="Collection to migrate (repeatable; default: all)")] = None,
+    max_rate: Annotated[Optional[float], typer.Option(help="Points/sec to re-embed (defaults to VECTOR_MIGRATION_MAX_RATE)")] = None,
+    swap: Annotated[bool, typer.Option("--swap", help="Switch the alias to the new version when the backfill is done")] = False,
+) -> None:
+    """Build a new-model version of collections next to the live one (blue/green).
+
+    New writes go to both versions while existing points are re-embedded in
+    the background; search stays on the old version until the swap.
+    """
+    from src.storage.vector.qdrant_client import COLLECTIONS_CONFIG
+
+    names = collection or list(COLLECTIONS_CONFIG)
+    unknown = [name for name in names if name not in COLLECTIONS_CONFIG]
+    if unknown:
+        console.print(f"[red]Unknown collection(s): {', '.join(unknown)}[/red]")
+        raise typer.Exit(1)
+    run(_migrate(names, model, max_rate, swap))
+
+
+async def _migrate(names: list[str], model: str, max_rate: float | None, swap: bool) -> None:
+    from src.services.vector_migration import VectorMigration
+
+    store, async_store, factory = _stores()
+    try:
+        for name in names:
+            migration = VectorMigration(
+                store, async_store, factory, name, model, max_rate=max_rate
+            )
+            console.print(f"Migrating [cyan]{name}[/cyan] to [bold]{migration.target}[/bold]...")
+            written = await migration.run(swap=swap)
+            state = "now live" if swap else "ready; run `rri vectors activate` to switch"
+            console.print(f"[green]{name}: {written} points re-embedded, {state}[/green]")
+    finally:
+        await async_store.close()
+
+
+@app.command()
+def activate(
+    collection: Annotated[str, typer.Option(help="Collection whose alias to switch")],
+    model: Annotated[str, typer.Option(help="Model whose version becomes live (also used to roll back)")],
+) -> None:
+    """Atomically point a collection at the version built with MODEL."""
+    from src.cli._context import get_vector_store
+    from src.storage.cache.collection_versions import get_migration_target, set_migration_target
+
+    store = get_vector_store()
+    if not store:
+        console.print("[red]Qdrant required[/red]")
+        raise typer.Exit(1)
+
+    physical = store.find_version(collection, model)
+    if physical is None:
+        console.print(f"[red]No {model} version of {collection}; run `rri vectors migrate`[/red]")
+        raise typer.Exit(1)
+
+    previous = store.activate_version(collection, physical)
+    if get_migration_target(collection) == physical:
+        set_migration_target(collection, None)
+    console.print(f"[green]{collection} -> {physical}[/green] (was {previous or '-'})")
+
+
+@app.command()
+def abort(
+    collection: Annotated[str, typer.Option(help="Collection whose migration to cancel")],
+    model: Annotated[str, typer.Option(help="Model of the migration to cancel")],
+) -> None:
+    """Stop dual-writes and delete the unfinished new version."""
+    from src.services.vector_migration import VectorMigration
+
+    store, async_store, factory = _stores()
+    VectorMigration(store, async_store, factory, collection, model).abort()
+    console.print(f"[green]Migration of {collection} to {model} aborted[/green]")
@@ -2,7 +2,17 @@
 
 import typer
 
-from src.cli.commands import analyze, chat, collect, export, search
+from src.cli.commands import (
+    analytics,
+    analyze,
+    chat,
+    collect,
+    embed_server,
+    export,
+    reindex,
+    search,
+    vectors,
+)
 
 app = typer.Typer(
     name="rri",
@@ -14,7 +24,11 @@ app.add_typer(collect.app, name="collect", help="Collect papers, models, and rep
 app.add_typer(search.app, name="search", help="Search papers, vectors, and repos")
 app.add_typer(analyze.app, name="analyze", help="Analyze papers with LLM")
 app.add_typer(export.app, name="export", help="Export reports and data")
+app.add_typer(vectors.app, name="vectors", help="Maintain Qdrant collections")
 app.command(name="chat")(chat.chat_command)
+app.command(name="embed-server")(embed_server.embed_server_command)
+app.command(name="reindex")(reindex.reindex_command)
+app.command(name="refresh-analytics")(analytics.refresh_analytics_command)
 
 
 if __name__ == "__main__":
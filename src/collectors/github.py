@@ -5,7 +5,10 @@ API Docs: https://docs.github.com/en/graphql
 Rate Limit: 5000 points/hour (authenticated)
 """
 
+import asyncio
+import time
 from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta
 
@@ -14,6 +17,48 @@ from src.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+REPO_FIELDS = """
+fragment RepoFields on Repository {
+  id
+  databaseId
+  nameWithOwner
+  name
+  owner { login }
+  description
+  url
+  homepageUrl
+  stargazerCount
+  forkCount
+  watchers { totalCount }
+  primaryLanguage { name }
+  languages(first: 10) {
+    edges { size node { name } }
+  }
+  repositoryTopics(first: 20) {
+    nodes { topic { name } }
+  }
+  defaultBranchRef {
+    target {
+      ... on Commit {
+        history(first: 1) {
+          totalCount
+          nodes { committedDate }
+        }
+      }
+    }
+  }
+  releases(first: 1, orderBy: {field: CREATED_AT, direction: DESC}) {
+    nodes { tagName publishedAt }
+  }
+  licenseInfo { spdxId }
+  hasIssuesEnabled
+  openIssues: issues(states: OPEN) { totalCount }
+  createdAt
+  updatedAt
+  pushedAt
+}
+"""
+
 REPO_QUERY = """
 query($query: String!, $first: Int!, $after: String) {
   search(query: $query, type: REPOSITORY, first: $first, after: $after) {
@@ -22,50 +67,25 @@ query($query: String!, $first: Int!, $after: String) {
       endCursor
     }
     nodes {
-      ... on Repository {
-        id
-        databaseId
-        nameWithOwner
-        name
-        owner { login }
-        description
-        url
-        homepageUrl
-        stargazerCount
-        forkCount
-        watchers { totalCount }
-        primaryLanguage { name }
-        languages(first: 10) {
-          edges { size node { name } }
-        }
-        repositoryTopics(first: 20) {
-          nodes { topic { name } }
-        }
-        defaultBranchRef {
-          target {
-            ... on Commit {
-              history(first: 1) {
-                totalCount
-                nodes { committedDate }
-              }
-            }
-          }
-        }
-        releases(first: 1, orderBy: {field: CREATED_AT, direction: DESC}) {
-          nodes { tagName publishedAt }
-        }
-        licenseInfo { spdxId }
-        hasIssuesEnabled
-        openIssues: issues(states: OPEN) { totalCount }
-        createdAt
-        updatedAt
-        pushedAt
-      }
+      ...RepoFields
     }
   }
   rateLimit { limit cost remaining resetAt }
 }
-"""
+""" + REPO_FIELDS
+
+
+def _build_batch_repo_query(count: int) -> str:
+    """Aliased ``repository(owner:, name:)`` lookups: ``r0`` .. ``r{count-1}``."""
+    params = ", ".join(f"$o{i}: String!, $n{i}: String!" for i in range(count))
+    fields = "\n".join(
+        f"  r{i}: repository(owner: $o{i}, name: $n{i}) {{ ...RepoFields }}"
+        for i in range(count)
+    )
+    return (
+        f"query({params}) {{\n{fields}\n  rateLimit {{ limit cost remaining resetAt }}\n}}\n"
+        + REPO_FIELDS
+    )
 
 
 def _parse_datetime(dt_str: str | None) -> datetime | None:
@@ -75,6 +95,91 @@ def _parse_datetime(dt_str: str | None) -> datetime | None:
     return dt.replace(tzinfo=None)
 
 
+@dataclass
+class _TokenBudget:
+    token: str
+    limit: int = 5000
+    remaining: int = 5000
+    reset_at: float = 0.0  # epoch seconds; 0 = not observed yet
+    in_flight: int = 0
+
+
+class GraphQLRateScheduler:
+    """Cost-aware request scheduler over one or more GitHub tokens.
+
+    Tracks each token's point budget from the ``rateLimit`` block GitHub
+    returns with every GraphQL response, instead of a fixed requests/minute
+    cap. Requests are handed out round-robin to tokens whose remaining points
+    (minus the estimated cost of requests already in flight) stay above
+    ``reserve``; when every token is exhausted, callers sleep until the
+    earliest ``resetAt``.
+    """
+
+    def __init__(self, tokens: list[str], max_concurrency: int = 1, reserve: int = 50):
+        if not tokens:
+            raise ValueError("GraphQLRateScheduler needs at least one token")
+        self._budgets = [_TokenBudget(token=t) for t in tokens]
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._lock = asyncio.Lock()
+        self._next = 0
+        self._est_cost = 1.0
+        self.reserve = reserve
+
+    @property
+    def remaining(self) -> int:
+        return sum(b.remaining for b in self._budgets)
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[_TokenBudget]:
+        """Reserve a concurrency slot and a token with enough budget."""
+        async with self._semaphore:
+            budget = await self._acquire()
+            try:
+                yield budget
+            finally:
+                budget.in_flight -= 1
+
+    async def _acquire(self) -> _TokenBudget:
+        while True:
+            async with self._lock:
+                now = time.time()
+                n = len(self._budgets)
+                for i in range(n):
+                    budget = self._budgets[(self._next + i) % n]
+                    if budget.reset_at and now >= budget.reset_at:
+                        budget.remaining = budget.limit
+                        budget.reset_at = 0.0
+                    projected = budget.remaining - (budget.in_flight + 1) * self._est_cost
+                    if projected >= self.reserve:
+                        self._next = (self._next + i + 1) % n
+                        budget.in_flight += 1
+                        return budget
+                resets = [b.reset_at for b in self._budgets if b.reset_at]
+                wait = max(min(resets) - now, 1.0) if resets else 60.0
+            logger.warning(
+                "GitHub point budget exhausted, waiting for reset",
+                tokens=len(self._budgets),
+                wait_seconds=round(wait),
+            )
+            await asyncio.sleep(wait)
+
+    def record(self, budget: _TokenBudget, rate_limit: dict) -> None:
+        """Update a token's budget from a response's ``rateLimit`` block."""
+        if not rate_limit:
+            return
+        budget.limit = rate_limit.get("limit") or budget.limit
+        if rate_limit.get("remaining") is not None:
+            budget.remaining = rate_limit["remaining"]
+        if rate_limit.get("resetAt"):
+            budget.reset_at = datetime.fromisoformat(
+                rate_limit["resetAt"].replace("Z", "+00:00")
+            ).timestamp()
+        cost = rate_limit.get("cost")
+        if cost:
+            # Smoothed so in-flight reservations track the real query cost
+            self._est_cost = 0.8 * self._est_cost + 0.2 * cost
+
+
 @dataclass
 class GitHubRepo:
     github_id: int
@@ -112,15 +217,25 @@ class GitHubCollector(BaseCollector):
 
     GRAPHQL_URL = "https://api.github.com/graphql"
 
-    def __init__(self, token: str):
+    def __init__(
+        self,
+        token: str,
+        extra_tokens: list[str] | None = None,
+        max_concurrency: int = 1,
+    ):
         self.token = token
+        # Pacing comes from the point budget; the per-minute limiter only
+        # guards against GitHub's secondary (burst) limits.
         super().__init__(
             CollectorConfig(
                 name="github",
                 base_url=self.GRAPHQL_URL,
-                rate_limit_per_minute=80,
+                rate_limit_per_minute=600,
             )
         )
+        self.scheduler = GraphQLRateScheduler(
+            [token, *(extra_tokens or [])], max_concurrency=max_concurrency
+        )
 
     def _get_headers(self) -> dict:
         return {
@@ -132,6 +247,26 @@ class GitHubCollector(BaseCollector):
         async for result in self.search(**kwargs):
             yield result
 
+    async def _graphql(self, query: str, variables: dict) -> dict:
+        """POST a GraphQL query on a scheduled token and record its cost."""
+        async with self.scheduler.slot() as budget:
+            response = await self._request(
+                "POST",
+                self.GRAPHQL_URL,
+                json={"query": query, "variables": variables},
+                headers={"Authorization": f"Bearer {budget.token}"},
+            )
+            data = response.json()
+            rate_limit = (data.get("data") or {}).get("rateLimit") or {}
+            self.scheduler.record(budget, rate_limit)
+        if rate_limit:
+            logger.debug(
+                "GitHub rate limit",
+                remaining=rate_limit.get("remaining"),
+                cost=rate_limit.get("cost"),
+            )
+        return data
+
     async def search(
         self,
         query: str | None = None,
@@ -158,21 +293,7 @@ class GitHubCollector(BaseCollector):
                 "after": cursor,
             }
 
-            response = await self._request(
-                "POST",
-                self.GRAPHQL_URL,
-                json={"query": REPO_QUERY, "variables": variables},
-            )
-
-            data = response.json()
-
-            rate_limit = data.get("data", {}).get("rateLimit", {})
-            if rate_limit:
-                logger.debug(
-                    "GitHub rate limit",
-                    remaining=rate_limit.get("remaining"),
-                    cost=rate_limit.get("cost"),
-                )
+            data = await self._graphql(REPO_QUERY, variables)
 
             search_data = data.get("data", {}).get("search", {})
             nodes = search_data.get("nodes", [])
@@ -202,6 +323,31 @@ class GitHubCollector(BaseCollector):
             return result.data
         return None
 
+    async def get_repos_batch(
+        self, full_names: list[str], batch_size: int = 50
+    ) -> dict[str, GitHubRepo]:
+        """Fetch many repos by ``owner/name``, ``batch_size`` per GraphQL request.
+
+        Returns a mapping keyed by the requested full name; repos that no
+        longer exist (or are inaccessible) are omitted.
+        """
+        repos: dict[str, GitHubRepo] = {}
+        for start in range(0, len(full_names), batch_size):
+            batch = full_names[start : start + batch_size]
+            variables = {}
+            for i, full_name in enumerate(batch):
+                owner, _, name = full_name.partition("/")
+                variables[f"o{i}"] = owner
+                variables[f"n{i}"] = name
+
+            data = await self._graphql(_build_batch_repo_query(len(batch)), variables)
+            nodes = data.get("data") or {}
+            for i, full_name in enumerate(batch):
+                repo = self._parse_repo(nodes.get(f"r{i}"))
+                if repo:
+                    repos[full_name] = repo
+        return repos
+
     async def get_trending(
         self,
         language: str | None = None,
@@ -34,7 +34,36 @@ class Settings(BaseSettings):
 
     # Embedding Settings
     EMBEDDING_MODEL: str = "BAAI/bge-base-en-v1.5"
+    EMBEDDING_BACKEND: str = "torch"  # torch | torch-fp16 | torch-bf16 | onnx | onnx-int8
     EMBEDDING_DIMENSION: int = 768
+    EMBEDDING_SERVER_SOCKET: str | None = None
+    EMBEDDING_BATCH_MAX_SIZE: int = 64
+    EMBEDDING_BATCH_MAX_WAIT_MS: float = 5.0
+    EMBEDDING_CACHE_ENABLED: bool = True
+    EMBEDDING_CACHE_TTL_DAYS: int = 90
+
+    # RAG answer cache
+    RAG_CACHE_ENABLED: bool = True
+    RAG_CACHE_SIMILARITY_THRESHOLD: float = 0.95
+    RAG_CACHE_TTL_SECONDS: int = 3600
+    RAG_CACHE_MAX_ENTRIES: int = 1000
+
+    # Reranker
+    RERANKER_BACKEND: str = "torch"  # torch | onnx (int8, CPU)
+    RERANKER_BATCH_MAX_SIZE: int = 64
+    RERANKER_BATCH_MAX_WAIT_MS: float = 5.0
+    RERANKER_CACHE_SIZE: int = 10000
+    ONNX_CACHE_DIR: str = "./models/onnx"
+
+    # Reindexer (rri reindex)
+    REINDEX_READ_BATCH: int = 256
+    REINDEX_WRITE_BATCH: int = 1024
+    REINDEX_QUEUE_DEPTH: int = 4
+    # Background re-embed of `rri vectors migrate`, points/sec (0 = unlimited)
+    VECTOR_MIGRATION_MAX_RATE: float = 50.0
+
+    # Estimated counts of filtered list endpoints (count=estimate)
+    COUNT_CACHE_TTL_SECONDS: int = 300
 
     # Collection Settings
     ARXIV_CATEGORIES: list[str] = ["cs.AI", "cs.CL", "cs.CV", "cs.LG"]
@@ -42,11 +71,15 @@ class Settings(BaseSettings):
 
     # Rate Limits
     GITHUB_REQUESTS_PER_HOUR: int = 5000
+    GITHUB_EXTRA_TOKENS: list[str] = []
+    GITHUB_MAX_CONCURRENCY: int = 6
     S2_REQUESTS_PER_MINUTE: int = 100
 
     # File Upload
     UPLOAD_DIR: str = "./uploads"
     MAX_FILE_SIZE_MB: int = 100
+    PDF_EXTRACT_WORKERS: int = 2
+    PDF_PAGES_PER_TASK: int = 8
 
     # JWT / Auth
     SECRET_KEY: str = "change-me-in-production-use-a-long-random-string"
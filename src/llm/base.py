@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 from dataclasses import dataclass
 
 
@@ -22,6 +23,21 @@ class BaseLLMClient(ABC):
     ) -> str:
         pass
 
+    async def generate_stream(
+        self,
+        prompt: str,
+        max_tokens: int = 500,
+        temperature: float = 0.7,
+        system_prompt: str | None = None,
+    ) -> AsyncIterator[str]:
+        """Yield the response as text deltas. Default: a single chunk from ``generate``."""
+        yield await self.generate(
+            prompt,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            system_prompt=system_prompt,
+        )
+
     @abstractmethod
     async def generate_json(
         self,
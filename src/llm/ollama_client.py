@@ -1,4 +1,5 @@
 import json
+from collections.abc import AsyncIterator
 
 import httpx
 
@@ -23,27 +24,60 @@ class OllamaClient(BaseLLMClient):
         temperature: float = 0.7,
         system_prompt: str | None = None,
     ) -> str:
-        messages = []
-        if system_prompt:
-            messages.append({"role": "system", "content": system_prompt})
-        messages.append({"role": "user", "content": prompt})
-
         response = await self.client.post(
             f"{self.base_url}/api/chat",
-            json={
-                "model": self.model,
-                "messages": messages,
-                "options": {
-                    "num_predict": max_tokens,
-                    "temperature": temperature,
-                },
-                "stream": False,
-            },
+            json=self._chat_payload(prompt, max_tokens, temperature, system_prompt, stream=False),
         )
         response.raise_for_status()
         data = response.json()
         return data.get("message", {}).get("content", "")
 
+    async def generate_stream(
+        self,
+        prompt: str,
+        max_tokens: int = 500,
+        temperature: float = 0.7,
+        system_prompt: str | None = None,
+    ) -> AsyncIterator[str]:
+        async with self.client.stream(
+            "POST",
+            f"{self.base_url}/api/chat",
+            json=self._chat_payload(prompt, max_tokens, temperature, system_prompt, stream=True),
+        ) as response:
+            response.raise_for_status()
+            # Ollama streams one JSON object per line
+            async for line in response.aiter_lines():
+                if not line:
+                    continue
+                data = json.loads(line)
+                content = data.get("message", {}).get("content")
+                if content:
+                    yield content
+                if data.get("done"):
+                    break
+
+    def _chat_payload(
+        self,
+        prompt: str,
+        max_tokens: int,
+        temperature: float,
+        system_prompt: str | None,
+        stream: bool,
+    ) -> dict:
+        messages = []
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+        messages.append({"role": "user", "content": prompt})
+        return {
+            "model": self.model,
+            "messages": messages,
+            "options": {
+                "num_predict": max_tokens,
+                "temperature": temperature,
+            },
+            "stream": stream,
+        }
+
     async def generate_json(
         self,
         prompt: str,
@@ -1,4 +1,5 @@
 import json
+from collections.abc import AsyncIterator
 
 from openai import AsyncOpenAI
 
@@ -35,6 +36,29 @@ class OpenAIClient(BaseLLMClient):
         )
         return response.choices[0].message.content or ""
 
+    async def generate_stream(
+        self,
+        prompt: str,
+        max_tokens: int = 500,
+        temperature: float = 0.7,
+        system_prompt: str | None = None,
+    ) -> AsyncIterator[str]:
+        messages = []
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+        messages.append({"role": "user", "content": prompt})
+
+        stream = await self.client.chat.completions.create(
+            model=self.model,
+            messages=messages,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            stream=True,
+        )
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
     async def generate_json(
         self,
         prompt: str,
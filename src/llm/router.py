@@ -1,5 +1,7 @@
 """LLM Router - routes requests to appropriate LLM with auto-fallback."""
 
+from collections.abc import AsyncIterator
+
 from src.core.config import get_settings
 from src.core.logging import get_logger
 from src.llm.base import BaseLLMClient
@@ -60,6 +62,32 @@ class LLMRouter(BaseLLMClient):
                 )
             raise
 
+    async def generate_stream(
+        self,
+        prompt: str,
+        max_tokens: int = 500,
+        temperature: float = 0.7,
+        system_prompt: str | None = None,
+    ) -> AsyncIterator[str]:
+        kwargs = {
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "system_prompt": system_prompt,
+        }
+        started = False
+        try:
+            async for chunk in self.local_llm.generate_stream(prompt, **kwargs):
+                started = True
+                yield chunk
+        except Exception as e:
+            # Fall back only before any text was sent; a half-streamed answer
+            # cannot be continued by a different model.
+            if started or not self.cloud_llm:
+                raise
+            logger.warning("Local LLM stream failed, falling back to cloud LLM", error=str(e))
+            async for chunk in self.cloud_llm.generate_stream(prompt, **kwargs):
+                yield chunk
+
     async def generate_json(
         self,
         prompt: str,
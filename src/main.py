@@ -1,12 +1,14 @@
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from uvicorn.middleware.proxy_headers import ProxyHeadersMiddleware
 
 from src.api.routers import alerts, auth, bookmarks, chat, community, document_chat, documents, folders, health, papers, reports, repositories, search, trending
 from src.core.config import get_settings
 from src.core.logging import setup_logging
+from src.storage.repositories.pagination import InvalidCursorError
 
 
 @asynccontextmanager
@@ -16,8 +18,11 @@ async def lifespan(app: FastAPI):
     from src.storage.vector.qdrant_client import VectorStore
     VectorStore().init_collections()
     # Preload embedding model at startup so /search doesn't block later
+    # (skipped when a shared embedding server owns the model)
     import threading
     def _preload():
+        if get_settings().EMBEDDING_SERVER_SOCKET:
+            return
         from src.processors.embedding import EmbeddingGenerator
         EmbeddingGenerator().model
     threading.Thread(target=_preload, daemon=True).start()
@@ -45,6 +50,10 @@ def create_app() -> FastAPI:
     # Trust proxy headers for correct HTTPS redirects through Cloudflare tunnel
     app.add_middleware(ProxyHeadersMiddleware, trusted_hosts=["*"])
 
+    @app.exception_handler(InvalidCursorError)
+    async def invalid_cursor_handler(request: Request, exc: InvalidCursorError):
+        return JSONResponse(status_code=400, content={"detail": str(exc)})
+
     # Register routers
     app.include_router(health.router)
     app.include_router(auth.router)
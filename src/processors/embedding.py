@@ -1,15 +1,46 @@
-"""Embedding Generator using sentence-transformers."""
+"""Embedding Generator using sentence-transformers.
 
+The inference backend is chosen by ``EMBEDDING_BACKEND``:
+
+- ``torch``: fp32 PyTorch on mps/cuda/cpu (reference)
+- ``torch-fp16`` / ``torch-bf16``: half-precision PyTorch weights; fp16
+  needs cuda/mps and falls back to bf16 on CPU, where fp16 matmuls are
+  unsupported or slower than fp32
+- ``onnx`` / ``onnx-int8``: ONNX Runtime on CPU, fp32 or int8 dynamically
+  quantized (needs the ``onnx`` extra)
+
+``scripts/bench_embeddings.py`` checks each backend's cosine parity with
+the reference and its throughput.
+"""
+
+import json
+
+import numpy as np
 import torch
 from sentence_transformers import SentenceTransformer
 
 from src.core.config import get_settings
+from src.core.exceptions import ProcessingError
 from src.core.logging import get_logger
 
 logger = get_logger(__name__)
 
-# Module-level cache: load model once per process
-_model_cache: dict[str, SentenceTransformer] = {}
+EMBEDDING_BACKENDS = ("torch", "torch-fp16", "torch-bf16", "onnx", "onnx-int8")
+
+# Module-level cache: load each (model, backend) once per process
+_model_cache: dict[tuple[str, str], object] = {}
+
+_embedding_cache = None
+
+
+def _get_embedding_cache():
+    """Lazily create the shared content-addressed cache (None if disabled)."""
+    global _embedding_cache
+    if _embedding_cache is None and get_settings().EMBEDDING_CACHE_ENABLED:
+        from src.storage.cache.embedding_cache import EmbeddingCache
+
+        _embedding_cache = EmbeddingCache()
+    return _embedding_cache
 
 
 def _get_device() -> str:
@@ -21,32 +52,143 @@ def _get_device() -> str:
     return "cpu"
 
 
+class OnnxSentenceEncoder:
+    """``SentenceTransformer.encode`` look-alike over an ONNX Runtime model.
+
+    Pooling and max sequence length are read from the model's
+    sentence-transformers config, so vectors match the reference model.
+    """
+
+    def __init__(self, model_name: str, precision: str):
+        from optimum.onnxruntime import ORTModelForFeatureExtraction
+        from transformers import AutoTokenizer
+
+        from src.processors.onnx_backend import load_onnx_model
+
+        self.tokenizer = AutoTokenizer.from_pretrained(model_name)
+        self.model = load_onnx_model(model_name, ORTModelForFeatureExtraction, precision)
+        self.pooling, self.max_length = self._sentence_config(model_name)
+
+    @staticmethod
+    def _sentence_config(model_name: str) -> tuple[str, int]:
+        from huggingface_hub import hf_hub_download
+
+        pooling, max_length = "mean", 512
+        try:
+            with open(hf_hub_download(model_name, "1_Pooling/config.json")) as f:
+                if json.load(f).get("pooling_mode_cls_token"):
+                    pooling = "cls"
+            with open(hf_hub_download(model_name, "sentence_bert_config.json")) as f:
+                max_length = json.load(f).get("max_seq_length", max_length)
+        except Exception as e:
+            logger.warning("No sentence-transformers config, using mean pooling", error=str(e))
+        return pooling, max_length
+
+    def encode(
+        self, texts: list[str], normalize_embeddings: bool = True, batch_size: int = 32
+    ) -> np.ndarray:
+        batches = []
+        for start in range(0, len(texts), batch_size):
+            features = self.tokenizer(
+                texts[start : start + batch_size],
+                padding=True,
+                truncation=True,
+                max_length=self.max_length,
+                return_tensors="np",
+            )
+            hidden = self.model(**features).last_hidden_state
+            if self.pooling == "cls":
+                pooled = hidden[:, 0]
+            else:
+                mask = features["attention_mask"][..., None].astype(hidden.dtype)
+                pooled = (hidden * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+            batches.append(pooled)
+
+        embeddings = np.concatenate(batches).astype(np.float32)
+        if normalize_embeddings:
+            embeddings /= np.clip(np.linalg.norm(embeddings, axis=1, keepdims=True), 1e-12, None)
+        return embeddings
+
+
+def _load_model(model_name: str, backend: str, device: str):
+    if backend == "onnx":
+        return OnnxSentenceEncoder(model_name, "fp32")
+    if backend == "onnx-int8":
+        return OnnxSentenceEncoder(model_name, "int8")
+
+    model = SentenceTransformer(model_name, device=device)
+    if backend == "torch-fp16":
+        model = model.half()
+    elif backend == "torch-bf16":
+        model = model.to(torch.bfloat16)
+    return model
+
+
 class EmbeddingGenerator:
     """Generates vector embeddings for text content."""
 
-    def __init__(self, model_name: str | None = None):
+    def __init__(
+        self,
+        model_name: str | None = None,
+        use_cache: bool = True,
+        backend: str | None = None,
+    ):
         settings = get_settings()
         self.model_name = model_name or settings.EMBEDDING_MODEL
-        self.device = _get_device()
+        self.backend = backend or settings.EMBEDDING_BACKEND
+        if self.backend not in EMBEDDING_BACKENDS:
+            raise ProcessingError(f"Unknown embedding backend: {self.backend}")
+        self.device = "cpu" if self.backend.startswith("onnx") else _get_device()
+        if self.backend == "torch-fp16" and self.device == "cpu":
+            logger.warning("torch-fp16 needs cuda or mps, using torch-bf16 on cpu")
+            self.backend = "torch-bf16"
+        self.cache = _get_embedding_cache() if use_cache else None
 
     @property
-    def model(self) -> SentenceTransformer:
-        if self.model_name not in _model_cache:
-            logger.info("Loading embedding model", model=self.model_name, device=self.device)
-            _model_cache[self.model_name] = SentenceTransformer(
-                self.model_name, device=self.device
+    def model(self) -> SentenceTransformer | OnnxSentenceEncoder:
+        key = (self.model_name, self.backend)
+        if key not in _model_cache:
+            logger.info(
+                "Loading embedding model",
+                model=self.model_name,
+                backend=self.backend,
+                device=self.device,
             )
-        return _model_cache[self.model_name]
+            _model_cache[key] = _load_model(self.model_name, self.backend, self.device)
+        return _model_cache[key]
 
     def embed(self, text: str) -> list[float]:
-        embedding = self.model.encode(text, normalize_embeddings=True)
-        return embedding.tolist()
+        return self.embed_batch([text])[0]
 
     def embed_batch(self, texts: list[str], batch_size: int = 32) -> list[list[float]]:
+        """Embed texts, running the model only on cache misses."""
+        if not texts:
+            return []
+        if self.cache is None:
+            return self._encode(texts, batch_size)
+
+        results = self.cache.get_many(self.model_name, self.backend, texts)
+        miss_idx = [i for i, r in enumerate(results) if r is None]
+        if miss_idx:
+            miss_texts = [texts[i] for i in miss_idx]
+            encoded = self._encode(miss_texts, batch_size)
+            for i, embedding in zip(miss_idx, encoded):
+                results[i] = embedding
+            self.cache.set_many(self.model_name, self.backend, miss_texts, encoded)
+
+        logger.debug(
+            "Embedding cache lookup",
+            total=len(texts),
+            hits=len(texts) - len(miss_idx),
+        )
+        return results
+
+    def _encode(self, texts: list[str], batch_size: int) -> list[list[float]]:
         embeddings = self.model.encode(
             texts, normalize_embeddings=True, batch_size=batch_size
         )
-        return embeddings.tolist()
+        # Half-precision backends return fp16/bf16 arrays
+        return np.asarray(embeddings, dtype=np.float32).tolist()
 
     def embed_paper(self, title: str, abstract: str) -> list[float]:
         text = f"{title}\n\n{abstract}"
@@ -0,0 +1,256 @@
+"""Micro-batching embedding service shared by the API and Celery workers.
+
+Concurrent ``embed()`` calls are coalesced into a single ``encode`` call so
+the model runs one batched forward pass instead of many single-item ones.
+The service can run in-process (``LocalEmbeddingService``) or behind a local
+Unix socket (``EmbeddingServer`` + ``SocketEmbeddingClient``) so that every
+API and worker process shares a single copy of the model.
+
+Wire protocol (socket mode): one JSON object per line.
+    request:  {"texts": ["...", ...]}
+    response: {"embeddings": [[...], ...]} or {"error": "..."}
+"""
+
+import asyncio
+import json
+import os
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+
+from src.core.config import get_settings
+from src.core.exceptions import ProcessingError
+from src.core.logging import get_logger
+from src.processors.embedding import EmbeddingGenerator
+
+logger = get_logger(__name__)
+
+# Large READMEs/abstracts produce long lines; raise asyncio's 64 KiB default.
+_STREAM_LIMIT = 64 * 1024 * 1024
+
+
+class EmbeddingService(ABC):
+    """Async embedding interface used by search, RAG retrieval and workers."""
+
+    model_name: str
+
+    async def embed(self, text: str) -> list[float]:
+        embeddings = await self.embed_batch([text])
+        return embeddings[0]
+
+    @abstractmethod
+    async def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        pass
+
+
+class MicroBatcher:
+    """Coalesces concurrent model requests into bounded micro-batches.
+
+    A request waits at most ``max_wait_ms`` for other requests to join its
+    batch; a batch is flushed early once it holds ``max_batch_size`` items.
+    ``batch_fn`` (e.g. ``EmbeddingGenerator.embed_batch``) maps a list of
+    items to one result per item and runs in the default executor so the
+    event loop stays free.
+    """
+
+    def __init__(
+        self,
+        batch_fn: Callable[[list], list],
+        max_batch_size: int = 64,
+        max_wait_ms: float = 5.0,
+    ):
+        self.batch_fn = batch_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+        self._queue: asyncio.Queue | None = None
+        self._worker: asyncio.Task | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def _ensure_worker(self) -> asyncio.Queue:
+        # Celery tasks may run each invocation on a fresh loop, so the queue
+        # and worker task are rebound whenever the running loop changes.
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._worker is None or self._worker.done():
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._run())
+        return self._queue
+
+    async def submit(self, items: list) -> list:
+        if not items:
+            return []
+        queue = self._ensure_worker()
+        future = asyncio.get_running_loop().create_future()
+        await queue.put((items, future))
+        return await future
+
+    async def _run(self) -> None:
+        queue = self._queue
+        loop = asyncio.get_running_loop()
+        while True:
+            pending = [await queue.get()]
+            size = len(pending[0][0])
+            deadline = loop.time() + self.max_wait
+
+            while size < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                pending.append(item)
+                size += len(item[0])
+
+            flat = [item for items, _ in pending for item in items]
+            try:
+                results = await loop.run_in_executor(None, self.batch_fn, flat)
+            except Exception as e:
+                logger.error("Micro-batch failed", size=len(flat), error=str(e))
+                for _, future in pending:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            offset = 0
+            for items, future in pending:
+                if not future.done():
+                    future.set_result(results[offset : offset + len(items)])
+                offset += len(items)
+
+
+class LocalEmbeddingService(EmbeddingService):
+    """In-process embedding service backed by a ``MicroBatcher``."""
+
+    def __init__(
+        self,
+        generator: EmbeddingGenerator | None = None,
+        max_batch_size: int | None = None,
+        max_wait_ms: float | None = None,
+    ):
+        settings = get_settings()
+        self.generator = generator or EmbeddingGenerator()
+        self.model_name = self.generator.model_name
+        self.batcher = MicroBatcher(
+            self.generator.embed_batch,
+            max_batch_size=max_batch_size or settings.EMBEDDING_BATCH_MAX_SIZE,
+            max_wait_ms=(
+                max_wait_ms if max_wait_ms is not None else settings.EMBEDDING_BATCH_MAX_WAIT_MS
+            ),
+        )
+
+    async def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        return await self.batcher.submit(texts)
+
+
+class SocketEmbeddingClient(EmbeddingService):
+    """Embedding service client talking to an ``EmbeddingServer`` over a Unix socket."""
+
+    def __init__(self, socket_path: str, model_name: str | None = None):
+        self.socket_path = socket_path
+        self.model_name = model_name or get_settings().EMBEDDING_MODEL
+
+    async def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        if not texts:
+            return []
+        # One short-lived connection per call: concurrent callers hit the
+        # server in parallel, which is what lets it coalesce their requests.
+        reader, writer = await asyncio.open_unix_connection(
+            self.socket_path, limit=_STREAM_LIMIT
+        )
+        try:
+            writer.write(json.dumps({"texts": texts}).encode() + b"\n")
+            await writer.drain()
+            line = await reader.readline()
+        finally:
+            writer.close()
+            await writer.wait_closed()
+
+        if not line:
+            raise ProcessingError("Embedding server closed the connection")
+        response = json.loads(line)
+        if "error" in response:
+            raise ProcessingError("Embedding server error", detail=response["error"])
+        return response["embeddings"]
+
+
+class EmbeddingServer:
+    """Serves a ``LocalEmbeddingService`` on a Unix socket."""
+
+    def __init__(self, socket_path: str, service: LocalEmbeddingService | None = None):
+        self.socket_path = socket_path
+        self.service = service or LocalEmbeddingService()
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            while line := await reader.readline():
+                try:
+                    request = json.loads(line)
+                    embeddings = await self.service.embed_batch(request["texts"])
+                    response = {"embeddings": embeddings}
+                except Exception as e:
+                    response = {"error": str(e)}
+                writer.write(json.dumps(response).encode() + b"\n")
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def serve_forever(self) -> None:
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+        # Load the model before accepting connections.
+        self.service.generator.model
+        server = await asyncio.start_unix_server(
+            self._handle, path=self.socket_path, limit=_STREAM_LIMIT
+        )
+        logger.info(
+            "Embedding server listening",
+            socket=self.socket_path,
+            model=self.service.model_name,
+        )
+        async with server:
+            await server.serve_forever()
+
+
+_services: dict[str, EmbeddingService] = {}
+
+
+def get_embedding_service(model_name: str | None = None) -> EmbeddingService:
+    """Return the process-wide embedding service for ``model_name``.
+
+    The configured ``EMBEDDING_MODEL`` uses the shared socket server when
+    ``EMBEDDING_SERVER_SOCKET`` is set, otherwise an in-process
+    micro-batcher. Other models (a collection switched to a new model by
+    ``rri vectors migrate``) are always loaded in-process.
+    """
+    settings = get_settings()
+    model_name = model_name or settings.EMBEDDING_MODEL
+    if model_name not in _services:
+        if settings.EMBEDDING_SERVER_SOCKET and model_name == settings.EMBEDDING_MODEL:
+            _services[model_name] = SocketEmbeddingClient(settings.EMBEDDING_SERVER_SOCKET)
+        else:
+            _services[model_name] = LocalEmbeddingService(EmbeddingGenerator(model_name=model_name))
+    return _services[model_name]
+
+
+async def embed_for_collections(
+    text: str, models: dict[str, str], default: EmbeddingService | None = None
+) -> dict[str, list[float]]:
+    """Embed ``text`` once per distinct model; returns a vector per collection.
+
+    ``models`` maps collection -> embedding model (``version_models``).
+    ``default`` is used for its own model instead of the shared service.
+    """
+    vectors: dict[str, list[float]] = {}
+    for model in set(models.values()):
+        if default is not None and model == default.model_name:
+            service = default
+        else:
+            service = get_embedding_service(model)
+        vector = await service.embed(text)
+        vectors.update({c: vector for c, m in models.items() if m == model})
+    return vectors
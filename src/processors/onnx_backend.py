@@ -0,0 +1,57 @@
+"""ONNX Runtime loading for transformer models on CPU-only hosts.
+
+A Hugging Face model is exported to ONNX with optimum the first time it is
+requested, dynamically quantized to int8 when asked, and cached under
+``ONNX_CACHE_DIR/<model>/<precision>`` so later processes load it directly.
+Requires the ``onnx`` extra (``pip install -e ".[onnx]"``).
+"""
+
+from pathlib import Path
+
+from src.core.config import get_settings
+from src.core.exceptions import ProcessingError
+from src.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+ONNX_PRECISIONS = ("fp32", "int8")
+QUANTIZED_FILE_NAME = "model_quantized.onnx"
+
+
+def onnx_model_dir(model_name: str, precision: str) -> Path:
+    return Path(get_settings().ONNX_CACHE_DIR) / model_name.replace("/", "--") / precision
+
+
+def _file_name(precision: str) -> str:
+    return QUANTIZED_FILE_NAME if precision == "int8" else "model.onnx"
+
+
+def load_onnx_model(model_name: str, model_cls, precision: str = "int8"):
+    """Load ``model_name`` as an optimum ``ORTModel*`` (``model_cls``), exporting on first use."""
+    if precision not in ONNX_PRECISIONS:
+        raise ProcessingError(f"Unsupported ONNX precision: {precision}")
+    try:
+        from optimum.onnxruntime import ORTQuantizer
+        from optimum.onnxruntime.configuration import AutoQuantizationConfig
+    except ImportError as e:
+        raise ProcessingError(
+            "ONNX backend requires the onnx extra: pip install -e '.[onnx]'"
+        ) from e
+
+    target = onnx_model_dir(model_name, precision)
+    if not (target / _file_name(precision)).exists():
+        fp32_dir = onnx_model_dir(model_name, "fp32")
+        if not (fp32_dir / "model.onnx").exists():
+            logger.info("Exporting model to ONNX", model=model_name, path=str(fp32_dir))
+            model_cls.from_pretrained(model_name, export=True).save_pretrained(fp32_dir)
+
+        if precision == "int8":
+            logger.info("Quantizing ONNX model to int8", model=model_name, path=str(target))
+            quantizer = ORTQuantizer.from_pretrained(fp32_dir)
+            # Dynamic quantization: no calibration data, weights stored as int8
+            qconfig = AutoQuantizationConfig.avx2(is_static=False, per_channel=False)
+            quantizer.quantize(save_dir=target, quantization_config=qconfig)
+
+    return model_cls.from_pretrained(
+        target, file_name=_file_name(precision), provider="CPUExecutionProvider"
+    )
@@ -11,6 +11,7 @@ from src.collectors.huggingface import HuggingFaceCollector
 from src.collectors.papers_with_code import PapersWithCodeCollector
 from src.core.constants import LinkType
 from src.core.logging import get_logger
+from src.storage.repositories.author_repo import author_name_key
 
 logger = get_logger(__name__)
 
@@ -224,15 +225,20 @@ class PaperCodeLinker:
 
 
 def _fuzzy_author_match(paper_authors: list[dict], github_user: str) -> float:
-    github_user_lower = github_user.lower()
+    # Compare on the authors-table name key, so accents and punctuation
+    # ("José García-López" vs "jgarcialopez") do not lower the score
+    user_key = author_name_key(github_user).replace(" ", "")
     best_score = 0.0
     for author in paper_authors:
-        name = author.get("name", "").lower()
-        score = fuzz.ratio(name, github_user_lower) / 100
-        parts = name.split()
-        if parts:
-            last_name_score = fuzz.ratio(parts[-1], github_user_lower) / 100
-            score = max(score, last_name_score)
+        key = author_name_key(author.get("name") or "")
+        if not key:
+            continue
+        parts = key.split()
+        score = max(
+            fuzz.ratio(key, user_key),
+            fuzz.ratio("".join(parts), user_key),
+            fuzz.ratio(parts[-1], user_key),
+        ) / 100
         best_score = max(best_score, score)
     return best_score
 
@@ -0,0 +1,103 @@
+"""BM25 sparse vector encoder for the lexical side of hybrid retrieval.
+
+Documents are encoded as hashed-token BM25 term-frequency weights; Qdrant
+applies IDF server-side (``Modifier.IDF``), so the index can be updated one
+point at a time without refitting corpus statistics.
+"""
+
+import re
+import zlib
+from collections import Counter
+
+# Keeps identifiers intact: "2401.12345", "gpt-4o", "llama3", "bge-base-en-v1.5"
+_TOKEN_RE = re.compile(r"[a-z0-9]+(?:[.\-_][a-z0-9]+)*")
+
+_STOPWORDS = frozenset(
+    """a an and are as at be by for from has have in is it its of on or that the
+    this to was were which with we our using via into can""".split()
+)
+
+
+def tokenize(text: str) -> list[str]:
+    tokens = []
+    for token in _TOKEN_RE.findall(text.lower()):
+        if token in _STOPWORDS or (len(token) < 2 and not token.isdigit()):
+            continue
+        tokens.append(token)
+        # Also index the parts of compound tokens so "bge-base" matches "bge"
+        if any(sep in token for sep in ".-_") and not token.replace(".", "").isdigit():
+            tokens.extend(p for p in re.split(r"[.\-_]", token) if p and p not in _STOPWORDS)
+    return tokens
+
+
+def _token_id(token: str) -> int:
+    return zlib.crc32(token.encode()) & 0x7FFFFFFF
+
+
+class BM25SparseEncoder:
+    """Encodes text into (indices, values) sparse vectors with BM25 TF saturation."""
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75, avg_doc_len: float = 180.0):
+        self.k1 = k1
+        self.b = b
+        self.avg_doc_len = avg_doc_len
+
+    def encode_document(self, text: str) -> tuple[list[int], list[float]]:
+        tokens = tokenize(text)
+        if not tokens:
+            return [], []
+        counts = Counter(tokens)
+        norm = self.k1 * (1 - self.b + self.b * len(tokens) / self.avg_doc_len)
+
+        weights: dict[int, float] = {}
+        for token, tf in counts.items():
+            idx = _token_id(token)
+            weights[idx] = weights.get(idx, 0.0) + tf * (self.k1 + 1) / (tf + norm)
+        return list(weights.keys()), list(weights.values())
+
+    def encode_query(self, text: str) -> tuple[list[int], list[float]]:
+        indices = sorted({_token_id(t) for t in tokenize(text)})
+        return indices, [1.0] * len(indices)
+
+    def to_point(self, point: dict, text: str) -> dict:
+        """Build a sparse point sharing ``point``'s id and payload."""
+        indices, values = self.encode_document(text)
+        return {
+            "id": point["id"],
+            "indices": indices,
+            "values": values,
+            "payload": point["payload"],
+        }
+
+
+def paper_lexical_text(paper) -> str:
+    """Text indexed for BM25 for a ``Paper`` row (arXiv ID included for exact lookups)."""
+    return "\n".join([paper.arxiv_id or "", paper.title, paper.abstract or ""])
+
+
+def repo_lexical_text(repository) -> str:
+    """Text indexed for BM25 for a ``Repository`` row."""
+    return "\n".join([
+        repository.full_name,
+        repository.description or "",
+        " ".join(repository.topics or []),
+        (repository.readme_content or "")[:2000],
+    ])
+
+
+def payload_lexical_text(payload: dict) -> str:
+    """Text indexed for BM25 for a point, rebuilt from its Qdrant payload."""
+    content = payload.get("content")
+    return "\n".join(
+        str(v)
+        for v in (
+            payload.get("arxiv_id"),
+            payload.get("full_name"),
+            payload.get("title"),
+            payload.get("abstract"),
+            payload.get("description"),
+            " ".join(payload.get("topics") or []),
+            content if content != payload.get("description") else None,
+        )
+        if v
+    )
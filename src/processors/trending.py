@@ -1,7 +1,9 @@
 """Trending Score Calculator."""
 
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import date, datetime
+
+import numpy as np
 
 from src.core.logging import get_logger
 from src.storage.repositories.metrics_repo import MetricsRepository
@@ -154,3 +156,143 @@ class TrendingCalculator:
         elif days_ago <= 30:
             return 0.5 - ((days_ago - 7) / 46)
         return max(0.0, 0.2 - ((days_ago - 30) / 150))
+
+
+def _days_since(values: list, now: datetime) -> np.ndarray:
+    """Whole days elapsed (floored, like ``timedelta.days``); NaN where missing."""
+    stamps = np.array(values, dtype="datetime64[s]")
+    elapsed = (np.datetime64(now, "s") - stamps) / np.timedelta64(1, "D")
+    return np.floor(elapsed)
+
+
+def _recency_scores(days_ago: np.ndarray) -> np.ndarray:
+    """Vectorized ``TrendingCalculator._calculate_recency``."""
+    with np.errstate(invalid="ignore"):
+        return np.select(
+            [np.isnan(days_ago), days_ago <= 0, days_ago <= 7, days_ago <= 30],
+            [0.0, 1.0, 1.0 - days_ago / 14, 0.5 - (days_ago - 7) / 46],
+            default=np.maximum(0.0, 0.2 - (days_ago - 30) / 150),
+        )
+
+
+class BatchTrendingCalculator:
+    """
+    Scores every paper and repository at once with the same formulas as
+    ``TrendingCalculator``.
+
+    Inputs and the metrics history window are each loaded with a single
+    query, scores are computed column-wise in NumPy, and the result is a
+    list of rows ready for ``MetricsRepository.bulk_upsert_trending_scores``.
+    """
+
+    def __init__(self, metrics_repo: MetricsRepository):
+        self.metrics = metrics_repo
+
+    def _total(self, activity, community, academic, recency) -> np.ndarray:
+        return (
+            activity * TrendingCalculator.W_ACTIVITY
+            + community * TrendingCalculator.W_COMMUNITY
+            + academic * TrendingCalculator.W_ACADEMIC
+            + recency * TrendingCalculator.W_RECENCY
+        )
+
+    def _history_arrays(
+        self, ids: list, summaries: dict, current: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """(has >= 2 snapshots in window, latest snapshot value defaulting to current)."""
+        counts = np.array([summaries.get(i, (0, None))[0] for i in ids], dtype=np.int64)
+        latest = np.array(
+            [summaries.get(i, (0, None))[1] for i in ids], dtype=np.float64
+        )
+        latest = np.where(np.isnan(latest), current, latest)
+        return counts >= 2, latest
+
+    def _rows(
+        self, entity_type: str, entities: list, activity, community, academic, recency
+    ) -> list[dict]:
+        total = self._total(activity, community, academic, recency)
+        today = date.today()
+        return [
+            {
+                "entity_type": entity_type,
+                "entity_id": entity.id,
+                "activity_score": float(activity[i]),
+                "community_score": float(community[i]),
+                "academic_score": float(academic[i]),
+                "recency_score": float(recency[i]),
+                "total_score": float(total[i]),
+                "category": entity.category,
+                "period_start": today,
+                "period_end": today,
+            }
+            for i, entity in enumerate(entities)
+        ]
+
+    async def score_repos(self, period_days: int = 7) -> list[dict]:
+        repos = await self.metrics.get_repo_score_inputs()
+        if not repos:
+            return []
+        ids = [r.id for r in repos]
+        stars = np.array([r.stars_count or 0 for r in repos], dtype=np.float64)
+        open_issues = np.array([r.open_issues_count or 0 for r in repos], dtype=np.float64)
+        commits = np.array([r.commit_count_30d or 0 for r in repos], dtype=np.float64)
+        days_since_commit = _days_since([r.last_commit_at for r in repos], datetime.utcnow())
+
+        summaries = await self.metrics.get_window_summaries(
+            "repository", "stars", period_days
+        )
+        has_history, old_stars = self._history_arrays(ids, summaries, stars)
+
+        # Activity
+        activity = np.minimum(1.0, commits / 30) * 0.5
+        activity += np.minimum(1.0, open_issues / 50) * 0.3
+        with np.errstate(invalid="ignore"):
+            activity += np.select(
+                [days_since_commit < 7, days_since_commit < 30], [0.2, 0.1], default=0.0
+            )
+        activity = np.minimum(1.0, activity)
+
+        # Community
+        with np.errstate(divide="ignore", invalid="ignore"):
+            velocity = np.where(stars > 0, (stars - old_stars) / stars, 0.0)
+        community = np.where(
+            has_history, np.minimum(1.0, velocity * 10), np.minimum(1.0, stars / 10000)
+        )
+
+        # Academic: repos carry no citation data
+        academic = np.full(len(repos), 0.5)
+
+        recency = _recency_scores(days_since_commit)
+        return self._rows("repository", repos, activity, community, academic, recency)
+
+    async def score_papers(self, period_days: int = 30) -> list[dict]:
+        papers = await self.metrics.get_paper_score_inputs()
+        if not papers:
+            return []
+        ids = [p.id for p in papers]
+        citations = np.array([p.citation_count or 0 for p in papers], dtype=np.float64)
+        influential = np.array(
+            [p.influential_citation_count or 0 for p in papers], dtype=np.float64
+        )
+        days_since_published = _days_since([p.published_date for p in papers], datetime.utcnow())
+
+        summaries = await self.metrics.get_window_summaries(
+            "paper", "citations", period_days
+        )
+        has_history, old_citations = self._history_arrays(ids, summaries, citations)
+
+        activity = np.full(len(papers), 0.5)
+        community = np.full(len(papers), 0.5)
+
+        # Academic (citation velocity)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            influential_ratio = np.where(citations > 0, influential / citations, 0.0)
+        velocity_score = np.minimum(1.0, (citations - old_citations) / 10)
+        academic = np.where(
+            has_history,
+            np.minimum(1.0, velocity_score + influential_ratio * 0.5),
+            np.minimum(1.0, citations / 100),
+        )
+
+        recency = _recency_scores(days_since_published)
+        return self._rows("paper", papers, activity, community, academic, recency)
@@ -0,0 +1,161 @@
+"""Semantic cache of RAG answers keyed by query embedding.
+
+Near-duplicate questions ("what is LoRA?" / "What's LoRA") skip retrieval,
+reranking and generation when an earlier answer was computed with the same
+filters and the query embeddings have cosine similarity above the
+threshold. Entries record the vector-collection versions they were built
+from (see ``src.storage.cache.collection_versions``) and are dropped once
+any collection has received new points, on TTL expiry, or by LRU eviction.
+
+The cache is per process: one linear scan over at most ``max_entries``
+normalized vectors is far cheaper than a retrieval round-trip.
+"""
+
+import json
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+from src.core.config import get_settings
+from src.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class _CacheEntry:
+    embedding: np.ndarray
+    scope: str
+    versions: tuple[int, ...]
+    value: Any
+    created_at: float
+    cost_seconds: float
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    latency_saved_seconds: float = 0.0
+    evictions: int = 0
+    invalidations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+def cache_scope(filters: dict | None, collections: list[str]) -> str:
+    """Canonical string for the parts of a query that must match exactly."""
+    return json.dumps(
+        {"filters": filters or {}, "collections": sorted(collections)},
+        sort_keys=True,
+        default=str,
+    )
+
+
+def _normalize(embedding: list[float]) -> np.ndarray:
+    vector = np.asarray(embedding, dtype=np.float32)
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
+
+class SemanticAnswerCache:
+    def __init__(self, max_entries: int, ttl_seconds: int, threshold: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.threshold = threshold
+        self._entries: OrderedDict[int, _CacheEntry] = OrderedDict()
+        self._next_key = 0
+        self._stats = CacheStats()
+
+    def _purge(self, scope: str, versions: tuple[int, ...]) -> None:
+        """Drop expired entries and those built against older collection versions."""
+        cutoff = time.monotonic() - self.ttl_seconds
+        for key, entry in list(self._entries.items()):
+            if entry.created_at < cutoff:
+                del self._entries[key]
+            elif entry.scope == scope and entry.versions != versions:
+                del self._entries[key]
+                self._stats.invalidations += 1
+
+    def lookup(
+        self, embedding: list[float], scope: str, versions: tuple[int, ...]
+    ) -> Any | None:
+        """Cached value for the closest query above the threshold, or None."""
+        self._purge(scope, versions)
+        query = _normalize(embedding)
+
+        best_key, best_score = None, self.threshold
+        for key, entry in self._entries.items():
+            if entry.scope != scope:
+                continue
+            score = float(np.dot(query, entry.embedding))
+            if score >= best_score:
+                best_key, best_score = key, score
+
+        if best_key is None:
+            self._stats.misses += 1
+            return None
+
+        entry = self._entries[best_key]
+        self._entries.move_to_end(best_key)
+        self._stats.hits += 1
+        self._stats.latency_saved_seconds += entry.cost_seconds
+        logger.debug("Answer cache hit", similarity=round(best_score, 4))
+        return entry.value
+
+    def store(
+        self,
+        embedding: list[float],
+        scope: str,
+        versions: tuple[int, ...],
+        value: Any,
+        cost_seconds: float,
+    ) -> None:
+        self._entries[self._next_key] = _CacheEntry(
+            embedding=_normalize(embedding),
+            scope=scope,
+            versions=versions,
+            value=value,
+            created_at=time.monotonic(),
+            cost_seconds=cost_seconds,
+        )
+        self._next_key += 1
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._stats.evictions += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self._stats.hits,
+            "misses": self._stats.misses,
+            "hit_rate": round(self._stats.hit_rate, 4),
+            "latency_saved_seconds": round(self._stats.latency_saved_seconds, 3),
+            "evictions": self._stats.evictions,
+            "invalidations": self._stats.invalidations,
+        }
+
+
+_answer_cache: SemanticAnswerCache | None = None
+
+
+def get_answer_cache() -> SemanticAnswerCache:
+    global _answer_cache
+    if _answer_cache is None:
+        settings = get_settings()
+        _answer_cache = SemanticAnswerCache(
+            max_entries=settings.RAG_CACHE_MAX_ENTRIES,
+            ttl_seconds=settings.RAG_CACHE_TTL_SECONDS,
+            threshold=settings.RAG_CACHE_SIMILARITY_THRESHOLD,
+        )
+    return _answer_cache
@@ -1,6 +1,7 @@
 """Answer Generator with citations for RAG pipeline."""
 
 import re
+from collections.abc import AsyncIterator
 
 from src.core.logging import get_logger
 from src.llm.base import BaseLLMClient
@@ -8,6 +9,8 @@ from src.rag.retriever import RetrievedDocument
 
 logger = get_logger(__name__)
 
+CITATION_PATTERN = re.compile(r"\[(\d+)\]")
+
 GENERATION_PROMPT = """
 You are a research assistant. Answer the question based on the provided context.
 
@@ -38,6 +41,46 @@ Answer:
 """
 
 
+def _citation(idx: int, documents: list[RetrievedDocument]) -> dict:
+    doc = documents[idx - 1]
+    return {
+        "index": idx,
+        "document_id": doc.id,
+        "title": doc.title,
+        "url": doc.url,
+    }
+
+
+class CitationTracker:
+    """Extracts ``[n]`` citations from an answer as it streams in.
+
+    ``feed`` returns citations seen for the first time. A marker split
+    across chunks (``"[1"`` + ``"2]"``) is held back until it completes.
+    """
+
+    def __init__(self, documents: list[RetrievedDocument]):
+        self.documents = documents
+        self._pending = ""
+        self._seen: set[int] = set()
+
+    def feed(self, text: str) -> list[dict]:
+        self._pending += text
+        new = []
+        for match in CITATION_PATTERN.finditer(self._pending):
+            idx = int(match.group(1))
+            if idx not in self._seen and 1 <= idx <= len(self.documents):
+                self._seen.add(idx)
+                new.append(_citation(idx, self.documents))
+        # Keep only a possibly unfinished "[123" tail for the next chunk
+        tail = self._pending[self._pending.rfind("["):] if "[" in self._pending else ""
+        self._pending = tail if "]" not in tail and len(tail) <= 8 else ""
+        return new
+
+    @property
+    def citations(self) -> list[dict]:
+        return [_citation(idx, self.documents) for idx in sorted(self._seen)]
+
+
 class AnswerGenerator:
     """Generates answers with citations from retrieved context."""
 
@@ -60,6 +103,18 @@ class AnswerGenerator:
         citations = self._extract_citations(response, context)
         return response, citations
 
+    async def generate_stream(
+        self,
+        query: str,
+        context: list[RetrievedDocument],
+    ) -> AsyncIterator[str]:
+        """Stream answer text; pair with ``CitationTracker`` for citations."""
+        prompt = GENERATION_PROMPT.format(
+            context=self._format_context(context), question=query
+        )
+        async for chunk in self.llm.generate_stream(prompt, max_tokens=1000, temperature=0.3):
+            yield chunk
+
     def _format_context(self, documents: list[RetrievedDocument]) -> str:
         parts = []
         for i, doc in enumerate(documents, 1):
@@ -70,22 +125,14 @@ class AnswerGenerator:
         prompt = FALLBACK_PROMPT.format(question=query)
         return await self.llm.generate(prompt, max_tokens=1000, temperature=0.7)
 
+    async def generate_fallback_stream(self, query: str) -> AsyncIterator[str]:
+        prompt = FALLBACK_PROMPT.format(question=query)
+        async for chunk in self.llm.generate_stream(prompt, max_tokens=1000, temperature=0.7):
+            yield chunk
+
     def _extract_citations(
         self, answer: str, documents: list[RetrievedDocument]
     ) -> list[dict]:
-        citation_pattern = re.compile(r"\[(\d+)\]")
-        cited_indices = set(int(m) for m in citation_pattern.findall(answer))
-
-        citations = []
-        for idx in sorted(cited_indices):
-            if 1 <= idx <= len(documents):
-                doc = documents[idx - 1]
-                citations.append(
-                    {
-                        "index": idx,
-                        "document_id": doc.id,
-                        "title": doc.title,
-                        "url": doc.url,
-                    }
-                )
-        return citations
+        tracker = CitationTracker(documents)
+        tracker.feed(answer)
+        return tracker.citations
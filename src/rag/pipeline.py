@@ -1,12 +1,16 @@
 """Full RAG Pipeline for research Q&A with multilingual support."""
 
+import time
+from collections.abc import AsyncIterator
 from dataclasses import dataclass
 
 from src.core.logging import get_logger
 from src.llm.base import BaseLLMClient
-from src.rag.generator import AnswerGenerator
+from src.rag.answer_cache import SemanticAnswerCache, cache_scope
+from src.rag.generator import CITATION_PATTERN, AnswerGenerator, CitationTracker
 from src.rag.reranker import CrossEncoderReranker
-from src.rag.retriever import HybridRetriever
+from src.rag.retriever import DEFAULT_COLLECTIONS, HybridRetriever, RetrievedDocument
+from src.storage.cache.collection_versions import get_collection_versions
 
 logger = get_logger(__name__)
 
@@ -36,6 +40,21 @@ class RAGResponse:
     confidence: float
 
 
+@dataclass
+class _CacheKey:
+    embedding: list[float]
+    scope: str
+    versions: tuple[int, ...]
+
+
+@dataclass
+class StreamEvent:
+    """One server-sent event: ``sources`` first, then ``token``/``citation``, then ``done``."""
+
+    event: str
+    data: dict
+
+
 class RAGPipeline:
     """
     Full RAG pipeline for research Q&A.
@@ -53,11 +72,31 @@ class RAGPipeline:
         reranker: CrossEncoderReranker,
         generator: AnswerGenerator,
         llm_client: BaseLLMClient | None = None,
+        answer_cache: SemanticAnswerCache | None = None,
     ):
         self.retriever = retriever
         self.reranker = reranker
         self.generator = generator
         self.llm = llm_client
+        self.answer_cache = answer_cache
+
+    async def _cache_key(
+        self, question: str, filters: dict | None, collections: list[str] | None
+    ) -> _CacheKey | None:
+        """Key for the answer cache, or None when caching is off or unavailable."""
+        if self.answer_cache is None:
+            return None
+        target_collections = collections or DEFAULT_COLLECTIONS
+        versions = await get_collection_versions(target_collections)
+        if versions is None:
+            # Without versions, stale answers could not be invalidated
+            return None
+        try:
+            embedding = await self.retriever.embeddings.embed(question)
+        except Exception as e:
+            logger.warning("Answer cache embedding failed", error=str(e))
+            return None
+        return _CacheKey(embedding, cache_scope(filters, target_collections), versions)
 
     async def _translate_to_english(self, text: str) -> str:
         """Translate non-English text to English using LLM."""
@@ -80,24 +119,62 @@ class RAGPipeline:
             logger.warning("Translation failed, using original query", error=str(e))
             return text
 
-    async def query(
+    async def _retrieve_context(
         self,
         question: str,
-        top_k: int = 10,
-        rerank_top_k: int = 5,
-        filters: dict | None = None,
-    ) -> RAGResponse:
-        # 0. Translate non-English queries for better embedding match
+        top_k: int,
+        rerank_top_k: int,
+        filters: dict | None,
+        collections: list[str] | None = None,
+    ) -> list[RetrievedDocument]:
+        # Translate non-English queries for better embedding match
         search_query = question
         if not _is_english(question):
             search_query = await self._translate_to_english(question)
 
-        # 1. Retrieve relevant documents (using English query)
         retrieved = await self.retriever.retrieve(
-            query=search_query, top_k=top_k, filters=filters
+            query=search_query, top_k=top_k, filters=filters, collections=collections
         )
-
         if not retrieved:
+            return []
+
+        return await self.reranker.rerank(
+            query=search_query, documents=retrieved, top_k=rerank_top_k
+        )
+
+    async def query(
+        self,
+        question: str,
+        top_k: int = 10,
+        rerank_top_k: int = 5,
+        filters: dict | None = None,
+    ) -> RAGResponse:
+        key = await self._cache_key(question, filters, None)
+        if key is not None:
+            cached = self.answer_cache.lookup(key.embedding, key.scope, key.versions)
+            if cached is not None:
+                return cached
+
+        started = time.perf_counter()
+        response = await self._answer(question, top_k, rerank_top_k, filters)
+        # Fallback answers carry no sources and are not worth pinning
+        if key is not None and response.sources:
+            self.answer_cache.store(
+                key.embedding,
+                key.scope,
+                key.versions,
+                response,
+                cost_seconds=time.perf_counter() - started,
+            )
+        return response
+
+    async def _answer(
+        self, question: str, top_k: int, rerank_top_k: int, filters: dict | None
+    ) -> RAGResponse:
+        # 1-2. Retrieve (English query) and rerank
+        reranked = await self._retrieve_context(question, top_k, rerank_top_k, filters)
+
+        if not reranked:
             # Fallback: answer using LLM general knowledge when no context found
             fallback_answer = await self.generator.generate_fallback(query=question)
             return RAGResponse(
@@ -106,18 +183,109 @@ class RAGPipeline:
                 confidence=0.0,
             )
 
-        # 2. Rerank for relevance
-        reranked = await self.reranker.rerank(
-            query=search_query, documents=retrieved, top_k=rerank_top_k
-        )
-
         # 3. Generate answer with citations (use original question for natural response)
         answer, citations = await self.generator.generate(
             query=question, context=reranked
         )
 
         # 4. Build response
-        sources = [
+        return RAGResponse(
+            answer=answer,
+            sources=self._build_sources(reranked),
+            confidence=self._calculate_confidence(reranked),
+        )
+
+    async def query_stream(
+        self,
+        question: str,
+        top_k: int = 10,
+        rerank_top_k: int = 5,
+        filters: dict | None = None,
+        collections: list[str] | None = None,
+    ) -> AsyncIterator[StreamEvent]:
+        """Streaming ``query``: sources as soon as reranking ends, then answer tokens."""
+        key = await self._cache_key(question, filters, collections)
+        if key is not None:
+            cached = self.answer_cache.lookup(key.embedding, key.scope, key.versions)
+            if cached is not None:
+                for event in self._cached_events(cached):
+                    yield event
+                return
+
+        started = time.perf_counter()
+        reranked = await self._retrieve_context(
+            question, top_k, rerank_top_k, filters, collections
+        )
+        sources = self._build_sources(reranked)
+        confidence = self._calculate_confidence(reranked)
+        yield StreamEvent("sources", {"sources": sources, "confidence": confidence})
+
+        tracker = CitationTracker(reranked)
+        if reranked:
+            chunks = self.generator.generate_stream(query=question, context=reranked)
+        else:
+            chunks = self.generator.generate_fallback_stream(query=question)
+
+        parts = []
+        async for chunk in chunks:
+            parts.append(chunk)
+            yield StreamEvent("token", {"text": chunk})
+            for citation in tracker.feed(chunk):
+                yield StreamEvent("citation", citation)
+
+        answer = "".join(parts)
+        if key is not None and sources:
+            self.answer_cache.store(
+                key.embedding,
+                key.scope,
+                key.versions,
+                RAGResponse(answer=answer, sources=sources, confidence=confidence),
+                cost_seconds=time.perf_counter() - started,
+            )
+
+        yield StreamEvent(
+            "done",
+            {
+                "answer": answer,
+                "sources": sources,
+                "citations": tracker.citations,
+                "confidence": confidence,
+            },
+        )
+
+    @staticmethod
+    def _cached_events(response: RAGResponse) -> list[StreamEvent]:
+        """Replay a cached answer as a stream: sources, the whole text, done."""
+        cited = sorted({int(m) for m in CITATION_PATTERN.findall(response.answer)})
+        citations = [
+            {
+                "index": idx,
+                "document_id": response.sources[idx - 1]["id"],
+                "title": response.sources[idx - 1]["title"],
+                "url": response.sources[idx - 1]["url"],
+            }
+            for idx in cited
+            if 1 <= idx <= len(response.sources)
+        ]
+        return [
+            StreamEvent(
+                "sources", {"sources": response.sources, "confidence": response.confidence}
+            ),
+            StreamEvent("token", {"text": response.answer}),
+            StreamEvent(
+                "done",
+                {
+                    "answer": response.answer,
+                    "sources": response.sources,
+                    "citations": citations,
+                    "confidence": response.confidence,
+                },
+            ),
+        ]
+
+    @staticmethod
+    def _build_sources(documents: list[RetrievedDocument]) -> list[dict]:
+        return [
             {
                 "id": doc.id,
                 "type": doc.source_type,
@@ -125,15 +293,9 @@ class RAGPipeline:
                 "url": doc.url,
                 "relevance_score": doc.score,
             }
-            for doc in reranked
+            for doc in documents
         ]
 
-        return RAGResponse(
-            answer=answer,
-            sources=sources,
-            confidence=self._calculate_confidence(reranked),
-        )
-
     def _calculate_confidence(self, documents: list) -> float:
         if not documents:
             return 0.0
@@ -1,19 +1,71 @@
-"""Cross-encoder Reranker for improving retrieval quality."""
+"""Cross-encoder Reranker for improving retrieval quality.
 
+One reranker per process (``get_reranker``) holds the model. Scoring runs
+in the default executor; pairs from concurrent requests are coalesced into
+one forward pass by a ``MicroBatcher``, and scores are memoized per
+(query, document) in an LRU cache since the same documents recur across
+near-identical questions.
+"""
+
+import hashlib
 import math
+from collections import OrderedDict
 
+from src.core.config import get_settings
 from src.core.logging import get_logger
+from src.processors.embedding_service import MicroBatcher
 from src.rag.retriever import RetrievedDocument
 
 logger = get_logger(__name__)
 
+DEFAULT_RERANKER_MODEL = "cross-encoder/ms-marco-MiniLM-L-6-v2"
+MAX_DOC_CHARS = 512
+
+
+class _OnnxCrossEncoder:
+    """``CrossEncoder.predict`` look-alike over an int8 ONNX Runtime model."""
+
+    def __init__(self, model_name: str):
+        from optimum.onnxruntime import ORTModelForSequenceClassification
+        from transformers import AutoTokenizer
+
+        from src.processors.onnx_backend import load_onnx_model
+
+        self.tokenizer = AutoTokenizer.from_pretrained(model_name)
+        self.model = load_onnx_model(model_name, ORTModelForSequenceClassification, "int8")
+
+    def predict(self, pairs: list[tuple[str, str]]):
+        features = self.tokenizer(
+            [q for q, _ in pairs],
+            [d for _, d in pairs],
+            padding=True,
+            truncation=True,
+            max_length=512,
+            return_tensors="np",
+        )
+        return self.model(**features).logits[:, 0]
+
 
 class CrossEncoderReranker:
     """Reranks retrieved documents using cross-encoder scoring."""
 
-    def __init__(self, model_name: str = "cross-encoder/ms-marco-MiniLM-L-6-v2"):
+    def __init__(
+        self,
+        model_name: str = DEFAULT_RERANKER_MODEL,
+        backend: str | None = None,
+        cache_size: int | None = None,
+    ):
+        settings = get_settings()
         self.model_name = model_name
+        self.backend = backend or settings.RERANKER_BACKEND
+        self.cache_size = cache_size if cache_size is not None else settings.RERANKER_CACHE_SIZE
         self._model = None
+        self._scores: OrderedDict[tuple[str, str], float] = OrderedDict()
+        self._batcher = MicroBatcher(
+            self._predict,
+            max_batch_size=settings.RERANKER_BATCH_MAX_SIZE,
+            max_wait_ms=settings.RERANKER_BATCH_MAX_WAIT_MS,
+        )
 
     @staticmethod
     def _get_device() -> str:
@@ -28,13 +80,21 @@ class CrossEncoderReranker:
     @property
     def model(self):
         if self._model is None:
-            from sentence_transformers import CrossEncoder
+            if self.backend == "onnx":
+                logger.info("Loading reranker model", model=self.model_name, backend="onnx-int8")
+                self._model = _OnnxCrossEncoder(self.model_name)
+            else:
+                from sentence_transformers import CrossEncoder
 
-            device = self._get_device()
-            logger.info("Loading reranker model", model=self.model_name, device=device)
-            self._model = CrossEncoder(self.model_name, device=device)
+                device = self._get_device()
+                logger.info("Loading reranker model", model=self.model_name, device=device)
+                self._model = CrossEncoder(self.model_name, device=device)
         return self._model
 
+    def _predict(self, pairs: list[tuple[str, str]]) -> list[float]:
+        """Blocking model call; runs in the executor via the micro-batcher."""
+        return [float(s) for s in self.model.predict(pairs)]
+
     async def rerank(
         self,
         query: str,
@@ -44,8 +104,23 @@ class CrossEncoderReranker:
         if not documents:
             return []
 
-        pairs = [(query, doc.content[:512]) for doc in documents]
-        scores = self.model.predict(pairs)
+        query_hash = hashlib.sha1(query.encode("utf-8")).hexdigest()
+        keys = [(query_hash, doc.id) for doc in documents]
+        scores: list[float | None] = []
+        for key in keys:
+            score = self._scores.get(key)
+            if score is not None:
+                self._scores.move_to_end(key)
+            scores.append(score)
+
+        misses = [i for i, score in enumerate(scores) if score is None]
+        if misses:
+            predicted = await self._batcher.submit(
+                [(query, documents[i].content[:MAX_DOC_CHARS]) for i in misses]
+            )
+            for i, score in zip(misses, predicted):
+                scores[i] = score
+                self._remember(keys[i], score)
 
         scored_docs = list(zip(documents, scores))
         scored_docs.sort(key=lambda x: x[1], reverse=True)
@@ -57,3 +132,21 @@ class CrossEncoderReranker:
             result.append(doc)
 
         return result
+
+    def _remember(self, key: tuple[str, str], score: float) -> None:
+        if self.cache_size <= 0:
+            return
+        self._scores[key] = score
+        while len(self._scores) > self.cache_size:
+            self._scores.popitem(last=False)
+
+
+_reranker: CrossEncoderReranker | None = None
+
+
+def get_reranker() -> CrossEncoderReranker:
+    """Return the process-wide reranker (the model is loaded once)."""
+    global _reranker
+    if _reranker is None:
+        _reranker = CrossEncoderReranker()
+    return _reranker
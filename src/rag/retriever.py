@@ -1,13 +1,20 @@
 """Hybrid Retriever combining BM25 and vector search."""
 
+import asyncio
 from dataclasses import dataclass
 
 from src.core.logging import get_logger
-from src.processors.embedding import EmbeddingGenerator
-from src.storage.vector.qdrant_client import VectorStore
+from src.processors.embedding_service import EmbeddingService, embed_for_collections
+from src.processors.sparse import BM25SparseEncoder
+from src.storage.vector.qdrant_client import AsyncVectorStore, version_models
 
 logger = get_logger(__name__)
 
+# Reciprocal-rank-fusion constant (Cormack et al.); dampens the top ranks
+RRF_K = 60
+
+DEFAULT_COLLECTIONS = ["papers", "repositories", "chunks"]
+
 
 @dataclass
 class RetrievedDocument:
@@ -16,7 +23,10 @@ class RetrievedDocument:
     title: str
     content: str
     url: str | None
+    # Dense (cosine) relevance, 0 for a BM25-only match; feeds answer confidence
     score: float
+    # Reciprocal-rank-fusion score the results are ordered by
+    fusion_score: float = 0.0
 
 
 class HybridRetriever:
@@ -24,11 +34,13 @@ class HybridRetriever:
 
     def __init__(
         self,
-        vector_store: VectorStore,
-        embedding_model: EmbeddingGenerator,
+        vector_store: AsyncVectorStore,
+        embedding_model: EmbeddingService,
+        sparse_encoder: BM25SparseEncoder | None = None,
     ):
         self.vector_store = vector_store
         self.embeddings = embedding_model
+        self.sparse_encoder = sparse_encoder or BM25SparseEncoder()
 
     async def retrieve(
         self,
@@ -37,30 +49,72 @@ class HybridRetriever:
         filters: dict | None = None,
         collections: list[str] | None = None,
     ) -> list[RetrievedDocument]:
-        query_embedding = self.embeddings.embed(query)
-        target_collections = collections or ["papers", "repositories", "chunks"]
+        target_collections = collections or DEFAULT_COLLECTIONS
+        indices, values = self.sparse_encoder.encode_query(query)
 
-        all_results = []
-        for collection in target_collections:
-            results = self.vector_store.search(
-                collection=collection,
-                query_vector=query_embedding,
+        # Dense and BM25 searches over all collections run concurrently
+        dense_hits, sparse_hits = await asyncio.gather(
+            self._dense_search(query, target_collections, top_k, filters),
+            self.vector_store.search_sparse_many(
+                collections=target_collections,
+                indices=indices,
+                values=values,
                 limit=top_k,
                 filters=filters,
-            )
-            for hit in results:
-                payload = hit.get("payload", {})
-                all_results.append(
-                    RetrievedDocument(
-                        id=str(hit["id"]),
-                        source_type=payload.get("source_type", collection),
-                        title=payload.get("title", ""),
-                        content=payload.get("content", payload.get("abstract", "")),
-                        url=payload.get("url"),
-                        score=hit["score"],
-                    )
+            ),
+        )
+
+        # RRF only orders the results; its scores (~1/60) say nothing about relevance
+        fused = self._reciprocal_rank_fusion([dense_hits, sparse_hits])
+        dense_scores = {(h["collection"], str(h["id"])): h["score"] for h in dense_hits}
+
+        all_results = []
+        for hit, fusion_score in fused[:top_k]:
+            payload = hit.get("payload", {})
+            all_results.append(
+                RetrievedDocument(
+                    id=str(hit["id"]),
+                    source_type=payload.get("source_type", hit["collection"]),
+                    title=payload.get("title", ""),
+                    content=payload.get("content", payload.get("abstract", "")),
+                    url=payload.get("url"),
+                    score=dense_scores.get((hit["collection"], str(hit["id"])), 0.0),
+                    fusion_score=fusion_score,
                 )
+            )
+        return all_results
+
+    async def _dense_search(
+        self,
+        query: str,
+        collections: list[str],
+        top_k: int,
+        filters: dict | None,
+    ) -> list[dict]:
+        # Normally one model; during a model switch collections may differ.
+        # Embed for and search the same versions, whatever the alias says by now.
+        versions = await self.vector_store.active_versions(collections)
+        query_vectors = await embed_for_collections(
+            query, version_models(versions), default=self.embeddings
+        )
+        return await self.vector_store.search_many(
+            collections=collections,
+            query_vector=query_vectors,
+            limit=top_k,
+            filters=filters,
+            versions=versions,
+        )
+
+    @staticmethod
+    def _reciprocal_rank_fusion(rankings: list[list[dict]]) -> list[tuple[dict, float]]:
+        """Merge ranked hit lists by RRF: score = sum(1 / (RRF_K + rank))."""
+        scores: dict[tuple[str, str], float] = {}
+        hits: dict[tuple[str, str], dict] = {}
+        for ranking in rankings:
+            for rank, hit in enumerate(ranking, 1):
+                key = (hit["collection"], str(hit["id"]))
+                scores[key] = scores.get(key, 0.0) + 1.0 / (RRF_K + rank)
+                hits.setdefault(key, hit)
 
-        # Sort by score descending
-        all_results.sort(key=lambda x: x.score, reverse=True)
-        return all_results[:top_k]
+        ordered = sorted(scores.items(), key=lambda kv: kv[1], reverse=True)
+        return [(hits[key], score) for key, score in ordered]
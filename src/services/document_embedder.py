@@ -0,0 +1,207 @@
+"""Streaming extract → chunk → embed → upsert pipeline for user documents.
+
+Pages come off a process pool one range at a time and are chunked as they
+arrive; each bounded batch of chunks is embedded and written to the
+``user_docs`` collection before the next is pulled. Peak memory stays
+around one batch of chunks and vectors instead of growing with the whole
+document. The extracted text is still kept once for the full-context
+cache in ``document_texts``.
+"""
+
+import asyncio
+import itertools
+import uuid
+from collections.abc import Awaitable, Callable, Iterator
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.config import get_settings
+from src.core.logging import get_logger
+from src.processors.embedding_service import EmbeddingService
+from src.processors.sparse import BM25SparseEncoder
+from src.services.document_text import DocumentTextService
+from src.services.repo_ingestion import RepoContent, chunk_repo_content
+from src.services.text_extractor import get_pdf_executor, pdf_page_count
+from src.storage.models.document import Document
+from src.storage.vector.qdrant_client import VectorStore
+
+logger = get_logger(__name__)
+
+USER_DOCS_COLLECTION = "user_docs"
+
+
+ProgressCallback = Callable[[int, int | None], Awaitable[None]]
+
+
+class _PageStream:
+    """Passes pages through, keeping the text and counting pages seen."""
+
+    def __init__(self, pages: Iterator[str], page_count: int | None):
+        self._pages = pages
+        self.page_count = page_count
+        self.seen = 0
+        self.texts: list[str] = []
+
+    def __iter__(self) -> Iterator[str]:
+        for page in self._pages:
+            self.seen += 1
+            if page:
+                self.texts.append(page)
+            yield page
+
+    def estimate_total(self, chunks_done: int) -> int | None:
+        if not self.page_count or not self.seen:
+            return None
+        return max(chunks_done, round(chunks_done * self.page_count / self.seen))
+
+
+class DocumentEmbedder:
+    def __init__(
+        self,
+        embedding_service: EmbeddingService,
+        vector_store: VectorStore,
+        sparse_encoder: BM25SparseEncoder,
+        texts: DocumentTextService,
+        batch_size: int | None = None,
+    ):
+        self.embedding_service = embedding_service
+        self.vector_store = vector_store
+        self.sparse_encoder = sparse_encoder
+        self.texts = texts
+        self.batch_size = batch_size or get_settings().EMBEDDING_BATCH_MAX_SIZE
+
+    async def embed(
+        self,
+        db: AsyncSession,
+        doc: Document,
+        resume_from: int = 0,
+        on_progress: ProgressCallback | None = None,
+    ) -> int:
+        """Embed ``doc`` into ``user_docs``; returns the number of chunks.
+
+        Chunking and point IDs are deterministic, so a retried job passes
+        the chunks already written as ``resume_from`` and only embeds the
+        rest. ``on_progress(done, total)`` runs after every batch; ``total``
+        is extrapolated from the pages read until extraction finishes.
+        """
+        extractor = self.texts.extractor
+        content_hash = None
+        text = await self.texts.get_cached(db, doc.id)
+        if text is None:
+            content_hash = await self.texts.hash_file(doc)
+            text = await self.texts.get_shared(db, content_hash)
+
+        stream = None
+        if text is not None:
+            total = await asyncio.to_thread(lambda: sum(1 for _ in extractor.iter_chunks([text])))
+            chunks = extractor.iter_chunks([text])
+
+            def estimate_total(done: int) -> int:
+                return total
+        else:
+            abs_path = self.texts.file_storage.get_absolute_path(doc.storage_path)
+            page_count = None
+            if doc.content_type == "application/pdf":
+                page_count = await asyncio.to_thread(pdf_page_count, abs_path)
+            stream = _PageStream(
+                extractor.iter_pages(abs_path, doc.content_type, get_pdf_executor()), page_count
+            )
+            chunks = extractor.iter_chunks(stream)
+            estimate_total = stream.estimate_total
+
+        items = ((chunk, {"source_type": "user_document"}) for chunk in chunks)
+        done = await self._embed_items(doc, items, resume_from, on_progress, estimate_total)
+
+        if stream is not None:
+            await self.texts.store(db, doc.id, "\n\n".join(stream.texts), content_hash)
+        elif content_hash is not None:
+            await self.texts.store(db, doc.id, text, content_hash)
+
+        logger.info(
+            "Embedded document",
+            document_id=str(doc.id),
+            chunks=done,
+            resumed_from=resume_from,
+            reused_text=stream is None,
+        )
+        return done
+
+    async def embed_repo(
+        self,
+        doc: Document,
+        repo_content: RepoContent,
+        url: str,
+        resume_from: int = 0,
+        on_progress: ProgressCallback | None = None,
+    ) -> int:
+        """Embed an ingested GitHub repo, one chunk per file section."""
+        chunks_data = await asyncio.to_thread(chunk_repo_content, repo_content)
+        items = (
+            (
+                c["content"],
+                {"file_path": c["file_path"], "source_type": "github_repo", "url": url},
+            )
+            for c in chunks_data
+        )
+        return await self._embed_items(
+            doc, items, resume_from, on_progress, lambda done: len(chunks_data)
+        )
+
+    async def _embed_items(
+        self,
+        doc: Document,
+        items: Iterator[tuple[str, dict]],
+        resume_from: int,
+        on_progress: ProgressCallback | None,
+        estimate_total: Callable[[int], int | None],
+    ) -> int:
+        done = 0
+        while True:
+            # Page extraction and chunking block, so pull each batch in a thread
+            batch = await asyncio.to_thread(
+                lambda: list(itertools.islice(items, self.batch_size))
+            )
+            if not batch:
+                return done
+            skip = min(max(resume_from - done, 0), len(batch))
+            if skip < len(batch):
+                await self._embed_batch(doc, batch[skip:], start_index=done + skip)
+            done += len(batch)
+            if on_progress is not None:
+                await on_progress(done, estimate_total(done))
+
+    async def _embed_batch(
+        self, doc: Document, items: list[tuple[str, dict]], start_index: int
+    ) -> None:
+        embeddings = await self.embedding_service.embed_batch([chunk for chunk, _ in items])
+
+        points = []
+        for offset, ((chunk, extra), embedding) in enumerate(zip(items, embeddings)):
+            i = start_index + offset
+            points.append(
+                {
+                    "id": str(uuid.uuid5(uuid.NAMESPACE_URL, f"{doc.id}:{i}")),
+                    "vector": embedding,
+                    "payload": {
+                        "user_id": str(doc.user_id),
+                        "document_id": str(doc.id),
+                        "chunk_index": i,
+                        "title": doc.original_filename,
+                        "content": chunk,
+                        **extra,
+                    },
+                }
+            )
+
+        sparse_points = [
+            self.sparse_encoder.to_point(p, f"{p['payload']['title']}\n{p['payload']['content']}")
+            for p in points
+        ]
+        await asyncio.to_thread(
+            self.vector_store.upsert_batch,
+            collection=USER_DOCS_COLLECTION,
+            points=points,
+            texts=[chunk for chunk, _ in items],
+            model=self.embedding_service.model_name,
+            sparse_points=sparse_points,
+        )
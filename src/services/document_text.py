@@ -0,0 +1,112 @@
+"""Extract-once cache of document text backed by the ``document_texts`` table.
+
+Parsing a large PDF with pdfplumber takes seconds of CPU, so text is
+extracted the first time a document is embedded (or first read in
+full-context mode) and every later reader gets the stored copy.
+"""
+
+import asyncio
+import hashlib
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.logging import get_logger
+from src.services.file_storage import FileStorageService
+from src.services.text_extractor import TextExtractor, clean_text, get_pdf_executor
+from src.storage.models.document import Document
+from src.storage.models.document_text import DocumentText
+
+logger = get_logger(__name__)
+
+HASH_BLOCK_SIZE = 1 << 20
+
+
+def file_content_hash(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while block := f.read(HASH_BLOCK_SIZE):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class DocumentTextService:
+    def __init__(
+        self,
+        extractor: TextExtractor | None = None,
+        file_storage: FileStorageService | None = None,
+    ):
+        self.extractor = extractor or TextExtractor()
+        self.file_storage = file_storage or FileStorageService()
+
+    async def get_cached(self, db: AsyncSession, document_id) -> str | None:
+        result = await db.execute(
+            select(DocumentText.text).where(DocumentText.document_id == document_id)
+        )
+        return result.scalar_one_or_none()
+
+    async def get_text(self, db: AsyncSession, doc: Document) -> str:
+        """Text of ``doc``: cached, copied from an identical file, or extracted.
+
+        Raises ``FileNotFoundError`` if the stored file is missing and the
+        text was never cached.
+        """
+        cached = await self.get_cached(db, doc.id)
+        if cached is not None:
+            return cached
+
+        content_hash = await self.hash_file(doc)
+        text = await self.get_shared(db, content_hash)
+        if text is None:
+            text = await asyncio.to_thread(self._extract, doc)
+            logger.info(
+                "Extracted document text",
+                document_id=str(doc.id),
+                content_type=doc.content_type,
+                chars=len(text),
+            )
+
+        await self.store(db, doc.id, text, content_hash)
+        return text
+
+    async def hash_file(self, doc: Document) -> str:
+        if not doc.storage_path:
+            # Paper/repo documents get their file from a queued embedding job
+            raise FileNotFoundError(f"Document {doc.id} has no stored file yet")
+        abs_path = self.file_storage.get_absolute_path(doc.storage_path)
+        return await asyncio.to_thread(file_content_hash, abs_path)
+
+    async def get_shared(self, db: AsyncSession, content_hash: str) -> str | None:
+        """Text already extracted from another file with the same content."""
+        result = await db.execute(
+            select(DocumentText.text).where(DocumentText.content_hash == content_hash).limit(1)
+        )
+        return result.scalar_one_or_none()
+
+    def _extract(self, doc: Document) -> str:
+        abs_path = self.file_storage.get_absolute_path(doc.storage_path)
+        pages = self.extractor.iter_pages(abs_path, doc.content_type, get_pdf_executor())
+        return "\n\n".join(page for page in pages if page)
+
+    async def store(
+        self, db: AsyncSession, document_id, text: str, content_hash: str | None = None
+    ) -> None:
+        """Cache ``text`` for a document whose content is already in memory."""
+        text = clean_text(text)
+        if content_hash is None:
+            content_hash = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        existing = await db.get(DocumentText, document_id)
+        if existing is not None:
+            existing.text = text
+            existing.content_hash = content_hash
+            existing.char_count = len(text)
+        else:
+            db.add(
+                DocumentText(
+                    document_id=document_id,
+                    content_hash=content_hash,
+                    text=text,
+                    char_count=len(text),
+                )
+            )
+        await db.flush()
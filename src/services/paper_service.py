@@ -6,6 +6,7 @@ from datetime import date
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.storage.models.paper import Paper
+from src.storage.repositories.pagination import Page
 from src.storage.repositories.paper_repo import PaperRepository
 
 
@@ -20,7 +21,7 @@ class PaperService:
         filters: dict | None = None,
         sort_by: str = "published_date",
         sort_order: str = "desc",
-    ) -> tuple[list[Paper], int]:
+    ) -> Page[Paper]:
         f = filters or {}
         return await self.repo.list_papers(
             skip=skip,
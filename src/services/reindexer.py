@@ -0,0 +1,355 @@
+"""Pipelined, resumable (re)indexing of papers and repositories into Qdrant.
+
+Three stages run concurrently and hand work over bounded queues, so DB
+reads, embedding and Qdrant writes overlap while memory stays capped at
+a few batches:
+
+    reader   keyset-paginates the table on (created_at, id), one short
+             session per page
+    embedder embeds each page (shared embedding service, or a dedicated
+             model when reindexing with a different one)
+    writer   accumulates large batches and upserts them with
+             ``wait=False``, then advances the checkpoint
+
+The checkpoint (``reindex_checkpoints``) is the last (created_at, id) the
+writer has handed to Qdrant, so a crashed or interrupted run continues
+from there, and a later run only picks up rows created since.
+
+With ``target`` set, the same pipeline fills another (model-versioned)
+physical collection for a model migration; ``max_rate`` then keeps it
+from competing with live traffic.
+"""
+
+import asyncio
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime
+
+from sqlalchemy import select, tuple_, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.core.config import get_settings
+from src.core.logging import get_logger
+from src.processors.sparse import BM25SparseEncoder, paper_lexical_text, repo_lexical_text
+from src.storage.cache.collection_versions import batched_version_bumps
+from src.storage.models.paper import Paper
+from src.storage.models.reindex_checkpoint import ReindexCheckpoint
+from src.storage.models.repository import Repository
+from src.storage.vector.qdrant_client import AsyncVectorStore
+
+logger = get_logger(__name__)
+
+
+def paper_embedding_text(paper: Paper) -> str:
+    return f"{paper.title}\n\n{paper.abstract or ''}"
+
+
+def paper_payload(paper: Paper) -> dict:
+    return {
+        "arxiv_id": paper.arxiv_id,
+        "title": paper.title,
+        "abstract": (paper.abstract or "")[:500],
+        "categories": paper.categories or [],
+        "topics": paper.topics or [],
+        "keywords": paper.keywords or [],
+        "published_date": str(paper.published_date) if paper.published_date else None,
+        "citation_count": paper.citation_count,
+        "source_type": "paper",
+        "url": paper.source_url,
+    }
+
+
+def repo_embedding_text(repository: Repository) -> str:
+    parts = [repository.name, repository.description or ""]
+    if repository.readme_content:
+        parts.append(repository.readme_content[:2000])
+    return "\n\n".join(parts)
+
+
+def repo_payload(repository: Repository) -> dict:
+    return {
+        "full_name": repository.full_name,
+        "title": repository.name,
+        "description": repository.description or "",
+        "content": repository.description or "",
+        "primary_language": repository.primary_language,
+        "topics": repository.topics or [],
+        "frameworks": repository.frameworks or [],
+        "stars_count": repository.stars_count,
+        "source_type": "repository",
+        "url": repository.html_url,
+    }
+
+
+@dataclass(frozen=True)
+class IndexSource:
+    """How rows of one table become points of one collection."""
+
+    model: type
+    embedding_text: Callable
+    lexical_text: Callable
+    payload: Callable[..., dict]
+
+
+INDEX_SOURCES = {
+    "papers": IndexSource(Paper, paper_embedding_text, paper_lexical_text, paper_payload),
+    "repositories": IndexSource(
+        Repository, repo_embedding_text, repo_lexical_text, repo_payload
+    ),
+}
+
+
+@dataclass
+class _Row:
+    id: str
+    key: tuple[datetime, object]  # (created_at, id) keyset position
+    text: str
+    lexical_text: str
+    payload: dict
+
+
+ProgressCallback = Callable[[int], None]
+
+
+class RateLimiter:
+    """Spaces out work to at most ``rate`` items per second (None = unlimited)."""
+
+    def __init__(self, rate: float | None):
+        self.rate = rate
+        self._started: float | None = None
+        self._count = 0
+
+    async def wait(self, items: int) -> None:
+        if not self.rate:
+            return
+        if self._started is None:
+            self._started = time.monotonic()
+        self._count += items
+        ahead = self._count / self.rate - (time.monotonic() - self._started)
+        if ahead > 0:
+            await asyncio.sleep(ahead)
+
+
+class Reindexer:
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        vector_store: AsyncVectorStore,
+        collection: str,
+        model: str | None = None,
+        since: datetime | None = None,
+        read_batch: int | None = None,
+        write_batch: int | None = None,
+        queue_depth: int | None = None,
+        target: str | None = None,
+        max_rate: float | None = None,
+    ):
+        if collection not in INDEX_SOURCES:
+            raise ValueError(
+                f"Unknown collection {collection!r}; expected one of {', '.join(INDEX_SOURCES)}"
+            )
+        settings = get_settings()
+        self.session_factory = session_factory
+        self.vector_store = vector_store
+        self.collection = collection
+        self.source = INDEX_SOURCES[collection]
+        # Default: the model of the collection's active version (set in run)
+        self.model = model
+        # Live collection (alias) unless filling a migration target
+        self.target = target or collection
+        self.since = since
+        self.read_batch = read_batch or settings.REINDEX_READ_BATCH
+        self.write_batch = write_batch or settings.REINDEX_WRITE_BATCH
+        self.queue_depth = queue_depth or settings.REINDEX_QUEUE_DEPTH
+        self.sparse_encoder = BM25SparseEncoder()
+        self.limiter = RateLimiter(max_rate)
+        self._generator = None
+        self._written = 0
+
+    async def run(self, restart: bool = False, on_progress: ProgressCallback | None = None) -> int:
+        """Index every row past the checkpoint; returns the number written by this run."""
+        if self.model is None:
+            self.model = (await self.vector_store.collection_models([self.target]))[self.target]
+        checkpoint = await self._load_checkpoint(restart)
+        start = None
+        if checkpoint.last_created_at is not None:
+            start = (checkpoint.last_created_at, checkpoint.last_id)
+        logger.info(
+            "Reindex started",
+            collection=self.target,
+            model=self.model,
+            resume_from=str(start[0]) if start else None,
+            since=str(self.since) if self.since else None,
+        )
+
+        rows: asyncio.Queue = asyncio.Queue(maxsize=self.queue_depth)
+        embedded: asyncio.Queue = asyncio.Queue(maxsize=self.queue_depth)
+        self._written = 0
+        try:
+            # One answer-cache invalidation for the run, not one per batch
+            async with batched_version_bumps(), asyncio.TaskGroup() as tg:
+                tg.create_task(self._read(start, rows))
+                tg.create_task(self._embed(rows, embedded))
+                tg.create_task(self._write(embedded, checkpoint.id, on_progress))
+        except ExceptionGroup as group:
+            # The first failing stage cancels the others; the checkpoint
+            # still points at the last batch that reached Qdrant.
+            error = group.exceptions[0]
+            await self._finish(checkpoint.id, "failed", repr(error))
+            logger.error(
+                "Reindex failed", collection=self.target, written=self._written, error=repr(error)
+            )
+            raise error
+
+        await self._finish(checkpoint.id, "completed")
+        logger.info("Reindex completed", collection=self.target, written=self._written)
+        return self._written
+
+    async def _load_checkpoint(self, restart: bool) -> ReindexCheckpoint:
+        async with self.session_factory() as session:
+            result = await session.execute(
+                select(ReindexCheckpoint).where(
+                    ReindexCheckpoint.collection == self.target,
+                    ReindexCheckpoint.model == self.model,
+                )
+            )
+            checkpoint = result.scalar_one_or_none()
+            if checkpoint is None:
+                checkpoint = ReindexCheckpoint(collection=self.target, model=self.model)
+                session.add(checkpoint)
+            elif restart:
+                checkpoint.last_created_at = None
+                checkpoint.last_id = None
+                checkpoint.processed = 0
+            checkpoint.status = "running"
+            checkpoint.error_message = None
+            await session.commit()
+            await session.refresh(checkpoint)
+            return checkpoint
+
+    async def _finish(self, checkpoint_id, status: str, error: str | None = None) -> None:
+        async with self.session_factory() as session:
+            await session.execute(
+                update(ReindexCheckpoint)
+                .where(ReindexCheckpoint.id == checkpoint_id)
+                .values(status=status, error_message=error)
+            )
+            await session.commit()
+
+    async def _read(self, start: tuple | None, out: asyncio.Queue) -> None:
+        model = self.source.model
+        cursor = start
+        while True:
+            query = select(model).order_by(model.created_at, model.id).limit(self.read_batch)
+            if self.since is not None:
+                query = query.where(model.created_at >= self.since)
+            if cursor is not None:
+                query = query.where(tuple_(model.created_at, model.id) > tuple_(*cursor))
+
+            async with self.session_factory() as session:
+                records = (await session.execute(query)).scalars().all()
+                page = [
+                    _Row(
+                        id=str(r.id),
+                        key=(r.created_at, r.id),
+                        text=self.source.embedding_text(r),
+                        lexical_text=self.source.lexical_text(r),
+                        payload=self.source.payload(r),
+                    )
+                    for r in records
+                ]
+            if not page:
+                break
+            await out.put(page)
+            cursor = page[-1].key
+        await out.put(None)
+
+    async def _embed(self, rows: asyncio.Queue, out: asyncio.Queue) -> None:
+        while (page := await rows.get()) is not None:
+            # Paced here, page by page, so the model load stays smooth
+            await self.limiter.wait(len(page))
+            vectors = await self._embed_texts([row.text for row in page])
+            await out.put(list(zip(page, vectors)))
+        await out.put(None)
+
+    async def _embed_texts(self, texts: list[str]) -> list[list[float]]:
+        if self.model == get_settings().EMBEDDING_MODEL:
+            from src.processors.embedding_service import get_embedding_service
+
+            return await get_embedding_service().embed_batch(texts)
+
+        # A model other than the served one: load it in this process
+        if self._generator is None:
+            from src.processors.embedding import EmbeddingGenerator
+
+            self._generator = EmbeddingGenerator(model_name=self.model)
+        return await asyncio.to_thread(self._generator.embed_batch, texts)
+
+    async def _write(
+        self, embedded: asyncio.Queue, checkpoint_id, on_progress: ProgressCallback | None
+    ) -> None:
+        pending: list[tuple[_Row, list[float]]] = []
+        while True:
+            batch = await embedded.get()
+            if batch is not None:
+                pending.extend(batch)
+            if pending and (batch is None or len(pending) >= self.write_batch):
+                await self._flush(pending, checkpoint_id)
+                self._written += len(pending)
+                pending = []
+                if on_progress is not None:
+                    on_progress(self._written)
+            if batch is None:
+                return
+
+    async def _flush(self, items: list[tuple[_Row, list[float]]], checkpoint_id) -> None:
+        live = self.target == self.collection
+        points = [
+            {"id": row.id, "vector": vector, "payload": row.payload} for row, vector in items
+        ]
+        # wait=False: Qdrant acknowledges once the batch is in its WAL, so the
+        # writer does not sit idle while the points are indexed.
+        if live:
+            await self.vector_store.upsert_batch(
+                self.target,
+                points,
+                wait=False,
+                texts=[row.text for row, _ in items],
+                model=self.model,
+                sparse_points=[
+                    self.sparse_encoder.to_point(point, row.lexical_text)
+                    for point, (row, _) in zip(points, items)
+                ],
+            )
+        else:
+            # Migration target: BM25 points do not depend on the model
+            await self.vector_store.upsert_batch(
+                self.target, points, wait=False, model=self.model
+            )
+
+        last_created_at, last_id = items[-1][0].key
+        model = self.source.model
+        async with self.session_factory() as session:
+            if live:
+                await session.execute(
+                    update(model)
+                    .where(model.id.in_([row.key[1] for row, _ in items]))
+                    .values(is_processed=True)
+                )
+            await session.execute(
+                update(ReindexCheckpoint)
+                .where(ReindexCheckpoint.id == checkpoint_id)
+                .values(
+                    last_created_at=last_created_at,
+                    last_id=last_id,
+                    processed=ReindexCheckpoint.processed + len(items),
+                )
+            )
+            await session.commit()
+        logger.info(
+            "Reindex batch written",
+            collection=self.target,
+            batch=len(items),
+            last_created_at=str(last_created_at),
+        )
@@ -6,6 +6,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.storage.models.repository import Repository
 from src.storage.repositories.github_repo import GitHubRepository
+from src.storage.repositories.pagination import Page
 
 
 class RepoService:
@@ -21,7 +22,7 @@ class RepoService:
         min_stars: int | None = None,
         sort_by: str = "stars_count",
         sort_order: str = "desc",
-    ) -> tuple[list[Repository], int]:
+    ) -> Page[Repository]:
         return await self.repo.list_repos(
             skip=skip,
             limit=limit,
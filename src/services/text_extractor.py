@@ -2,7 +2,12 @@
 
 import csv
 import io
+import multiprocessing
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Executor, ProcessPoolExecutor
 
+from src.core.config import get_settings
 from src.core.logging import get_logger
 
 logger = get_logger(__name__)
@@ -19,11 +24,87 @@ SUPPORTED_TYPES = {
 }
 
 
+_pdf_executor: ProcessPoolExecutor | None = None
+
+
+def clean_text(text: str) -> str:
+    """Drop characters PostgreSQL ``TEXT`` cannot store (NUL, common in PDF text)."""
+    return text.replace("\x00", "")
+
+
+def get_pdf_executor() -> ProcessPoolExecutor | None:
+    """Process pool for PDF page extraction, or None when disabled (workers=0)."""
+    global _pdf_executor
+    workers = get_settings().PDF_EXTRACT_WORKERS
+    if workers <= 0:
+        return None
+    if _pdf_executor is None:
+        # spawn: forking a threaded API/worker process is unsafe
+        _pdf_executor = ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+        )
+    return _pdf_executor
+
+
+def pdf_page_count(file_path: str) -> int:
+    import pdfplumber
+
+    with pdfplumber.open(file_path) as pdf:
+        return len(pdf.pages)
+
+
+def _extract_pdf_pages(file_path: str, start: int, stop: int) -> list[str]:
+    """Text of pages ``[start, stop)``; runs in a pool process."""
+    import pdfplumber
+
+    pages = []
+    with pdfplumber.open(file_path) as pdf:
+        for page in pdf.pages[start:stop]:
+            pages.append(page.extract_text() or "")
+            # Drop the parsed layout objects before the next page
+            page.flush_cache()
+    return pages
+
+
+def iter_pdf_pages(
+    file_path: str,
+    executor: Executor | None = None,
+    pages_per_task: int | None = None,
+) -> Iterator[str]:
+    """Yield page texts in order, extracting page ranges on ``executor``.
+
+    At most two ranges per pool worker are in flight, so memory is bounded
+    by the pool size rather than the page count.
+    """
+    pages_per_task = pages_per_task or get_settings().PDF_PAGES_PER_TASK
+    page_count = pdf_page_count(file_path)
+    ranges = iter(range(0, page_count, pages_per_task))
+
+    if executor is None:
+        for start in ranges:
+            yield from _extract_pdf_pages(file_path, start, start + pages_per_task)
+        return
+
+    max_in_flight = 2 * max(getattr(executor, "_max_workers", 1), 1)
+    in_flight: deque = deque()
+    for start in ranges:
+        in_flight.append(
+            executor.submit(_extract_pdf_pages, file_path, start, start + pages_per_task)
+        )
+        if len(in_flight) >= max_in_flight:
+            yield from in_flight.popleft().result()
+    while in_flight:
+        yield from in_flight.popleft().result()
+
+
 class TextExtractor:
     """Extract text from various file types and chunk for embedding."""
 
     def extract(self, file_path: str, content_type: str) -> str:
         """Extract text content from a file based on its content type."""
+        return clean_text(self._extract(file_path, content_type))
+
+    def _extract(self, file_path: str, content_type: str) -> str:
         if content_type == "application/pdf":
             return self._extract_pdf(file_path)
         elif content_type in (
@@ -41,50 +122,80 @@ class TextExtractor:
         else:
             raise ValueError(f"Unsupported content type: {content_type}")
 
+    def iter_pages(
+        self, file_path: str, content_type: str, executor: Executor | None = None
+    ) -> Iterator[str]:
+        """Stream a document's text: page by page for PDFs, whole otherwise.
+
+        ``"\n\n".join`` of the non-empty pages equals ``extract``.
+        """
+        if content_type == "application/pdf":
+            for page in iter_pdf_pages(file_path, executor):
+                yield clean_text(page)
+        else:
+            yield self.extract(file_path, content_type)
+
     def chunk_text(
         self, text: str, chunk_size: int = 1000, overlap: int = 200
     ) -> list[str]:
         """Split text into overlapping chunks for embedding."""
         if not text or not text.strip():
             return []
+        return list(self.iter_chunks([text], chunk_size, overlap))
+
+    def iter_chunks(
+        self, pages: Iterable[str], chunk_size: int = 1000, overlap: int = 200
+    ) -> Iterator[str]:
+        """Chunk a stream of pages as they arrive; same output as ``chunk_text``.
+
+        Only the unchunked tail (under one chunk plus a page) is buffered.
+        Pages are joined with a blank line, as in ``_extract_pdf``.
+        """
+        buffer = ""
+        for page in pages:
+            if not page:
+                continue
+            buffer = f"{buffer}\n\n{page}" if buffer else page
+            start = 0
+            # A chunk is final once text beyond its window has arrived
+            while start + chunk_size < len(buffer):
+                end = self._chunk_end(buffer, start, chunk_size)
+                chunk = buffer[start:end].strip()
+                if chunk:
+                    yield chunk
+                start = end - overlap
+            buffer = buffer[start:]
 
-        chunks = []
         start = 0
-        text_len = len(text)
-
+        text_len = len(buffer)
         while start < text_len:
             end = start + chunk_size
-
-            # Try to break at sentence boundary
             if end < text_len:
-                # Look for sentence end within last 20% of chunk
-                search_start = end - int(chunk_size * 0.2)
-                last_period = text.rfind(". ", search_start, end)
-                last_newline = text.rfind("\n", search_start, end)
-                break_point = max(last_period, last_newline)
-                if break_point > search_start:
-                    end = break_point + 1
-
-            chunk = text[start:end].strip()
+                end = self._chunk_end(buffer, start, chunk_size)
+
+            chunk = buffer[start:end].strip()
             if chunk:
-                chunks.append(chunk)
+                yield chunk
 
             start = end - overlap
             if start >= text_len:
                 break
 
-        return chunks
+    @staticmethod
+    def _chunk_end(text: str, start: int, chunk_size: int) -> int:
+        """End of the chunk at ``start``, moved back to a sentence boundary."""
+        end = start + chunk_size
+        # Look for sentence end within last 20% of chunk
+        search_start = end - int(chunk_size * 0.2)
+        last_period = text.rfind(". ", search_start, end)
+        last_newline = text.rfind("\n", search_start, end)
+        break_point = max(last_period, last_newline)
+        if break_point > search_start:
+            end = break_point + 1
+        return end
 
     def _extract_pdf(self, file_path: str) -> str:
-        import pdfplumber
-
-        pages = []
-        with pdfplumber.open(file_path) as pdf:
-            for page in pdf.pages:
-                text = page.extract_text()
-                if text:
-                    pages.append(text)
-        return "\n\n".join(pages)
+        return "\n\n".join(page for page in iter_pdf_pages(file_path) if page)
 
     def _extract_docx(self, file_path: str) -> str:
         from docx import Document
@@ -0,0 +1,170 @@
+"""Blue/green switch of a vector collection to a new embedding model.
+
+Each logical collection (``papers``, ...) is an alias for a physical,
+model-versioned collection. A migration:
+
+1. ``start``    creates ``<collection>__<model>`` sized for the new model and
+                turns on dual-writes: every write to the live collection is
+                re-embedded with the new model and mirrored into it (a write
+                that cannot read the migration state fails);
+2. ``backfill`` re-embeds everything already there in the background, at
+                most ``max_rate`` points/sec (papers/repositories from
+                PostgreSQL via the ``Reindexer``, document chunks from the
+                text stored in their payload);
+3. ``swap``     points the alias at the new version in one atomic request
+                and ends the dual-writes. The old version is kept, so
+                ``activate`` can roll back.
+
+Search keeps using the old version until the swap; query embeddings follow
+the active version's model (``AsyncVectorStore.active_versions``). Writes
+resolve their versions when they happen, so vectors embedded with the old
+model just before the swap are re-embedded for the new live version.
+"""
+
+import asyncio
+import time
+
+from qdrant_client.models import PointStruct
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.core.config import get_settings
+from src.core.logging import get_logger
+from src.services.reindexer import INDEX_SOURCES, RateLimiter, Reindexer
+from src.storage.cache.collection_versions import (
+    MIGRATION_CACHE_SECONDS,
+    set_migration_target,
+)
+from src.storage.vector.qdrant_client import (
+    COLLECTIONS_CONFIG,
+    AsyncVectorStore,
+    VectorStore,
+    physical_model,
+    version_name,
+)
+
+logger = get_logger(__name__)
+
+DIMENSION_PROBE = "dimension probe"
+
+
+class VectorMigration:
+    def __init__(
+        self,
+        vector_store: VectorStore,
+        async_store: AsyncVectorStore,
+        session_factory: async_sessionmaker[AsyncSession],
+        collection: str,
+        model: str,
+        max_rate: float | None = None,
+        batch_size: int | None = None,
+    ):
+        if collection not in COLLECTIONS_CONFIG:
+            raise ValueError(f"Unknown collection {collection!r}")
+        settings = get_settings()
+        self.vector_store = vector_store
+        self.async_store = async_store
+        self.session_factory = session_factory
+        self.collection = collection
+        self.model = model
+        self.target = version_name(collection, model)
+        self.max_rate = max_rate if max_rate is not None else settings.VECTOR_MIGRATION_MAX_RATE
+        self.batch_size = batch_size or settings.REINDEX_READ_BATCH
+        self._generator = None
+
+    @property
+    def generator(self):
+        if self._generator is None:
+            from src.processors.embedding import EmbeddingGenerator
+
+            # No embedding cache: it is keyed per model and would only fill up
+            self._generator = EmbeddingGenerator(model_name=self.model, use_cache=False)
+        return self._generator
+
+    async def run(self, swap: bool = False) -> int:
+        """Start (idempotent), backfill and optionally swap; returns points backfilled."""
+        await asyncio.to_thread(self.start)
+        written = await self.backfill()
+        if swap:
+            await asyncio.to_thread(self.swap)
+        return written
+
+    def start(self) -> str:
+        if physical_model(self.vector_store.resolve(self.collection)) == self.model:
+            raise ValueError(f"{self.collection} already uses {self.model}")
+        size = len(self.generator.embed(DIMENSION_PROBE))
+        self.vector_store.create_version(self.collection, self.model, size)
+        # Dual-writes first, then backfill: every point is either written
+        # after this (mirrored) or still there when the backfill reads it.
+        # Writers may hold a cached "no migration" for MIGRATION_CACHE_SECONDS,
+        # so the backfill only starts once every writer has seen the target.
+        set_migration_target(self.collection, self.target)
+        time.sleep(MIGRATION_CACHE_SECONDS)
+        logger.info(
+            "Vector migration started", collection=self.collection, target=self.target, size=size
+        )
+        return self.target
+
+    async def backfill(self) -> int:
+        if self.collection in INDEX_SOURCES:
+            reindexer = Reindexer(
+                self.session_factory,
+                self.async_store,
+                self.collection,
+                model=self.model,
+                target=self.target,
+                max_rate=self.max_rate,
+            )
+            return await reindexer.run()
+        return await self._backfill_from_payloads()
+
+    async def _backfill_from_payloads(self) -> int:
+        """Re-embed document chunks from their stored text, skipping ones already copied."""
+        client = self.async_store.client
+        limiter = RateLimiter(self.max_rate)
+        written = 0
+        offset = None
+        while True:
+            records, offset = await client.scroll(
+                collection_name=self.collection,
+                limit=self.batch_size,
+                offset=offset,
+                with_payload=True,
+                with_vectors=False,
+            )
+            if not records:
+                return written
+            copied = await client.retrieve(
+                self.target, ids=[r.id for r in records], with_payload=False
+            )
+            done = {r.id for r in copied}
+            todo = [r for r in records if r.id not in done]
+            if todo:
+                await limiter.wait(len(todo))
+                vectors = await asyncio.to_thread(
+                    self.generator.embed_batch, [r.payload.get("content", "") for r in todo]
+                )
+                await client.upsert(
+                    collection_name=self.target,
+                    points=[
+                        PointStruct(id=r.id, vector=vector, payload=r.payload)
+                        for r, vector in zip(todo, vectors)
+                    ],
+                    wait=False,
+                )
+                written += len(todo)
+                logger.info("Migration batch written", collection=self.target, total=written)
+            if offset is None:
+                return written
+
+    def swap(self) -> str | None:
+        """Make the new version live; returns the previous physical collection."""
+        previous = self.vector_store.activate_version(self.collection, self.target)
+        set_migration_target(self.collection, None)
+        return previous
+
+    def abort(self) -> None:
+        """Stop dual-writes and drop the unfinished new version."""
+        set_migration_target(self.collection, None)
+        if self.vector_store.resolve(self.collection) != self.target:
+            self.vector_store.client.delete_collection(self.target)
+        logger.info("Vector migration aborted", collection=self.collection, target=self.target)
@@ -0,0 +1,161 @@
+"""Per-collection vector state shared by every API and worker process.
+
+Every write to a vector collection bumps ``vector:version:<collection>``;
+a cached answer remembers the versions it was computed against and is
+discarded as soon as any of them moves. Redis errors are logged and
+ignored: a missed bump only delays invalidation until the entry's TTL.
+Inside ``batched_version_bumps`` (every Celery task, a reindex run) the
+bumps are collected and applied once per collection on exit, so a bulk
+job does not invalidate the answer cache on every batch it writes.
+
+``vector:migration:<collection>`` names the physical collection a model
+migration is filling; while it is set, writers mirror their writes into
+it (see ``rri vectors migrate``). Failing to read it raises
+``VectorStoreError``: a write that cannot tell whether it must be
+mirrored fails instead of leaving a hole in the new version.
+"""
+
+import time
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+
+import redis
+import redis.asyncio as aioredis
+
+from src.core.config import get_settings
+from src.core.exceptions import VectorStoreError
+from src.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Looked up on every write, so cached briefly; writers notice a started or
+# finished migration within this many seconds, and a migration waits this
+# long after starting dual-writes before it backfills.
+MIGRATION_CACHE_SECONDS = 5.0
+
+_sync_client: redis.Redis | None = None
+_async_client: aioredis.Redis | None = None
+_migration_targets: dict[str, tuple[float, str | None]] = {}
+# Collections written inside the current batched_version_bumps block
+_pending_bumps: ContextVar[set[str] | None] = ContextVar("pending_bumps", default=None)
+
+
+def _key(collection: str) -> str:
+    return f"vector:version:{collection}"
+
+
+def _migration_key(collection: str) -> str:
+    return f"vector:migration:{collection}"
+
+
+def _get_sync_client() -> redis.Redis:
+    global _sync_client
+    if _sync_client is None:
+        _sync_client = redis.Redis.from_url(get_settings().REDIS_URL)
+    return _sync_client
+
+
+def _get_async_client() -> aioredis.Redis:
+    global _async_client
+    if _async_client is None:
+        _async_client = aioredis.from_url(get_settings().REDIS_URL)
+    return _async_client
+
+
+def bump_collection_version(collection: str) -> None:
+    pending = _pending_bumps.get()
+    if pending is not None:
+        pending.add(collection)
+        return
+    try:
+        _get_sync_client().incr(_key(collection))
+    except redis.RedisError as e:
+        logger.warning("Failed to bump collection version", collection=collection, error=str(e))
+
+
+async def abump_collection_version(collection: str) -> None:
+    pending = _pending_bumps.get()
+    if pending is not None:
+        pending.add(collection)
+        return
+    try:
+        await _get_async_client().incr(_key(collection))
+    except redis.RedisError as e:
+        logger.warning("Failed to bump collection version", collection=collection, error=str(e))
+
+
+@asynccontextmanager
+async def batched_version_bumps():
+    """Defer version bumps made inside (tasks and threads included) to one per collection.
+
+    The bumps are applied on exit even if the block fails, since part of
+    its writes may have landed. Nested blocks leave the bumps to the
+    outermost one.
+    """
+    if _pending_bumps.get() is not None:
+        yield
+        return
+    pending: set[str] = set()
+    token = _pending_bumps.set(pending)
+    try:
+        yield
+    finally:
+        _pending_bumps.reset(token)
+        for collection in sorted(pending):
+            await abump_collection_version(collection)
+
+
+async def get_collection_versions(collections: list[str]) -> tuple[int, ...] | None:
+    """Current versions of ``collections``, or None if Redis is unavailable."""
+    try:
+        values = await _get_async_client().mget([_key(c) for c in collections])
+    except redis.RedisError as e:
+        logger.warning("Failed to read collection versions", error=str(e))
+        return None
+    return tuple(int(v or 0) for v in values)
+
+
+def set_migration_target(collection: str, target: str | None) -> None:
+    """Start (``target`` = physical collection) or end (``None``) dual-writes."""
+    client = _get_sync_client()
+    if target is None:
+        client.delete(_migration_key(collection))
+    else:
+        client.set(_migration_key(collection), target)
+    _migration_targets.pop(collection, None)
+
+
+def _cached_target(collection: str) -> tuple[bool, str | None]:
+    cached = _migration_targets.get(collection)
+    if cached is not None and cached[0] > time.monotonic():
+        return True, cached[1]
+    return False, None
+
+
+def _remember_target(collection: str, raw: bytes | None) -> str | None:
+    target = raw.decode() if raw else None
+    _migration_targets[collection] = (time.monotonic() + MIGRATION_CACHE_SECONDS, target)
+    return target
+
+
+def get_migration_target(collection: str) -> str | None:
+    hit, target = _cached_target(collection)
+    if hit:
+        return target
+    try:
+        return _remember_target(collection, _get_sync_client().get(_migration_key(collection)))
+    except redis.RedisError as e:
+        logger.error("Failed to read migration target", collection=collection, error=str(e))
+        raise VectorStoreError(f"Cannot read migration target of {collection}", str(e)) from e
+
+
+async def aget_migration_target(collection: str) -> str | None:
+    hit, target = _cached_target(collection)
+    if hit:
+        return target
+    try:
+        raw = await _get_async_client().get(_migration_key(collection))
+    except redis.RedisError as e:
+        logger.error("Failed to read migration target", collection=collection, error=str(e))
+        raise VectorStoreError(f"Cannot read migration target of {collection}", str(e)) from e
+    return _remember_target(collection, raw)
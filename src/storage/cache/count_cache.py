@@ -0,0 +1,51 @@
+"""Short-lived cache of filtered row counts for list endpoints.
+
+Keys are ``count:<sha256 of the compiled COUNT query and its parameters>``,
+so every distinct filter combination gets its own entry. An entry may be
+up to ``COUNT_CACHE_TTL_SECONDS`` stale, which is why counts served from
+here are reported as estimates. Redis errors degrade to a miss.
+"""
+
+import hashlib
+
+import redis.asyncio as aioredis
+from redis.exceptions import RedisError
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.sql import Select
+
+from src.core.config import get_settings
+from src.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+_client: aioredis.Redis | None = None
+
+
+def _get_client() -> aioredis.Redis:
+    global _client
+    if _client is None:
+        _client = aioredis.from_url(get_settings().REDIS_URL)
+    return _client
+
+
+def count_key(count_query: Select) -> str:
+    compiled = count_query.compile(dialect=postgresql.dialect())
+    params = sorted((k, repr(v)) for k, v in compiled.params.items())
+    digest = hashlib.sha256(f"{compiled}\x00{params}".encode()).hexdigest()
+    return f"count:{digest}"
+
+
+async def get_cached_count(key: str) -> int | None:
+    try:
+        value = await _get_client().get(key)
+    except RedisError as e:
+        logger.warning("Count cache read failed", error=str(e))
+        return None
+    return int(value) if value is not None else None
+
+
+async def set_cached_count(key: str, total: int) -> None:
+    try:
+        await _get_client().set(key, total, ex=get_settings().COUNT_CACHE_TTL_SECONDS)
+    except RedisError as e:
+        logger.warning("Count cache write failed", error=str(e))
@@ -0,0 +1,81 @@
+"""Content-addressed embedding cache stored in Redis.
+
+Keys are ``emb:<sha256(model_name, backend, normalized text)>`` and values
+are raw float32 bytes, so re-embedding unchanged text (e.g. a repo whose
+stars changed but whose README did not) skips the encoder entirely. The
+backend (``EMBEDDING_BACKEND``, which includes the precision) is part of
+the key: int8 or half-precision vectors are never served to an fp32 caller.
+
+The cache is synchronous because ``EmbeddingGenerator.embed_batch`` runs in
+worker threads / Celery tasks, not on the event loop.
+"""
+
+import hashlib
+import re
+import unicodedata
+
+import numpy as np
+import redis
+
+from src.core.config import get_settings
+from src.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    """Normalize text so cosmetic differences map to the same cache key."""
+    return _WHITESPACE_RE.sub(" ", unicodedata.normalize("NFC", text)).strip()
+
+
+def cache_key(model_name: str, backend: str, text: str) -> str:
+    payload = f"{model_name}\x00{backend}\x00{normalize_text(text)}"
+    return f"emb:{hashlib.sha256(payload.encode()).hexdigest()}"
+
+
+class EmbeddingCache:
+    """Redis-backed embedding lookup keyed by model, backend and text content.
+
+    Any Redis error degrades to a cache miss so embedding never fails
+    because the cache is unavailable.
+    """
+
+    def __init__(self, ttl_seconds: int | None = None):
+        settings = get_settings()
+        self.ttl = ttl_seconds or settings.EMBEDDING_CACHE_TTL_DAYS * 86400
+        self.client = redis.Redis.from_url(settings.REDIS_URL)
+
+    def get_many(
+        self, model_name: str, backend: str, texts: list[str]
+    ) -> list[list[float] | None]:
+        if not texts:
+            return []
+        keys = [cache_key(model_name, backend, t) for t in texts]
+        try:
+            values = self.client.mget(keys)
+        except redis.RedisError as e:
+            logger.warning("Embedding cache read failed", error=str(e))
+            return [None] * len(texts)
+        return [
+            np.frombuffer(v, dtype=np.float32).tolist() if v is not None else None
+            for v in values
+        ]
+
+    def set_many(
+        self, model_name: str, backend: str, texts: list[str], embeddings: list[list[float]]
+    ) -> None:
+        if not texts:
+            return
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            for text, embedding in zip(texts, embeddings):
+                pipe.set(
+                    cache_key(model_name, backend, text),
+                    np.asarray(embedding, dtype=np.float32).tobytes(),
+                    ex=self.ttl,
+                )
+            pipe.execute()
+        except redis.RedisError as e:
+            logger.warning("Embedding cache write failed", error=str(e))
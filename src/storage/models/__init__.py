@@ -1,10 +1,12 @@
 from src.storage.models.alert import Alert
+from src.storage.models.author import Author, PaperAuthor
 from src.storage.models.bookmark import Bookmark
 from src.storage.models.community_post import CommunityPost
 from src.storage.models.conversation import ChatMessage, Conversation
 from src.storage.models.conversation_document import ConversationDocument
 from src.storage.models.document import Document
 from src.storage.models.document_embedding import DocumentEmbedding
+from src.storage.models.document_text import DocumentText
 from src.storage.models.folder import Folder
 from src.storage.models.github_discussion import GitHubDiscussion
 from src.storage.models.hf_model import HFModel
@@ -13,6 +15,16 @@ from src.storage.models.link import PaperRepoLink
 from src.storage.models.metrics import CrawlJob, MetricsHistory, TrendingScore
 from src.storage.models.openreview_note import OpenReviewNote
 from src.storage.models.paper import Paper
+from src.storage.models.paper_analytics import (
+    AuthorStat,
+    CategoryYearCount,
+    CoauthorEdge,
+    InstitutionStat,
+    KeywordYearCount,
+    PaperAnalyticsSync,
+    TopicPairCount,
+)
+from src.storage.models.reindex_checkpoint import ReindexCheckpoint
 from src.storage.models.repository import Repository
 from src.storage.models.subscription import ApiRateLimit, Subscription
 from src.storage.models.tech_radar import TechRadarSnapshot
@@ -36,6 +48,7 @@ __all__ = [
     "Conversation",
     "ChatMessage",
     "DocumentEmbedding",
+    "DocumentText",
     "ConversationDocument",
     "TechRadarSnapshot",
     "WeeklyReport",
@@ -44,4 +57,14 @@ __all__ = [
     "CommunityPost",
     "GitHubDiscussion",
     "OpenReviewNote",
+    "ReindexCheckpoint",
+    "Author",
+    "PaperAuthor",
+    "AuthorStat",
+    "CoauthorEdge",
+    "InstitutionStat",
+    "KeywordYearCount",
+    "CategoryYearCount",
+    "TopicPairCount",
+    "PaperAnalyticsSync",
 ]
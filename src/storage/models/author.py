@@ -0,0 +1,60 @@
+import uuid
+from datetime import datetime
+
+from sqlalchemy import ForeignKey, Index, Integer, String, Text
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from src.storage.database import Base
+
+
+class Author(Base):
+    """One person, identified by the normalized form of their name.
+
+    ``name_key`` comes from ``author_repo.author_name_key``, so spellings
+    that differ only in case, accents or punctuation share a row.
+    """
+
+    __tablename__ = "authors"
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+    )
+    name_key: Mapped[str] = mapped_column(Text, nullable=False, unique=True)
+    # Spelling the author was first seen with
+    name: Mapped[str] = mapped_column(Text, nullable=False)
+
+    created_at: Mapped[datetime] = mapped_column(
+        default=func.now(), server_default=func.now()
+    )
+
+
+class PaperAuthor(Base):
+    """One entry of ``Paper.authors``, linked to its ``Author``.
+
+    Rewritten whenever a paper's authors are written (``AuthorRepository``).
+    """
+
+    __tablename__ = "paper_authors"
+
+    paper_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("papers.id", ondelete="CASCADE"), primary_key=True
+    )
+    position: Mapped[int] = mapped_column(Integer, primary_key=True)
+    author_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("authors.id", ondelete="CASCADE"), nullable=False
+    )
+    # As written on this paper
+    name: Mapped[str] = mapped_column(Text, nullable=False)
+    affiliation: Mapped[str | None] = mapped_column(Text)
+
+    # Copied from the paper so aggregates need no join
+    year: Mapped[int | None] = mapped_column(Integer)
+    citation_count: Mapped[int] = mapped_column(Integer, default=0)
+    categories: Mapped[list[str] | None] = mapped_column(ARRAY(String(50)))
+
+    __table_args__ = (
+        Index("idx_paper_authors_author", "author_id"),
+        Index("idx_paper_authors_affiliation", "affiliation"),
+    )
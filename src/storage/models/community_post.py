@@ -42,7 +42,7 @@ class CommunityPost(Base):
     __table_args__ = (
         Index("uq_community_platform_external", "platform", "external_id", unique=True),
         Index("idx_community_platform", "platform"),
-        Index("idx_community_score", "score", postgresql_using="btree"),
+        Index("idx_community_score_id", "score", "id"),
         Index("idx_community_published_at", "published_at"),
         Index("idx_community_tags", "tags", postgresql_using="gin"),
     )
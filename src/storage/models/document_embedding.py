@@ -29,7 +29,10 @@ class DocumentEmbedding(Base):
         nullable=False,
         index=True,
     )
+    # Chunks embedded so far; doubles as the resume checkpoint of a retried job
     chunk_count: Mapped[int] = mapped_column(Integer, default=0)
+    # Expected chunk count; estimated while a PDF is still being extracted
+    total_chunks: Mapped[int | None] = mapped_column(Integer, nullable=True)
     status: Mapped[str] = mapped_column(
         String(20), default="pending"
     )  # pending | processing | completed | failed
@@ -0,0 +1,33 @@
+import uuid
+from datetime import datetime
+
+from sqlalchemy import ForeignKey, Integer, String, Text
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from src.storage.database import Base
+
+
+class DocumentText(Base):
+    """Extracted text of an uploaded document, so it is parsed only once.
+
+    ``content_hash`` is the SHA-256 of the stored file; identical files
+    (e.g. the same arXiv PDF saved by several users) share one extraction.
+    Postgres compresses the ``text`` column out of line (TOAST).
+    """
+
+    __tablename__ = "document_texts"
+
+    document_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("documents.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    content_hash: Mapped[str] = mapped_column(String(64), nullable=False, index=True)
+    text: Mapped[str] = mapped_column(Text, nullable=False)
+    char_count: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    created_at: Mapped[datetime] = mapped_column(
+        default=func.now(), server_default=func.now()
+    )
@@ -41,7 +41,7 @@ class GitHubDiscussion(Base):
     )
 
     __table_args__ = (
-        Index("idx_gh_discussion_upvotes", "upvotes", postgresql_using="btree"),
+        Index("idx_gh_discussion_upvotes_id", "upvotes", "id"),
         Index("idx_gh_discussion_category", "category"),
         Index("idx_gh_discussion_published_at", "published_at"),
         Index("idx_gh_discussion_labels", "labels", postgresql_using="gin"),
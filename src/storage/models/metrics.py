@@ -71,7 +71,7 @@ class TrendingScore(Base):
         UniqueConstraint(
             "entity_type", "entity_id", "period_start", name="uq_trending_entity_period"
         ),
-        Index("idx_trending_score", "total_score"),
+        Index("idx_trending_score_id", "total_score", "id"),
         Index("idx_trending_category", "category", "rank_in_category"),
     )
 
@@ -50,7 +50,7 @@ class OpenReviewNote(Base):
     __table_args__ = (
         Index("idx_openreview_venue", "venue"),
         Index("idx_openreview_venueid", "venueid"),
-        Index("idx_openreview_avg_rating", "average_rating", postgresql_using="btree"),
+        Index("idx_openreview_avg_rating_id", "average_rating", "id"),
         Index("idx_openreview_published_at", "published_at"),
         Index("idx_openreview_keywords", "keywords", postgresql_using="gin"),
         Index("idx_openreview_primary_area", "primary_area"),
@@ -1,8 +1,8 @@
 import uuid
 from datetime import date, datetime
 
-from sqlalchemy import Boolean, Date, Float, Index, Integer, String, Text
-from sqlalchemy.dialects.postgresql import ARRAY, JSONB, UUID
+from sqlalchemy import Boolean, Computed, Date, Float, Index, Integer, String, Text
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, TSVECTOR, UUID
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
 
@@ -57,6 +57,18 @@ class Paper(Base):
     is_vietnamese: Mapped[bool] = mapped_column(Boolean, default=False)
     vietnam_entities: Mapped[dict | None] = mapped_column(JSONB, default=dict)
 
+    # Full-text search (generated; arxiv_id uses the 'simple' config so IDs stay exact)
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR,
+        Computed(
+            "setweight(to_tsvector('simple', coalesce(arxiv_id, '')), 'A') || "
+            "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+            "setweight(to_tsvector('english', coalesce(abstract, '')), 'B')",
+            persisted=True,
+        ),
+        deferred=True,
+    )
+
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
         default=func.now(), server_default=func.now()
@@ -66,7 +78,18 @@ class Paper(Base):
     )
 
     __table_args__ = (
-        Index("idx_papers_published_date", "published_date", postgresql_using="btree"),
+        Index("idx_papers_published_date_id", "published_date", "id"),
+        # Keyset pagination for the reindexer
+        Index("idx_papers_created_at_id", "created_at", "id"),
+        # Changed-paper scan of the incremental analytics refresh
+        Index("idx_papers_updated_at", "updated_at"),
         Index("idx_papers_categories", "categories", postgresql_using="gin"),
         Index("idx_papers_topics", "topics", postgresql_using="gin"),
+        Index("idx_papers_search_vector", "search_vector", postgresql_using="gin"),
+        Index(
+            "idx_papers_title_trgm",
+            "title",
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"},
+        ),
     )
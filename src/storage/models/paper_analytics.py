@@ -0,0 +1,136 @@
+"""Precomputed analytics tables derived from ``papers``.
+
+Maintained by ``PaperAnalyticsRepository.refresh``; never written by the
+API. Every aggregate has a ``scope``: ``'*'`` for all papers, otherwise the
+arXiv category the figures are restricted to, so a category-filtered
+endpoint is a lookup rather than a scan.
+"""
+
+import uuid
+from datetime import datetime
+
+from sqlalchemy import BigInteger, ForeignKey, Index, Integer, String, Text
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.storage.database import Base
+
+ALL_SCOPE = "*"
+
+
+class AuthorStat(Base):
+    __tablename__ = "author_stats"
+
+    scope: Mapped[str] = mapped_column(String(50), primary_key=True)
+    author_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("authors.id", ondelete="CASCADE"), primary_key=True
+    )
+    name: Mapped[str] = mapped_column(Text, nullable=False)
+    affiliation: Mapped[str | None] = mapped_column(Text)
+    paper_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    total_citations: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    first_year: Mapped[int | None] = mapped_column(Integer)
+    last_year: Mapped[int | None] = mapped_column(Integer)
+
+    __table_args__ = (
+        Index("idx_author_stats_author", "author_id"),
+        Index("idx_author_stats_papers", "scope", "paper_count"),
+        Index("idx_author_stats_citations", "scope", "total_citations"),
+    )
+
+
+class CoauthorEdge(Base):
+    """Papers co-authored by two authors (``source_id < target_id``)."""
+
+    __tablename__ = "coauthor_edges"
+
+    scope: Mapped[str] = mapped_column(String(50), primary_key=True)
+    source_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("authors.id", ondelete="CASCADE"), primary_key=True
+    )
+    target_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("authors.id", ondelete="CASCADE"), primary_key=True
+    )
+    weight: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    __table_args__ = (
+        Index("idx_coauthor_edges_weight", "scope", "weight"),
+        Index("idx_coauthor_edges_source", "source_id"),
+        Index("idx_coauthor_edges_target", "target_id"),
+    )
+
+
+class InstitutionStat(Base):
+    __tablename__ = "institution_stats"
+
+    scope: Mapped[str] = mapped_column(String(50), primary_key=True)
+    affiliation: Mapped[str] = mapped_column(Text, primary_key=True)
+    paper_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    author_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    # Author entries naming this affiliation (one per author per paper)
+    mention_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    citation_sum: Mapped[int] = mapped_column(BigInteger, nullable=False)
+
+    __table_args__ = (
+        Index("idx_institution_stats_affiliation", "affiliation"),
+        Index("idx_institution_stats_papers", "scope", "paper_count"),
+        Index("idx_institution_stats_mentions", "scope", "mention_count"),
+    )
+
+
+class KeywordYearCount(Base):
+    """Dated papers per keyword (``kind='keyword'``) or topic (``kind='topic'``) and year."""
+
+    __tablename__ = "keyword_year_counts"
+
+    scope: Mapped[str] = mapped_column(String(50), primary_key=True)
+    kind: Mapped[str] = mapped_column(String(10), primary_key=True)
+    keyword: Mapped[str] = mapped_column(String(100), primary_key=True)
+    year: Mapped[int] = mapped_column(Integer, primary_key=True)
+    paper_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    citation_sum: Mapped[int] = mapped_column(BigInteger, nullable=False)
+
+
+class CategoryYearCount(Base):
+    __tablename__ = "category_year_counts"
+
+    scope: Mapped[str] = mapped_column(String(50), primary_key=True)
+    category: Mapped[str] = mapped_column(String(50), primary_key=True)
+    year: Mapped[int] = mapped_column(Integer, primary_key=True)
+    paper_count: Mapped[int] = mapped_column(Integer, nullable=False)
+
+
+class TopicPairCount(Base):
+    """Papers tagged with both ``topic_a`` and ``topic_b`` (``topic_a < topic_b``)."""
+
+    __tablename__ = "topic_pair_counts"
+
+    scope: Mapped[str] = mapped_column(String(50), primary_key=True)
+    topic_a: Mapped[str] = mapped_column(String(100), primary_key=True)
+    topic_b: Mapped[str] = mapped_column(String(100), primary_key=True)
+    paper_count: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    __table_args__ = (Index("idx_topic_pair_counts_papers", "scope", "paper_count"),)
+
+
+class PaperAnalyticsSync(Base):
+    """The values of a paper that the counters currently include.
+
+    An incremental refresh subtracts these and adds the paper's current
+    values, so the counters stay exact without rescanning ``papers``;
+    ``author_ids``/``affiliations`` tell it whose aggregates to recompute
+    when a paper's authors change. There is no foreign key to ``papers``:
+    a deleted paper's row stays until the refresh has subtracted it.
+    """
+
+    __tablename__ = "paper_analytics_sync"
+
+    paper_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True)
+    source_updated_at: Mapped[datetime] = mapped_column(nullable=False, index=True)
+    year: Mapped[int | None] = mapped_column(Integer)
+    citation_count: Mapped[int] = mapped_column(Integer, default=0)
+    categories: Mapped[list[str] | None] = mapped_column(ARRAY(String(50)))
+    keywords: Mapped[list[str] | None] = mapped_column(ARRAY(String(100)))
+    topics: Mapped[list[str] | None] = mapped_column(ARRAY(String(100)))
+    author_ids: Mapped[list[uuid.UUID] | None] = mapped_column(ARRAY(UUID(as_uuid=True)))
+    affiliations: Mapped[list[str] | None] = mapped_column(ARRAY(Text))
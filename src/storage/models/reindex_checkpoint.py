@@ -0,0 +1,43 @@
+import uuid
+from datetime import datetime
+
+from sqlalchemy import Integer, String, Text, UniqueConstraint
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from src.storage.database import Base
+
+
+class ReindexCheckpoint(Base):
+    """Resume position of a reindex run into one Qdrant collection with one model.
+
+    Rows are read in (created_at, id) order; everything up to and including
+    ``(last_created_at, last_id)`` has been written to Qdrant.
+    """
+
+    __tablename__ = "reindex_checkpoints"
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+    )
+    collection: Mapped[str] = mapped_column(String(200), nullable=False)
+    model: Mapped[str] = mapped_column(String(200), nullable=False)
+
+    last_created_at: Mapped[datetime | None] = mapped_column()
+    last_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True))
+    processed: Mapped[int] = mapped_column(Integer, default=0)
+
+    status: Mapped[str] = mapped_column(
+        String(20), default="running"
+    )  # running | completed | failed
+    error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+    started_at: Mapped[datetime] = mapped_column(
+        default=func.now(), server_default=func.now()
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        default=func.now(), server_default=func.now(), onupdate=func.now()
+    )
+
+    __table_args__ = (UniqueConstraint("collection", "model", name="uq_reindex_collection_model"),)
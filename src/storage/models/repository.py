@@ -1,8 +1,8 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import BigInteger, Boolean, Index, Integer, String, Text
-from sqlalchemy.dialects.postgresql import ARRAY, JSONB, UUID
+from sqlalchemy import BigInteger, Boolean, Computed, Index, Integer, String, Text
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, TSVECTOR, UUID
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
 
@@ -63,6 +63,17 @@ class Repository(Base):
     # Processing
     is_processed: Mapped[bool] = mapped_column(Boolean, default=False)
 
+    # Full-text search (generated)
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR,
+        Computed(
+            "setweight(to_tsvector('simple', coalesce(full_name, '')), 'A') || "
+            "setweight(to_tsvector('english', coalesce(description, '')), 'B')",
+            persisted=True,
+        ),
+        deferred=True,
+    )
+
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
         default=func.now(), server_default=func.now()
@@ -74,8 +85,17 @@ class Repository(Base):
     repo_updated_at: Mapped[datetime | None] = mapped_column()
 
     __table_args__ = (
-        Index("idx_repos_stars", "stars_count", postgresql_using="btree"),
+        Index("idx_repos_stars_id", "stars_count", "id"),
+        # Keyset pagination for the reindexer
+        Index("idx_repos_created_at_id", "created_at", "id"),
         Index("idx_repos_language", "primary_language"),
         Index("idx_repos_topics", "topics", postgresql_using="gin"),
         Index("idx_repos_frameworks", "frameworks", postgresql_using="gin"),
+        Index("idx_repos_search_vector", "search_vector", postgresql_using="gin"),
+        Index(
+            "idx_repos_full_name_trgm",
+            "full_name",
+            postgresql_using="gin",
+            postgresql_ops={"full_name": "gin_trgm_ops"},
+        ),
     )
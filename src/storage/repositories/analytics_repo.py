@@ -0,0 +1,305 @@
+"""Incremental maintenance of the paper analytics tables (``models.paper_analytics``).
+
+A refresh looks only at papers whose ``updated_at`` moved since they were
+last counted:
+
+- ``author_stats`` / ``coauthor_edges`` / ``institution_stats`` are
+  recomputed for just the authors and affiliations involved (the ones in
+  ``paper_analytics_sync`` and the current ``paper_authors`` rows), via
+  the ``paper_authors`` indexes;
+- the keyword, category and topic-pair counters get a delta: minus the
+  values recorded in ``paper_analytics_sync`` for the paper, plus its
+  current values. Counters that drop to zero are deleted.
+
+Deleted papers are found as ``paper_analytics_sync`` rows without a
+paper; they only get the "minus" half, and their sync rows are dropped.
+
+Everything runs in the caller's transaction, so readers see either the
+previous or the refreshed figures. A transaction-level advisory lock keeps
+concurrent refreshes (collection runs finishing together) from applying
+the same delta twice. ``full=True`` also rebuilds ``paper_authors`` from
+``Paper.authors``, then empties and recomputes everything. It uses
+``DELETE`` rather than ``TRUNCATE``: the ACCESS EXCLUSIVE lock of a
+truncate would block every analytics read until the rebuild commits.
+"""
+
+from datetime import timedelta
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.logging import get_logger
+from src.storage.repositories.author_repo import AuthorRepository
+
+logger = get_logger(__name__)
+
+# Arbitrary application-wide key for pg_try_advisory_xact_lock
+REFRESH_LOCK_KEY = 7_240_112_024
+
+# papers.updated_at is the writer's transaction start, which can be earlier
+# than its commit; re-examine this window before the last synced change.
+COMMIT_LAG = timedelta(hours=1)
+
+DERIVED_TABLES = (
+    "author_stats",
+    "coauthor_edges",
+    "institution_stats",
+    "keyword_year_counts",
+    "category_year_counts",
+    "topic_pair_counts",
+    "paper_analytics_sync",
+)
+
+# The scopes a row counts towards: all papers plus each of its categories
+_SCOPES = "(SELECT DISTINCT unnest(array_prepend('*'::varchar, {categories})))"
+
+_CHANGED_ALL = """
+    CREATE TEMP TABLE analytics_changed ON COMMIT DROP AS
+    SELECT p.id AS paper_id FROM papers p
+"""
+
+_CHANGED_SINCE = """
+    CREATE TEMP TABLE analytics_changed ON COMMIT DROP AS
+    SELECT p.id AS paper_id
+    FROM papers p
+    LEFT JOIN paper_analytics_sync s ON s.paper_id = p.id
+    WHERE p.updated_at > :since
+      AND (s.paper_id IS NULL OR p.updated_at > s.source_updated_at)
+    UNION ALL
+    SELECT s.paper_id
+    FROM paper_analytics_sync s
+    WHERE NOT EXISTS (SELECT 1 FROM papers p WHERE p.id = s.paper_id)
+"""
+
+_DELTA = """
+    CREATE TEMP TABLE analytics_delta ON COMMIT DROP AS
+    SELECT -1 AS sign, s.year, s.citation_count, s.categories, s.keywords, s.topics
+    FROM paper_analytics_sync s
+    JOIN analytics_changed c ON c.paper_id = s.paper_id
+    UNION ALL
+    SELECT 1, EXTRACT(YEAR FROM p.published_date)::int, COALESCE(p.citation_count, 0),
+           p.categories, p.keywords, p.topics
+    FROM papers p
+    JOIN analytics_changed c ON c.paper_id = p.id
+"""
+
+_KEYWORD_DELTA = f"""
+    INSERT INTO keyword_year_counts AS t (scope, kind, keyword, year, paper_count, citation_sum)
+    SELECT sc.scope, k.kind, k.keyword, d.year, SUM(d.sign), SUM(d.sign * d.citation_count)
+    FROM analytics_delta d
+    CROSS JOIN LATERAL {_SCOPES.format(categories="d.categories")} AS sc(scope)
+    CROSS JOIN LATERAL (
+        SELECT 'keyword', unnest(d.keywords)
+        UNION ALL
+        SELECT 'topic', unnest(d.topics)
+    ) AS k(kind, keyword)
+    WHERE d.year IS NOT NULL AND k.keyword IS NOT NULL
+    GROUP BY sc.scope, k.kind, k.keyword, d.year
+    HAVING SUM(d.sign) <> 0 OR SUM(d.sign * d.citation_count) <> 0
+    ON CONFLICT (scope, kind, keyword, year) DO UPDATE
+    SET paper_count = t.paper_count + EXCLUDED.paper_count,
+        citation_sum = t.citation_sum + EXCLUDED.citation_sum
+"""
+
+_CATEGORY_DELTA = f"""
+    INSERT INTO category_year_counts AS t (scope, category, year, paper_count)
+    SELECT sc.scope, cat.category, d.year, SUM(d.sign)
+    FROM analytics_delta d
+    CROSS JOIN LATERAL {_SCOPES.format(categories="d.categories")} AS sc(scope)
+    CROSS JOIN LATERAL (SELECT DISTINCT unnest(d.categories)) AS cat(category)
+    WHERE d.year IS NOT NULL
+    GROUP BY sc.scope, cat.category, d.year
+    HAVING SUM(d.sign) <> 0
+    ON CONFLICT (scope, category, year) DO UPDATE
+    SET paper_count = t.paper_count + EXCLUDED.paper_count
+"""
+
+_TOPIC_PAIR_DELTA = f"""
+    INSERT INTO topic_pair_counts AS t (scope, topic_a, topic_b, paper_count)
+    SELECT sc.scope, a.topic, b.topic, SUM(d.sign)
+    FROM analytics_delta d
+    CROSS JOIN LATERAL {_SCOPES.format(categories="d.categories")} AS sc(scope)
+    CROSS JOIN LATERAL (SELECT DISTINCT unnest(d.topics)) AS a(topic)
+    CROSS JOIN LATERAL (SELECT DISTINCT unnest(d.topics)) AS b(topic)
+    WHERE a.topic < b.topic
+    GROUP BY sc.scope, a.topic, b.topic
+    HAVING SUM(d.sign) <> 0
+    ON CONFLICT (scope, topic_a, topic_b) DO UPDATE
+    SET paper_count = t.paper_count + EXCLUDED.paper_count
+"""
+
+_PRUNE = [
+    "DELETE FROM keyword_year_counts WHERE paper_count <= 0",
+    "DELETE FROM category_year_counts WHERE paper_count <= 0",
+    "DELETE FROM topic_pair_counts WHERE paper_count <= 0",
+]
+
+# Old (snapshot) and current authors/affiliations of the changed papers
+_AFFECTED = [
+    """
+    CREATE TEMP TABLE analytics_authors ON COMMIT DROP AS
+    SELECT unnest(s.author_ids) AS author_id
+    FROM paper_analytics_sync s
+    JOIN analytics_changed c ON c.paper_id = s.paper_id
+    UNION
+    SELECT pa.author_id
+    FROM paper_authors pa
+    JOIN analytics_changed c ON c.paper_id = pa.paper_id
+    """,
+    """
+    CREATE TEMP TABLE analytics_affiliations ON COMMIT DROP AS
+    SELECT unnest(s.affiliations) AS affiliation
+    FROM paper_analytics_sync s
+    JOIN analytics_changed c ON c.paper_id = s.paper_id
+    UNION
+    SELECT pa.affiliation
+    FROM paper_authors pa
+    JOIN analytics_changed c ON c.paper_id = pa.paper_id
+    WHERE pa.affiliation IS NOT NULL
+    """,
+    "ANALYZE analytics_authors",
+    "ANALYZE analytics_affiliations",
+]
+
+# Citation counts and dates change without the author list changing
+_COPY_PAPER_FIELDS = """
+    UPDATE paper_authors pa
+    SET year = EXTRACT(YEAR FROM p.published_date)::int,
+        citation_count = COALESCE(p.citation_count, 0),
+        categories = p.categories
+    FROM papers p
+    JOIN analytics_changed c ON c.paper_id = p.id
+    WHERE pa.paper_id = p.id
+      AND (pa.year, pa.citation_count, pa.categories) IS DISTINCT FROM
+          (EXTRACT(YEAR FROM p.published_date)::int, COALESCE(p.citation_count, 0), p.categories)
+"""
+
+_SYNC = [
+    """
+    DELETE FROM paper_analytics_sync s
+    USING analytics_changed c WHERE s.paper_id = c.paper_id
+    """,
+    """
+    INSERT INTO paper_analytics_sync
+        (paper_id, source_updated_at, year, citation_count, categories, keywords, topics,
+         author_ids, affiliations)
+    SELECT p.id, p.updated_at, EXTRACT(YEAR FROM p.published_date)::int,
+           COALESCE(p.citation_count, 0), p.categories, p.keywords, p.topics,
+           a.author_ids, a.affiliations
+    FROM papers p
+    JOIN analytics_changed c ON c.paper_id = p.id
+    CROSS JOIN LATERAL (
+        SELECT array_agg(DISTINCT pa.author_id) AS author_ids,
+               array_agg(DISTINCT pa.affiliation)
+                   FILTER (WHERE pa.affiliation IS NOT NULL) AS affiliations
+        FROM paper_authors pa
+        WHERE pa.paper_id = p.id
+    ) AS a
+    """,
+]
+
+_RECOMPUTE_AUTHORS = [
+    "DELETE FROM author_stats s USING analytics_authors n WHERE s.author_id = n.author_id",
+    f"""
+    INSERT INTO author_stats
+        (scope, author_id, name, affiliation, paper_count, total_citations,
+         first_year, last_year)
+    SELECT sc.scope, pa.author_id, au.name, MIN(pa.affiliation), COUNT(DISTINCT pa.paper_id),
+           SUM(pa.citation_count), MIN(pa.year), MAX(pa.year)
+    FROM paper_authors pa
+    JOIN analytics_authors n ON n.author_id = pa.author_id
+    JOIN authors au ON au.id = pa.author_id
+    CROSS JOIN LATERAL {_SCOPES.format(categories="pa.categories")} AS sc(scope)
+    GROUP BY sc.scope, pa.author_id, au.name
+    """,
+    """
+    DELETE FROM coauthor_edges e
+    WHERE e.source_id IN (SELECT author_id FROM analytics_authors)
+       OR e.target_id IN (SELECT author_id FROM analytics_authors)
+    """,
+    # Every pair touching an affected author, whichever side of "<" it is on
+    f"""
+    INSERT INTO coauthor_edges (scope, source_id, target_id, weight)
+    SELECT sc.scope, LEAST(a.author_id, b.author_id), GREATEST(a.author_id, b.author_id),
+           COUNT(DISTINCT a.paper_id)
+    FROM paper_authors a
+    JOIN analytics_authors n ON n.author_id = a.author_id
+    JOIN paper_authors b ON b.paper_id = a.paper_id AND b.author_id <> a.author_id
+    CROSS JOIN LATERAL {_SCOPES.format(categories="a.categories")} AS sc(scope)
+    GROUP BY sc.scope, LEAST(a.author_id, b.author_id), GREATEST(a.author_id, b.author_id)
+    """,
+    """
+    DELETE FROM institution_stats s
+    USING analytics_affiliations a WHERE s.affiliation = a.affiliation
+    """,
+    f"""
+    INSERT INTO institution_stats
+        (scope, affiliation, paper_count, author_count, mention_count, citation_sum)
+    SELECT sc.scope, pa.affiliation, COUNT(DISTINCT pa.paper_id), COUNT(DISTINCT pa.author_id),
+           COUNT(*), SUM(pa.citation_count)
+    FROM paper_authors pa
+    JOIN analytics_affiliations a ON a.affiliation = pa.affiliation
+    CROSS JOIN LATERAL {_SCOPES.format(categories="pa.categories")} AS sc(scope)
+    GROUP BY sc.scope, pa.affiliation
+    """,
+]
+
+
+class PaperAnalyticsRepository:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def _run(self, *statements: str, **params) -> None:
+        for statement in statements:
+            await self.session.execute(text(statement), params)
+
+    async def refresh(self, full: bool = False) -> dict | None:
+        """Bring the analytics tables up to date with ``papers``.
+
+        Returns ``{"papers": <changed>, "authors": <recomputed>}``, or None
+        when another refresh holds the lock. The caller commits.
+        """
+        locked = (
+            await self.session.execute(
+                text("SELECT pg_try_advisory_xact_lock(:key)"), {"key": REFRESH_LOCK_KEY}
+            )
+        ).scalar()
+        if not locked:
+            logger.info("Analytics refresh already running, skipped")
+            return None
+
+        since = None
+        if full:
+            # Repairs rows of papers written without going through PaperRepository
+            await AuthorRepository(self.session).resync_all()
+        else:
+            since = (
+                await self.session.execute(
+                    text("SELECT MAX(source_updated_at) FROM paper_analytics_sync")
+                )
+            ).scalar()
+        if since is None:
+            # Nothing counted yet (or a forced rebuild): start from empty tables
+            await self._run(*(f"DELETE FROM {table}" for table in DERIVED_TABLES))
+            await self._run(_CHANGED_ALL)
+        else:
+            await self._run(_CHANGED_SINCE, since=since - COMMIT_LAG)
+        await self._run("ANALYZE analytics_changed")
+
+        changed = (
+            await self.session.execute(text("SELECT COUNT(*) FROM analytics_changed"))
+        ).scalar()
+        if not changed:
+            return {"papers": 0, "authors": 0}
+
+        # Counters: subtract what was counted for these papers, add what is there now
+        await self._run(_DELTA, _KEYWORD_DELTA, _CATEGORY_DELTA, _TOPIC_PAIR_DELTA, *_PRUNE)
+
+        # Author aggregates: recompute for every author/affiliation involved
+        await self._run(*_AFFECTED, _COPY_PAPER_FIELDS, *_SYNC, *_RECOMPUTE_AUTHORS)
+        authors = (
+            await self.session.execute(text("SELECT COUNT(*) FROM analytics_authors"))
+        ).scalar()
+
+        logger.info("Analytics refreshed", papers=changed, authors=authors, full=since is None)
+        return {"papers": changed, "authors": authors}
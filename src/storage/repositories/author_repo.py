@@ -0,0 +1,145 @@
+"""Normalized authors: ``authors`` keyed by a normalized name, linked by ``paper_authors``.
+
+``Paper.authors`` (JSONB) stays the record of what a source returned. Every
+``PaperRepository`` write that sets it calls ``sync_paper_authors`` in the
+same transaction, so author lookups never parse the JSON.
+"""
+
+import re
+import unicodedata
+import uuid
+from collections.abc import Iterable, Mapping
+
+from sqlalchemy import Integer, cast, delete, func, insert, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.storage.models.author import Author, PaperAuthor
+from src.storage.models.paper import Paper
+
+BATCH_SIZE = 1000
+
+_SEPARATORS = re.compile(r"[\W_]+")
+
+
+def author_name_key(name: str) -> str:
+    """Case-, accent- and punctuation-insensitive form of a name.
+
+    ``"José  García-López"`` and ``"jose garcia lopez"`` both become
+    ``"jose garcia lopez"``. Letters of any script are kept.
+    """
+    decomposed = unicodedata.normalize("NFKD", name)
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return _SEPARATORS.sub(" ", stripped.casefold()).strip()
+
+
+def _affiliation(author: dict) -> str | None:
+    value = author.get("affiliation")
+    if not isinstance(value, str):
+        return None
+    return value.strip() or None
+
+
+class AuthorRepository:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def ids_by_key(self, keys: Iterable[str]) -> dict[str, uuid.UUID]:
+        keys = list(set(keys))
+        found: dict[str, uuid.UUID] = {}
+        for start in range(0, len(keys), BATCH_SIZE):
+            result = await self.session.execute(
+                select(Author.name_key, Author.id).where(
+                    Author.name_key.in_(keys[start : start + BATCH_SIZE])
+                )
+            )
+            found.update(result.tuples().all())
+        return found
+
+    async def ids_by_name(self, names: Iterable[str]) -> dict[str, uuid.UUID]:
+        """Author id of each known name in ``names``, matched on the name key."""
+        keys = {name: author_name_key(name) for name in names}
+        ids = await self.ids_by_key(keys.values())
+        return {name: ids[key] for name, key in keys.items() if key in ids}
+
+    async def sync_paper_authors(self, papers: Mapping[uuid.UUID, list | None]) -> None:
+        """Rewrite the ``paper_authors`` rows of ``papers`` (paper id -> ``Paper.authors``)."""
+        if not papers:
+            return
+
+        entries = []
+        names: dict[str, str] = {}
+        for paper_id, authors in papers.items():
+            for position, author in enumerate(authors or [], 1):
+                if not isinstance(author, dict) or not isinstance(author.get("name"), str):
+                    continue
+                name = author["name"].strip()
+                key = author_name_key(name)
+                if not key:
+                    continue
+                names.setdefault(key, name)
+                entries.append((paper_id, position, key, name, _affiliation(author)))
+
+        # Key order keeps concurrent collectors from deadlocking on the unique index
+        new_authors = [
+            {"id": uuid.uuid4(), "name_key": key, "name": names[key]} for key in sorted(names)
+        ]
+        for start in range(0, len(new_authors), BATCH_SIZE):
+            await self.session.execute(
+                pg_insert(Author)
+                .values(new_authors[start : start + BATCH_SIZE])
+                .on_conflict_do_nothing(index_elements=["name_key"])
+            )
+        author_ids = await self.ids_by_key(names)
+
+        paper_ids = list(papers)
+        await self.session.execute(delete(PaperAuthor).where(PaperAuthor.paper_id.in_(paper_ids)))
+        links = [
+            {
+                "paper_id": paper_id,
+                "position": position,
+                "author_id": author_ids[key],
+                "name": name,
+                "affiliation": affiliation,
+            }
+            for paper_id, position, key, name, affiliation in entries
+        ]
+        for start in range(0, len(links), BATCH_SIZE):
+            await self.session.execute(
+                insert(PaperAuthor).values(links[start : start + BATCH_SIZE])
+            )
+
+        # Year, citations and categories as the paper has them now
+        await self.session.execute(
+            update(PaperAuthor)
+            .where(PaperAuthor.paper_id == Paper.id)
+            .where(PaperAuthor.paper_id.in_(paper_ids))
+            .values(
+                year=cast(func.extract("year", Paper.published_date), Integer),
+                citation_count=func.coalesce(Paper.citation_count, 0),
+                categories=Paper.categories,
+            )
+        )
+
+    async def resync_all(self) -> int:
+        """Rebuild ``paper_authors`` for every paper; returns the number of papers."""
+        synced = 0
+        last_id = None
+        while True:
+            query = select(Paper.id, Paper.authors).order_by(Paper.id).limit(BATCH_SIZE)
+            if last_id is not None:
+                query = query.where(Paper.id > last_id)
+            rows = (await self.session.execute(query)).all()
+            if not rows:
+                break
+            await self.sync_paper_authors({row.id: row.authors for row in rows})
+            synced += len(rows)
+            last_id = rows[-1].id
+
+        # Names no paper lists any more
+        await self.session.execute(
+            delete(Author).where(
+                ~select(PaperAuthor.paper_id).where(PaperAuthor.author_id == Author.id).exists()
+            )
+        )
+        return synced
@@ -0,0 +1,165 @@
+"""Set-based upsert on top of PostgreSQL ``INSERT ... ON CONFLICT DO UPDATE``.
+
+Replaces the per-row SELECT + setattr + flush cycle of the ``upsert_by_*``
+repository methods for bulk collection. Semantics match those methods:
+a ``None`` value never overwrites an existing column value.
+"""
+
+from collections.abc import Iterable, Sequence
+
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.logging import get_logger
+from src.storage.database import Base
+
+logger = get_logger(__name__)
+
+DEFAULT_BATCH_SIZE = 500
+
+
+def _apply_insert_defaults(model: type[Base], row: dict) -> dict:
+    """Fill Python-side column defaults (``id``, counters, flags) for the INSERT path.
+
+    An explicit NULL would bypass the column default, so defaults are
+    resolved here. They only reach the inserted row: ``_build_statement``
+    updates just the columns the caller supplied.
+    """
+    filled = dict(row)
+    for column in model.__table__.columns:
+        if filled.get(column.key) is not None or column.default is None:
+            continue
+        if column.default.is_scalar:
+            filled[column.key] = column.default.arg
+        elif column.default.is_callable:
+            filled[column.key] = column.default.arg({})
+    return filled
+
+
+def _dedupe(rows: Iterable[dict], conflict_cols: Sequence[str]) -> list[dict]:
+    """Merge rows sharing a conflict key (later non-None values win).
+
+    Postgres rejects a statement that touches the same row twice.
+    """
+    merged: dict[tuple, dict] = {}
+    for row in rows:
+        key = tuple(row.get(c) for c in conflict_cols)
+        if key in merged:
+            merged[key].update({k: v for k, v in row.items() if v is not None})
+        else:
+            merged[key] = dict(row)
+    return list(merged.values())
+
+
+def _group_by_supplied(rows: Iterable[dict]) -> dict[frozenset, list[dict]]:
+    """Group rows by the set of keys they carry a non-None value for.
+
+    Each group becomes its own statement, so its ``SET`` list names exactly
+    the columns its rows supply and a missing value never overwrites.
+    """
+    groups: dict[frozenset, list[dict]] = {}
+    for row in rows:
+        supplied = {k: v for k, v in row.items() if v is not None}
+        groups.setdefault(frozenset(supplied), []).append(supplied)
+    return groups
+
+
+def _build_statement(
+    model: type[Base],
+    rows: list[dict],
+    conflict_cols: Sequence[str],
+    update_cols: Sequence[str],
+):
+    """Upsert ``rows``, which must all carry the same keys.
+
+    Only ``update_cols`` are written on conflict; the caller passes the
+    columns the rows supplied, never ones filled by ``_apply_insert_defaults``.
+    """
+    table = model.__table__
+    stmt = insert(table).values(rows)
+    set_ = {col: stmt.excluded[col] for col in update_cols}
+    if "updated_at" in table.c and "updated_at" not in set_:
+        set_["updated_at"] = func.now()
+
+    if set_:
+        stmt = stmt.on_conflict_do_update(index_elements=list(conflict_cols), set_=set_)
+    else:
+        stmt = stmt.on_conflict_do_nothing(index_elements=list(conflict_cols))
+    return stmt.returning(table.c.id)
+
+
+async def bulk_upsert(
+    session: AsyncSession,
+    model: type[Base],
+    rows: Iterable[dict],
+    conflict_cols: Sequence[str],
+    update_cols: Sequence[str] | None = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> list:
+    """Insert or update ``rows`` in batches of ``batch_size`` per statement.
+
+    ``update_cols`` defaults to every supplied column except the conflict
+    key. Rows that supply different columns go in separate statements,
+    so a column a row leaves out (or sets to ``None``) keeps its stored
+    value. Returns the IDs of inserted or updated rows. If a batch violates
+    another unique constraint, it is retried row by row inside savepoints
+    and offending rows are logged and skipped.
+    """
+    rows = _dedupe(rows, conflict_cols)
+    if not rows:
+        return []
+
+    if update_cols is None:
+        supplied = {k for row in rows for k in row}
+        update_cols = sorted(supplied - set(conflict_cols) - {"id"})
+
+    ids: list = []
+    for supplied, group in _group_by_supplied(rows).items():
+        cols = [col for col in update_cols if col in supplied]
+        group = [_apply_insert_defaults(model, row) for row in group]
+        for start in range(0, len(group), batch_size):
+            ids.extend(
+                await _execute_batch(
+                    session, model, group[start : start + batch_size], conflict_cols, cols
+                )
+            )
+    return ids
+
+
+async def _execute_batch(
+    session: AsyncSession,
+    model: type[Base],
+    batch: list[dict],
+    conflict_cols: Sequence[str],
+    update_cols: Sequence[str],
+) -> list:
+    ids: list = []
+    try:
+        async with session.begin_nested():
+            result = await session.execute(
+                _build_statement(model, batch, conflict_cols, update_cols)
+            )
+            ids.extend(result.scalars().all())
+    except IntegrityError:
+        logger.warning(
+            "Bulk upsert batch conflicted, retrying row by row",
+            table=model.__tablename__,
+            size=len(batch),
+        )
+        for row in batch:
+            try:
+                async with session.begin_nested():
+                    result = await session.execute(
+                        _build_statement(model, [row], conflict_cols, update_cols)
+                    )
+                    ids.extend(result.scalars().all())
+            except IntegrityError as e:
+                logger.warning(
+                    "Skipping row in bulk upsert",
+                    table=model.__tablename__,
+                    key={c: row.get(c) for c in conflict_cols},
+                    error=str(e.orig)[:200],
+                )
+    return ids
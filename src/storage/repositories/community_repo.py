@@ -5,6 +5,8 @@ from sqlalchemy import and_, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.storage.models.community_post import CommunityPost
+from src.storage.repositories.bulk import bulk_upsert
+from src.storage.repositories.pagination import CountMode, Page, SortKey, paginate
 
 STOPWORDS = frozenset({
     "a", "an", "the", "and", "or", "of", "to", "in", "for", "with", "on",
@@ -51,6 +53,9 @@ class CommunityPostRepository:
         await self.session.flush()
         return obj
 
+    async def bulk_upsert_by_platform_id(self, rows: list[dict]) -> list:
+        return await bulk_upsert(self.session, CommunityPost, rows, ["platform", "external_id"])
+
     async def list_posts(
         self,
         skip: int = 0,
@@ -60,9 +65,10 @@ class CommunityPostRepository:
         tag: str | None = None,
         sort_by: str = "score",
         sort_order: str = "desc",
-    ) -> tuple[list[CommunityPost], int]:
+        cursor: str | None = None,
+        count: CountMode = "exact",
+    ) -> Page[CommunityPost]:
         query = select(CommunityPost)
-        count_query = select(func.count()).select_from(CommunityPost)
 
         filters = []
         if platform:
@@ -80,23 +86,22 @@ class CommunityPostRepository:
 
         if filters:
             query = query.where(and_(*filters))
-            count_query = count_query.where(and_(*filters))
 
         sort_column = getattr(CommunityPost, sort_by, CommunityPost.score)
-        if sort_order == "desc":
-            query = query.order_by(sort_column.desc())
-        else:
-            query = query.order_by(sort_column.asc())
-
-        query = query.offset(skip).limit(limit)
-
-        result = await self.session.execute(query)
-        posts = list(result.scalars().all())
-
-        count_result = await self.session.execute(count_query)
-        total = count_result.scalar() or 0
+        sort = SortKey(
+            sort_column.key, sort_column, CommunityPost.id, descending=sort_order == "desc"
+        )
 
-        return posts, total
+        return await paginate(
+            self.session,
+            query,
+            sort,
+            skip=skip,
+            limit=limit,
+            cursor=cursor,
+            count=count,
+            table=None if filters else CommunityPost.__tablename__,
+        )
 
     async def get_stats(self, platform: str | None = None) -> dict:
         base_filter = []
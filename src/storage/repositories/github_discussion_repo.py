@@ -2,6 +2,8 @@ from sqlalchemy import and_, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.storage.models.github_discussion import GitHubDiscussion
+from src.storage.repositories.bulk import bulk_upsert
+from src.storage.repositories.pagination import CountMode, Page, SortKey, paginate
 
 
 class GitHubDiscussionRepository:
@@ -28,6 +30,9 @@ class GitHubDiscussionRepository:
         await self.session.flush()
         return obj
 
+    async def bulk_upsert_by_discussion_id(self, rows: list[dict]) -> list:
+        return await bulk_upsert(self.session, GitHubDiscussion, rows, ["discussion_id"])
+
     async def list_discussions(
         self,
         skip: int = 0,
@@ -37,9 +42,10 @@ class GitHubDiscussionRepository:
         search: str | None = None,
         sort_by: str = "upvotes",
         sort_order: str = "desc",
-    ) -> tuple[list[GitHubDiscussion], int]:
+        cursor: str | None = None,
+        count: CountMode = "exact",
+    ) -> Page[GitHubDiscussion]:
         query = select(GitHubDiscussion)
-        count_query = select(func.count()).select_from(GitHubDiscussion)
 
         filters = []
         if repo:
@@ -57,23 +63,22 @@ class GitHubDiscussionRepository:
 
         if filters:
             query = query.where(and_(*filters))
-            count_query = count_query.where(and_(*filters))
 
         sort_column = getattr(GitHubDiscussion, sort_by, GitHubDiscussion.upvotes)
-        if sort_order == "desc":
-            query = query.order_by(sort_column.desc())
-        else:
-            query = query.order_by(sort_column.asc())
-
-        query = query.offset(skip).limit(limit)
-
-        result = await self.session.execute(query)
-        discussions = list(result.scalars().all())
-
-        count_result = await self.session.execute(count_query)
-        total = count_result.scalar() or 0
+        sort = SortKey(
+            sort_column.key, sort_column, GitHubDiscussion.id, descending=sort_order == "desc"
+        )
 
-        return discussions, total
+        return await paginate(
+            self.session,
+            query,
+            sort,
+            skip=skip,
+            limit=limit,
+            cursor=cursor,
+            count=count,
+            table=None if filters else GitHubDiscussion.__tablename__,
+        )
 
     async def get_stats(self) -> dict:
         summary_q = select(
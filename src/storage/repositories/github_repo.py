@@ -4,6 +4,9 @@ from sqlalchemy import and_, case, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.storage.models.repository import Repository
+from src.storage.repositories.bulk import bulk_upsert
+from src.storage.repositories.pagination import CountMode, Page, SortKey, paginate
+from src.storage.repositories.text_search import fulltext_filter, fulltext_rank
 
 
 class GitHubRepository:
@@ -22,6 +25,12 @@ class GitHubRepository:
         )
         return result.scalar_one_or_none()
 
+    async def get_by_full_names(self, full_names: list[str]) -> list[Repository]:
+        result = await self.session.execute(
+            select(Repository).where(Repository.full_name.in_(full_names))
+        )
+        return list(result.scalars().all())
+
     async def list_repos(
         self,
         skip: int = 0,
@@ -30,32 +39,36 @@ class GitHubRepository:
         topic: str | None = None,
         min_stars: int | None = None,
         search: str | None = None,
-        sort_by: str = "stars_count",
+        sort_by: str | None = None,
         sort_order: str = "desc",
-    ) -> tuple[list[Repository], int]:
+        cursor: str | None = None,
+        count: CountMode = "exact",
+    ) -> Page[Repository]:
+        """List repos; with ``search`` and no explicit sort, rank by relevance."""
         query = select(Repository)
-        count_query = select(func.count()).select_from(Repository)
 
         filters = self._build_filters(language, topic, min_stars, search)
         if filters:
             query = query.where(and_(*filters))
-            count_query = count_query.where(and_(*filters))
 
-        sort_column = getattr(Repository, sort_by, Repository.stars_count)
-        if sort_order == "desc":
-            query = query.order_by(sort_column.desc())
+        if search and sort_by in (None, "relevance"):
+            sort_name = "relevance"
+            sort_column = fulltext_rank(Repository.search_vector, Repository.full_name, search)
         else:
-            query = query.order_by(sort_column.asc())
-
-        query = query.offset(skip).limit(limit)
-
-        result = await self.session.execute(query)
-        repos = list(result.scalars().all())
-
-        count_result = await self.session.execute(count_query)
-        total = count_result.scalar() or 0
-
-        return repos, total
+            sort_column = getattr(Repository, sort_by or "stars_count", Repository.stars_count)
+            sort_name = sort_column.key
+        sort = SortKey(sort_name, sort_column, Repository.id, descending=sort_order == "desc")
+
+        return await paginate(
+            self.session,
+            query,
+            sort,
+            skip=skip,
+            limit=limit,
+            cursor=cursor,
+            count=count,
+            table=None if filters else Repository.__tablename__,
+        )
 
     async def upsert_by_full_name(self, repo_data: dict) -> Repository:
         existing = await self.get_by_full_name(repo_data.get("full_name", ""))
@@ -71,6 +84,9 @@ class GitHubRepository:
         await self.session.flush()
         return repo
 
+    async def bulk_upsert_by_full_name(self, rows: list[dict]) -> list:
+        return await bulk_upsert(self.session, Repository, rows, ["full_name"])
+
     async def list_all_full_names(self) -> list[str]:
         """Return full_name of all repos (lightweight query for update task)."""
         result = await self.session.execute(
@@ -97,12 +113,8 @@ class GitHubRepository:
         if min_stars:
             filters.append(Repository.stars_count >= min_stars)
         if search:
-            pattern = f"%{search}%"
             filters.append(
-                or_(
-                    Repository.full_name.ilike(pattern),
-                    Repository.description.ilike(pattern),
-                )
+                fulltext_filter(Repository.search_vector, Repository.full_name, search)
             )
         return filters
 
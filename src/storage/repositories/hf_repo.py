@@ -6,6 +6,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.storage.models.hf_model import HFModel
 from src.storage.models.hf_paper import HFPaper
+from src.storage.repositories.bulk import bulk_upsert
 
 STOPWORDS = frozenset({
     "a", "an", "the", "and", "or", "of", "to", "in", "for", "with", "on",
@@ -46,6 +47,9 @@ class HFModelRepository:
         await self.session.flush()
         return obj
 
+    async def bulk_upsert_by_model_id(self, rows: list[dict]) -> list:
+        return await bulk_upsert(self.session, HFModel, rows, ["model_id"])
+
     async def list_models(
         self,
         skip: int = 0,
@@ -158,6 +162,9 @@ class HFPaperRepository:
         await self.session.flush()
         return obj
 
+    async def bulk_upsert_by_arxiv_id(self, rows: list[dict]) -> list:
+        return await bulk_upsert(self.session, HFPaper, rows, ["arxiv_id"])
+
     async def list_recent(self, limit: int = 50) -> list[HFPaper]:
         # Get latest collected_date
         date_q = select(func.max(HFPaper.collected_date))
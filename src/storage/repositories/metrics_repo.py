@@ -1,12 +1,18 @@
 import uuid
 from datetime import date, timedelta
 
-from sqlalchemy import and_, func, select
+from sqlalchemy import Date, Float, and_, cast, column, func, literal, select, true, values
+from sqlalchemy.dialects.postgresql import JSONB, UUID, aggregate_order_by, insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.storage.models.metrics import MetricsHistory, TrendingScore
 from src.storage.models.paper import Paper
 from src.storage.models.repository import Repository
+from src.storage.repositories.bulk import bulk_upsert
+from src.storage.repositories.pagination import CountMode, Page, SortKey, paginate
+from src.storage.repositories.text_search import fulltext_filter
+
+_TRENDING_SORT = SortKey("total_score", TrendingScore.total_score, TrendingScore.id)
 
 
 class MetricsRepository:
@@ -97,6 +103,92 @@ class MetricsRepository:
         await self.session.flush()
         return record
 
+    async def upsert_daily_snapshots_bulk(
+        self,
+        entity_type: str,
+        snapshots: dict[uuid.UUID, dict],
+    ) -> int:
+        """Set-based ``upsert_daily_snapshot`` for many entities in one statement.
+
+        Velocities are computed in SQL against each entity's latest snapshot
+        at or before 1/7/30 days ago (one LATERAL lookup per window, served
+        by the ``uq_metrics_entity_date`` index).
+        """
+        if not snapshots:
+            return 0
+        today = date.today()
+
+        incoming = values(
+            column("id", UUID(as_uuid=True)),
+            column("entity_id", UUID(as_uuid=True)),
+            column("metrics", JSONB),
+            name="incoming",
+        ).data([(uuid.uuid4(), entity_id, metrics) for entity_id, metrics in snapshots.items()])
+
+        def prior(days: int):
+            return (
+                select(MetricsHistory.metrics, MetricsHistory.recorded_at)
+                .where(
+                    and_(
+                        MetricsHistory.entity_type == entity_type,
+                        MetricsHistory.entity_id == incoming.c.entity_id,
+                        MetricsHistory.recorded_at <= today - timedelta(days=days),
+                    )
+                )
+                .order_by(MetricsHistory.recorded_at.desc())
+                .limit(1)
+                .lateral(f"prior_{days}d")
+            )
+
+        def stars(metrics_col):
+            return func.coalesce(cast(metrics_col["stars_count"].astext, Float), 0)
+
+        windows = {days: prior(days) for days in (1, 7, 30)}
+        velocities = [
+            (
+                (stars(incoming.c.metrics) - stars(p.c.metrics))
+                / func.nullif(literal(today, Date) - p.c.recorded_at, 0)
+            ).label(f"velocity_{days}d")
+            for days, p in windows.items()
+        ]
+
+        source = incoming
+        for p in windows.values():
+            source = source.outerjoin(p, true())
+        select_stmt = select(
+            incoming.c.id,
+            literal(entity_type).label("entity_type"),
+            incoming.c.entity_id,
+            incoming.c.metrics,
+            literal(today, Date).label("recorded_at"),
+            *velocities,
+        ).select_from(source)
+
+        stmt = insert(MetricsHistory).from_select(
+            [
+                "id",
+                "entity_type",
+                "entity_id",
+                "metrics",
+                "recorded_at",
+                "velocity_1d",
+                "velocity_7d",
+                "velocity_30d",
+            ],
+            select_stmt,
+        )
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_metrics_entity_date",
+            set_={
+                "metrics": stmt.excluded.metrics,
+                "velocity_1d": stmt.excluded.velocity_1d,
+                "velocity_7d": stmt.excluded.velocity_7d,
+                "velocity_30d": stmt.excluded.velocity_30d,
+            },
+        )
+        await self.session.execute(stmt)
+        return len(snapshots)
+
     async def _calc_velocity(
         self,
         entity_type: str,
@@ -129,13 +221,71 @@ class MetricsRepository:
             return None
         return (new_stars - old_stars) / actual_days
 
+    async def get_window_summaries(
+        self,
+        entity_type: str,
+        metric_key: str,
+        days: int,
+    ) -> dict[uuid.UUID, tuple[int, float | None]]:
+        """Per entity: snapshot count in the last ``days`` and the latest ``metric_key`` value.
+
+        One grouped query over the whole window, for batch scoring.
+        """
+        cutoff = date.today() - timedelta(days=days)
+        latest = func.array_agg(
+            aggregate_order_by(
+                MetricsHistory.metrics[metric_key].astext, MetricsHistory.recorded_at.desc()
+            )
+        )[1]
+        result = await self.session.execute(
+            select(MetricsHistory.entity_id, func.count(), latest)
+            .where(
+                and_(
+                    MetricsHistory.entity_type == entity_type,
+                    MetricsHistory.recorded_at >= cutoff,
+                )
+            )
+            .group_by(MetricsHistory.entity_id)
+        )
+        return {
+            entity_id: (count, float(value) if value is not None else None)
+            for entity_id, count, value in result.all()
+        }
+
+    async def get_paper_score_inputs(self) -> list:
+        result = await self.session.execute(
+            select(
+                Paper.id,
+                Paper.citation_count,
+                Paper.influential_citation_count,
+                Paper.published_date,
+                Paper.topics[1].label("category"),
+            )
+        )
+        return list(result.all())
+
+    async def get_repo_score_inputs(self) -> list:
+        result = await self.session.execute(
+            select(
+                Repository.id,
+                Repository.stars_count,
+                Repository.open_issues_count,
+                Repository.commit_count_30d,
+                Repository.last_commit_at,
+                Repository.topics[1].label("category"),
+            )
+        )
+        return list(result.all())
+
     async def get_trending(
         self,
         entity_type: str | None = None,
         category: str | None = None,
         skip: int = 0,
         limit: int = 20,
-    ) -> tuple[list[TrendingScore], int]:
+        cursor: str | None = None,
+        count: CountMode = "exact",
+    ) -> Page[TrendingScore]:
         base_query = select(TrendingScore)
 
         filters = []
@@ -146,14 +296,16 @@ class MetricsRepository:
         if filters:
             base_query = base_query.where(and_(*filters))
 
-        count_result = await self.session.execute(
-            select(func.count()).select_from(base_query.subquery())
+        return await paginate(
+            self.session,
+            base_query,
+            _TRENDING_SORT,
+            skip=skip,
+            limit=limit,
+            cursor=cursor,
+            count=count,
+            table=None if filters else TrendingScore.__tablename__,
         )
-        total = count_result.scalar() or 0
-
-        query = base_query.order_by(TrendingScore.total_score.desc()).offset(skip).limit(limit)
-        result = await self.session.execute(query)
-        return list(result.scalars().all()), total
 
     async def get_trending_papers_with_search(
         self,
@@ -161,10 +313,10 @@ class MetricsRepository:
         search: str | None = None,
         skip: int = 0,
         limit: int = 20,
-    ) -> tuple[list[tuple[TrendingScore, Paper]], int]:
+        cursor: str | None = None,
+        count: CountMode = "exact",
+    ) -> Page[tuple[TrendingScore, Paper]]:
         """Get trending papers joined with Paper for search filtering."""
-        from sqlalchemy import or_
-
         base_query = (
             select(TrendingScore, Paper)
             .join(Paper, TrendingScore.entity_id == Paper.id)
@@ -174,24 +326,19 @@ class MetricsRepository:
         if category:
             base_query = base_query.where(TrendingScore.category == category)
         if search:
-            search_filter = f"%{search}%"
             base_query = base_query.where(
-                or_(
-                    Paper.title.ilike(search_filter),
-                    Paper.abstract.ilike(search_filter),
-                    Paper.arxiv_id.ilike(search_filter),
-                )
+                fulltext_filter(Paper.search_vector, Paper.title, search)
             )
 
-        count_result = await self.session.execute(
-            select(func.count()).select_from(base_query.subquery())
+        return await paginate(
+            self.session,
+            base_query,
+            _TRENDING_SORT,
+            skip=skip,
+            limit=limit,
+            cursor=cursor,
+            count=count,
         )
-        total = count_result.scalar() or 0
-
-        query = base_query.order_by(TrendingScore.total_score.desc()).offset(skip).limit(limit)
-        result = await self.session.execute(query)
-        rows = result.all()
-        return rows, total
 
     async def get_trending_with_language(
         self,
@@ -200,7 +347,9 @@ class MetricsRepository:
         search: str | None = None,
         skip: int = 0,
         limit: int = 20,
-    ) -> tuple[list[tuple[TrendingScore, Repository]], int]:
+        cursor: str | None = None,
+        count: CountMode = "exact",
+    ) -> Page[tuple[TrendingScore, Repository]]:
         """Get trending repos joined with Repository for language/topic/search filtering."""
         base_query = (
             select(TrendingScore, Repository)
@@ -214,24 +363,19 @@ class MetricsRepository:
             for t in topics:
                 base_query = base_query.where(Repository.topics.any(t))
         if search:
-            search_filter = f"%{search}%"
-            from sqlalchemy import or_
             base_query = base_query.where(
-                or_(
-                    Repository.full_name.ilike(search_filter),
-                    Repository.description.ilike(search_filter),
-                )
+                fulltext_filter(Repository.search_vector, Repository.full_name, search)
             )
 
-        count_result = await self.session.execute(
-            select(func.count()).select_from(base_query.subquery())
+        return await paginate(
+            self.session,
+            base_query,
+            _TRENDING_SORT,
+            skip=skip,
+            limit=limit,
+            cursor=cursor,
+            count=count,
         )
-        total = count_result.scalar() or 0
-
-        query = base_query.order_by(TrendingScore.total_score.desc()).offset(skip).limit(limit)
-        result = await self.session.execute(query)
-        rows = result.all()
-        return rows, total
 
     async def get_trending_filters(self) -> dict:
         """Get distinct categories and languages available in trending data."""
@@ -300,3 +444,13 @@ class MetricsRepository:
         self.session.add(score)
         await self.session.flush()
         return score
+
+    async def bulk_upsert_trending_scores(self, rows: list[dict]) -> int:
+        await bulk_upsert(
+            self.session,
+            TrendingScore,
+            rows,
+            ["entity_type", "entity_id", "period_start"],
+            batch_size=2000,
+        )
+        return len(rows)
@@ -5,6 +5,8 @@ from sqlalchemy import and_, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.storage.models.openreview_note import OpenReviewNote
+from src.storage.repositories.bulk import bulk_upsert
+from src.storage.repositories.pagination import CountMode, Page, SortKey, paginate
 
 STOPWORDS = frozenset({
     "a", "an", "the", "and", "or", "of", "to", "in", "for", "with", "on",
@@ -45,6 +47,9 @@ class OpenReviewRepository:
         await self.session.flush()
         return obj
 
+    async def bulk_upsert_by_note_id(self, rows: list[dict]) -> list:
+        return await bulk_upsert(self.session, OpenReviewNote, rows, ["note_id"])
+
     async def list_notes(
         self,
         skip: int = 0,
@@ -55,9 +60,10 @@ class OpenReviewRepository:
         min_rating: float | None = None,
         sort_by: str = "average_rating",
         sort_order: str = "desc",
-    ) -> tuple[list[OpenReviewNote], int]:
+        cursor: str | None = None,
+        count: CountMode = "exact",
+    ) -> Page[OpenReviewNote]:
         query = select(OpenReviewNote)
-        count_query = select(func.count()).select_from(OpenReviewNote)
 
         filters = []
         if venue:
@@ -77,23 +83,26 @@ class OpenReviewRepository:
 
         if filters:
             query = query.where(and_(*filters))
-            count_query = count_query.where(and_(*filters))
 
         sort_column = getattr(OpenReviewNote, sort_by, OpenReviewNote.average_rating)
-        if sort_order == "desc":
-            query = query.order_by(sort_column.desc().nulls_last())
-        else:
-            query = query.order_by(sort_column.asc().nulls_last())
-
-        query = query.offset(skip).limit(limit)
-
-        result = await self.session.execute(query)
-        notes = list(result.scalars().all())
-
-        count_result = await self.session.execute(count_query)
-        total = count_result.scalar() or 0
+        sort = SortKey(
+            sort_column.key,
+            sort_column,
+            OpenReviewNote.id,
+            descending=sort_order == "desc",
+            nulls_last=True,
+        )
 
-        return notes, total
+        return await paginate(
+            self.session,
+            query,
+            sort,
+            skip=skip,
+            limit=limit,
+            cursor=cursor,
+            count=count,
+            table=None if filters else OpenReviewNote.__tablename__,
+        )
 
     async def get_stats(self) -> dict:
         summary_q = select(
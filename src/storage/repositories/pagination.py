@@ -0,0 +1,186 @@
+"""Keyset (cursor) pagination and cheap counts shared by the list repositories.
+
+Every list is ordered by its sort column plus ``id`` as a tie-breaker. The
+opaque cursor carries the (sort value, id) of the last row of a page, so the
+next page starts with a range condition instead of an ``OFFSET`` that reads
+and discards every earlier row. ``skip`` keeps working for shallow pages.
+
+Counts: ``exact`` runs ``COUNT(*)`` with the list's filters, as before;
+``estimate`` reads ``pg_class.reltuples`` for an unfiltered list and a
+short-lived cached count (``count_cache``) for a filtered one.
+"""
+
+import base64
+import json
+import operator
+import uuid
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, Generic, Literal, TypeVar
+
+from sqlalchemy import and_, func, or_, select, text, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Select
+
+from src.storage.cache.count_cache import count_key, get_cached_count, set_cached_count
+
+T = TypeVar("T")
+
+CountMode = Literal["exact", "estimate"]
+
+_RELTUPLES = text("SELECT reltuples::bigint FROM pg_class WHERE oid = CAST(:table AS regclass)")
+
+
+class InvalidCursorError(ValueError):
+    """The cursor is malformed or was issued for a different sort order."""
+
+
+@dataclass
+class Page(Generic[T]):
+    items: list[T]
+    total: int
+    next_cursor: str | None = None
+    total_is_estimate: bool = False
+
+    def __iter__(self):
+        # Callers that only need ``items, total = await repo.list_...()``
+        return iter((self.items, self.total))
+
+
+@dataclass(frozen=True)
+class SortKey:
+    """Sort column (or expression) of a list plus its ``id`` tie-breaker."""
+
+    name: str
+    column: Any
+    id_column: Any
+    descending: bool = True
+    nulls_last: bool = False
+
+    @property
+    def token(self) -> str:
+        return f"{self.name}:{'desc' if self.descending else 'asc'}"
+
+    def order_by(self) -> tuple:
+        if self.descending:
+            column, ident = self.column.desc(), self.id_column.desc()
+        else:
+            column, ident = self.column.asc(), self.id_column.asc()
+        return (column.nulls_last() if self.nulls_last else column), ident
+
+    def after(self, value, row_id):
+        """Condition for rows that come after (``value``, ``row_id``) in this order."""
+        beyond = operator.lt if self.descending else operator.gt
+        # Postgres sorts NULLs as the largest values unless told otherwise
+        nulls_at_end = self.nulls_last or not self.descending
+        if value is None:
+            null_tail = and_(self.column.is_(None), beyond(self.id_column, row_id))
+            return null_tail if nulls_at_end else or_(self.column.isnot(None), null_tail)
+
+        after = beyond(tuple_(self.column, self.id_column), tuple_(value, row_id))
+        if nulls_at_end and getattr(self.column.expression, "nullable", True):
+            return or_(after, self.column.is_(None))
+        return after
+
+
+def _dump(value):
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, date):
+        return {"d": value.isoformat()}
+    if isinstance(value, uuid.UUID):
+        return {"u": str(value)}
+    return value
+
+
+def _load(value):
+    if not isinstance(value, dict):
+        return value
+    if "dt" in value:
+        return datetime.fromisoformat(value["dt"])
+    if "d" in value:
+        return date.fromisoformat(value["d"])
+    return uuid.UUID(value["u"])
+
+
+def encode_cursor(sort: SortKey, value, row_id) -> str:
+    raw = json.dumps([sort.token, _dump(value), _dump(row_id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(sort: SortKey, cursor: str) -> tuple[Any, Any]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        token, value, row_id = json.loads(raw)
+        value, row_id = _load(value), _load(row_id)
+    except (ValueError, TypeError, KeyError) as e:
+        raise InvalidCursorError("Malformed cursor") from e
+    if token != sort.token:
+        raise InvalidCursorError("Cursor was issued for a different sort order")
+    return value, row_id
+
+
+async def count_rows(
+    session: AsyncSession,
+    count_query: Select,
+    mode: CountMode = "exact",
+    table: str | None = None,
+) -> tuple[int, bool]:
+    """Return ``(total, is_estimate)``; ``table`` is set only for unfiltered lists."""
+    if mode == "exact":
+        return (await session.execute(count_query)).scalar() or 0, False
+
+    if table is not None:
+        estimate = (await session.execute(_RELTUPLES, {"table": table})).scalar()
+        # -1 (or 0) until the table has been vacuumed/analyzed at least once
+        if estimate and estimate > 0:
+            return int(estimate), True
+
+    key = count_key(count_query)
+    cached = await get_cached_count(key)
+    if cached is not None:
+        return cached, True
+    total = (await session.execute(count_query)).scalar() or 0
+    await set_cached_count(key, total)
+    return total, False
+
+
+async def paginate(
+    session: AsyncSession,
+    query: Select,
+    sort: SortKey,
+    *,
+    skip: int = 0,
+    limit: int = 20,
+    cursor: str | None = None,
+    count: CountMode = "exact",
+    table: str | None = None,
+) -> Page:
+    """Fetch one page of ``query`` (filtered, not yet ordered) and count its rows.
+
+    With ``cursor`` the page starts after the row the cursor was issued for
+    and ``skip`` is ignored. ``table`` names the underlying table when
+    ``query`` has no filters, so an estimated count can use the planner's
+    statistics.
+    """
+    count_query = select(func.count()).select_from(query.subquery())
+
+    page_query = query.add_columns(
+        sort.column.label("sort_value"), sort.id_column.label("sort_id")
+    ).order_by(*sort.order_by())
+    if cursor:
+        page_query = page_query.where(sort.after(*decode_cursor(sort, cursor)))
+    elif skip:
+        page_query = page_query.offset(skip)
+    # One extra row tells whether there is a next page
+    rows = (await session.execute(page_query.limit(limit + 1))).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(sort, rows[-1].sort_value, rows[-1].sort_id)
+    width = len(rows[0]) - 2 if rows else 1
+    items = [row[0] if width == 1 else tuple(row[:width]) for row in rows]
+
+    total, estimated = await count_rows(session, count_query, count, table)
+    return Page(items, total, next_cursor=next_cursor, total_is_estimate=estimated)
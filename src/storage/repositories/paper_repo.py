@@ -1,10 +1,25 @@
 import uuid
 from datetime import date, timedelta
 
-from sqlalchemy import and_, case, func, literal_column, or_, select, text
+from sqlalchemy import Float, and_, bindparam, case, cast, func, or_, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
+from src.storage.models.author import Author, PaperAuthor
 from src.storage.models.paper import Paper
+from src.storage.models.paper_analytics import (
+    ALL_SCOPE,
+    AuthorStat,
+    CategoryYearCount,
+    CoauthorEdge,
+    InstitutionStat,
+    KeywordYearCount,
+    TopicPairCount,
+)
+from src.storage.repositories.author_repo import BATCH_SIZE, AuthorRepository
+from src.storage.repositories.bulk import bulk_upsert
+from src.storage.repositories.pagination import CountMode, Page, SortKey, paginate
+from src.storage.repositories.text_search import fulltext_filter, fulltext_rank
 
 
 class PaperRepository:
@@ -56,14 +71,7 @@ class PaperRepository:
         if source:
             filters.append(Paper.source == source)
         if search:
-            term = f"%{search}%"
-            filters.append(
-                or_(
-                    Paper.title.ilike(term),
-                    Paper.abstract.ilike(term),
-                    Paper.arxiv_id.ilike(term),
-                )
-            )
+            filters.append(fulltext_filter(Paper.search_vector, Paper.title, search))
         return filters
 
     async def list_papers(
@@ -78,9 +86,12 @@ class PaperRepository:
         is_vietnamese: bool | None = None,
         search: str | None = None,
         source: str | None = None,
-        sort_by: str = "published_date",
+        sort_by: str | None = None,
         sort_order: str = "desc",
-    ) -> tuple[list[Paper], int]:
+        cursor: str | None = None,
+        count: CountMode = "exact",
+    ) -> Page[Paper]:
+        """List papers; with ``search`` and no explicit sort, rank by relevance."""
         filters = self._build_filters(
             category=category, topic=topic, date_from=date_from,
             date_to=date_to, has_code=has_code, is_vietnamese=is_vietnamese,
@@ -88,28 +99,27 @@ class PaperRepository:
         )
 
         query = select(Paper)
-        count_query = select(func.count()).select_from(Paper)
-
         if filters:
-            where = and_(*filters)
-            query = query.where(where)
-            count_query = count_query.where(where)
+            query = query.where(and_(*filters))
 
-        sort_column = getattr(Paper, sort_by, Paper.published_date)
-        if sort_order == "desc":
-            query = query.order_by(sort_column.desc())
+        if search and sort_by in (None, "relevance"):
+            sort_name = "relevance"
+            sort_column = fulltext_rank(Paper.search_vector, Paper.title, search)
         else:
-            query = query.order_by(sort_column.asc())
-
-        query = query.offset(skip).limit(limit)
-
-        result = await self.session.execute(query)
-        papers = list(result.scalars().all())
-
-        count_result = await self.session.execute(count_query)
-        total = count_result.scalar() or 0
-
-        return papers, total
+            sort_column = getattr(Paper, sort_by or "published_date", Paper.published_date)
+            sort_name = sort_column.key
+        sort = SortKey(sort_name, sort_column, Paper.id, descending=sort_order == "desc")
+
+        return await paginate(
+            self.session,
+            query,
+            sort,
+            skip=skip,
+            limit=limit,
+            cursor=cursor,
+            count=count,
+            table=None if filters else Paper.__tablename__,
+        )
 
     async def get_stats(
         self,
@@ -183,8 +193,15 @@ class PaperRepository:
     async def create(self, paper: Paper) -> Paper:
         self.session.add(paper)
         await self.session.flush()
+        if paper.authors:
+            await self._sync_authors(paper)
         return paper
 
+    async def _sync_authors(self, *papers: Paper) -> None:
+        await AuthorRepository(self.session).sync_paper_authors(
+            {paper.id: paper.authors for paper in papers}
+        )
+
     async def upsert_by_arxiv_id(self, paper_data: dict) -> Paper:
         existing = await self.get_by_arxiv_id(paper_data.get("arxiv_id", ""))
         if existing:
@@ -192,12 +209,27 @@ class PaperRepository:
                 if value is not None:
                     setattr(existing, key, value)
             await self.session.flush()
+            if paper_data.get("authors") is not None:
+                await self._sync_authors(existing)
             return existing
 
-        paper = Paper(**paper_data)
-        self.session.add(paper)
-        await self.session.flush()
-        return paper
+        return await self.create(Paper(**paper_data))
+
+    async def bulk_upsert_by_arxiv_id(self, rows: list[dict]) -> list:
+        ids = await bulk_upsert(self.session, Paper, rows, ["arxiv_id"])
+
+        # None never overwrites, so only rows that carried authors changed them
+        arxiv_ids = list({row["arxiv_id"] for row in rows if row.get("authors") is not None})
+        for start in range(0, len(arxiv_ids), BATCH_SIZE):
+            result = await self.session.execute(
+                select(Paper.id, Paper.authors).where(
+                    Paper.arxiv_id.in_(arxiv_ids[start : start + BATCH_SIZE])
+                )
+            )
+            await AuthorRepository(self.session).sync_paper_authors(
+                {row.id: row.authors for row in result}
+            )
+        return ids
 
     async def get_by_s2_id(self, s2_id: str) -> Paper | None:
         result = await self.session.execute(
@@ -229,13 +261,12 @@ class PaperRepository:
                 if value is not None:
                     setattr(existing, key, value)
             await self.session.flush()
+            if paper_data.get("authors") is not None:
+                await self._sync_authors(existing)
             return existing
 
         try:
-            paper = Paper(**paper_data)
-            self.session.add(paper)
-            await self.session.flush()
-            return paper
+            return await self.create(Paper(**paper_data))
         except Exception:
             await self.session.rollback()
             return None
@@ -258,92 +289,42 @@ class PaperRepository:
     async def get_author_analytics(
         self, limit: int = 20, category: str | None = None
     ) -> dict:
-        filters = self._build_filters(category=category)
-        where_clause = and_(*filters) if filters else text("TRUE")
-
-        # Use jsonb_array_elements to unnest JSONB authors array
-        author_subq = (
-            select(
-                literal_column("author->>'name'").label("author_name"),
-                literal_column("author->>'affiliation'").label("affiliation"),
-                Paper.citation_count,
-            )
-            .select_from(
-                Paper.__table__.join(
-                    text("jsonb_array_elements(papers.authors) AS author"),
-                    text("TRUE"),
-                    isouter=True,
-                )
-            )
-            .where(where_clause)
-            .where(Paper.authors.isnot(None))
-            .subquery()
-        )
-
-        # Top by papers
-        top_papers_q = (
-            select(
-                author_subq.c.author_name,
-                func.min(author_subq.c.affiliation).label("affiliation"),
-                func.count().label("paper_count"),
-                func.coalesce(func.sum(author_subq.c.citation_count), 0).label("total_citations"),
+        scope = category or ALL_SCOPE
+
+        def top_by(column):
+            return (
+                select(AuthorStat)
+                .where(AuthorStat.scope == scope)
+                .order_by(column.desc(), AuthorStat.name)
+                .limit(limit)
             )
-            .where(author_subq.c.author_name.isnot(None))
-            .group_by(author_subq.c.author_name)
-            .order_by(func.count().desc())
-            .limit(limit)
-        )
-        top_papers = (await self.session.execute(top_papers_q)).all()
 
-        # Top by citations
-        top_cit_q = (
-            select(
-                author_subq.c.author_name,
-                func.min(author_subq.c.affiliation).label("affiliation"),
-                func.count().label("paper_count"),
-                func.coalesce(func.sum(author_subq.c.citation_count), 0).label("total_citations"),
-            )
-            .where(author_subq.c.author_name.isnot(None))
-            .group_by(author_subq.c.author_name)
-            .order_by(func.coalesce(func.sum(author_subq.c.citation_count), 0).desc())
-            .limit(limit)
-        )
-        top_citations = (await self.session.execute(top_cit_q)).all()
+        top_papers = (await self.session.execute(top_by(AuthorStat.paper_count))).scalars()
+        top_citations = (
+            await self.session.execute(top_by(AuthorStat.total_citations))
+        ).scalars()
 
         # Affiliation distribution
         aff_q = (
-            select(
-                author_subq.c.affiliation,
-                func.count().label("cnt"),
-            )
-            .where(author_subq.c.affiliation.isnot(None))
-            .where(author_subq.c.affiliation != "")
-            .group_by(author_subq.c.affiliation)
-            .order_by(func.count().desc())
+            select(InstitutionStat.affiliation, InstitutionStat.mention_count)
+            .where(InstitutionStat.scope == scope)
+            .order_by(InstitutionStat.mention_count.desc())
             .limit(20)
         )
         aff_result = (await self.session.execute(aff_q)).all()
 
+        def author(stat: AuthorStat) -> dict:
+            return {
+                "name": stat.name,
+                "affiliation": stat.affiliation,
+                "paper_count": stat.paper_count,
+                "total_citations": stat.total_citations,
+            }
+
         return {
-            "top_by_papers": [
-                {
-                    "name": r.author_name,
-                    "affiliation": r.affiliation,
-                    "paper_count": r.paper_count,
-                    "total_citations": int(r.total_citations),
-                }
-                for r in top_papers
-            ],
-            "top_by_citations": [
-                {
-                    "name": r.author_name,
-                    "affiliation": r.affiliation,
-                    "paper_count": r.paper_count,
-                    "total_citations": int(r.total_citations),
-                }
-                for r in top_citations
-            ],
-            "affiliation_distribution": {r.affiliation: r.cnt for r in aff_result},
+            "top_by_papers": [author(s) for s in top_papers],
+            "top_by_citations": [author(s) for s in top_citations],
+            "affiliation_distribution": {r.affiliation: r.mention_count for r in aff_result},
         }
 
     async def get_keyword_analytics(
@@ -400,59 +381,48 @@ class PaperRepository:
         limit: int = 100,
         category: str | None = None,
     ) -> dict:
-        # Build category filter clause for raw SQL
-        if category:
-            cat_clause = "AND :category = ANY(p.categories)"
-            params = {"min_collabs": min_collabs, "limit": limit, "category": category}
-        else:
-            cat_clause = ""
-            params = {"min_collabs": min_collabs, "limit": limit}
-
-        # Build co-author pairs using raw SQL for JSONB cross join
-        query = text(f"""
-            WITH paper_authors AS (
-                SELECT p.id AS paper_id,
-                       a->>'name' AS author_name,
-                       a->>'affiliation' AS affiliation
-                FROM papers p,
-                     jsonb_array_elements(p.authors) AS a
-                WHERE p.authors IS NOT NULL
-                  AND jsonb_typeof(p.authors) = 'array'
-                  AND jsonb_array_length(p.authors) > 1
-                  {cat_clause}
-            ),
-            pairs AS (
-                SELECT a1.author_name AS source,
-                       a2.author_name AS target,
-                       a1.affiliation AS source_aff,
-                       a2.affiliation AS target_aff,
-                       COUNT(DISTINCT a1.paper_id) AS weight
-                FROM paper_authors a1
-                JOIN paper_authors a2
-                  ON a1.paper_id = a2.paper_id
-                 AND a1.author_name < a2.author_name
-                WHERE a1.author_name IS NOT NULL
-                  AND a2.author_name IS NOT NULL
-                GROUP BY a1.author_name, a2.author_name, a1.affiliation, a2.affiliation
-                HAVING COUNT(DISTINCT a1.paper_id) >= :min_collabs
-                ORDER BY weight DESC
-                LIMIT :limit
+        source = aliased(Author)
+        target = aliased(Author)
+        edge_q = (
+            select(
+                CoauthorEdge.source_id,
+                CoauthorEdge.target_id,
+                source.name.label("source_name"),
+                target.name.label("target_name"),
+                CoauthorEdge.weight,
             )
-            SELECT * FROM pairs
-        """)
-        result = (await self.session.execute(query, params)).all()
+            .select_from(CoauthorEdge)
+            .join(source, source.id == CoauthorEdge.source_id)
+            .join(target, target.id == CoauthorEdge.target_id)
+            .where(CoauthorEdge.scope == (category or ALL_SCOPE))
+            .where(CoauthorEdge.weight >= min_collabs)
+            .order_by(CoauthorEdge.weight.desc())
+            .limit(limit)
+        )
+        result = (await self.session.execute(edge_q)).all()
+
+        author_ids = {r.source_id for r in result} | {r.target_id for r in result}
+        affiliations: dict = {}
+        if author_ids:
+            aff_q = select(AuthorStat.author_id, AuthorStat.affiliation).where(
+                AuthorStat.scope == ALL_SCOPE, AuthorStat.author_id.in_(author_ids)
+            )
+            affiliations = dict((await self.session.execute(aff_q)).tuples().all())
 
         # Collect unique nodes
         node_map: dict[str, dict] = {}
         edges = []
         for row in result:
-            src, tgt, src_aff, tgt_aff, w = row
-            if src not in node_map:
-                node_map[src] = {"id": src, "label": src, "paper_count": 0, "affiliation": src_aff}
-            if tgt not in node_map:
-                node_map[tgt] = {"id": tgt, "label": tgt, "paper_count": 0, "affiliation": tgt_aff}
-            node_map[src]["paper_count"] += w
-            node_map[tgt]["paper_count"] += w
+            src, tgt, w = row.source_name, row.target_name, row.weight
+            for author_id, name in ((row.source_id, src), (row.target_id, tgt)):
+                if name not in node_map:
+                    node_map[name] = {
+                        "id": name,
+                        "label": name,
+                        "paper_count": 0,
+                        "affiliation": affiliations.get(author_id),
+                    }
+                node_map[name]["paper_count"] += w
             edges.append({"source": src, "target": tgt, "weight": w})
 
         return {
@@ -463,53 +433,41 @@ class PaperRepository:
     async def get_keyword_trends(
         self, top_n: int = 10, category: str | None = None
     ) -> dict:
-        filters = self._build_filters(category=category)
-        where_clause = and_(*filters) if filters else text("TRUE")
-
         # Use keywords if available, fall back to topics
-        # Check which field has data
-        kw_count = (await self.session.execute(
-            select(func.count()).select_from(Paper).where(Paper.keywords.isnot(None))
-        )).scalar() or 0
-
-        if kw_count > 0:
-            field = Paper.keywords
-            field_label = "keyword"
-        else:
-            field = Paper.topics
-            field_label = "keyword"
-
-        kw_unnest = func.unnest(field).label("keyword")
-        kw_subq = (
-            select(Paper.id, kw_unnest, Paper.published_date)
-            .where(where_clause)
-            .where(field.isnot(None))
-            .where(Paper.published_date.isnot(None))
-            .subquery()
+        has_keywords = (await self.session.execute(
+            select(KeywordYearCount.keyword)
+            .where(KeywordYearCount.scope == ALL_SCOPE, KeywordYearCount.kind == "keyword")
+            .limit(1)
+        )).first()
+        kind = "keyword" if has_keywords else "topic"
+
+        base = (
+            KeywordYearCount.scope == (category or ALL_SCOPE),
+            KeywordYearCount.kind == kind,
         )
+        total = func.sum(KeywordYearCount.paper_count)
         top_kw_q = (
-            select(kw_subq.c.keyword, func.count().label("cnt"))
-            .group_by(kw_subq.c.keyword)
-            .order_by(func.count().desc())
+            select(KeywordYearCount.keyword)
+            .where(*base)
+            .group_by(KeywordYearCount.keyword)
+            .order_by(total.desc())
             .limit(top_n)
         )
-        top_kw_result = (await self.session.execute(top_kw_q)).all()
-        top_keywords = [r.keyword for r in top_kw_result]
+        top_keywords = list((await self.session.execute(top_kw_q)).scalars())
 
         if not top_keywords:
             return {"trends": [], "top_keywords": [], "emerging": []}
 
-        # Get per-year counts for top keywords
-        year_expr = func.extract("year", kw_subq.c.published_date).label("year")
+        # Per-year counts for top keywords
         trend_q = (
-            select(year_expr, kw_subq.c.keyword, func.count().label("cnt"))
-            .where(kw_subq.c.keyword.in_(top_keywords))
-            .group_by(year_expr, kw_subq.c.keyword)
-            .order_by(year_expr.asc())
+            select(KeywordYearCount.year, KeywordYearCount.keyword, KeywordYearCount.paper_count)
+            .where(*base)
+            .where(KeywordYearCount.keyword.in_(top_keywords))
+            .order_by(KeywordYearCount.year.asc())
         )
         trend_result = (await self.session.execute(trend_q)).all()
         trends = [
-            {"period": str(int(r.year)), "keyword": r.keyword, "count": r.cnt}
+            {"period": str(r.year), "keyword": r.keyword, "count": r.paper_count}
             for r in trend_result
             if r.year
         ]
@@ -519,19 +477,17 @@ class PaperRepository:
         recent_years = [current_year, current_year - 1]
         previous_years = [current_year - 2, current_year - 3]
 
-        recent_q = (
-            select(kw_subq.c.keyword, func.count().label("cnt"))
-            .where(func.extract("year", kw_subq.c.published_date).in_(recent_years))
-            .group_by(kw_subq.c.keyword)
-            .having(func.count() >= 2)
-        )
-        recent_result = {r.keyword: r.cnt for r in (await self.session.execute(recent_q)).all()}
+        def counts_in(years: list[int]):
+            return (
+                select(KeywordYearCount.keyword, total.label("cnt"))
+                .where(*base)
+                .where(KeywordYearCount.year.in_(years))
+                .group_by(KeywordYearCount.keyword)
+            )
 
-        prev_q = (
-            select(kw_subq.c.keyword, func.count().label("cnt"))
-            .where(func.extract("year", kw_subq.c.published_date).in_(previous_years))
-            .group_by(kw_subq.c.keyword)
-        )
+        recent_q = counts_in(recent_years).having(total >= 2)
+        recent_result = {r.keyword: r.cnt for r in (await self.session.execute(recent_q)).all()}
+        prev_q = counts_in(previous_years)
         prev_result = {r.keyword: r.cnt for r in (await self.session.execute(prev_q)).all()}
 
         emerging = []
@@ -565,30 +521,14 @@ class PaperRepository:
     async def get_topic_cooccurrence(
         self, limit: int = 80, min_cooccurrence: int = 5, category: str | None = None
     ) -> dict:
-        if category:
-            cat_clause = "AND :category = ANY(p.categories)"
-            params: dict = {"limit": limit, "min_co": min_cooccurrence, "category": category}
-        else:
-            cat_clause = ""
-            params = {"limit": limit, "min_co": min_cooccurrence}
-
-        query = text(f"""
-            WITH topic_pairs AS (
-                SELECT t1.topic AS topic_a, t2.topic AS topic_b,
-                       COUNT(*) AS weight
-                FROM (SELECT p.id, unnest(p.topics) AS topic FROM papers p
-                      WHERE p.topics IS NOT NULL {cat_clause}) t1
-                JOIN (SELECT p.id, unnest(p.topics) AS topic FROM papers p
-                      WHERE p.topics IS NOT NULL {cat_clause}) t2
-                  ON t1.id = t2.id AND t1.topic < t2.topic
-                GROUP BY t1.topic, t2.topic
-                HAVING COUNT(*) >= :min_co
-                ORDER BY weight DESC
-                LIMIT :limit
-            )
-            SELECT * FROM topic_pairs
-        """)
-        result = (await self.session.execute(query, params)).all()
+        query = (
+            select(TopicPairCount.topic_a, TopicPairCount.topic_b, TopicPairCount.paper_count)
+            .where(TopicPairCount.scope == (category or ALL_SCOPE))
+            .where(TopicPairCount.paper_count >= min_cooccurrence)
+            .order_by(TopicPairCount.paper_count.desc())
+            .limit(limit)
+        )
+        result = (await self.session.execute(query)).all()
 
         node_map: dict[str, dict] = {}
         edges = []
@@ -607,92 +547,66 @@ class PaperRepository:
     async def get_citation_timeline(
         self, limit: int = 8, category: str | None = None
     ) -> dict:
-        if category:
-            cat_clause = "AND :category = ANY(p.categories)"
-            params: dict = {"limit": limit, "category": category}
-        else:
-            cat_clause = ""
-            params = {"limit": limit}
-
-        # First get top authors by total citations
-        top_q = text(f"""
-            SELECT a->>'name' AS author_name,
-                   SUM(p.citation_count) AS total_cit
-            FROM papers p, jsonb_array_elements(p.authors) AS a
-            WHERE p.authors IS NOT NULL
-              AND jsonb_typeof(p.authors) = 'array'
-              AND p.citation_count > 0
-              {cat_clause}
-            GROUP BY a->>'name'
-            ORDER BY total_cit DESC
-            LIMIT :limit
-        """)
-        top_authors = [r.author_name for r in (await self.session.execute(top_q, params)).all()]
+        # Top authors by total citations
+        top_q = (
+            select(AuthorStat.author_id, AuthorStat.name)
+            .where(AuthorStat.scope == (category or ALL_SCOPE))
+            .where(AuthorStat.total_citations > 0)
+            .order_by(AuthorStat.total_citations.desc())
+            .limit(limit)
+        )
+        top_authors = dict((await self.session.execute(top_q)).tuples().all())
 
         if not top_authors:
             return {"data": [], "authors": []}
 
-        # Get per-year citation sums for these authors
-        placeholders = ", ".join(f":a{i}" for i in range(len(top_authors)))
-        author_params = {f"a{i}": name for i, name in enumerate(top_authors)}
-
-        timeline_q = text(f"""
-            SELECT EXTRACT(YEAR FROM p.published_date)::int AS year,
-                   a->>'name' AS author_name,
-                   SUM(p.citation_count) AS citations
-            FROM papers p, jsonb_array_elements(p.authors) AS a
-            WHERE p.authors IS NOT NULL
-              AND jsonb_typeof(p.authors) = 'array'
-              AND p.published_date IS NOT NULL
-              AND a->>'name' IN ({placeholders})
-            GROUP BY year, author_name
-            ORDER BY year
-        """)
-        result = (await self.session.execute(timeline_q, author_params)).all()
+        # Per-year citation sums for these authors
+        citations = func.sum(PaperAuthor.citation_count)
+        timeline_q = (
+            select(PaperAuthor.year, PaperAuthor.author_id, citations.label("citations"))
+            .where(PaperAuthor.author_id.in_(top_authors))
+            .where(PaperAuthor.year.isnot(None))
+            .group_by(PaperAuthor.year, PaperAuthor.author_id)
+            .order_by(PaperAuthor.year)
+        )
+        result = (await self.session.execute(timeline_q)).all()
 
         data = [
-            {"year": str(r.year), "author": r.author_name, "citations": int(r.citations)}
+            {
+                "year": str(r.year),
+                "author": top_authors[r.author_id],
+                "citations": int(r.citations),
+            }
             for r in result if r.year
         ]
-        return {"data": data, "authors": top_authors}
+        return {"data": data, "authors": list(top_authors.values())}
 
     async def get_category_heatmap(self, category: str | None = None) -> dict:
-        filters = self._build_filters(category=category)
-        where_clause = and_(*filters) if filters else text("TRUE")
-
-        cat_unnest = func.unnest(Paper.categories).label("category")
-        year_expr = func.extract("year", Paper.published_date).label("year")
-
-        subq = (
-            select(cat_unnest, year_expr)
-            .where(where_clause)
-            .where(Paper.categories.isnot(None))
-            .where(Paper.published_date.isnot(None))
-            .subquery()
-        )
+        scope = CategoryYearCount.scope == (category or ALL_SCOPE)
 
         # Get top categories
         top_cat_q = (
-            select(subq.c.category, func.count().label("cnt"))
-            .group_by(subq.c.category)
-            .order_by(func.count().desc())
+            select(CategoryYearCount.category)
+            .where(scope)
+            .group_by(CategoryYearCount.category)
+            .order_by(func.sum(CategoryYearCount.paper_count).desc())
             .limit(15)
         )
-        top_cats = [r.category for r in (await self.session.execute(top_cat_q)).all()]
+        top_cats = list((await self.session.execute(top_cat_q)).scalars())
 
         if not top_cats:
             return {"cells": [], "categories": [], "years": []}
 
         heatmap_q = (
-            select(subq.c.category, subq.c.year, func.count().label("cnt"))
-            .where(subq.c.category.in_(top_cats))
-            .group_by(subq.c.category, subq.c.year)
-            .order_by(subq.c.year)
+            select(CategoryYearCount)
+            .where(scope)
+            .where(CategoryYearCount.category.in_(top_cats))
+            .order_by(CategoryYearCount.year)
         )
-        result = (await self.session.execute(heatmap_q)).all()
+        result = (await self.session.execute(heatmap_q)).scalars()
 
         cells = [
-            {"category": r.category, "year": str(int(r.year)), "count": r.cnt}
+            {"category": r.category, "year": str(r.year), "count": r.paper_count}
             for r in result if r.year
         ]
         years = sorted(set(c["year"] for c in cells))
@@ -743,44 +657,21 @@ class PaperRepository:
     async def get_institution_ranking(
         self, limit: int = 30, category: str | None = None
     ) -> dict:
-        if category:
-            cat_clause = "AND :category = ANY(p.categories)"
-            params: dict = {"limit": limit, "category": category}
-        else:
-            cat_clause = ""
-            params = {"limit": limit}
-
-        query = text(f"""
-            SELECT aff,
-                   COUNT(DISTINCT paper_id) AS paper_count,
-                   COALESCE(SUM(citation_count), 0) AS total_citations,
-                   ROUND(AVG(citation_count)::numeric, 1) AS avg_citations,
-                   COUNT(DISTINCT author_name) AS author_count
-            FROM (
-                SELECT p.id AS paper_id,
-                       a->>'name' AS author_name,
-                       a->>'affiliation' AS aff,
-                       p.citation_count
-                FROM papers p, jsonb_array_elements(p.authors) AS a
-                WHERE p.authors IS NOT NULL
-                  AND jsonb_typeof(p.authors) = 'array'
-                  AND a->>'affiliation' IS NOT NULL
-                  AND a->>'affiliation' != ''
-                  {cat_clause}
-            ) sub
-            GROUP BY aff
-            ORDER BY paper_count DESC
-            LIMIT :limit
-        """)
-        result = (await self.session.execute(query, params)).all()
+        query = (
+            select(InstitutionStat)
+            .where(InstitutionStat.scope == (category or ALL_SCOPE))
+            .order_by(InstitutionStat.paper_count.desc())
+            .limit(limit)
+        )
+        result = (await self.session.execute(query)).scalars()
 
         return {
             "institutions": [
                 {
-                    "name": r.aff,
+                    "name": r.affiliation,
                     "paper_count": r.paper_count,
-                    "total_citations": int(r.total_citations),
-                    "avg_citations": float(r.avg_citations),
+                    "total_citations": r.citation_sum,
+                    "avg_citations": round(r.citation_sum / r.mention_count, 1),
                     "author_count": r.author_count,
                 }
                 for r in result
@@ -791,98 +682,85 @@ class PaperRepository:
         if not author_names:
             return {"authors": []}
 
-        placeholders = ", ".join(f":a{i}" for i in range(len(author_names)))
-        params = {f"a{i}": name for i, name in enumerate(author_names)}
-
-        query = text(f"""
-            SELECT a->>'name' AS author_name,
-                   a->>'affiliation' AS affiliation,
-                   COUNT(DISTINCT p.id) AS paper_count,
-                   COALESCE(SUM(p.citation_count), 0) AS total_citations,
-                   ROUND(AVG(p.citation_count)::numeric, 1) AS avg_citations,
-                   MIN(EXTRACT(YEAR FROM p.published_date))::int AS first_year,
-                   MAX(EXTRACT(YEAR FROM p.published_date))::int AS last_year
-            FROM papers p, jsonb_array_elements(p.authors) AS a
-            WHERE p.authors IS NOT NULL
-              AND jsonb_typeof(p.authors) = 'array'
-              AND a->>'name' IN ({placeholders})
-            GROUP BY a->>'name', a->>'affiliation'
-        """)
-        rows = (await self.session.execute(query, params)).all()
-
-        # Also get topics per author
-        topics_q = text(f"""
-            SELECT a->>'name' AS author_name, t.topic, COUNT(*) AS cnt
-            FROM papers p,
-                 jsonb_array_elements(p.authors) AS a,
-                 unnest(p.topics) AS t(topic)
-            WHERE p.authors IS NOT NULL
-              AND jsonb_typeof(p.authors) = 'array'
-              AND p.topics IS NOT NULL
-              AND a->>'name' IN ({placeholders})
-            GROUP BY a->>'name', t.topic
-            ORDER BY a->>'name', cnt DESC
-        """)
-        topics_result = (await self.session.execute(topics_q, params)).all()
+        # One name-key index lookup for all requested names
+        author_ids = await AuthorRepository(self.session).ids_by_name(author_names)
+        if not author_ids:
+            return {"authors": []}
+        ids = set(author_ids.values())
+
+        stats_q = (
+            select(
+                PaperAuthor.author_id,
+                func.min(PaperAuthor.affiliation).label("affiliation"),
+                func.count(PaperAuthor.paper_id.distinct()).label("paper_count"),
+                func.coalesce(func.sum(PaperAuthor.citation_count), 0).label("total_citations"),
+                func.avg(PaperAuthor.citation_count).label("avg_citations"),
+                func.min(PaperAuthor.year).label("first_year"),
+                func.max(PaperAuthor.year).label("last_year"),
+            )
+            .where(PaperAuthor.author_id.in_(ids))
+            .group_by(PaperAuthor.author_id)
+        )
+        stats = {r.author_id: r for r in (await self.session.execute(stats_q)).all()}
+
+        # Topics per author, most frequent first
+        topics_q = text("""
+            SELECT pa.author_id, t.topic, COUNT(*) AS cnt
+            FROM paper_authors pa
+            JOIN papers p ON p.id = pa.paper_id
+            CROSS JOIN LATERAL unnest(p.topics) AS t(topic)
+            WHERE pa.author_id IN :author_ids
+            GROUP BY pa.author_id, t.topic
+            ORDER BY pa.author_id, cnt DESC
+        """).bindparams(bindparam("author_ids", expanding=True))
+        topics_result = await self.session.execute(topics_q, {"author_ids": list(ids)})
 
         # Group topics by author (top 5 each)
-        author_topics: dict[str, list[str]] = {}
+        author_topics: dict = {}
         for r in topics_result:
-            if r.author_name not in author_topics:
-                author_topics[r.author_name] = []
-            if len(author_topics[r.author_name]) < 5:
-                author_topics[r.author_name].append(r.topic)
-
-        # Merge rows (author may have multiple affiliations)
-        merged: dict[str, dict] = {}
-        for r in rows:
-            name = r.author_name
-            if name not in merged:
-                merged[name] = {
-                    "name": name,
-                    "affiliation": r.affiliation,
-                    "paper_count": r.paper_count,
-                    "total_citations": int(r.total_citations),
-                    "avg_citations": float(r.avg_citations),
-                    "first_year": r.first_year,
-                    "last_year": r.last_year,
-                    "topics": author_topics.get(name, []),
-                }
-            else:
-                merged[name]["paper_count"] += r.paper_count
-                merged[name]["total_citations"] += int(r.total_citations)
-
-        return {"authors": list(merged.values())}
+            topics = author_topics.setdefault(r.author_id, [])
+            if len(topics) < 5:
+                topics.append(r.topic)
+
+        authors = []
+        for name, author_id in author_ids.items():
+            r = stats.get(author_id)
+            if r is None:
+                continue
+            authors.append({
+                "name": name,
+                "affiliation": r.affiliation,
+                "paper_count": r.paper_count,
+                "total_citations": int(r.total_citations),
+                "avg_citations": round(float(r.avg_citations), 1),
+                "first_year": r.first_year,
+                "last_year": r.last_year,
+                "topics": author_topics.get(author_id, []),
+            })
+
+        return {"authors": authors}
 
     async def get_research_landscape(
         self, limit: int = 50, category: str | None = None
     ) -> dict:
-        filters = self._build_filters(category=category)
-        where_clause = and_(*filters) if filters else text("TRUE")
-
-        tp_unnest = func.unnest(Paper.topics).label("topic")
-        subq = (
-            select(
-                tp_unnest,
-                func.extract("year", Paper.published_date).label("year"),
-                Paper.citation_count,
-            )
-            .where(where_clause)
-            .where(Paper.topics.isnot(None))
-            .where(Paper.published_date.isnot(None))
-            .subquery()
-        )
-
+        paper_count = func.sum(KeywordYearCount.paper_count)
         landscape_q = (
             select(
-                subq.c.topic,
-                func.avg(subq.c.year).label("avg_year"),
-                func.avg(subq.c.citation_count).label("avg_citations"),
-                func.count().label("paper_count"),
+                KeywordYearCount.keyword.label("topic"),
+                (
+                    cast(func.sum(KeywordYearCount.year * KeywordYearCount.paper_count), Float)
+                    / paper_count
+                ).label("avg_year"),
+                (cast(func.sum(KeywordYearCount.citation_sum), Float) / paper_count).label(
+                    "avg_citations"
+                ),
+                paper_count.label("paper_count"),
             )
-            .group_by(subq.c.topic)
-            .having(func.count() >= 5)
-            .order_by(func.count().desc())
+            .where(KeywordYearCount.scope == (category or ALL_SCOPE))
+            .where(KeywordYearCount.kind == "topic")
+            .group_by(KeywordYearCount.keyword)
+            .having(paper_count >= 5)
+            .order_by(paper_count.desc())
             .limit(limit)
         )
         result = (await self.session.execute(landscape_q)).all()
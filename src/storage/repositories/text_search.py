@@ -0,0 +1,28 @@
+"""Postgres full-text + trigram search helpers shared by the repositories.
+
+Matches use the GIN-indexed generated ``search_vector`` column with
+``websearch_to_tsquery`` (quoted phrases, ``OR``, ``-term``), plus a
+``pg_trgm`` similarity match on a short title column for typo tolerance.
+Both predicates are index-backed, unlike ``ILIKE '%term%'``.
+"""
+
+from sqlalchemy import func, or_
+from sqlalchemy.sql.elements import ColumnElement
+
+
+def _tsquery(search: str):
+    return func.websearch_to_tsquery("english", search)
+
+
+def fulltext_filter(search_vector, title_column, search: str) -> ColumnElement:
+    return or_(
+        search_vector.op("@@")(_tsquery(search)),
+        title_column.op("%")(search),
+    )
+
+
+def fulltext_rank(search_vector, title_column, search: str) -> ColumnElement:
+    """Relevance: weighted cover-density rank plus title trigram similarity."""
+    return func.ts_rank_cd(search_vector, _tsquery(search)) + func.similarity(
+        title_column, search
+    )
@@ -1,37 +1,311 @@
-from qdrant_client import QdrantClient
+import asyncio
+import time
+
+from qdrant_client import AsyncQdrantClient, QdrantClient
 from qdrant_client.models import (
+    BinaryQuantization,
+    BinaryQuantizationConfig,
+    CreateAlias,
+    CreateAliasOperation,
+    DatetimeRange,
+    DeleteAlias,
+    DeleteAliasOperation,
+    Disabled,
     Distance,
     FieldCondition,
     Filter,
+    FilterSelector,
+    HnswConfigDiff,
+    KeywordIndexParams,
+    MatchAny,
     MatchValue,
+    Modifier,
+    PayloadSchemaType,
     PointStruct,
+    QuantizationSearchParams,
+    Range,
+    ScalarQuantization,
+    ScalarQuantizationConfig,
+    ScalarType,
+    SearchParams,
+    SparseVector,
+    SparseVectorParams,
+    UpdateMode,
     VectorParams,
+    VectorParamsDiff,
 )
 
 from src.core.config import get_settings
 from src.core.logging import get_logger
+from src.processors.sparse import BM25SparseEncoder, payload_lexical_text
+from src.storage.cache.collection_versions import (
+    MIGRATION_CACHE_SECONDS,
+    abump_collection_version,
+    aget_migration_target,
+    bump_collection_version,
+    get_migration_target,
+    set_migration_target,
+)
 
 logger = get_logger(__name__)
 
+# Logical collections. Each name is a Qdrant alias for a physical,
+# model-versioned collection (``version_name``); the vector size comes
+# from the model. Per-collection storage and index tuning:
+#   quantization: None | "scalar" (int8, 4x smaller) | "binary" (1 bit/dim, 32x)
+#   on_disk:      keep original float32 vectors memory-mapped; the quantized
+#                 copy stays in RAM and originals are read only to rescore
+#   hnsw:         graph degree ``m`` and build-time ``ef_construct``
+#   search:       query-time ``hnsw_ef`` and, with quantization, how many
+#                 extra candidates (``oversampling``) to ``rescore`` exactly
+#   payload_indexes: fields filtered on at query time; without an index
+#                 Qdrant checks every candidate's payload
 COLLECTIONS_CONFIG = {
     "papers": {
-        "size": 768,
         "distance": Distance.COSINE,
+        "quantization": "scalar",
+        "on_disk": False,
+        "hnsw": {"m": 16, "ef_construct": 128},
+        "search": {"hnsw_ef": 128, "oversampling": 1.5, "rescore": True},
+        "payload_indexes": {
+            "source_type": PayloadSchemaType.KEYWORD,
+            "categories": PayloadSchemaType.KEYWORD,
+            "published_date": PayloadSchemaType.DATETIME,
+            "citation_count": PayloadSchemaType.INTEGER,
+        },
     },
     "repositories": {
-        "size": 768,
         "distance": Distance.COSINE,
+        "quantization": "scalar",
+        "on_disk": False,
+        "hnsw": {"m": 16, "ef_construct": 128},
+        "search": {"hnsw_ef": 128, "oversampling": 1.5, "rescore": True},
+        "payload_indexes": {
+            "source_type": PayloadSchemaType.KEYWORD,
+            "primary_language": PayloadSchemaType.KEYWORD,
+            "topics": PayloadSchemaType.KEYWORD,
+            "stars_count": PayloadSchemaType.INTEGER,
+        },
     },
     "chunks": {
-        "size": 768,
         "distance": Distance.COSINE,
+        "quantization": "scalar",
+        "on_disk": True,
+        "hnsw": {"m": 32, "ef_construct": 256},
+        "search": {"hnsw_ef": 128, "oversampling": 2.0, "rescore": True},
+        "payload_indexes": {
+            "source_type": PayloadSchemaType.KEYWORD,
+            "document_id": PayloadSchemaType.KEYWORD,
+        },
     },
+    # Multi-tenant: every search is scoped to one user. ``is_tenant`` keeps
+    # each user's points together on disk, and with ``m=0`` Qdrant builds
+    # one small HNSW graph per user_id (``payload_m``) instead of a global
+    # graph, so a search only ever walks that user's corpus.
     "user_docs": {
-        "size": 768,
         "distance": Distance.COSINE,
+        "quantization": "scalar",
+        "on_disk": True,
+        "hnsw": {"m": 0, "payload_m": 16, "ef_construct": 128},
+        "search": {"hnsw_ef": 128, "oversampling": 2.0, "rescore": True},
+        "payload_indexes": {
+            "user_id": KeywordIndexParams(type="keyword", is_tenant=True),
+            "document_id": PayloadSchemaType.KEYWORD,
+            "source_type": PayloadSchemaType.KEYWORD,
+        },
     },
 }
 
+# Lexical (BM25) side of hybrid retrieval: one sparse-only companion
+# collection per dense collection, sharing point IDs and payloads.
+SPARSE_COLLECTIONS = ["papers", "repositories", "chunks", "user_docs"]
+SPARSE_VECTOR_NAME = "bm25"
+
+
+# A rebuilt version alternates between ``<version>`` and ``<version>__rebuild``
+REBUILD_SUFFIX = "__rebuild"
+VERSION_SEPARATOR = "__"
+# How long an async store trusts its alias -> collection map
+ALIAS_CACHE_SECONDS = 30.0
+
+
+def version_name(collection: str, model: str) -> str:
+    """Physical collection holding ``collection`` embedded with ``model``.
+
+    ``("papers", "BAAI/bge-base-en-v1.5")`` -> ``papers__BAAI--bge-base-en-v1.5``
+    """
+    return f"{collection}{VERSION_SEPARATOR}{model.replace('/', '--')}"
+
+
+def version_model(physical: str) -> str | None:
+    """Embedding model of a versioned collection (None for a legacy one)."""
+    physical = physical.removesuffix(REBUILD_SUFFIX)
+    if VERSION_SEPARATOR not in physical:
+        return None
+    return physical.split(VERSION_SEPARATOR, 1)[1].replace("--", "/")
+
+
+def physical_model(physical: str) -> str:
+    """Embedding model of a physical collection (the default model for a legacy one)."""
+    return version_model(physical) or get_settings().EMBEDDING_MODEL
+
+
+def version_models(versions: dict[str, str]) -> dict[str, str]:
+    """Embedding model per collection, from a collection -> physical map."""
+    return {c: physical_model(physical) for c, physical in versions.items()}
+
+
+def rebuild_name(physical: str) -> str:
+    """The collection a rebuild of ``physical`` is built in (same model, new layout)."""
+    if physical.endswith(REBUILD_SUFFIX):
+        return physical.removesuffix(REBUILD_SUFFIX)
+    return f"{physical}{REBUILD_SUFFIX}"
+
+
+def sparse_collection(collection: str) -> str:
+    return f"{collection}_sparse"
+
+
+def _vectors_config(config: dict, size: int) -> VectorParams:
+    return VectorParams(
+        size=size,
+        distance=config["distance"],
+        on_disk=config.get("on_disk", False),
+    )
+
+
+def _quantization_config(config: dict) -> ScalarQuantization | BinaryQuantization | None:
+    kind = config.get("quantization")
+    if kind == "scalar":
+        return ScalarQuantization(
+            scalar=ScalarQuantizationConfig(type=ScalarType.INT8, quantile=0.99, always_ram=True)
+        )
+    if kind == "binary":
+        return BinaryQuantization(binary=BinaryQuantizationConfig(always_ram=True))
+    return None
+
+
+def _hnsw_config(config: dict) -> HnswConfigDiff | None:
+    hnsw = config.get("hnsw")
+    return HnswConfigDiff(**hnsw) if hnsw else None
+
+
+def search_params(collection: str) -> SearchParams | None:
+    """Query-time parameters for a dense collection (None = server defaults)."""
+    config = COLLECTIONS_CONFIG.get(collection)
+    if not config or not config.get("search"):
+        return None
+    search = config["search"]
+    quantization = None
+    if config.get("quantization"):
+        quantization = QuantizationSearchParams(
+            rescore=search.get("rescore", True),
+            oversampling=search.get("oversampling"),
+        )
+    return SearchParams(hnsw_ef=search.get("hnsw_ef"), quantization=quantization)
+
+
+RANGE_KEYS = ("gt", "gte", "lt", "lte")
+
+
+def _condition(key: str, value) -> FieldCondition:
+    """One payload condition: exact match, any-of (list) or range (dict).
+
+    Range bounds that are numbers give a numeric ``Range``; anything else
+    (``date``/``datetime`` or ISO strings) gives a ``DatetimeRange``.
+    """
+    if isinstance(value, dict):
+        bounds = {k: v for k, v in value.items() if k in RANGE_KEYS and v is not None}
+        numeric = all(
+            isinstance(v, (int, float)) and not isinstance(v, bool) for v in bounds.values()
+        )
+        range_ = Range(**bounds) if numeric else DatetimeRange(**bounds)
+        return FieldCondition(key=key, range=range_)
+    if isinstance(value, (list, tuple, set)):
+        return FieldCondition(key=key, match=MatchAny(any=list(value)))
+    return FieldCondition(key=key, match=MatchValue(value=value))
+
+
+def _build_filter(filters: dict | None) -> Filter | None:
+    """Qdrant filter ANDing one condition per key (``None`` values are ignored).
+
+    ``{"user_id": "u1", "categories": ["cs.CL", "cs.LG"],
+    "published_date": {"gte": "2024-01-01"}, "stars_count": {"gte": 100}}``
+    """
+    if not filters:
+        return None
+    conditions = [_condition(key, value) for key, value in filters.items() if value is not None]
+    return Filter(must=conditions) if conditions else None
+
+
+def _index_matches(info, schema) -> bool:
+    """Whether an existing payload index (``PayloadIndexInfo``) matches ``schema``."""
+    if isinstance(schema, PayloadSchemaType):
+        return info.data_type == schema
+    if info.data_type != schema.type or info.params is None:
+        return False
+    return all(
+        getattr(info.params, key, None) == value
+        for key, value in schema.model_dump(exclude_none=True).items()
+    )
+
+
+def _delete_selector(filters: dict) -> FilterSelector:
+    query_filter = _build_filter(filters)
+    if query_filter is None:
+        # An empty filter would select the whole collection
+        raise ValueError("delete_by_filter requires at least one condition")
+    return FilterSelector(filter=query_filter)
+
+
+def _sparse_structs(points: list[dict]) -> list[PointStruct]:
+    return [
+        PointStruct(
+            id=p["id"],
+            vector={SPARSE_VECTOR_NAME: SparseVector(indices=p["indices"], values=p["values"])},
+            payload=p["payload"],
+        )
+        for p in points
+        if p["indices"]
+    ]
+
+
+def _model_mismatch(physical: str, model: str) -> ValueError:
+    return ValueError(f"Vectors from {model} cannot be written to {physical} without texts")
+
+
+def _companion_points(
+    collection: str, points: list[dict], sparse_points: list[dict] | None
+) -> list[dict]:
+    """Sparse points for ``collection``'s BM25 companion (none if it has no companion).
+
+    Callers with better lexical text than the payload pass ``sparse_points``.
+    """
+    if collection not in SPARSE_COLLECTIONS:
+        return []
+    if sparse_points is not None:
+        return sparse_points
+    encoder = BM25SparseEncoder()
+    return [encoder.to_point(p, payload_lexical_text(p["payload"])) for p in points]
+
+
+def _mirror_points(points: list[dict], vectors: list[list[float]]) -> list[PointStruct]:
+    return [
+        PointStruct(id=p["id"], vector=vector, payload=p["payload"])
+        for p, vector in zip(points, vectors)
+    ]
+
+
+def _to_hits(points) -> list[dict]:
+    return [
+        {
+            "id": hit.id,
+            "score": hit.score,
+            "payload": hit.payload,
+        }
+        for hit in points
+    ]
+
 
 class VectorStore:
     def __init__(self):
@@ -42,19 +316,224 @@ class VectorStore:
         )
 
     def init_collections(self) -> None:
+        settings = get_settings()
+        existing_names = [c.name for c in self.client.get_collections().collections]
+        aliases = self.aliases()
         for name, config in COLLECTIONS_CONFIG.items():
-            existing = self.client.get_collections().collections
-            existing_names = [c.name for c in existing]
+            if name in aliases:
+                self.ensure_payload_indexes(aliases[name], config)
+            elif name in existing_names:
+                # Collection from before versioning; `rri vectors migrate` moves it
+                self.ensure_payload_indexes(name, config)
+            else:
+                physical = self.create_version(
+                    name, settings.EMBEDDING_MODEL, settings.EMBEDDING_DIMENSION
+                )
+                self.client.update_collection_aliases(
+                    change_aliases_operations=[
+                        CreateAliasOperation(
+                            create_alias=CreateAlias(collection_name=physical, alias_name=name)
+                        )
+                    ]
+                )
+                logger.info("Created Qdrant collection", collection=physical, alias=name)
 
-            if name not in existing_names:
+        existing_names = [c.name for c in self.client.get_collections().collections]
+        for name in SPARSE_COLLECTIONS:
+            sparse_name = sparse_collection(name)
+            if sparse_name not in existing_names:
                 self.client.create_collection(
-                    collection_name=name,
-                    vectors_config=VectorParams(
-                        size=config["size"],
-                        distance=config["distance"],
-                    ),
+                    collection_name=sparse_name,
+                    vectors_config={},
+                    sparse_vectors_config={
+                        SPARSE_VECTOR_NAME: SparseVectorParams(modifier=Modifier.IDF),
+                    },
+                )
+                logger.info("Created Qdrant sparse collection", collection=sparse_name)
+            # Sparse points carry the same payload and take the same filters
+            self.ensure_payload_indexes(sparse_name, COLLECTIONS_CONFIG[name])
+
+    def ensure_payload_indexes(self, collection_name: str, config: dict) -> None:
+        """Create the configured payload indexes missing on an existing collection."""
+        wanted = config.get("payload_indexes", {})
+        if not wanted:
+            return
+        existing = self.client.get_collection(collection_name).payload_schema or {}
+        for field, schema in wanted.items():
+            if field in existing:
+                if _index_matches(existing[field], schema):
+                    continue
+                # Index params changed (e.g. became a tenant index): rebuild it
+                self.client.delete_payload_index(collection_name, field)
+            self.client.create_payload_index(
+                collection_name=collection_name, field_name=field, field_schema=schema
+            )
+            logger.info("Created payload index", collection=collection_name, field=field)
+
+    def aliases(self) -> dict[str, str]:
+        """Alias -> physical collection name."""
+        return {a.alias_name: a.collection_name for a in self.client.get_aliases().aliases}
+
+    def resolve(self, collection: str) -> str:
+        """Physical collection behind a logical name (itself if not an alias)."""
+        return self.aliases().get(collection, collection)
+
+    def collection_model(self, collection: str) -> str:
+        """Embedding model of the version ``collection`` currently points at."""
+        return version_model(self.resolve(collection)) or get_settings().EMBEDDING_MODEL
+
+    def vector_size(self, physical: str) -> int:
+        return self.client.get_collection(physical).config.params.vectors.size
+
+    def create_version(self, collection: str, model: str, size: int) -> str:
+        """Create (if missing) the physical collection for ``collection`` + ``model``."""
+        physical = version_name(collection, model)
+        if not self.client.collection_exists(physical):
+            self._create_dense_collection(physical, COLLECTIONS_CONFIG[collection], size)
+        return physical
+
+    def activate_version(self, collection: str, physical: str) -> str | None:
+        """Atomically point the ``collection`` alias at ``physical``.
+
+        Returns the previously active physical collection. A legacy
+        (unversioned) collection of the same name has to be deleted before
+        the alias can be created, so it cannot be rolled back to.
+        """
+        previous = self.aliases().get(collection)
+        operations = []
+        if previous is not None:
+            operations.append(DeleteAliasOperation(delete_alias=DeleteAlias(alias_name=collection)))
+        elif self.client.collection_exists(collection):
+            logger.warning("Dropping unversioned collection for alias", collection=collection)
+            self.client.delete_collection(collection)
+            previous = collection
+        operations.append(
+            CreateAliasOperation(
+                create_alias=CreateAlias(collection_name=physical, alias_name=collection)
+            )
+        )
+        # One request: searches see either the old or the new version, never neither
+        self.client.update_collection_aliases(change_aliases_operations=operations)
+        bump_collection_version(collection)
+        logger.info("Activated collection version", collection=collection, version=physical)
+        return previous
+
+    def _create_dense_collection(self, name: str, config: dict, size: int | None = None) -> None:
+        self.client.create_collection(
+            collection_name=name,
+            vectors_config=_vectors_config(config, size or get_settings().EMBEDDING_DIMENSION),
+            hnsw_config=_hnsw_config(config),
+            quantization_config=_quantization_config(config),
+        )
+        self.ensure_payload_indexes(name, config)
+
+    def find_version(self, collection: str, model: str) -> str | None:
+        """Existing physical collection of ``collection`` built with ``model``."""
+        physical = version_name(collection, model)
+        for name in (physical, rebuild_name(physical)):
+            if self.client.collection_exists(name):
+                return name
+        return None
+
+    def _copy_points(self, source: str, target: str, batch_size: int) -> int:
+        """Copy points with their stored vectors; nothing is re-embedded.
+
+        Meant to run while writes go to both collections: points already in
+        ``target`` were written after the copy started and are newer, so
+        they are left alone, and points deleted after the scroll read them
+        are deleted from ``target`` again.
+        """
+        copied = 0
+        offset = None
+        while True:
+            records, offset = self.client.scroll(
+                collection_name=source,
+                limit=batch_size,
+                offset=offset,
+                with_payload=True,
+                with_vectors=True,
+            )
+            if records:
+                self.client.upsert(
+                    collection_name=target,
+                    points=[
+                        PointStruct(id=r.id, vector=r.vector, payload=r.payload)
+                        for r in records
+                    ],
+                    wait=True,
+                    update_mode=UpdateMode.INSERT_ONLY,
                 )
-                logger.info("Created Qdrant collection", collection=name)
+                ids = [r.id for r in records]
+                kept = {r.id for r in self.client.retrieve(source, ids=ids, with_payload=False)}
+                deleted = [point_id for point_id in ids if point_id not in kept]
+                if deleted:
+                    self.client.delete(collection_name=target, points_selector=deleted)
+                copied += len(records)
+            if offset is None:
+                return copied
+
+    def recreate_collection(self, name: str, batch_size: int = 256) -> int:
+        """Bring ``name`` in line with its current ``COLLECTIONS_CONFIG``.
+
+        Quantization, HNSW and on-disk settings are changed in place;
+        Qdrant re-optimizes the segments in the background while the
+        collection keeps serving searches and writes. A change it cannot
+        apply in place (the distance) goes through ``_rebuild``. Returns the
+        number of points; raises ``ValueError`` if there is nothing to
+        update or a model migration of ``name`` is running.
+        """
+        config = COLLECTIONS_CONFIG[name]
+        physical = self.resolve(name)
+        if not self.client.collection_exists(physical):
+            raise ValueError(f"Collection {name} does not exist")
+        target = get_migration_target(name)
+        if target not in (None, rebuild_name(physical)):
+            raise ValueError(f"Migration of {name} to {target} in progress")
+        distance = self.client.get_collection(physical).config.params.vectors.distance
+        if target is not None or distance != config["distance"]:
+            return self._rebuild(name, physical, config, batch_size)
+
+        self.client.update_collection(
+            collection_name=physical,
+            vectors_config={"": VectorParamsDiff(on_disk=config.get("on_disk", False))},
+            hnsw_config=_hnsw_config(config),
+            quantization_config=_quantization_config(config) or Disabled.DISABLED,
+        )
+        self.ensure_payload_indexes(physical, config)
+        points = self.client.count(physical, exact=True).count
+        logger.info("Updated Qdrant collection config", collection=physical, points=points)
+        return points
+
+    def _rebuild(self, name: str, physical: str, config: dict, batch_size: int) -> int:
+        """Build a new physical collection with ``config`` and swap the alias to it.
+
+        Works like a model migration to the same model: writes go to both
+        collections while the points are copied, then the alias is switched
+        in one request, so search never sees a missing or partial
+        collection. A rerun after an interruption resumes the copy.
+        """
+        target = rebuild_name(physical)
+        if get_migration_target(name) != target:
+            if self.client.collection_exists(target):
+                # Left over from a run interrupted before dual-writes started
+                self.client.delete_collection(target)
+            self._create_dense_collection(target, config, self.vector_size(physical))
+            set_migration_target(name, target)
+            # Writers may hold a cached "no migration" for this long
+            time.sleep(MIGRATION_CACHE_SECONDS)
+        else:
+            logger.info("Resuming rebuild", collection=physical, target=target)
+
+        copied = self._copy_points(physical, target, batch_size)
+        self.activate_version(name, target)
+        set_migration_target(name, None)
+        if physical != name:
+            # (activate_version already dropped a legacy one.) Let searches
+            # with a cached alias and in-flight writes drain first
+            time.sleep(ALIAS_CACHE_SECONDS)
+            self.client.delete_collection(physical)
+        logger.info("Rebuilt Qdrant collection", collection=target, points=copied)
+        return copied
 
     def upsert(
         self,
@@ -78,19 +557,47 @@ class VectorStore:
         self,
         collection: str,
         points: list[dict],
+        texts: list[str] | None = None,
+        model: str | None = None,
+        sparse_points: list[dict] | None = None,
     ) -> None:
-        """Upsert multiple points at once. Each dict: {id, vector, payload}."""
-        self.client.upsert(
-            collection_name=collection,
-            points=[
-                PointStruct(
-                    id=p["id"],
-                    vector=p["vector"],
-                    payload=p["payload"],
-                )
-                for p in points
-            ],
-        )
+        """Upsert multiple points at once. Each dict: {id, vector, payload}.
+
+        The BM25 companion of a hybrid-searched collection is written in the
+        same call, from ``sparse_points`` or else from the payloads, so no
+        writer can leave it behind the dense collection.
+
+        ``model`` is the model the vectors come from (default: the active
+        version's). The versions written are resolved now, not when the
+        vectors were made: the one ``collection`` points at and, during a
+        model migration, its target. A version on another model gets
+        ``texts`` re-embedded with that model; without ``texts`` the write
+        raises ``ValueError`` rather than mixing models in one collection.
+        """
+        versions = self._write_targets(collection)
+        model = model or physical_model(versions[0])
+        for physical in versions:
+            vectors = [p["vector"] for p in points]
+            if physical_model(physical) != model:
+                if texts is None:
+                    raise _model_mismatch(physical, model)
+                from src.processors.embedding import EmbeddingGenerator
+
+                generator = EmbeddingGenerator(model_name=physical_model(physical))
+                vectors = generator.embed_batch(texts)
+            self.client.upsert(collection_name=physical, points=_mirror_points(points, vectors))
+        self.upsert_sparse_batch(collection, _companion_points(collection, points, sparse_points))
+        bump_collection_version(collection)
+
+    def upsert_sparse_batch(self, collection: str, points: list[dict]) -> None:
+        """Upsert BM25 sparse points into ``collection``'s sparse companion.
+
+        Each dict: {id, indices, values, payload}. Points without any
+        tokens are skipped.
+        """
+        structs = _sparse_structs(points)
+        if structs:
+            self.client.upsert(collection_name=sparse_collection(collection), points=structs)
 
     def search(
         self,
@@ -99,33 +606,270 @@ class VectorStore:
         limit: int = 10,
         filters: dict | None = None,
     ) -> list[dict]:
-        query_filter = None
-        if filters:
-            conditions = []
-            for key, value in filters.items():
-                conditions.append(
-                    FieldCondition(key=key, match=MatchValue(value=value))
-                )
-            query_filter = Filter(must=conditions)
-
         results = self.client.query_points(
             collection_name=collection,
             query=query_vector,
             limit=limit,
-            query_filter=query_filter,
+            query_filter=_build_filter(filters),
+            search_params=search_params(collection),
         )
-
-        return [
-            {
-                "id": hit.id,
-                "score": hit.score,
-                "payload": hit.payload,
-            }
-            for hit in results.points
-        ]
+        return _to_hits(results.points)
 
     def delete(self, collection: str, point_ids: list[str]) -> None:
-        self.client.delete(
-            collection_name=collection,
-            points_selector=point_ids,
+        for name in self._write_targets(collection):
+            self.client.delete(
+                collection_name=name,
+                points_selector=point_ids,
+            )
+        if collection in SPARSE_COLLECTIONS:
+            self.client.delete(
+                collection_name=sparse_collection(collection),
+                points_selector=point_ids,
+            )
+        bump_collection_version(collection)
+
+    def _write_targets(self, collection: str) -> list[str]:
+        """Physical collections a write to ``collection`` goes to, resolved now."""
+        live = self.resolve(collection)
+        target = get_migration_target(collection)
+        return [live] if target in (None, live) else [live, target]
+
+    def delete_by_filter(self, collection: str, filters: dict) -> None:
+        """Delete every point matching ``filters`` (e.g. all of one user's chunks)."""
+        selector = _delete_selector(filters)
+        for name in self._write_targets(collection):
+            self.client.delete(collection_name=name, points_selector=selector)
+        if collection in SPARSE_COLLECTIONS:
+            self.client.delete(
+                collection_name=sparse_collection(collection), points_selector=selector
+            )
+        bump_collection_version(collection)
+
+
+class AsyncVectorStore:
+    """Non-blocking counterpart of ``VectorStore`` for use inside async handlers."""
+
+    def __init__(self, url: str | None = None, api_key: str | None = None):
+        settings = get_settings()
+        self.client = AsyncQdrantClient(
+            url=url or settings.QDRANT_URL,
+            api_key=api_key or settings.QDRANT_API_KEY,
+        )
+        self._aliases: dict[str, str] = {}
+        self._aliases_expire = 0.0
+
+    async def aliases(self, fresh: bool = False) -> dict[str, str]:
+        """Alias -> physical collection, cached for ``ALIAS_CACHE_SECONDS``.
+
+        Writes pass ``fresh=True``: vectors must go to the version that is
+        live now, not the one a stale map names.
+        """
+        now = asyncio.get_running_loop().time()
+        if fresh or now >= self._aliases_expire:
+            response = await self.client.get_aliases()
+            self._aliases = {a.alias_name: a.collection_name for a in response.aliases}
+            self._aliases_expire = now + ALIAS_CACHE_SECONDS
+        return self._aliases
+
+    async def active_versions(self, collections: list[str]) -> dict[str, str]:
+        """Physical collection each logical name points at, from one alias snapshot.
+
+        Embed with ``version_models`` of the result and pass it to
+        ``search_many(versions=...)``: the query vector and the searched
+        collection then come from the same version even if the alias was
+        swapped since the snapshot was cached.
+        """
+        aliases = await self.aliases()
+        return {c: aliases.get(c, c) for c in collections}
+
+    async def collection_models(self, collections: list[str]) -> dict[str, str]:
+        """Embedding model each collection's active version was built with."""
+        return version_models(await self.active_versions(collections))
+
+    async def search(
+        self,
+        collection: str,
+        query_vector: list[float],
+        limit: int = 10,
+        filters: dict | None = None,
+        physical: str | None = None,
+    ) -> list[dict]:
+        """Dense search; ``physical`` pins the version searched (default: the alias)."""
+        results = await self.client.query_points(
+            collection_name=physical or collection,
+            query=query_vector,
+            limit=limit,
+            query_filter=_build_filter(filters),
+            search_params=search_params(collection),
+        )
+        return _to_hits(results.points)
+
+    async def search_sparse(
+        self,
+        collection: str,
+        indices: list[int],
+        values: list[float],
+        limit: int = 10,
+        filters: dict | None = None,
+    ) -> list[dict]:
+        """BM25 search over ``collection``'s sparse companion collection."""
+        if not indices:
+            return []
+        results = await self.client.query_points(
+            collection_name=sparse_collection(collection),
+            query=SparseVector(indices=indices, values=values),
+            using=SPARSE_VECTOR_NAME,
+            limit=limit,
+            query_filter=_build_filter(filters),
+        )
+        return _to_hits(results.points)
+
+    async def search_many(
+        self,
+        collections: list[str],
+        query_vector: list[float] | dict[str, list[float]],
+        limit: int = 10,
+        filters: dict | None = None,
+        collection_filters: dict[str, dict] | None = None,
+        versions: dict[str, str] | None = None,
+    ) -> list[dict]:
+        """Query several collections concurrently and merge hits by score.
+
+        Each hit gets a ``collection`` key. A failing collection is logged and
+        skipped so one bad collection does not fail the whole search.
+        ``collection_filters`` adds conditions for fields that only exist in
+        some collections (e.g. ``stars_count`` on repositories).
+        ``query_vector`` may be a per-collection dict when collections are
+        on different embedding models (``embed_for_collections``); pass the
+        ``active_versions`` those models came from as ``versions``.
+        """
+        return await self._gather_merged(
+            collections,
+            [
+                self.search(
+                    c,
+                    query_vector[c] if isinstance(query_vector, dict) else query_vector,
+                    limit=limit,
+                    filters={**(filters or {}), **(collection_filters or {}).get(c, {})},
+                    physical=(versions or {}).get(c),
+                )
+                for c in collections
+            ],
+        )
+
+    async def search_sparse_many(
+        self,
+        collections: list[str],
+        indices: list[int],
+        values: list[float],
+        limit: int = 10,
+        filters: dict | None = None,
+    ) -> list[dict]:
+        """Sparse counterpart of ``search_many``."""
+        return await self._gather_merged(
+            collections,
+            [
+                self.search_sparse(c, indices, values, limit=limit, filters=filters)
+                for c in collections
+            ],
+        )
+
+    async def _gather_merged(self, collections: list[str], searches: list) -> list[dict]:
+        responses = await asyncio.gather(*searches, return_exceptions=True)
+
+        merged = []
+        for collection, hits in zip(collections, responses):
+            if isinstance(hits, BaseException):
+                logger.error("Qdrant search failed", collection=collection, error=str(hits))
+                # The cached aliases may name a version that has since been dropped
+                self._aliases_expire = 0.0
+                continue
+            for hit in hits:
+                hit["collection"] = collection
+                merged.append(hit)
+
+        merged.sort(key=lambda h: h["score"], reverse=True)
+        return merged
+
+    async def upsert_batch(
+        self,
+        collection: str,
+        points: list[dict],
+        wait: bool = True,
+        texts: list[str] | None = None,
+        model: str | None = None,
+        sparse_points: list[dict] | None = None,
+    ) -> None:
+        """Upsert dense points; ``wait=False`` returns once Qdrant has queued the write.
+
+        ``texts``, ``model`` and ``sparse_points`` work as in
+        ``VectorStore.upsert_batch``.
+        """
+        from src.processors.embedding_service import get_embedding_service
+
+        versions = await self._write_targets(collection)
+        model = model or physical_model(versions[0])
+        for physical in versions:
+            vectors = [p["vector"] for p in points]
+            if physical_model(physical) != model:
+                if texts is None:
+                    raise _model_mismatch(physical, model)
+                vectors = await get_embedding_service(physical_model(physical)).embed_batch(texts)
+            await self.client.upsert(
+                collection_name=physical, points=_mirror_points(points, vectors), wait=wait
+            )
+        await self.upsert_sparse_batch(
+            collection, _companion_points(collection, points, sparse_points), wait=wait
         )
+        await abump_collection_version(collection)
+
+    async def upsert_sparse_batch(
+        self, collection: str, points: list[dict], wait: bool = True
+    ) -> None:
+        structs = _sparse_structs(points)
+        if structs:
+            await self.client.upsert(
+                collection_name=sparse_collection(collection), points=structs, wait=wait
+            )
+
+    async def delete(self, collection: str, point_ids: list[str]) -> None:
+        for name in await self._write_targets(collection):
+            await self.client.delete(
+                collection_name=name,
+                points_selector=point_ids,
+            )
+        if collection in SPARSE_COLLECTIONS:
+            await self.client.delete(
+                collection_name=sparse_collection(collection),
+                points_selector=point_ids,
+            )
+        await abump_collection_version(collection)
+
+    async def delete_by_filter(self, collection: str, filters: dict) -> None:
+        selector = _delete_selector(filters)
+        for name in await self._write_targets(collection):
+            await self.client.delete(collection_name=name, points_selector=selector)
+        if collection in SPARSE_COLLECTIONS:
+            await self.client.delete(
+                collection_name=sparse_collection(collection), points_selector=selector
+            )
+        await abump_collection_version(collection)
+
+    async def _write_targets(self, collection: str) -> list[str]:
+        live = (await self.aliases(fresh=True)).get(collection, collection)
+        target = await aget_migration_target(collection)
+        return [live] if target in (None, live) else [live, target]
+
+    async def close(self) -> None:
+        await self.client.close()
+
+
+_async_store: AsyncVectorStore | None = None
+
+
+def get_async_vector_store() -> AsyncVectorStore:
+    """Process-wide ``AsyncVectorStore`` so the API reuses one connection pool."""
+    global _async_store
+    if _async_store is None:
+        _async_store = AsyncVectorStore()
+    return _async_store
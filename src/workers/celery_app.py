@@ -65,6 +65,12 @@ _beat_schedule = {
         "schedule": crontab(minute=0, hour="1,13"),
         "options": {"queue": "processing"},
     },
+    # Catch paper changes made outside the collection tasks (they refresh on completion)
+    "refresh-paper-analytics": {
+        "task": "src.workers.tasks.processing.refresh_paper_analytics",
+        "schedule": crontab(minute=45, hour=2),
+        "options": {"queue": "processing"},
+    },
     # Calculate trending scores daily
     "calculate-trending": {
         "task": "src.workers.tasks.processing.calculate_trending_scores",
@@ -0,0 +1,146 @@
+"""Per-process async runtime for Celery workers.
+
+Each worker process owns one long-lived event loop plus the clients that
+are expensive to build (SQLAlchemy engine, Qdrant, Redis, httpx). They are
+created on ``worker_process_init`` and reused by every task the process
+runs, instead of paying loop creation, pool warm-up and TCP/TLS handshakes
+per task.
+
+Tasks can be written as coroutines directly::
+
+    @async_task(name="src.workers.tasks.collection.collect_hf_models")
+    async def collect_hf_models():
+        ...
+"""
+
+import asyncio
+import functools
+
+import httpx
+from celery.signals import worker_process_init, worker_process_shutdown
+
+from src.core.logging import get_logger
+from src.storage.cache.collection_versions import batched_version_bumps
+from src.storage.cache.redis_client import RedisCache
+from src.storage.database import create_async_session_factory
+from src.storage.vector.qdrant_client import VectorStore
+from src.workers.celery_app import celery_app
+
+logger = get_logger(__name__)
+
+HTTP_TIMEOUT_SECONDS = 30
+
+
+class WorkerRuntime:
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.session_factory = create_async_session_factory()
+        self._vector_store: VectorStore | None = None
+        self._http_client: httpx.AsyncClient | None = None
+        self._redis: RedisCache | None = None
+
+    def run(self, coro):
+        return self.loop.run_until_complete(coro)
+
+    @property
+    def vector_store(self) -> VectorStore:
+        if self._vector_store is None:
+            self._vector_store = VectorStore()
+        return self._vector_store
+
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        if self._http_client is None:
+            self._http_client = httpx.AsyncClient(
+                timeout=HTTP_TIMEOUT_SECONDS, follow_redirects=True
+            )
+        return self._http_client
+
+    @property
+    def redis(self) -> RedisCache:
+        if self._redis is None:
+            self._redis = RedisCache()
+        return self._redis
+
+    def close(self) -> None:
+        async def _aclose():
+            if self._http_client is not None:
+                await self._http_client.aclose()
+            if self._redis is not None:
+                await self._redis.close()
+            await self.session_factory.kw["bind"].dispose()
+
+        try:
+            self.run(_aclose())
+            if self._vector_store is not None:
+                self._vector_store.client.close()
+        finally:
+            self.loop.close()
+
+
+_runtime: WorkerRuntime | None = None
+
+
+def get_runtime() -> WorkerRuntime:
+    """The process runtime; created lazily outside a worker (eager mode, scripts)."""
+    global _runtime
+    if _runtime is None:
+        _runtime = WorkerRuntime()
+    return _runtime
+
+
+@worker_process_init.connect
+def _init_worker_runtime(**_):
+    global _runtime
+    # A forked child must not reuse the parent's loop or connections
+    _runtime = WorkerRuntime()
+    logger.info("Worker runtime initialized")
+
+
+@worker_process_shutdown.connect
+def _close_worker_runtime(**_):
+    global _runtime
+    if _runtime is not None:
+        _runtime.close()
+        _runtime = None
+
+
+def run_async(coro):
+    """Run ``coro`` to completion on the process's long-lived loop."""
+    return get_runtime().run(coro)
+
+
+def get_session_factory():
+    return get_runtime().session_factory
+
+
+def get_vector_store() -> VectorStore:
+    return get_runtime().vector_store
+
+
+def get_http_client() -> httpx.AsyncClient:
+    return get_runtime().http_client
+
+
+def get_redis() -> RedisCache:
+    return get_runtime().redis
+
+
+async def _with_batched_bumps(coro):
+    # A task invalidates the answer cache once, when it is done writing
+    async with batched_version_bumps():
+        return await coro
+
+
+def async_task(*task_args, **task_opts):
+    """``celery_app.task`` for coroutine functions, run on the worker's loop."""
+
+    def decorator(fn):
+        @functools.wraps(fn)
+        def run(*args, **kwargs):
+            return run_async(_with_batched_bumps(fn(*args, **kwargs)))
+
+        return celery_app.task(*task_args, **task_opts)(run)
+
+    return decorator
@@ -6,139 +6,105 @@ from datetime import date, datetime, timedelta
 from src.core.config import get_settings
 from src.core.logging import get_logger
 from src.workers.celery_app import celery_app
+from src.workers.runtime import async_task, get_http_client, get_session_factory
 
 logger = get_logger(__name__)
 
 
-def _run_async(coro):
-    loop = asyncio.new_event_loop()
-    try:
-        return loop.run_until_complete(coro)
-    finally:
-        loop.close()
-
-
-@celery_app.task(name="src.workers.tasks.collection.collect_arxiv_papers")
-def collect_arxiv_papers(categories: list[str] | None = None, max_results: int = 200):
+@async_task(name="src.workers.tasks.collection.collect_arxiv_papers")
+async def collect_arxiv_papers(categories: list[str] | None = None, max_results: int = 200):
     """Collect recent papers from ArXiv, then trigger processing."""
-    _run_async(_collect_arxiv(categories, max_results))
-    from src.workers.tasks.processing import process_unprocessed_papers
+    await _collect_arxiv(categories, max_results)
+    from src.workers.tasks.processing import process_unprocessed_papers, refresh_paper_analytics
     process_unprocessed_papers.delay()
+    refresh_paper_analytics.delay()
 
 
 async def _collect_arxiv(categories: list[str] | None, max_results: int):
     from src.collectors.arxiv import ArxivCollector
-    from src.storage.database import create_async_session_factory
     from src.storage.repositories.paper_repo import PaperRepository
 
-    async_session_factory = create_async_session_factory()
+    async_session_factory = get_session_factory()
 
     settings = get_settings()
     cats = categories or settings.ARXIV_CATEGORIES
     date_from = date.today() - timedelta(days=7)
 
-    collected = 0
+    rows: list[dict] = []
     async with ArxivCollector() as collector:
-        async with async_session_factory() as session:
-            repo = PaperRepository(session)
-            async for result in collector.collect(
-                categories=cats,
-                date_from=date_from,
-                max_results=max_results,
-            ):
-                paper = result.data
-                await repo.upsert_by_arxiv_id(
-                    {
-                        "arxiv_id": paper.arxiv_id,
-                        "title": paper.title,
-                        "abstract": paper.abstract,
-                        "authors": paper.authors,
-                        "categories": paper.categories,
-                        "published_date": paper.published_date,
-                        "updated_date": paper.updated_date,
-                        "pdf_url": paper.pdf_url,
-                        "source": "arxiv",
-                        "source_url": f"https://arxiv.org/abs/{paper.arxiv_id}",
-                    }
-                )
-                collected += 1
+        async for result in collector.collect(
+            categories=cats,
+            date_from=date_from,
+            max_results=max_results,
+        ):
+            rows.append(_paper_data_from_arxiv(result.data))
 
-            await session.commit()
+    async with async_session_factory() as session:
+        repo = PaperRepository(session)
+        await repo.bulk_upsert_by_arxiv_id(rows)
+        await session.commit()
+
+    logger.info("ArXiv collection completed", collected=len(rows))
 
-    logger.info("ArXiv collection completed", collected=collected)
+
+def _paper_data_from_arxiv(paper) -> dict:
+    """Extract DB-compatible dict from an ArxivPaper dataclass."""
+    return {
+        "arxiv_id": paper.arxiv_id,
+        "title": paper.title,
+        "abstract": paper.abstract,
+        "authors": paper.authors,
+        "categories": paper.categories,
+        "published_date": paper.published_date,
+        "updated_date": paper.updated_date,
+        "pdf_url": paper.pdf_url,
+        "source": "arxiv",
+        "source_url": f"https://arxiv.org/abs/{paper.arxiv_id}",
+    }
 
 
-@celery_app.task(name="src.workers.tasks.collection.collect_github_trending")
-def collect_github_trending(language: str | None = None):
+@async_task(name="src.workers.tasks.collection.collect_github_trending")
+async def collect_github_trending(language: str | None = None):
     """Collect trending repositories from GitHub, then trigger processing."""
-    _run_async(_collect_github(language))
+    await _collect_github(language)
     from src.workers.tasks.processing import process_unprocessed_repos
     process_unprocessed_repos.delay()
 
 
 async def _collect_github(language: str | None):
     from src.collectors.github import GitHubCollector
-    from src.storage.database import create_async_session_factory
     from src.storage.repositories.github_repo import GitHubRepository
 
-    async_session_factory = create_async_session_factory()
+    async_session_factory = get_session_factory()
 
     settings = get_settings()
     if not settings.GITHUB_TOKEN:
         logger.warning("No GitHub token configured, skipping collection")
         return
 
-    collected = 0
+    rows: list[dict] = []
     async with GitHubCollector(token=settings.GITHUB_TOKEN) as collector:
-        async with async_session_factory() as session:
-            repo_store = GitHubRepository(session)
-            async for result in collector.get_trending(
-                language=language, since="weekly"
-            ):
-                gh_repo = result.data
-                await repo_store.upsert_by_full_name(
-                    {
-                        "github_id": gh_repo.github_id,
-                        "full_name": gh_repo.full_name,
-                        "name": gh_repo.name,
-                        "owner": gh_repo.owner,
-                        "description": gh_repo.description,
-                        "html_url": gh_repo.html_url,
-                        "homepage_url": gh_repo.homepage_url,
-                        "primary_language": gh_repo.primary_language,
-                        "languages": gh_repo.languages,
-                        "topics": gh_repo.topics,
-                        "stars_count": gh_repo.stars_count,
-                        "forks_count": gh_repo.forks_count,
-                        "watchers_count": gh_repo.watchers_count,
-                        "open_issues_count": gh_repo.open_issues_count,
-                        "readme_content": gh_repo.readme_content,
-                        "has_readme": gh_repo.readme_content is not None,
-                        "has_license": gh_repo.has_license,
-                        "has_docker": gh_repo.has_dockerfile,
-                        "last_commit_at": gh_repo.last_commit_at,
-                        "last_release_tag": gh_repo.last_release_tag,
-                        "last_release_at": gh_repo.last_release_at,
-                        "dependencies": gh_repo.dependencies,
-                        "repo_created_at": gh_repo.created_at,
-                        "repo_updated_at": gh_repo.updated_at,
-                    }
-                )
-                collected += 1
+        async for result in collector.get_trending(
+            language=language, since="weekly"
+        ):
+            rows.append(_repo_data_from_gh(result.data))
 
-            await session.commit()
+    async with async_session_factory() as session:
+        repo_store = GitHubRepository(session)
+        await repo_store.bulk_upsert_by_full_name(rows)
+        await session.commit()
 
-    logger.info("GitHub collection completed", collected=collected)
+    logger.info("GitHub collection completed", collected=len(rows))
 
 
-@celery_app.task(
+@async_task(
     name="src.workers.tasks.collection.collect_github_comprehensive",
     soft_time_limit=7200,
     time_limit=7500,
 )
-def collect_github_comprehensive():
+async def collect_github_comprehensive():
     """Collect 10,000-20,000+ repos from GitHub using diverse search strategies, then process."""
-    _run_async(_collect_github_comprehensive())
+    await _collect_github_comprehensive()
     from src.workers.tasks.processing import process_unprocessed_repos
     process_unprocessed_repos.delay()
 
@@ -258,10 +224,9 @@ def _repo_data_from_gh(gh_repo) -> dict:
 
 async def _collect_github_comprehensive():
     from src.collectors.github import GitHubCollector
-    from src.storage.database import create_async_session_factory
     from src.storage.repositories.github_repo import GitHubRepository
 
-    async_session_factory = create_async_session_factory()
+    async_session_factory = get_session_factory()
 
     settings = get_settings()
     if not settings.GITHUB_TOKEN:
@@ -272,26 +237,42 @@ async def _collect_github_comprehensive():
     total_collected = 0
     seen_names: set[str] = set()
 
-    logger.info("Starting comprehensive collection", total_queries=len(queries))
+    logger.info(
+        "Starting comprehensive collection",
+        total_queries=len(queries),
+        tokens=1 + len(settings.GITHUB_EXTRA_TOKENS),
+        concurrency=settings.GITHUB_MAX_CONCURRENCY,
+    )
 
-    async with GitHubCollector(token=settings.GITHUB_TOKEN) as collector:
-        for idx, q in enumerate(queries, 1):
+    async with GitHubCollector(
+        token=settings.GITHUB_TOKEN,
+        extra_tokens=settings.GITHUB_EXTRA_TOKENS,
+        max_concurrency=settings.GITHUB_MAX_CONCURRENCY,
+    ) as collector:
+        # The collector's scheduler bounds in-flight requests and spends the
+        # point budget; this only bounds how many search cursors are open.
+        query_slots = asyncio.Semaphore(settings.GITHUB_MAX_CONCURRENCY)
+
+        async def run_query(idx: int, q: dict) -> None:
+            nonlocal total_collected
             collected = 0
-            try:
-                async with async_session_factory() as session:
-                    repo_store = GitHubRepository(session)
+            async with query_slots:
+                try:
+                    rows: list[dict] = []
                     async for result in collector.search(**q):
                         gh_repo = result.data
                         if gh_repo.full_name in seen_names:
                             continue
                         seen_names.add(gh_repo.full_name)
-                        await repo_store.upsert_by_full_name(
-                            _repo_data_from_gh(gh_repo)
-                        )
-                        collected += 1
-                    await session.commit()
-            except Exception:
-                logger.exception("Error collecting query", query_idx=idx, query=q)
+                        rows.append(_repo_data_from_gh(gh_repo))
+
+                    async with async_session_factory() as session:
+                        repo_store = GitHubRepository(session)
+                        await repo_store.bulk_upsert_by_full_name(rows)
+                        await session.commit()
+                    collected = len(rows)
+                except Exception:
+                    logger.exception("Error collecting query", query_idx=idx, query=q)
             total_collected += collected
             logger.info(
                 "Query batch done",
@@ -300,8 +281,11 @@ async def _collect_github_comprehensive():
                 batch_collected=collected,
                 total_collected=total_collected,
                 unique_repos=len(seen_names),
+                points_remaining=collector.scheduler.remaining,
             )
 
+        await asyncio.gather(*(run_query(idx, q) for idx, q in enumerate(queries, 1)))
+
     logger.info(
         "Comprehensive GitHub collection completed",
         total_collected=total_collected,
@@ -309,21 +293,18 @@ async def _collect_github_comprehensive():
     )
 
 
-@celery_app.task(name="src.workers.tasks.collection.update_existing_repos")
-def update_existing_repos():
+@async_task(name="src.workers.tasks.collection.update_existing_repos")
+async def update_existing_repos():
     """Update metrics for all existing repos in the database."""
-    _run_async(_update_existing_repos())
+    await _update_existing_repos()
 
 
 async def _update_existing_repos():
-    import asyncio as _asyncio
-
     from src.collectors.github import GitHubCollector
-    from src.storage.database import create_async_session_factory
     from src.storage.repositories.github_repo import GitHubRepository
     from src.storage.repositories.metrics_repo import MetricsRepository
 
-    async_session_factory = create_async_session_factory()
+    async_session_factory = get_session_factory()
 
     settings = get_settings()
     if not settings.GITHUB_TOKEN:
@@ -337,69 +318,67 @@ async def _update_existing_repos():
 
     logger.info("Starting repo update", total_repos=len(full_names))
 
-    batch_size = 50
+    batch_size = 500
     updated = 0
     snapshots_recorded = 0
 
     async with GitHubCollector(token=settings.GITHUB_TOKEN) as collector:
         for i in range(0, len(full_names), batch_size):
             batch = full_names[i : i + batch_size]
-            async with async_session_factory() as session:
-                repo_store = GitHubRepository(session)
-                metrics_repo = MetricsRepository(session)
+            try:
+                gh_repos = await collector.get_repos_batch(batch)
 
-                for full_name in batch:
-                    try:
-                        owner, name = full_name.split("/", 1)
-                        gh_repo = await collector.get_repo(owner, name)
-                        if not gh_repo:
-                            logger.warning("Repo not found on GitHub", repo=full_name)
-                            continue
+                async with async_session_factory() as session:
+                    repo_store = GitHubRepository(session)
+                    metrics_repo = MetricsRepository(session)
 
-                        existing = await repo_store.get_by_full_name(full_name)
-                        if not existing:
+                    rows: list[dict] = []
+                    snapshots: dict = {}
+                    for existing in await repo_store.get_by_full_names(batch):
+                        gh_repo = gh_repos.get(existing.full_name)
+                        if not gh_repo:
+                            logger.warning("Repo not found on GitHub", repo=existing.full_name)
                             continue
 
-                        # Check if metrics changed
-                        stars_changed = existing.stars_count != gh_repo.stars_count
-                        forks_changed = existing.forks_count != gh_repo.forks_count
-
-                        # Update repo data
-                        await repo_store.upsert_by_full_name(
-                            {
-                                "full_name": full_name,
-                                "stars_count": gh_repo.stars_count,
-                                "forks_count": gh_repo.forks_count,
-                                "watchers_count": gh_repo.watchers_count,
-                                "open_issues_count": gh_repo.open_issues_count,
-                                "last_commit_at": gh_repo.last_commit_at,
-                                "last_release_tag": gh_repo.last_release_tag,
-                                "last_release_at": gh_repo.last_release_at,
-                                "repo_updated_at": gh_repo.updated_at,
-                            }
-                        )
-
-                        # Record daily metrics snapshot for trend analysis
-                        await metrics_repo.upsert_daily_snapshot(
-                            entity_type="repo",
-                            entity_id=existing.id,
-                            metrics={
-                                "stars_count": gh_repo.stars_count,
-                                "forks_count": gh_repo.forks_count,
-                                "watchers_count": gh_repo.watchers_count,
-                                "open_issues_count": gh_repo.open_issues_count,
-                            },
+                        # Changed metrics mean the repo needs re-processing
+                        changed = (
+                            existing.stars_count != gh_repo.stars_count
+                            or existing.forks_count != gh_repo.forks_count
                         )
-                        snapshots_recorded += 1
-
-                        if stars_changed or forks_changed:
-                            existing.is_processed = False
-
-                        updated += 1
-                    except Exception:
-                        logger.exception("Error updating repo", repo=full_name)
+                        row = {
+                            "full_name": existing.full_name,
+                            # NOT NULL columns, checked even when the row conflicts
+                            "name": existing.name,
+                            "owner": existing.owner,
+                            "html_url": existing.html_url,
+                            "stars_count": gh_repo.stars_count,
+                            "forks_count": gh_repo.forks_count,
+                            "watchers_count": gh_repo.watchers_count,
+                            "open_issues_count": gh_repo.open_issues_count,
+                            "last_commit_at": gh_repo.last_commit_at,
+                            "last_release_tag": gh_repo.last_release_tag,
+                            "last_release_at": gh_repo.last_release_at,
+                            "repo_updated_at": gh_repo.updated_at,
+                            "is_processed": existing.is_processed and not changed,
+                        }
+                        rows.append(row)
+
+                        # Daily metrics snapshot for trend analysis
+                        snapshots[existing.id] = {
+                            "stars_count": gh_repo.stars_count,
+                            "forks_count": gh_repo.forks_count,
+                            "watchers_count": gh_repo.watchers_count,
+                            "open_issues_count": gh_repo.open_issues_count,
+                        }
 
-                await session.commit()
+                    await repo_store.bulk_upsert_by_full_name(rows)
+                    snapshots_recorded += await metrics_repo.upsert_daily_snapshots_bulk(
+                        entity_type="repo", snapshots=snapshots
+                    )
+                    await session.commit()
+                updated += len(rows)
+            except Exception:
+                logger.exception("Error updating repo batch", batch_start=i)
 
             logger.info(
                 "Batch updated",
@@ -407,9 +386,8 @@ async def _update_existing_repos():
                 total_batches=(len(full_names) + batch_size - 1) // batch_size,
                 updated=updated,
                 snapshots=snapshots_recorded,
+                points_remaining=collector.scheduler.remaining,
             )
-            # Small delay between batches to avoid rate limiting
-            await _asyncio.sleep(2)
 
     logger.info(
         "Repo update completed",
@@ -419,46 +397,47 @@ async def _update_existing_repos():
     )
 
 
-@celery_app.task(name="src.workers.tasks.collection.collect_semantic_scholar")
-def collect_semantic_scholar(query: str = "machine learning", max_results: int = 100):
+@async_task(name="src.workers.tasks.collection.collect_semantic_scholar")
+async def collect_semantic_scholar(query: str = "machine learning", max_results: int = 100):
     """Enrich papers with Semantic Scholar data."""
-    _run_async(_collect_s2(query, max_results))
+    await _collect_s2(query, max_results)
+    from src.workers.tasks.processing import refresh_paper_analytics
+    refresh_paper_analytics.delay()
 
 
 async def _collect_s2(query: str, max_results: int):
     from src.collectors.semantic_scholar import SemanticScholarCollector
-    from src.storage.database import create_async_session_factory
     from src.storage.repositories.paper_repo import PaperRepository
 
-    async_session_factory = create_async_session_factory()
+    async_session_factory = get_session_factory()
 
     settings = get_settings()
 
-    collected = 0
+    rows: list[dict] = []
     async with SemanticScholarCollector(
         api_key=settings.SEMANTIC_SCHOLAR_API_KEY
     ) as collector:
-        async with async_session_factory() as session:
-            repo = PaperRepository(session)
-            async for result in collector.search(
-                query=query, max_results=max_results
-            ):
-                paper = result.data
-                if paper.arxiv_id:
-                    await repo.upsert_by_arxiv_id(
-                        {
-                            "arxiv_id": paper.arxiv_id,
-                            "semantic_scholar_id": paper.s2_id,
-                            "doi": paper.doi,
-                            "citation_count": paper.citation_count,
-                            "influential_citation_count": paper.influential_citation_count,
-                        }
-                    )
-                    collected += 1
+        async for result in collector.search(
+            query=query, max_results=max_results
+        ):
+            paper = result.data
+            if paper.arxiv_id:
+                rows.append(
+                    {
+                        "arxiv_id": paper.arxiv_id,
+                        "semantic_scholar_id": paper.s2_id,
+                        "doi": paper.doi,
+                        "citation_count": paper.citation_count,
+                        "influential_citation_count": paper.influential_citation_count,
+                    }
+                )
 
-            await session.commit()
+    async with async_session_factory() as session:
+        repo = PaperRepository(session)
+        await repo.bulk_upsert_by_arxiv_id(rows)
+        await session.commit()
 
-    logger.info("S2 enrichment completed", collected=collected)
+    logger.info("S2 enrichment completed", collected=len(rows))
 
 
 # ============================================================
@@ -584,28 +563,31 @@ def _build_paper_arxiv_queries() -> list[dict]:
     return queries
 
 
-@celery_app.task(
+@async_task(
     name="src.workers.tasks.collection.collect_papers_comprehensive",
     soft_time_limit=86400,   # 24 hours
     time_limit=90000,        # 25 hours hard limit
 )
-def collect_papers_comprehensive():
+async def collect_papers_comprehensive():
     """Collect papers from ArXiv + trigger S2 collection in parallel, then process."""
     # Trigger S2 as a separate task so they run in parallel
     collect_papers_s2.delay()
-    _run_async(_collect_papers_arxiv())
-    from src.workers.tasks.processing import process_unprocessed_papers
+    await _collect_papers_arxiv()
+    from src.workers.tasks.processing import process_unprocessed_papers, refresh_paper_analytics
     process_unprocessed_papers.delay()
+    refresh_paper_analytics.delay()
 
 
-@celery_app.task(
+@async_task(
     name="src.workers.tasks.collection.collect_papers_s2",
     soft_time_limit=86400,
     time_limit=90000,
 )
-def collect_papers_s2():
+async def collect_papers_s2():
     """Collect papers from Semantic Scholar (runs in parallel with ArXiv)."""
-    _run_async(_collect_papers_s2())
+    await _collect_papers_s2()
+    from src.workers.tasks.processing import refresh_paper_analytics
+    refresh_paper_analytics.delay()
 
 
 def _build_paper_s2_queries() -> list[dict]:
@@ -700,15 +682,14 @@ async def _collect_papers_arxiv():
     import asyncio as _asyncio
 
     from src.collectors.arxiv import ArxivCollector
-    from src.storage.database import create_async_session_factory
     from src.storage.repositories.paper_repo import PaperRepository
 
-    async_session_factory = create_async_session_factory()
+    async_session_factory = get_session_factory()
 
     total_collected = 0
     total_skipped = 0
     seen_arxiv_ids: set[str] = set()
-    commit_every = 100
+    flush_every = 500
 
     arxiv_queries = _build_paper_arxiv_queries()
     logger.info("Starting MAXIMUM ArXiv collection", total_queries=len(arxiv_queries))
@@ -717,7 +698,7 @@ async def _collect_papers_arxiv():
         for idx, q in enumerate(arxiv_queries, 1):
             batch_collected = 0
             batch_skipped = 0
-            pending = 0
+            pending: list[dict] = []
             try:
                 async with async_session_factory() as session:
                     repo = PaperRepository(session)
@@ -727,27 +708,16 @@ async def _collect_papers_arxiv():
                             batch_skipped += 1
                             continue
                         seen_arxiv_ids.add(paper.arxiv_id)
-                        await repo.upsert_by_arxiv_id(
-                            {
-                                "arxiv_id": paper.arxiv_id,
-                                "title": paper.title,
-                                "abstract": paper.abstract,
-                                "authors": paper.authors,
-                                "categories": paper.categories,
-                                "published_date": paper.published_date,
-                                "updated_date": paper.updated_date,
-                                "pdf_url": paper.pdf_url,
-                                "source": "arxiv",
-                                "source_url": f"https://arxiv.org/abs/{paper.arxiv_id}",
-                            }
-                        )
-                        batch_collected += 1
-                        pending += 1
-                        if pending >= commit_every:
+                        pending.append(_paper_data_from_arxiv(paper))
+                        if len(pending) >= flush_every:
+                            await repo.bulk_upsert_by_arxiv_id(pending)
                             await session.commit()
-                            pending = 0
-                    if pending > 0:
+                            batch_collected += len(pending)
+                            pending = []
+                    if pending:
+                        await repo.bulk_upsert_by_arxiv_id(pending)
                         await session.commit()
+                        batch_collected += len(pending)
             except Exception:
                 logger.exception("Error in ArXiv query", query_idx=idx, query=q)
 
@@ -778,10 +748,9 @@ async def _collect_papers_s2():
     import asyncio as _asyncio
 
     from src.collectors.semantic_scholar import SemanticScholarCollector
-    from src.storage.database import create_async_session_factory
     from src.storage.repositories.paper_repo import PaperRepository
 
-    async_session_factory = create_async_session_factory()
+    async_session_factory = get_session_factory()
     settings = get_settings()
 
     s2_collected = 0
@@ -852,18 +821,21 @@ async def _collect_papers_s2():
 # Citation Enrichment via Semantic Scholar Batch API
 # ============================================================
 
-@celery_app.task(
+@async_task(
     name="src.workers.tasks.collection.enrich_paper_citations",
     soft_time_limit=7200,
     time_limit=7500,
 )
-def enrich_paper_citations():
+async def enrich_paper_citations():
     """Enrich existing papers with citation data from Semantic Scholar Batch API."""
-    _run_async(_enrich_paper_citations())
+    await _enrich_paper_citations()
+    from src.workers.tasks.processing import refresh_paper_analytics
+    refresh_paper_analytics.delay()
 
 
-def _enrich_paper_from_s2(paper, s2_paper):
-    """Fill missing fields on a Paper from Semantic Scholar data."""
+def _enrich_paper_from_s2(paper, s2_paper) -> bool:
+    """Fill missing fields on a Paper from Semantic Scholar data; True if authors were set."""
+    filled_authors = False
     paper.citation_count = s2_paper.citation_count
     paper.influential_citation_count = s2_paper.influential_citation_count
     if not paper.semantic_scholar_id:
@@ -872,18 +844,20 @@ def _enrich_paper_from_s2(paper, s2_paper):
         paper.abstract = s2_paper.abstract
     if (not paper.authors or paper.authors == []) and s2_paper.authors:
         paper.authors = s2_paper.authors
+        filled_authors = True
     if not paper.topics and s2_paper.fields_of_study:
         paper.topics = s2_paper.fields_of_study
+    return filled_authors
 
 
 async def _enrich_paper_citations():
     import asyncio as _asyncio
 
     from src.collectors.semantic_scholar import SemanticScholarCollector
-    from src.storage.database import create_async_session_factory
+    from src.storage.repositories.author_repo import AuthorRepository
     from src.storage.repositories.paper_repo import PaperRepository
 
-    async_session_factory = create_async_session_factory()
+    async_session_factory = get_session_factory()
     settings = get_settings()
 
     enriched = 0
@@ -926,22 +900,26 @@ async def _enrich_paper_citations():
 
                 async with async_session_factory() as session:
                     repo = PaperRepository(session)
+                    authored = {}
                     for s2_paper in s2_papers:
                         s2_aid = strip_version(s2_paper.arxiv_id) if s2_paper.arxiv_id else None
                         if s2_aid and s2_aid in id_map:
                             paper = await repo.get_by_id(id_map[s2_aid])
                             if paper:
-                                _enrich_paper_from_s2(paper, s2_paper)
+                                if _enrich_paper_from_s2(paper, s2_paper):
+                                    authored[paper.id] = paper.authors
                                 if s2_paper.doi and not paper.doi:
                                     existing = await session.execute(
                                         select(Paper).where(Paper.doi == s2_paper.doi)
                                     )
                                     existing_paper = existing.scalar_one_or_none()
                                     if existing_paper:
-                                        _enrich_paper_from_s2(existing_paper, s2_paper)
+                                        if _enrich_paper_from_s2(existing_paper, s2_paper):
+                                            authored[existing_paper.id] = existing_paper.authors
                                     else:
                                         paper.doi = s2_paper.doi
                                 enriched += 1
+                    await AuthorRepository(session).sync_paper_authors(authored)
                     await session.commit()
 
             except Exception:
@@ -986,162 +964,162 @@ POPULAR_PIPELINE_TAGS = [
 HF_API_BASE = "https://huggingface.co/api"
 
 
-@celery_app.task(
+@async_task(
     name="src.workers.tasks.collection.collect_hf_models",
     soft_time_limit=3600,
     time_limit=3900,
 )
-def collect_hf_models():
+async def collect_hf_models():
     """Collect trending models from HuggingFace API and store in DB."""
-    _run_async(_collect_hf_models())
+    await _collect_hf_models()
 
 
 async def _collect_hf_models():
-    import httpx
-
-    from src.storage.database import create_async_session_factory
     from src.storage.repositories.hf_repo import HFModelRepository
 
-    async_session_factory = create_async_session_factory()
+    async_session_factory = get_session_factory()
     collected = 0
     seen_ids: set[str] = set()
 
-    async with httpx.AsyncClient(timeout=30) as client:
-        # Collect for each pipeline tag + overall top
-        queries: list[dict] = []
+    client = get_http_client()
+    # Collect for each pipeline tag + overall top
+    queries: list[dict] = []
 
-        # Overall top by downloads and likes
-        queries.append({"sort": "downloads", "direction": "-1", "limit": 50, "full": "true"})
-        queries.append({"sort": "likes", "direction": "-1", "limit": 50, "full": "true"})
+    # Overall top by downloads and likes
+    queries.append({"sort": "downloads", "direction": "-1", "limit": 50, "full": "true"})
+    queries.append({"sort": "likes", "direction": "-1", "limit": 50, "full": "true"})
 
-        # Per pipeline tag
-        for tag in POPULAR_PIPELINE_TAGS:
-            queries.append({"filter": tag, "sort": "downloads", "direction": "-1", "limit": 50, "full": "true"})
-            queries.append({"filter": tag, "sort": "likes", "direction": "-1", "limit": 50, "full": "true"})
+    # Per pipeline tag
+    for tag in POPULAR_PIPELINE_TAGS:
+        queries.append({"filter": tag, "sort": "downloads", "direction": "-1", "limit": 50, "full": "true"})
+        queries.append({"filter": tag, "sort": "likes", "direction": "-1", "limit": 50, "full": "true"})
 
-        for params in queries:
-            try:
-                resp = await client.get(f"{HF_API_BASE}/models", params=params)
-                resp.raise_for_status()
-                raw = resp.json()
+    for params in queries:
+        try:
+            resp = await client.get(f"{HF_API_BASE}/models", params=params)
+            resp.raise_for_status()
+            raw = resp.json()
 
-                async with async_session_factory() as session:
-                    repo = HFModelRepository(session)
-                    for m in raw:
-                        mid = m.get("modelId") or m.get("id", "")
-                        if not mid or mid in seen_ids:
-                            continue
-                        seen_ids.add(mid)
-
-                        architecture = None
-                        config = m.get("config") or {}
-                        architectures = config.get("architectures")
-                        if architectures and isinstance(architectures, list):
-                            architecture = architectures[0]
-
-                        model_type = config.get("model_type")
-
-                        parameter_count = None
-                        safetensors = m.get("safetensors")
-                        if safetensors and isinstance(safetensors, dict):
-                            total = safetensors.get("total")
-                            if total:
-                                parameter_count = total
-
-                        tags = m.get("tags") or []
-                        languages = [t.replace("language:", "") for t in tags if t.startswith("language:")]
-
-                        license_val = None
-                        card_data = m.get("cardData") or {}
-                        license_val = card_data.get("license") or m.get("license")
-
-                        author = m.get("author") or (mid.split("/")[0] if "/" in mid else None)
-
-                        def _parse_iso(val):
-                            if not val or not isinstance(val, str):
-                                return val
-                            try:
-                                return datetime.fromisoformat(val.replace("Z", "+00:00")).replace(tzinfo=None)
-                            except (ValueError, TypeError):
-                                return None
-
-                        await repo.upsert_by_model_id({
-                            "model_id": mid,
-                            "author": author,
-                            "downloads": m.get("downloads", 0),
-                            "likes": m.get("likes", 0),
-                            "pipeline_tag": m.get("pipeline_tag"),
-                            "architecture": architecture,
-                            "model_type": model_type,
-                            "library_name": m.get("library_name"),
-                            "tags": tags[:50] if tags else None,
-                            "languages": languages[:20] if languages else None,
-                            "license": license_val,
-                            "parameter_count": parameter_count,
-                            "created_at_hf": _parse_iso(m.get("createdAt")),
-                            "last_modified_hf": _parse_iso(m.get("lastModified")),
-                        })
-                        collected += 1
-                    await session.commit()
-            except Exception:
-                logger.exception("Error collecting HF models", params=params)
+            rows: list[dict] = []
+            for m in raw:
+                mid = m.get("modelId") or m.get("id", "")
+                if not mid or mid in seen_ids:
+                    continue
+                seen_ids.add(mid)
+
+                architecture = None
+                config = m.get("config") or {}
+                architectures = config.get("architectures")
+                if architectures and isinstance(architectures, list):
+                    architecture = architectures[0]
+
+                model_type = config.get("model_type")
+
+                parameter_count = None
+                safetensors = m.get("safetensors")
+                if safetensors and isinstance(safetensors, dict):
+                    total = safetensors.get("total")
+                    if total:
+                        parameter_count = total
+
+                tags = m.get("tags") or []
+                languages = [t.replace("language:", "") for t in tags if t.startswith("language:")]
+
+                license_val = None
+                card_data = m.get("cardData") or {}
+                license_val = card_data.get("license") or m.get("license")
+
+                author = m.get("author") or (mid.split("/")[0] if "/" in mid else None)
+
+                def _parse_iso(val):
+                    if not val or not isinstance(val, str):
+                        return val
+                    try:
+                        return datetime.fromisoformat(val.replace("Z", "+00:00")).replace(tzinfo=None)
+                    except (ValueError, TypeError):
+                        return None
+
+                rows.append({
+                    "model_id": mid,
+                    "author": author,
+                    "downloads": m.get("downloads", 0),
+                    "likes": m.get("likes", 0),
+                    "pipeline_tag": m.get("pipeline_tag"),
+                    "architecture": architecture,
+                    "model_type": model_type,
+                    "library_name": m.get("library_name"),
+                    "tags": tags[:50] if tags else None,
+                    "languages": languages[:20] if languages else None,
+                    "license": license_val,
+                    "parameter_count": parameter_count,
+                    "created_at_hf": _parse_iso(m.get("createdAt")),
+                    "last_modified_hf": _parse_iso(m.get("lastModified")),
+                })
+
+            async with async_session_factory() as session:
+                repo = HFModelRepository(session)
+                await repo.bulk_upsert_by_model_id(rows)
+                await session.commit()
+            collected += len(rows)
+        except Exception:
+            logger.exception("Error collecting HF models", params=params)
 
     logger.info("HuggingFace model collection completed", collected=collected, unique=len(seen_ids))
 
 
-@celery_app.task(name="src.workers.tasks.collection.collect_hf_daily_papers")
-def collect_hf_daily_papers():
+@async_task(name="src.workers.tasks.collection.collect_hf_daily_papers")
+async def collect_hf_daily_papers():
     """Collect daily papers from HuggingFace API and store in DB."""
-    _run_async(_collect_hf_daily_papers())
+    await _collect_hf_daily_papers()
 
 
 async def _collect_hf_daily_papers():
-    import httpx
-
-    from src.storage.database import create_async_session_factory
     from src.storage.repositories.hf_repo import HFPaperRepository
 
-    async_session_factory = create_async_session_factory()
+    async_session_factory = get_session_factory()
     collected = 0
     today = date.today()
 
-    async with httpx.AsyncClient(timeout=15) as client:
-        try:
-            resp = await client.get(f"{HF_API_BASE}/daily_papers")
-            resp.raise_for_status()
-            raw = resp.json()
-
-            async with async_session_factory() as session:
-                repo = HFPaperRepository(session)
-                for item in raw:
-                    paper = item.get("paper") or {}
-                    arxiv_id = paper.get("id")
-                    if not arxiv_id:
-                        continue
+    client = get_http_client()
+    try:
+        resp = await client.get(f"{HF_API_BASE}/daily_papers", timeout=15)
+        resp.raise_for_status()
+        raw = resp.json()
+
+        rows: list[dict] = []
+        for item in raw:
+            paper = item.get("paper") or {}
+            arxiv_id = paper.get("id")
+            if not arxiv_id:
+                continue
+
+            title = item.get("title") or paper.get("title", "")
+            authors_raw = paper.get("authors") or []
+            authors = [a.get("name", "") for a in authors_raw if a.get("name")]
+
+            pub_at = paper.get("publishedAt")
+            if pub_at and isinstance(pub_at, str):
+                try:
+                    pub_at = datetime.fromisoformat(pub_at.replace("Z", "+00:00")).replace(tzinfo=None)
+                except (ValueError, TypeError):
+                    pub_at = None
+
+            rows.append({
+                "arxiv_id": arxiv_id,
+                "title": title,
+                "authors": authors,
+                "upvotes": paper.get("upvotes", 0),
+                "published_at": pub_at,
+                "collected_date": today,
+            })
 
-                    title = item.get("title") or paper.get("title", "")
-                    authors_raw = paper.get("authors") or []
-                    authors = [a.get("name", "") for a in authors_raw if a.get("name")]
-
-                    pub_at = paper.get("publishedAt")
-                    if pub_at and isinstance(pub_at, str):
-                        try:
-                            pub_at = datetime.fromisoformat(pub_at.replace("Z", "+00:00")).replace(tzinfo=None)
-                        except (ValueError, TypeError):
-                            pub_at = None
-
-                    await repo.upsert_by_arxiv_id({
-                        "arxiv_id": arxiv_id,
-                        "title": title,
-                        "authors": authors,
-                        "upvotes": paper.get("upvotes", 0),
-                        "published_at": pub_at,
-                        "collected_date": today,
-                    })
-                    collected += 1
-                await session.commit()
-        except Exception:
-            logger.exception("Error collecting HF daily papers")
+        async with async_session_factory() as session:
+            repo = HFPaperRepository(session)
+            await repo.bulk_upsert_by_arxiv_id(rows)
+            await session.commit()
+        collected = len(rows)
+    except Exception:
+        logger.exception("Error collecting HF daily papers")
 
     logger.info("HuggingFace daily papers collection completed", collected=collected)
 
@@ -1150,116 +1128,116 @@ async def _collect_hf_daily_papers():
 # Community Posts Collection (HN, Dev.to, Mastodon, Lemmy)
 # ============================================================
 
-@celery_app.task(name="src.workers.tasks.collection.collect_hackernews")
-def collect_hackernews():
+@async_task(name="src.workers.tasks.collection.collect_hackernews")
+async def collect_hackernews():
     """Collect AI-related stories from Hacker News."""
-    _run_async(_collect_hackernews())
+    await _collect_hackernews()
 
 
 async def _collect_hackernews():
     from src.services.hackernews_service import fetch_all_hn_ai_stories
-    from src.storage.database import create_async_session_factory
     from src.storage.repositories.community_repo import CommunityPostRepository
 
-    async_session_factory = create_async_session_factory()
+    async_session_factory = get_session_factory()
     collected = 0
 
     try:
         posts = await fetch_all_hn_ai_stories()
+        collected_at = datetime.now()
+        for post_data in posts:
+            post_data["collected_at"] = collected_at
         async with async_session_factory() as session:
             repo = CommunityPostRepository(session)
-            for post_data in posts:
-                post_data["collected_at"] = datetime.now()
-                await repo.upsert_by_platform_id(post_data)
-                collected += 1
+            await repo.bulk_upsert_by_platform_id(posts)
             await session.commit()
+        collected = len(posts)
     except Exception:
         logger.exception("Error collecting Hacker News")
 
     logger.info("HN collection completed", collected=collected)
 
 
-@celery_app.task(name="src.workers.tasks.collection.collect_devto")
-def collect_devto():
+@async_task(name="src.workers.tasks.collection.collect_devto")
+async def collect_devto():
     """Collect AI-related articles from Dev.to."""
-    _run_async(_collect_devto())
+    await _collect_devto()
 
 
 async def _collect_devto():
     from src.services.devto_service import fetch_all_devto_ai_articles
-    from src.storage.database import create_async_session_factory
     from src.storage.repositories.community_repo import CommunityPostRepository
 
-    async_session_factory = create_async_session_factory()
+    async_session_factory = get_session_factory()
     collected = 0
 
     try:
         posts = await fetch_all_devto_ai_articles()
+        collected_at = datetime.now()
+        for post_data in posts:
+            post_data["collected_at"] = collected_at
         async with async_session_factory() as session:
             repo = CommunityPostRepository(session)
-            for post_data in posts:
-                post_data["collected_at"] = datetime.now()
-                await repo.upsert_by_platform_id(post_data)
-                collected += 1
+            await repo.bulk_upsert_by_platform_id(posts)
             await session.commit()
+        collected = len(posts)
     except Exception:
         logger.exception("Error collecting Dev.to")
 
     logger.info("Dev.to collection completed", collected=collected)
 
 
-@celery_app.task(name="src.workers.tasks.collection.collect_mastodon")
-def collect_mastodon():
+@async_task(name="src.workers.tasks.collection.collect_mastodon")
+async def collect_mastodon():
     """Collect AI-related posts from Mastodon instances."""
-    _run_async(_collect_mastodon())
+    await _collect_mastodon()
 
 
 async def _collect_mastodon():
     from src.services.mastodon_service import fetch_all_mastodon_ai_posts
-    from src.storage.database import create_async_session_factory
     from src.storage.repositories.community_repo import CommunityPostRepository
 
-    async_session_factory = create_async_session_factory()
+    async_session_factory = get_session_factory()
     collected = 0
 
     try:
         posts = await fetch_all_mastodon_ai_posts()
+        collected_at = datetime.now()
+        for post_data in posts:
+            post_data["collected_at"] = collected_at
         async with async_session_factory() as session:
             repo = CommunityPostRepository(session)
-            for post_data in posts:
-                post_data["collected_at"] = datetime.now()
-                await repo.upsert_by_platform_id(post_data)
-                collected += 1
+            await repo.bulk_upsert_by_platform_id(posts)
             await session.commit()
+        collected = len(posts)
     except Exception:
         logger.exception("Error collecting Mastodon")
 
     logger.info("Mastodon collection completed", collected=collected)
 
 
-@celery_app.task(name="src.workers.tasks.collection.collect_lemmy")
-def collect_lemmy():
+@async_task(name="src.workers.tasks.collection.collect_lemmy")
+async def collect_lemmy():
     """Collect AI-related posts from Lemmy instances."""
-    _run_async(_collect_lemmy())
+    await _collect_lemmy()
 
 
 async def _collect_lemmy():
     from src.services.lemmy_service import fetch_all_lemmy_ai_posts
-    from src.storage.database import create_async_session_factory
     from src.storage.repositories.community_repo import CommunityPostRepository
 
-    async_session_factory = create_async_session_factory()
+    async_session_factory = get_session_factory()
     collected = 0
 
     try:
         posts = await fetch_all_lemmy_ai_posts()
+        collected_at = datetime.now()
+        for post_data in posts:
+            post_data["collected_at"] = collected_at
         async with async_session_factory() as session:
             repo = CommunityPostRepository(session)
-            for post_data in posts:
-                post_data["collected_at"] = datetime.now()
-                await repo.upsert_by_platform_id(post_data)
-                collected += 1
+            await repo.bulk_upsert_by_platform_id(posts)
             await session.commit()
+        collected = len(posts)
     except Exception:
         logger.exception("Error collecting Lemmy")
 
@@ -1280,22 +1258,21 @@ def collect_all_community():
 # GitHub Discussions Collection
 # ============================================================
 
-@celery_app.task(
+@async_task(
     name="src.workers.tasks.collection.collect_github_discussions",
     soft_time_limit=3600,
     time_limit=3900,
 )
-def collect_github_discussions():
+async def collect_github_discussions():
     """Collect discussions from AI-related GitHub repositories."""
-    _run_async(_collect_github_discussions())
+    await _collect_github_discussions()
 
 
 async def _collect_github_discussions():
     from src.services.github_discussions_service import fetch_github_discussions
-    from src.storage.database import create_async_session_factory
     from src.storage.repositories.github_discussion_repo import GitHubDiscussionRepository
 
-    async_session_factory = create_async_session_factory()
+    async_session_factory = get_session_factory()
     settings = get_settings()
 
     if not settings.GITHUB_TOKEN:
@@ -1310,13 +1287,14 @@ async def _collect_github_discussions():
             query="AI OR LLM OR machine learning",
             limit=200,
         )
+        collected_at = datetime.now()
+        for disc_data in discussions:
+            disc_data["collected_at"] = collected_at
         async with async_session_factory() as session:
             repo = GitHubDiscussionRepository(session)
-            for disc_data in discussions:
-                disc_data["collected_at"] = datetime.now()
-                await repo.upsert_by_discussion_id(disc_data)
-                collected += 1
+            await repo.bulk_upsert_by_discussion_id(discussions)
             await session.commit()
+        collected = len(discussions)
     except Exception:
         logger.exception("Error collecting GitHub Discussions")
 
@@ -1327,16 +1305,16 @@ async def _collect_github_discussions():
 # OpenReview Collection (papers + reviews + paper linking)
 # ============================================================
 
-@celery_app.task(
+@async_task(
     name="src.workers.tasks.collection.collect_openreview",
     soft_time_limit=14400,
     time_limit=15000,
 )
-def collect_openreview():
+async def collect_openreview():
     """Collect ALL papers from OpenReview venues (paginated, no reviews).
     After papers are collected, triggers review enrichment and paper linking.
     """
-    _run_async(_collect_openreview_papers())
+    await _collect_openreview_papers()
     enrich_openreview_reviews.delay()
     link_openreview_papers.delay()
 
@@ -1345,29 +1323,25 @@ async def _collect_openreview_papers():
     import asyncio as _asyncio
 
     from src.services.openreview_service import DEFAULT_VENUES, fetch_openreview_notes_paginated
-    from src.storage.database import create_async_session_factory
     from src.storage.repositories.openreview_repo import OpenReviewRepository
 
-    async_session_factory = create_async_session_factory()
+    async_session_factory = get_session_factory()
     total_collected = 0
-    commit_every = 200
+    commit_every = 1000
 
     for venue_id in DEFAULT_VENUES:
         try:
             notes = await fetch_openreview_notes_paginated(venue_id=venue_id)
-            pending = 0
+            collected_at = datetime.now()
+            for note_data in notes:
+                note_data["collected_at"] = collected_at
             async with async_session_factory() as session:
                 repo = OpenReviewRepository(session)
-                for note_data in notes:
-                    note_data["collected_at"] = datetime.now()
-                    await repo.upsert_by_note_id(note_data)
-                    total_collected += 1
-                    pending += 1
-                    if pending >= commit_every:
-                        await session.commit()
-                        pending = 0
-                if pending > 0:
+                for i in range(0, len(notes), commit_every):
+                    batch = notes[i : i + commit_every]
+                    await repo.bulk_upsert_by_note_id(batch)
                     await session.commit()
+                    total_collected += len(batch)
             logger.info("OpenReview venue done", venue=venue_id, collected=len(notes))
         except Exception:
             logger.exception("Error collecting OpenReview venue", venue=venue_id)
@@ -1376,14 +1350,14 @@ async def _collect_openreview_papers():
     logger.info("OpenReview paper collection completed", total=total_collected)
 
 
-@celery_app.task(
+@async_task(
     name="src.workers.tasks.collection.enrich_openreview_reviews",
     soft_time_limit=14400,
     time_limit=15000,
 )
-def enrich_openreview_reviews():
+async def enrich_openreview_reviews():
     """Fetch reviews for OpenReview papers that don't have reviews yet."""
-    _run_async(_enrich_openreview_reviews())
+    await _enrich_openreview_reviews()
 
 
 async def _enrich_openreview_reviews():
@@ -1392,10 +1366,9 @@ async def _enrich_openreview_reviews():
     from sqlalchemy import select
 
     from src.services.openreview_service import fetch_reviews_batch
-    from src.storage.database import create_async_session_factory
     from src.storage.models.openreview_note import OpenReviewNote
 
-    async_session_factory = create_async_session_factory()
+    async_session_factory = get_session_factory()
 
     # Get all notes without reviews
     async with async_session_factory() as session:
@@ -1464,10 +1437,10 @@ async def _enrich_openreview_reviews():
     logger.info("OpenReview review enrichment completed", enriched=enriched)
 
 
-@celery_app.task(name="src.workers.tasks.collection.link_openreview_papers")
-def link_openreview_papers():
+@async_task(name="src.workers.tasks.collection.link_openreview_papers")
+async def link_openreview_papers():
     """Link OpenReview notes to existing papers in DB by matching normalized titles."""
-    _run_async(_link_openreview_papers())
+    await _link_openreview_papers()
 
 
 async def _link_openreview_papers():
@@ -1475,11 +1448,10 @@ async def _link_openreview_papers():
 
     from sqlalchemy import select
 
-    from src.storage.database import create_async_session_factory
     from src.storage.models.openreview_note import OpenReviewNote
     from src.storage.models.paper import Paper
 
-    async_session_factory = create_async_session_factory()
+    async_session_factory = get_session_factory()
 
     def clean_for_search(t: str) -> str:
         """Remove special chars for ILIKE search."""
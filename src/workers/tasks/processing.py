@@ -1,37 +1,34 @@
 """Processing tasks for classifying, summarizing, and embedding."""
 
-import asyncio
-from datetime import date
+import uuid
 
 from src.core.logging import get_logger
-from src.workers.celery_app import celery_app
+from src.workers.runtime import (
+    async_task,
+    get_http_client,
+    get_session_factory,
+    get_vector_store,
+)
 
 logger = get_logger(__name__)
 
 
-def _run_async(coro):
-    loop = asyncio.new_event_loop()
-    try:
-        return loop.run_until_complete(coro)
-    finally:
-        loop.close()
-
-
-@celery_app.task(name="src.workers.tasks.processing.process_unprocessed_papers")
-def process_unprocessed_papers(batch_size: int = 50):
+@async_task(name="src.workers.tasks.processing.process_unprocessed_papers")
+async def process_unprocessed_papers(batch_size: int = 50):
     """Process unprocessed papers: embed + upsert to Qdrant."""
-    _run_async(_process_papers(batch_size))
+    await _process_papers(batch_size)
 
 
 async def _process_papers(batch_size: int):
-    from src.processors.embedding import EmbeddingGenerator
-    from src.storage.database import create_async_session_factory
+    from src.processors.embedding_service import get_embedding_service
+    from src.processors.sparse import BM25SparseEncoder, paper_lexical_text
+    from src.services.reindexer import paper_embedding_text, paper_payload
     from src.storage.repositories.paper_repo import PaperRepository
-    from src.storage.vector.qdrant_client import VectorStore
 
-    async_session_factory = create_async_session_factory()
-    embedding_gen = EmbeddingGenerator()
-    vector_store = VectorStore()
+    async_session_factory = get_session_factory()
+    sparse_encoder = BM25SparseEncoder()
+    vector_store = get_vector_store()
+    embedding_service = get_embedding_service(vector_store.collection_model("papers"))
 
     async with async_session_factory() as session:
         repo = PaperRepository(session)
@@ -44,31 +41,21 @@ async def _process_papers(batch_size: int):
         logger.info("Processing papers", count=len(papers))
 
         # Batch embed all papers at once
-        texts = [
-            f"{paper.title}\n\n{paper.abstract or ''}"
-            for paper in papers
-        ]
-        embeddings = embedding_gen.embed_batch(texts)
+        texts = [paper_embedding_text(paper) for paper in papers]
+        embeddings = await embedding_service.embed_batch(texts)
 
         points = []
-        for paper, embedding in zip(papers, embeddings):
+        point_texts = []
+        sparse_points = []
+        for paper, text, embedding in zip(papers, texts, embeddings):
             try:
                 points.append({
                     "id": str(paper.id),
                     "vector": embedding,
-                    "payload": {
-                        "arxiv_id": paper.arxiv_id,
-                        "title": paper.title,
-                        "abstract": (paper.abstract or "")[:500],
-                        "categories": paper.categories or [],
-                        "topics": paper.topics or [],
-                        "keywords": paper.keywords or [],
-                        "published_date": str(paper.published_date) if paper.published_date else None,
-                        "citation_count": paper.citation_count,
-                        "source_type": "paper",
-                        "url": paper.source_url,
-                    },
+                    "payload": paper_payload(paper),
                 })
+                point_texts.append(text)
+                sparse_points.append(sparse_encoder.to_point(points[-1], paper_lexical_text(paper)))
                 paper.is_processed = True
             except Exception as e:
                 logger.error(
@@ -78,28 +65,35 @@ async def _process_papers(batch_size: int):
                 )
 
         if points:
-            vector_store.upsert_batch(collection="papers", points=points)
+            vector_store.upsert_batch(
+                collection="papers",
+                points=points,
+                texts=point_texts,
+                model=embedding_service.model_name,
+                sparse_points=sparse_points,
+            )
 
         await session.commit()
 
     logger.info("Paper processing completed", processed=len(papers))
 
 
-@celery_app.task(name="src.workers.tasks.processing.process_unprocessed_repos")
-def process_unprocessed_repos(batch_size: int = 50):
+@async_task(name="src.workers.tasks.processing.process_unprocessed_repos")
+async def process_unprocessed_repos(batch_size: int = 50):
     """Process unprocessed repositories: embed + upsert to Qdrant."""
-    _run_async(_process_repos(batch_size))
+    await _process_repos(batch_size)
 
 
 async def _process_repos(batch_size: int):
-    from src.processors.embedding import EmbeddingGenerator
-    from src.storage.database import create_async_session_factory
+    from src.processors.embedding_service import get_embedding_service
+    from src.processors.sparse import BM25SparseEncoder, repo_lexical_text
+    from src.services.reindexer import repo_embedding_text, repo_payload
     from src.storage.repositories.github_repo import GitHubRepository
-    from src.storage.vector.qdrant_client import VectorStore
 
-    async_session_factory = create_async_session_factory()
-    embedding_gen = EmbeddingGenerator()
-    vector_store = VectorStore()
+    async_session_factory = get_session_factory()
+    sparse_encoder = BM25SparseEncoder()
+    vector_store = get_vector_store()
+    embedding_service = get_embedding_service(vector_store.collection_model("repositories"))
 
     async with async_session_factory() as session:
         repo_store = GitHubRepository(session)
@@ -109,33 +103,23 @@ async def _process_repos(batch_size: int):
             return
 
         # Batch embed all repos at once
-        texts = []
-        for r in repos:
-            parts = [r.name, r.description or ""]
-            if r.readme_content:
-                parts.append(r.readme_content[:2000])
-            texts.append("\n\n".join(parts))
-        embeddings = embedding_gen.embed_batch(texts)
+        texts = [repo_embedding_text(r) for r in repos]
+        embeddings = await embedding_service.embed_batch(texts)
 
         points = []
-        for repository, embedding in zip(repos, embeddings):
+        point_texts = []
+        sparse_points = []
+        for repository, text, embedding in zip(repos, texts, embeddings):
             try:
                 points.append({
                     "id": str(repository.id),
                     "vector": embedding,
-                    "payload": {
-                        "full_name": repository.full_name,
-                        "title": repository.name,
-                        "description": repository.description or "",
-                        "content": repository.description or "",
-                        "primary_language": repository.primary_language,
-                        "topics": repository.topics or [],
-                        "frameworks": repository.frameworks or [],
-                        "stars_count": repository.stars_count,
-                        "source_type": "repository",
-                        "url": repository.html_url,
-                    },
+                    "payload": repo_payload(repository),
                 })
+                point_texts.append(text)
+                sparse_points.append(
+                    sparse_encoder.to_point(points[-1], repo_lexical_text(repository))
+                )
                 repository.is_processed = True
             except Exception as e:
                 logger.error(
@@ -145,97 +129,207 @@ async def _process_repos(batch_size: int):
                 )
 
         if points:
-            vector_store.upsert_batch(collection="repositories", points=points)
+            vector_store.upsert_batch(
+                collection="repositories",
+                points=points,
+                texts=point_texts,
+                model=embedding_service.model_name,
+                sparse_points=sparse_points,
+            )
 
         await session.commit()
 
 
-@celery_app.task(name="src.workers.tasks.processing.calculate_trending_scores")
-def calculate_trending_scores():
+@async_task(name="src.workers.tasks.processing.calculate_trending_scores")
+async def calculate_trending_scores():
     """Calculate trending scores for all entities."""
-    _run_async(_calculate_trending())
+    await _calculate_trending()
 
 
 async def _calculate_trending():
-    from datetime import datetime
-
-    from src.processors.trending import TrendingCalculator
-    from src.storage.database import create_async_session_factory
-    from src.storage.repositories.github_repo import GitHubRepository
+    from src.processors.trending import BatchTrendingCalculator
     from src.storage.repositories.metrics_repo import MetricsRepository
-    from src.storage.repositories.paper_repo import PaperRepository
 
-    async_session_factory = create_async_session_factory()
+    async_session_factory = get_session_factory()
     async with async_session_factory() as session:
         metrics_repo = MetricsRepository(session)
-        paper_repo = PaperRepository(session)
-        github_repo = GitHubRepository(session)
-        calculator = TrendingCalculator(metrics_repo)
+        calculator = BatchTrendingCalculator(metrics_repo)
 
-        # Calculate for recent papers
-        papers, _ = await paper_repo.list_papers(limit=500, sort_by="published_date")
+        paper_rows = await calculator.score_papers()
+        await metrics_repo.bulk_upsert_trending_scores(paper_rows)
 
-        for paper in papers:
-            try:
-                scores = await calculator.calculate_paper_score(
-                    paper_id=paper.id,
-                    citation_count=paper.citation_count,
-                    influential_citation_count=paper.influential_citation_count,
-                    published_date=datetime.combine(
-                        paper.published_date, datetime.min.time()
-                    )
-                    if paper.published_date
-                    else None,
-                )
+        repo_rows = await calculator.score_repos()
+        await metrics_repo.bulk_upsert_trending_scores(repo_rows)
 
-                await metrics_repo.upsert_trending_score(
-                    {
-                        "entity_type": "paper",
-                        "entity_id": paper.id,
-                        "activity_score": scores.activity_score,
-                        "community_score": scores.community_score,
-                        "academic_score": scores.academic_score,
-                        "recency_score": scores.recency_score,
-                        "total_score": scores.total_score,
-                        "category": (paper.topics[0] if paper.topics else None),
-                        "period_start": date.today(),
-                        "period_end": date.today(),
-                    }
-                )
-            except Exception as e:
-                logger.error("Failed to calculate paper trending", paper_id=str(paper.id), error=str(e))
+        await session.commit()
 
-        # Calculate for repositories
-        repos, _ = await github_repo.list_repos(limit=500, sort_by="stars_count")
+    logger.info(
+        "Trending scores calculated", papers=len(paper_rows), repositories=len(repo_rows)
+    )
 
-        for repo in repos:
-            try:
-                scores = await calculator.calculate_repo_score(
-                    repo_id=repo.id,
-                    stars_count=repo.stars_count,
-                    forks_count=repo.forks_count,
-                    open_issues_count=repo.open_issues_count,
-                    commit_count_30d=repo.commit_count_30d,
-                    last_commit_at=repo.last_commit_at,
-                )
 
-                await metrics_repo.upsert_trending_score(
-                    {
-                        "entity_type": "repository",
-                        "entity_id": repo.id,
-                        "activity_score": scores.activity_score,
-                        "community_score": scores.community_score,
-                        "academic_score": scores.academic_score,
-                        "recency_score": scores.recency_score,
-                        "total_score": scores.total_score,
-                        "category": (repo.topics[0] if repo.topics else None),
-                        "period_start": date.today(),
-                        "period_end": date.today(),
-                    }
+@async_task(name="src.workers.tasks.processing.refresh_paper_analytics")
+async def refresh_paper_analytics(full: bool = False):
+    """Fold papers changed since the last run into the analytics tables."""
+    from src.storage.repositories.analytics_repo import PaperAnalyticsRepository
+
+    async_session_factory = get_session_factory()
+    async with async_session_factory() as session:
+        await PaperAnalyticsRepository(session).refresh(full=full)
+        await session.commit()
+
+
+@async_task(
+    name="src.workers.tasks.processing.embed_document",
+    queue="processing",
+    acks_late=True,
+)
+async def embed_document(document_id: str):
+    """Download/ingest if needed, then chunk and embed one user document.
+
+    One task per document, so independent documents run in parallel up to
+    the worker's concurrency. Progress is committed to ``DocumentEmbedding``
+    after every batch and a redelivered or re-requested job resumes there.
+    """
+    await _embed_document(uuid.UUID(document_id))
+
+
+async def _embed_document(document_id: uuid.UUID):
+    from sqlalchemy import select
+
+    from src.processors.embedding_service import get_embedding_service
+    from src.processors.sparse import BM25SparseEncoder
+    from src.services.document_embedder import DocumentEmbedder
+    from src.services.document_text import DocumentTextService
+    from src.storage.models.document import Document
+    from src.storage.models.document_embedding import DocumentEmbedding
+
+    vector_store = get_vector_store()
+    # Embed with the model the active user_docs version was built with
+    embedder = DocumentEmbedder(
+        get_embedding_service(vector_store.collection_model("user_docs")),
+        vector_store,
+        BM25SparseEncoder(),
+        DocumentTextService(),
+    )
+
+    async_session_factory = get_session_factory()
+    async with async_session_factory() as session:
+        doc = await session.get(Document, document_id)
+        if doc is None:
+            logger.warning("Document to embed no longer exists", document_id=str(document_id))
+            return
+
+        emb = (
+            await session.execute(
+                select(DocumentEmbedding).where(DocumentEmbedding.document_id == document_id)
+            )
+        ).scalar_one_or_none()
+        if emb is None:
+            emb = DocumentEmbedding(document_id=doc.id, user_id=doc.user_id, chunk_count=0)
+            session.add(emb)
+        elif emb.status == "completed":
+            return
+
+        resume_from = emb.chunk_count or 0
+        emb.status = "processing"
+        emb.error_message = None
+        await session.commit()
+
+        async def on_progress(done: int, total: int | None) -> None:
+            emb.chunk_count = done
+            emb.total_chunks = total
+            await session.commit()
+
+        try:
+            if doc.note and doc.note.startswith("repo:"):
+                chunk_count = await _ingest_repo_document(
+                    session, doc, embedder, resume_from, on_progress
                 )
-            except Exception as e:
-                logger.error("Failed to calculate repo trending", repo_id=str(repo.id), error=str(e))
+            else:
+                if not doc.storage_path and doc.note and doc.note.startswith("paper:"):
+                    await _download_paper_pdf(session, doc, embedder.texts.file_storage)
+                chunk_count = await embedder.embed(session, doc, resume_from, on_progress)
+
+            if chunk_count:
+                emb.status = "completed"
+                emb.chunk_count = chunk_count
+                emb.total_chunks = chunk_count
+            else:
+                emb.status = "failed"
+                emb.error_message = "No text could be extracted"
+        except Exception as e:
+            logger.error("Failed to embed document", document_id=str(document_id), error=str(e))
+            await session.rollback()
+            await session.refresh(doc)
+            if not doc.storage_path:
+                # A paper/repo placeholder whose file was never saved: drop it
+                # (and its embedding record) instead of leaving an empty document
+                await session.delete(doc)
+                await session.commit()
+                return
+            await session.refresh(emb)
+            emb.status = "failed"
+            emb.error_message = str(e)[:500]
 
         await session.commit()
 
-    logger.info("Trending scores calculated")
+
+async def _download_paper_pdf(session, doc, file_storage) -> None:
+    """Fetch the PDF of the paper a pending paper document was created for."""
+    from src.core.exceptions import ProcessingError
+    from src.storage.models.paper import Paper
+
+    paper = await session.get(Paper, uuid.UUID(doc.note.removeprefix("paper:")))
+    if paper is None or not paper.pdf_url:
+        raise ProcessingError("Paper has no PDF URL")
+
+    response = await get_http_client().get(paper.pdf_url, timeout=60.0)
+    response.raise_for_status()
+    content = response.content
+    if len(content) < 100:  # too small to be a real PDF
+        raise ProcessingError("Failed to download PDF")
+
+    doc.storage_path = file_storage.save_file(
+        user_id=doc.user_id,
+        document_id=doc.id,
+        filename=doc.filename,
+        content=content,
+    )
+    doc.file_size = len(content)
+    await session.commit()
+    logger.info("Downloaded paper PDF", paper_id=str(paper.id), size=len(content))
+
+
+async def _ingest_repo_document(session, doc, embedder, resume_from, on_progress) -> int:
+    """Ingest the repo behind a ``repo:<id>`` document via gitingest and embed it."""
+    from src.core.exceptions import ProcessingError
+    from src.services.repo_ingestion import ingest_repo
+    from src.storage.models.repository import Repository
+
+    repo = await session.get(Repository, uuid.UUID(doc.note.removeprefix("repo:")))
+    if repo is None:
+        raise ProcessingError("Repository not found")
+
+    repo_content = await ingest_repo(repo.html_url)
+    raw_text = (
+        f"# {repo.full_name}\n\n"
+        f"{repo_content.summary}\n\n"
+        f"## File Structure\n{repo_content.tree}\n\n"
+        f"## Content\n{repo_content.content}"
+    )
+    if not doc.storage_path:
+        raw_bytes = raw_text.encode("utf-8")
+        doc.storage_path = embedder.texts.file_storage.save_file(
+            user_id=doc.user_id,
+            document_id=doc.id,
+            filename=doc.filename,
+            content=raw_bytes,
+        )
+        doc.file_size = len(raw_bytes)
+    await embedder.texts.store(session, doc.id, raw_text)
+    await session.commit()
+
+    return await embedder.embed_repo(
+        doc, repo_content, repo.html_url, resume_from, on_progress
+    )
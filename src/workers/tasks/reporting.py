@@ -1,27 +1,18 @@
 """Reporting tasks for generating weekly digests and alerts."""
 
-import asyncio
 from datetime import date, timedelta
 
 from src.core.config import get_settings
 from src.core.logging import get_logger
-from src.workers.celery_app import celery_app
+from src.workers.runtime import async_task, get_session_factory
 
 logger = get_logger(__name__)
 
 
-def _run_async(coro):
-    loop = asyncio.new_event_loop()
-    try:
-        return loop.run_until_complete(coro)
-    finally:
-        loop.close()
-
-
-@celery_app.task(name="src.workers.tasks.reporting.generate_weekly_report")
-def generate_weekly_report():
+@async_task(name="src.workers.tasks.reporting.generate_weekly_report")
+async def generate_weekly_report():
     """Generate weekly digest report and persist to DB."""
-    _run_async(_generate_report())
+    await _generate_report()
 
 
 async def _generate_report():
@@ -29,14 +20,13 @@ async def _generate_report():
 
     from src.llm.ollama_client import OllamaClient
     from src.llm.prompts.analysis import WEEKLY_REPORT_PROMPT
-    from src.storage.database import create_async_session_factory
     from src.storage.models.paper import Paper
     from src.storage.models.repository import Repository
     from src.storage.models.weekly_report import WeeklyReport
     from src.storage.repositories.metrics_repo import MetricsRepository
     from src.storage.repositories.paper_repo import PaperRepository
 
-    async_session_factory = create_async_session_factory()
+    async_session_factory = get_session_factory()
 
     settings = get_settings()
     llm = OllamaClient(base_url=settings.LOCAL_LLM_URL, model=settings.LOCAL_LLM_MODEL)
@@ -196,10 +186,10 @@ async def _generate_report():
         )
 
 
-@celery_app.task(name="src.workers.tasks.reporting.generate_tech_radar")
-def generate_tech_radar():
+@async_task(name="src.workers.tasks.reporting.generate_tech_radar")
+async def generate_tech_radar():
     """Generate tech radar snapshot using LLM analysis."""
-    _run_async(_generate_tech_radar())
+    await _generate_tech_radar()
 
 
 async def _generate_tech_radar():
@@ -207,12 +197,11 @@ async def _generate_tech_radar():
 
     from src.llm.ollama_client import OllamaClient
     from src.llm.prompts.analysis import TECH_RADAR_PROMPT
-    from src.storage.database import create_async_session_factory
     from src.storage.models.repository import Repository
     from src.storage.models.tech_radar import TechRadarSnapshot
     from src.storage.repositories.metrics_repo import MetricsRepository
 
-    async_session_factory = create_async_session_factory()
+    async_session_factory = get_session_factory()
     settings = get_settings()
     llm = OllamaClient(base_url=settings.LOCAL_LLM_URL, model=settings.LOCAL_LLM_MODEL)
 
@@ -375,19 +364,18 @@ async def _generate_tech_radar():
         )
 
 
-@celery_app.task(name="src.workers.tasks.reporting.send_alerts")
-def send_alerts():
+@async_task(name="src.workers.tasks.reporting.send_alerts")
+async def send_alerts():
     """Send pending alerts to subscribers."""
-    _run_async(_send_pending_alerts())
+    await _send_pending_alerts()
 
 
 async def _send_pending_alerts():
     from sqlalchemy import select
 
-    from src.storage.database import create_async_session_factory
     from src.storage.models.alert import Alert
 
-    async_session_factory = create_async_session_factory()
+    async_session_factory = get_session_factory()
     async with async_session_factory() as session:
         result = await session.execute(
             select(Alert).where(Alert.is_sent == False).limit(100)  # noqa: E712
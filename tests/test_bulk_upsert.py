@@ -0,0 +1,121 @@
+import os
+import uuid
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.storage.database import Base
+from src.storage.models.repository import Repository
+from src.storage.repositories.bulk import bulk_upsert
+
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL")
+
+
+class _Result:
+    def scalars(self):
+        return self
+
+    def all(self):
+        return []
+
+
+class _Nested:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class RecordingSession:
+    """Collects the statements ``bulk_upsert`` would send."""
+
+    def __init__(self):
+        self.statements = []
+
+    def begin_nested(self):
+        return _Nested()
+
+    async def execute(self, stmt):
+        self.statements.append(stmt)
+        return _Result()
+
+
+def _set_clause(stmt) -> str:
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+    return sql.split("DO UPDATE SET", 1)[1].split("RETURNING", 1)[0]
+
+
+def _repo_row(full_name: str, **fields) -> dict:
+    owner, name = full_name.split("/")
+    return {
+        "full_name": full_name,
+        "name": name,
+        "owner": owner,
+        "html_url": f"https://github.com/{full_name}",
+        **fields,
+    }
+
+
+async def test_omitted_defaulted_column_is_not_updated():
+    session = RecordingSession()
+    await bulk_upsert(
+        session,
+        Repository,
+        [_repo_row("a/b", stars_count=10, is_processed=False), _repo_row("c/d", stars_count=3)],
+        ["full_name"],
+    )
+
+    assert len(session.statements) == 2
+    clauses = [_set_clause(stmt) for stmt in session.statements]
+    assert any("is_processed" in clause for clause in clauses)
+    assert any("is_processed" not in clause for clause in clauses)
+    assert all("stars_count" in clause for clause in clauses)
+
+
+async def test_none_value_is_not_updated():
+    session = RecordingSession()
+    await bulk_upsert(
+        session, Repository, [_repo_row("a/b", stars_count=None, description="x")], ["full_name"]
+    )
+
+    (stmt,) = session.statements
+    clause = _set_clause(stmt)
+    assert "description" in clause
+    assert "stars_count" not in clause
+    # The insert path still gets the column default
+    assert stmt.compile(dialect=postgresql.dialect()).params["stars_count_m0"] == 0
+
+
+@pytest.mark.skipif(not TEST_DATABASE_URL, reason="TEST_DATABASE_URL (PostgreSQL) not set")
+async def test_partial_row_keeps_existing_values():
+    engine = create_async_engine(TEST_DATABASE_URL)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all, tables=[Repository.__table__])
+
+    full_name = f"bulk-test/{uuid.uuid4().hex[:12]}"
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    try:
+        async with session_factory() as session:
+            await bulk_upsert(
+                session,
+                Repository,
+                [_repo_row(full_name, stars_count=5, forks_count=2, is_processed=True)],
+                ["full_name"],
+            )
+            await bulk_upsert(
+                session, Repository, [_repo_row(full_name, stars_count=7)], ["full_name"]
+            )
+
+            repo = (
+                await session.execute(select(Repository).where(Repository.full_name == full_name))
+            ).scalar_one()
+            await session.refresh(repo)
+            assert repo.stars_count == 7
+            assert repo.forks_count == 2
+            assert repo.is_processed is True
+            await session.rollback()
+    finally:
+        await engine.dispose()
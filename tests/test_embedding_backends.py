@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("sentence_transformers")
+
+from scripts.bench_embeddings import SAMPLE_TEXTS  # noqa: E402
+from src.processors.embedding import EmbeddingGenerator, _get_device  # noqa: E402
+
+MIN_COSINE = 0.99
+
+
+def _embed(backend: str) -> np.ndarray:
+    vectors = EmbeddingGenerator(use_cache=False, backend=backend).embed_batch(SAMPLE_TEXTS)
+    return np.asarray(vectors, dtype=np.float32)
+
+
+@pytest.fixture(scope="module")
+def reference() -> np.ndarray:
+    try:
+        return _embed("torch")
+    except OSError as e:
+        pytest.skip(f"embedding model not available: {e}")
+
+
+def _assert_parity(vectors: np.ndarray, reference: np.ndarray) -> None:
+    assert vectors.shape == reference.shape
+    # Both sides are L2-normalized, so the row-wise dot product is the cosine
+    cosines = (vectors * reference).sum(axis=1)
+    assert cosines.min() >= MIN_COSINE
+
+
+@pytest.mark.parametrize("backend", ["onnx", "onnx-int8"])
+def test_onnx_backend_matches_torch(backend: str, reference: np.ndarray):
+    pytest.importorskip("optimum")
+    _assert_parity(_embed(backend), reference)
+
+
+def test_torch_fp16_matches_torch(reference: np.ndarray):
+    if _get_device() == "cpu":
+        pytest.skip("torch-fp16 needs cuda or mps")
+    _assert_parity(_embed("torch-fp16"), reference)
+
+
+def test_torch_bf16_matches_torch(reference: np.ndarray):
+    _assert_parity(_embed("torch-bf16"), reference)
+
+
+def test_torch_fp16_falls_back_to_bf16_on_cpu():
+    if _get_device() != "cpu":
+        pytest.skip("fallback only applies on cpu")
+    assert EmbeddingGenerator(use_cache=False, backend="torch-fp16").backend == "torch-bf16"